@@ -38,6 +38,8 @@ class AnnualService(BulkPipelineService):
         )
         if self._enable_bronze:
             run = self._process_recipe_list(recipes, run)
+        else:
+            self._plan_recipe_list(recipes, run)
         run = self._promote_silver(run, ANNUAL_DOMAIN)
         self._logger.info("Annual bulk domain complete", run_id=run.run_id)
         return run
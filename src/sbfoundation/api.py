@@ -18,6 +18,7 @@ from sbfoundation.recovery.bronze_recovery_repo import BronzeRecoveryRepo
 from sbfoundation.recovery.bronze_recovery_service import BronzeRecoveryService
 from sbfoundation.run.dtos.run_context import RunContext
 from sbfoundation.run.services import BulkPipelineService
+from sbfoundation.run.services.run_journal import RunJournal
 from sbfoundation.services.universe_service import UniverseService
 from sbfoundation.settings import *
 
@@ -39,11 +40,36 @@ class RunCommand:
     eod_date: str | None = None  # ISO date override for __to__ query param in eod-bulk-price (e.g. "2024-10-22"); defaults to today
     quarter_year: int | None = None  # Optional calendar year for historical quarter fetch (e.g. 2025); requires quarter_period
     quarter_period: str | None = None  # Fiscal quarter to fetch (e.g. "Q1"); requires quarter_year; bypasses earnings-season gate
+    skip_unchanged_bronze: bool = False  # True records an "unchanged" manifest row instead of writing/promoting a payload identical to the last one
+    conditional_requests: bool = False  # True sends cached ETag/Last-Modified validators; a 304 is recorded as an "unchanged" Bronze outcome
+    pipeline_silver: bool = False  # True promotes Bronze files to Silver on a background thread while fetching continues
+    bronze_writer_workers: int = 0  # >0 writes Bronze files on this many dedicated threads so fetch workers only do HTTP
+    fetch_engine: str = FETCH_ENGINE_THREADS  # "asyncio" fetches eligible JSON recipes on one event loop; concurrent_requests caps requests in flight
+    silver_workers: int = 0  # >0 projects Bronze files on this many worker processes; MERGEs stay on one writer
+    silver_batch_mode: str = "file"  # "table" dedupes and MERGEs every promotable file of a Silver table at once
+    silver_engine: str = "pandas"  # "duckdb" projects and MERGEs Bronze files in SQL; files it cannot handle fall back to pandas
+    silver_dedupe_mode: str = "anti_join"  # "hash_only" rewrites only new or restated rows; "none" MERGEs every row
+    priority: str = RUN_PRIORITY_NORMAL  # quota class: "low" runs yield first when a source's daily/monthly API budget runs low
+    resume_run_id: str | None = None  # run_id of an interrupted run; its journal restores lost manifests and skips completed requests
 
     def validate(self) -> None:
         """Validate this RunCommand. Raises ValueError on invalid input."""
         if self.domain not in DOMAINS:
             raise ValueError(f"Invalid domain '{self.domain}'. Must be one of: {DOMAINS}")
+        if self.priority not in RUN_PRIORITIES:
+            raise ValueError(f"Invalid priority '{self.priority}'. Must be one of: {RUN_PRIORITIES}")
+        if self.fetch_engine not in FETCH_ENGINES:
+            raise ValueError(f"Invalid fetch_engine '{self.fetch_engine}'. Must be one of: {FETCH_ENGINES}")
+        if self.silver_batch_mode not in SILVER_BATCH_MODES:
+            raise ValueError(f"Invalid silver_batch_mode '{self.silver_batch_mode}'. Must be one of: {SILVER_BATCH_MODES}")
+        if self.silver_engine not in SILVER_ENGINES:
+            raise ValueError(f"Invalid silver_engine '{self.silver_engine}'. Must be one of: {SILVER_ENGINES}")
+        if self.silver_dedupe_mode not in SILVER_DEDUPE_MODES:
+            raise ValueError(f"Invalid silver_dedupe_mode '{self.silver_dedupe_mode}'. Must be one of: {SILVER_DEDUPE_MODES}")
+        if self.silver_workers > 0 and self.silver_engine == "duckdb":
+            raise ValueError("silver_workers project with pandas and cannot be combined with silver_engine='duckdb'")
+        if self.silver_batch_mode == "table" and (self.silver_workers > 0 or self.silver_engine == "duckdb"):
+            raise ValueError("silver_batch_mode='table' cannot be combined with silver_workers or silver_engine='duckdb'")
 
 
 class SBFoundationAPI:
@@ -120,6 +146,7 @@ class SBFoundationAPI:
             self.logger.warning(f"Integrity summary failed (non-fatal): {exc}", run_id=run.run_id)
 
         self._close_run(run)
+        RunJournal.for_run(run.run_id).discard()
 
         try:
             reporter = RunStatsReporter(bootstrap=self._bootstrap)
@@ -153,6 +180,16 @@ class SBFoundationAPI:
             concurrent_requests=command.concurrent_requests,
             force_from_date=force_from_date,
             today=self._today,
+            skip_unchanged_bronze=command.skip_unchanged_bronze,
+            conditional_requests=command.conditional_requests,
+            pipeline_silver=command.pipeline_silver,
+            bronze_writer_workers=command.bronze_writer_workers,
+            fetch_engine=command.fetch_engine,
+            silver_workers=command.silver_workers,
+            silver_batch_mode=command.silver_batch_mode,
+            silver_engine=command.silver_engine,
+            silver_dedupe_mode=command.silver_dedupe_mode,
+            priority=command.priority,
         )
         if command.domain == EOD_DOMAIN:
             return EodService(**kwargs)
@@ -164,7 +201,7 @@ class SBFoundationAPI:
 
     def _start_run(self, command: RunCommand) -> RunContext:
         run = RunContext(
-            run_id=self._universe_service.run_id(),
+            run_id=command.resume_run_id or self._universe_service.run_id(),
             started_at=self._universe_service.now(),
             tickers=[],
             update_tickers=[],
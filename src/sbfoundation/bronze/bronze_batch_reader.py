@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import json
 from pathlib import Path
 from typing import Iterator
 
@@ -9,7 +10,9 @@ import pandas as pd
 from sbfoundation.dtos.models import BronzeManifestRow
 from sbfoundation.infra.result_file_adaptor import ResultFileAdapter
 from sbfoundation.run.dtos.bronze_result import BronzeResult
+from sbfoundation.run.dtos.raw_payload import RAW_COMPRESSION_GZIP, RAW_FORMAT_CSV, RawPayload
 from sbfoundation.folders import Folders
+from sbfoundation.settings import SILVER_DUCKDB_MAX_JSON_OBJECT_BYTES
 
 
 @dataclass(frozen=True)
@@ -34,8 +37,57 @@ class BronzeBatchReader:
             raise ValueError(f"Bronze payload is not a BronzeResult: {abs_path}")
 
         payload = result.content or []
+        if isinstance(payload, RawPayload):
+            # Raw Bronze is parsed here, once, straight from the vendor bytes.
+            return BronzeBatchItem(row=row, result=result, df_content=payload.to_frame())
         if not isinstance(payload, list):
             raise ValueError(f"Bronze payload content is not a list for {row.file_path_rel}")
 
         df_content = pd.DataFrame(payload)
         return BronzeBatchItem(row=row, result=result, df_content=df_content)
+
+    def relation_sql(self, row: BronzeManifestRow) -> str | None:
+        """DuckDB table expression over the file's rows, or None when only ``read`` can parse it.
+
+        Parquet files, parsed JSON envelopes and raw CSV/JSON sidecars are scanned by DuckDB
+        in place.  JSON Lines files (envelope on the first line) and empty raw payloads
+        return None.  Raw CSV is read as text, as ``RawPayload.to_frame`` does.
+        """
+        abs_path = (Folders.data_absolute_path() / Path(row.file_path_rel)).resolve()
+        if not abs_path.exists():
+            raise FileNotFoundError(f"Bronze payload missing: {abs_path}")
+
+        if abs_path.name.endswith(".parquet"):
+            return f"read_parquet({self._path_literal(abs_path)})"
+        if not abs_path.name.endswith(".json"):
+            return None
+
+        sidecars = [RawPayload.sidecar_path(abs_path, compression) for compression in (None, RAW_COMPRESSION_GZIP)]
+        sidecar = next((path for path in sidecars if path.exists()), None)
+        if sidecar is None:
+            return self._unnest_rows(f"read_json({self._path_literal(abs_path)}, {self._json_options()})", "content")
+
+        # Raw envelopes carry no rows, so loading one is cheap.
+        with abs_path.open("r", encoding="utf-8") as fh:
+            descriptor = json.load(fh).get("payload") or {}
+        if not descriptor.get("rows"):
+            return None
+        if descriptor.get("format") == RAW_FORMAT_CSV:
+            return f"read_csv({self._path_literal(sidecar)}, header = true, all_varchar = true)"
+        content_key = descriptor.get("json_content_key")
+        if content_key:
+            return self._unnest_rows(f"read_json({self._path_literal(sidecar)}, {self._json_options()})", content_key)
+        return f"read_json({self._path_literal(sidecar)}, format = 'array', {self._json_options()})"
+
+    @staticmethod
+    def _unnest_rows(document: str, key: str) -> str:
+        column = '"' + key.replace('"', '""') + '"'
+        return f"(SELECT unnest(_row) FROM (SELECT unnest({column}) AS _row FROM {document}))"
+
+    @staticmethod
+    def _json_options() -> str:
+        return f"maximum_object_size = {SILVER_DUCKDB_MAX_JSON_OBJECT_BYTES}"
+
+    @staticmethod
+    def _path_literal(path: Path) -> str:
+        return "'" + str(path).replace("'", "''") + "'"
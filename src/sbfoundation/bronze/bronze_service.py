@@ -1,6 +1,11 @@
+import asyncio
+import functools
 import os
 import threading
+import time
 import typing
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
 from datetime import date, timedelta
 import requests
 
@@ -8,13 +13,29 @@ from sbfoundation.dataset.models.dataset_recipe import DatasetRecipe
 from sbfoundation.run.dtos.run_request import RunRequest
 from sbfoundation.run.dtos.bronze_result import BronzeResult
 from sbfoundation.run.dtos.run_context import RunContext
+from sbfoundation.run.dtos.run_plan import SKIP_DUPLICATE, SKIP_REJECTED, SKIP_RESUMED, SKIP_TOO_SOON, RunPlan
 from sbfoundation.services.universe_service import UniverseService
 from sbfoundation.folders import Folders
 from sbfoundation.settings import *
-from sbfoundation.run.services.run_request_executor import RunRequestExecutor
+from sbfoundation.run.services.run_request_executor import DeferredRetry, RunRequestExecutor
+from sbfoundation.run.services.async_fetch_engine import AsyncFetchEngine
+from sbfoundation.run.services.async_http_client import AsyncHttpClient
+from sbfoundation.run.services.http_validator_cache import HttpValidatorCache
+from sbfoundation.run.services.hedge_policy import HedgePolicy
+from sbfoundation.run.services.run_journal import JournalKey, RunJournal
+from sbfoundation.run.services.bronze_work_queue import BronzeWorkQueue
+from sbfoundation.run.services.bronze_writer_pool import BronzeWriterPool
+from sbfoundation.run.services.quota_manager import QuotaExhausted, QuotaManager
+from sbfoundation.run.services.rate_limiter import RateLimiter
 from sbfoundation.infra.result_file_adaptor import ResultFileAdapter
 from sbfoundation.infra.logger import LoggerFactory
 from sbfoundation.ops.services.ops_service import OpsService
+from sbfoundation.ops.dtos.file_injestion import DatasetInjestion
+from sbfoundation.ops.dtos.http_validator import HttpValidator
+
+
+class _UnparseableBody(Exception):
+    """A received body that is not valid JSON; raised past the executor so it is not retried."""
 
 
 class BronzeService:
@@ -31,6 +52,14 @@ class BronzeService:
         concurrent_requests: int = 1,
         force_from_date: str | None = None,
         backfill_to_1990: bool = False,
+        skip_unchanged: bool = False,
+        conditional_requests: bool = False,
+        hedge_policy: typing.Optional[HedgePolicy] = None,
+        manifest_sink: typing.Optional[typing.Callable[[list[DatasetInjestion]], None]] = None,
+        journal: typing.Optional[RunJournal] = None,
+        writer_workers: int = 0,
+        quota_manager: typing.Optional[QuotaManager] = None,
+        fetch_engine: str = FETCH_ENGINE_THREADS,
     ):
         """Initialize dependencies, run metadata, and storage repositories."""
         self.fmp_api_key = fmp_api_key or os.getenv("FMP_API_KEY")
@@ -41,17 +70,55 @@ class BronzeService:
         self._owns_ops_service = ops_service is None
         self.recipes: list[DatasetRecipe] = []
         self.request_executor = request_executor or RunRequestExecutor(self.logger)
+        self._owns_request_executor = request_executor is None
         self.run: RunContext = None
         self.concurrent_requests = max(1, concurrent_requests)  # Ensure >= 1
         self._force_from_date: str | None = force_from_date
         self._backfill_to_1990: bool = backfill_to_1990
-        # Pre-loaded {ticker: (last_ingestion_date, watermark_date)} for the current recipe.
-        # Set before the concurrent loop, cleared after.  None means "use per-ticker DB queries".
-        self._watermarks_cache: dict[str, tuple[date | None, date | None]] | None = None
+        # Pre-loaded {ticker: (last_ingestion_date, watermark_date)} per recipe, keyed by id(recipe).
+        # Set before the recipe's requests are dispatched, cleared once it completes.
+        # A missing entry means "use per-ticker DB queries".
+        self._watermarks_caches: dict[int, dict[str, tuple[date | None, date | None]]] = {}
         # Manifests queued by worker threads; flushed serially by the main thread after
         # each concurrent batch to avoid _conn_lock contention / WAL checkpoint stalls.
         self._pending_manifests: list[BronzeResult] = []
         self._pending_lock = threading.Lock()
+        # Concurrent backfill state: {id(recipe): {ticker: (floor, earliest)}} preloaded per
+        # recipe, and floor checkpoints queued by workers until the next batch flush.
+        self._backfill_caches: dict[int, dict[str, tuple[date | None, date | None]]] = {}
+        self._pending_floor_dates: dict[tuple, date] = {}
+        # Content-hash short-circuit: {id(recipe): {ticker: (payload_hash, bronze_filename)}} of
+        # each identity's latest promotable file, preloaded per recipe like the watermarks.
+        self._skip_unchanged = skip_unchanged
+        self._payload_hash_caches: dict[int, dict[str, tuple[str, str]]] = {}
+        # Conditional GETs: validators of earlier 200s are sent back and a 304 reuses their file.
+        # Forced and backfill runs must refetch, so they never send validators.
+        self.validator_cache: HttpValidatorCache | None = None
+        if conditional_requests and not backfill_to_1990 and not force_from_date:
+            self.validator_cache = HttpValidatorCache(self.ops_service)
+            self.request_executor.set_validator_cache(self.validator_cache)
+        # Tail-latency hedging; sources opt in through DATA_SOURCES_CONFIG[source][HEDGE_REQUESTS].
+        self.hedge_policy = hedge_policy or HedgePolicy(self.ops_service)
+        # Receives each flushed batch of manifests, e.g. SilverPromotionPipeline.submit.
+        self.manifest_sink = manifest_sink
+        # Crash-safe resume: every queued manifest is journaled before it is flushed, and a
+        # rerun of the same run_id skips the keys its journal already completed.
+        self.journal = journal
+        self._journal_completed: set[JournalKey] = set()
+        # Accepted payloads are written by dedicated threads so fetch workers only do HTTP.
+        # 0 keeps the write on the fetch worker.
+        self._writer_pool: BronzeWriterPool | None = None
+        if writer_workers > 0:
+            self._writer_pool = BronzeWriterPool(self._write_bronze_file, writer_workers, self.logger)
+        # Persistent daily/monthly API budgets; a request that would overdraw one yields
+        # without a Bronze file or manifest, so a later run picks it up.
+        self.quota_manager = quota_manager
+        if quota_manager is not None:
+            self.request_executor.set_quota_manager(quota_manager)
+        # "asyncio" moves eligible recipes of a concurrent run onto one event loop (see _runs_on_event_loop).
+        if fetch_engine not in FETCH_ENGINES:
+            raise ValueError(f"Invalid fetch_engine: {fetch_engine!r}. Must be one of {FETCH_ENGINES}")
+        self.fetch_engine = fetch_engine
 
     @property
     def summary(self) -> RunContext:
@@ -70,11 +137,111 @@ class BronzeService:
 
     def _process_run_request(self, request: RunRequest) -> None:
         """Execute a single request through Bronze write."""
+        result = self._prepare_run_request(request)
+        if result is None:
+            return
+
+        # Call source endpoint and read the response into the BronzeResult
+        try:
+            self.request_executor.execute(self._fetcher(result, conditional=True), f"GET {request.url}", source=request.recipe.source)
+        except Exception as e:
+            self._result_fetch_error(result, e)
+            return
+
+        self._accept_bronze_result(result)
+
+    def _process_queued_request(
+        self,
+        request: RunRequest,
+        result: BronzeResult | None = None,
+        attempt: int = 0,
+        fetch: typing.Callable[[], requests.Response] | None = None,
+    ) -> None:
+        """Work-queue variant of ``_process_run_request`` that never sleeps between attempts.
+
+        A failed attempt raises ``DeferredRetry`` whose ``resume`` continues with the same
+        result, fetcher and attempt count, so the queue can park it and free the worker.
+        """
+        if result is None:
+            result = self._prepare_run_request(request)
+            if result is None:
+                return
+        if fetch is None:
+            fetch = self._fetcher(result, conditional=True)
+
+        try:
+            self.request_executor.execute_once(fetch, f"GET {request.url}", source=request.recipe.source, attempt=attempt)
+        except DeferredRetry as retry:
+            retry.resume = functools.partial(self._process_queued_request, request, result, retry.attempt, fetch)
+            self.run.record_deferred_retry(request.recipe.source)
+            raise
+        except Exception as e:
+            self._result_fetch_error(result, e)
+            return
+
+        self._accept_bronze_result(result)
+
+    async def _process_request_async(self, client: AsyncHttpClient, request: RunRequest) -> None:
+        """Event-loop variant of ``_process_run_request``.
+
+        Only the HTTP exchange and the executor's waits run on the loop; the gates,
+        error recording and acceptance can touch the ops DB and disk, so they run on
+        the loop's default thread pool.
+        """
+        result = await asyncio.to_thread(self._prepare_run_request, request)
+        if result is None:
+            return
+
+        try:
+            await self.request_executor.execute_async(self._async_fetcher(client, result), f"GET {request.url}", source=request.recipe.source)
+        except Exception as e:
+            await asyncio.to_thread(self._result_fetch_error, result, e)
+            return
+
+        await asyncio.to_thread(self._accept_bronze_result, result)
+
+    def _prepare_run_request(self, request: RunRequest) -> BronzeResult | None:
+        """Run the dedup/cadence gates for a request.
+
+        Returns the BronzeResult to fill from the HTTP response, or None when the
+        request should not be fetched in this run (skips and rejections are logged
+        or recorded here).  Shared by the sequential, pooled, queued and event-loop dispatch paths.
+        """
         # Capture the Bronze payload and related metadata to support the
         # reproducibility and auditability properties of the medallion
         # architecture.
         result = BronzeResult(now=self.universe.now(), request=request)
 
+        skip = self._gate_run_request(request)
+        if skip is None:
+            return result
+        if skip == SKIP_RESUMED:
+            self.run.record_resumed_request()
+            self.logger.debug(f"{result.msg} | already completed by this run before it was interrupted", run_id=self.run.run_id)
+        elif skip == SKIP_DUPLICATE:
+            self.logger.debug(
+                "Skipping duplicate ingestion | dataset=%s | ticker=%s",
+                request.recipe.dataset,
+                request.ticker,
+                run_id=self.run.run_id,
+            )
+        elif skip == SKIP_TOO_SOON:
+            self.logger.warning(f"{result.msg} | REQUEST IS TOO SOON", run_id=self.run.run_id)
+        else:
+            result.error = request.error
+            self._result_bronze_error(result, result.error)
+        return None
+
+    def _gate_run_request(self, request: RunRequest) -> str | None:
+        """Apply the journal, dedup and cadence gates without any network IO or persistence.
+
+        Returns None when the request should be fetched (with its ``from_date`` advanced
+        to the watermark or forced date), otherwise the ``SKIP_*`` reason.  The dry-run
+        planner calls this directly.
+        """
+        if self._journal_completed and RunJournal.key(request) in self._journal_completed:
+            return SKIP_RESUMED
+
         # Run request acceptance criteria to reject malformed upstream
         # definitions before attempting any network IO.
         domain, source, dataset, discriminator, ticker = request.ingest_identity()
@@ -86,8 +253,9 @@ class BronzeService:
         # date-override fetch where the caller intentionally targets a specific date
         # (e.g. EodService with eod_date="2026-03-09") and the gate would incorrectly
         # block the request because a prior run already ingested today's data.
-        if self._watermarks_cache is not None:
-            last_ingestion_date, last_to_date = self._watermarks_cache.get(ticker or "", (None, None))
+        watermarks_cache = self._watermarks_caches.get(id(request.recipe))
+        if watermarks_cache is not None:
+            last_ingestion_date, last_to_date = watermarks_cache.get(ticker or "", (None, None))
         else:
             last_ingestion_date = self.ops_service.get_last_ingestion_date(
                 domain=domain, source=source, dataset=dataset, discriminator=discriminator, ticker=ticker
@@ -97,14 +265,7 @@ class BronzeService:
             )
 
         if not self._force_from_date and last_ingestion_date and last_ingestion_date >= today:
-            self.logger.debug(
-                "Skipping duplicate ingestion | dataset=%s | ticker=%s | last_ingestion=%s",
-                dataset,
-                ticker,
-                last_ingestion_date,
-                run_id=self.run.run_id,
-            )
-            return
+            return SKIP_DUPLICATE
 
         if self._force_from_date:
             # Backfill / date-override mode: defer setting request.from_date until
@@ -123,47 +284,104 @@ class BronzeService:
             # This handles datasets where the API always returns the same historical
             # snapshot so bronze_to_date never advances toward today.
             if last_ingestion_date and (today - last_ingestion_date).days <= request.min_age_days:
-                self.logger.warning(
-                    f"{result.msg} | REQUEST IS TOO SOON", run_id=self.run.run_id
-                )
-                return
+                return SKIP_TOO_SOON
 
         if not request.canRun():
-            result.error = result.request.error
             # Skip file persistence and ops tracking for "too soon" requests
-            if result.error == "REQUEST IS TOO SOON":
-                self.logger.warning(f"{result.msg} | {result.error}", run_id=self.run.run_id)
-                return
-            self._result_bronze_error(result, result.error)
-            return
+            if request.error == "REQUEST IS TOO SOON":
+                return SKIP_TOO_SOON
+            return SKIP_REJECTED
 
         if self._force_from_date:
             # Apply the forced start date now, after canRun() has validated against
             # the original from_date.
             request.from_date = self._force_from_date
 
-        # Call source endpoint and create a BronzeResult
-        try:
-            response = self.request_executor.execute(
-                lambda: requests.get(request.url, params=request.query_vars, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT)),
-                f"GET {request.url}",
-            )
-            result.add_response(response)
+        return None
 
-        except requests.Timeout:
-            self._result_bronze_error(result, f"Connection to {request.url} timed out.")
-            return
-        except requests.ConnectionError:
-            self._result_bronze_error(result, f"Connection to {request.url} failed:  DNS failure, or other connection related issue.")
-            return
-        except requests.TooManyRedirects:
-            self._result_bronze_error(result, f"Request to {request.url} exceeds the maximum number of predefined redirections.")
-            return
-        except requests.RequestException as e:
-            self._result_bronze_error(result, f"Request to {request.url} failed: {e}")
-            return
-        except Exception as e:
+    def _fetcher(self, result: BronzeResult, conditional: bool = False) -> typing.Callable[[], requests.Response]:
+        """Executor callable for one attempt: GET ``result.request`` and read the body into ``result``.
+
+        The body is read inside the attempt, so a connection dropped part-way through a
+        streamed CSV or raw body is retried like any other transport error.  The query is
+        copied up front because ``add_response`` masks the API key on the request.
+        """
+        request = result.request
+        params = dict(request.query_vars)
+
+        def attempt() -> requests.Response:
+            response = self._http_get(request, conditional=conditional, params=params)
+            try:
+                result.add_response(response)
+            except requests.exceptions.InvalidJSONError as exc:
+                raise _UnparseableBody(exc) from exc
+            return response
+
+        return attempt
+
+    def _async_fetcher(self, client: AsyncHttpClient, result: BronzeResult) -> typing.Callable[[], typing.Awaitable[requests.Response]]:
+        """Awaitable counterpart of ``_fetcher`` over the event loop's HTTP client."""
+        request = result.request
+        params = dict(request.query_vars)
+
+        async def attempt() -> requests.Response:
+            response = await client.get(request.url, params=params)
+            try:
+                result.add_response(response)
+            except requests.exceptions.InvalidJSONError as exc:
+                raise _UnparseableBody(exc) from exc
+            return response
+
+        return attempt
+
+    def _http_get(self, request: RunRequest, conditional: bool = False, params: dict | None = None) -> requests.Response:
+        """Issue the blocking GET for a request over the source's keep-alive session pool.
+
+        CSV and raw-storage bodies are streamed so ``BronzeResult.add_response`` can consume them chunk by chunk.
+        ``conditional`` is only set by callers that hand the result to ``_accept_bronze_result``,
+        the one path that knows what to do with a 304.  ``params`` overrides the request's
+        query.  Requests slower than the dataset's p90 latency are hedged when the source
+        opts in; every latency feeds the policy.
+        """
+        recipe = request.recipe
+        stream = request.query_vars.get("datatype") == "csv" or recipe.bronze_storage != BRONZE_STORAGE_PARSED
+        started = time.monotonic()
+        response = self.request_executor.http_get(
+            recipe.source,
+            request.url,
+            params=request.query_vars if params is None else params,
+            stream=stream,
+            conditional=conditional,
+            hedge_after=self.hedge_policy.delay_for(recipe.source, recipe.dataset),
+        )
+        self.hedge_policy.observe(recipe.source, recipe.dataset, time.monotonic() - started)
+        return response
+
+    def _result_fetch_error(self, result: BronzeResult, e: Exception) -> None:
+        """Record a failed fetch with a message that reflects the transport failure."""
+        url = result.request.url
+        if isinstance(e, _UnparseableBody):
+            e = e.__cause__
+        if isinstance(e, QuotaExhausted):
+            self._yield_to_quota(e, result.msg)
+        elif isinstance(e, requests.Timeout):
+            self._result_bronze_error(result, f"Connection to {url} timed out.")
+        elif isinstance(e, requests.ConnectionError):
+            self._result_bronze_error(result, f"Connection to {url} failed:  DNS failure, or other connection related issue.")
+        elif isinstance(e, requests.TooManyRedirects):
+            self._result_bronze_error(result, f"Request to {url} exceeds the maximum number of predefined redirections.")
+        elif isinstance(e, requests.RequestException):
+            self._result_bronze_error(result, f"Request to {url} failed: {e}")
+        else:
             self._result_bronze_error(result, f"A requests exception, Error: {e}")
+
+    def _yield_to_quota(self, e: QuotaExhausted, msg: str) -> None:
+        self.run.record_quota_yield(e.source)
+        self.logger.warning(f"{msg} | {e}; leaving it for a later run", run_id=self.run.run_id)
+
+    def _accept_bronze_result(self, result: BronzeResult) -> None:
+        """Apply Bronze acceptance and persist a fetched result."""
+        if result.status_code == HTTP_NOT_MODIFIED and self._accept_not_modified(result):
             return
 
         # Bronze acceptance criteria enforce persistence of well-structured raw
@@ -172,14 +390,106 @@ class BronzeService:
             self._result_bronze_error(result, f"Failed bronze acceptance: {result.error}")
             return
 
+        previous_filename = self._unchanged_payload_filename(result)
+        if previous_filename is not None:
+            self._record_unchanged(result, previous_filename)
+            self._remember_validator(result)
+            return
+
+        if self._writer_pool is not None:
+            self._writer_pool.submit(result, self.run, self._finish_pooled_write)
+            return
+
         # Write the bronze file and queue the manifest for serial flush on the main thread.
         # Do NOT call insert_bronze_manifest here — all workers share _conn_lock and a
         # stalled COMMIT in one thread would block all others indefinitely.
         filename = self._persist_bronze_file_only(result)
+        self._record_bronze_pass(result, filename)
+
+    def _finish_pooled_write(self, result: BronzeResult) -> None:
+        """Writer-thread callback once the pool has put the file on disk."""
+        self._queue_manifest(result)
+        self._record_bronze_pass(result, str(Folders.duckdb_absolute_path))
+
+    def _record_bronze_pass(self, result: BronzeResult, filename: str) -> None:
+        self._remember_validator(result)
 
         # Update the summary report
         self.run.result_bronze_pass(result, filename=filename)
 
+    def _accept_not_modified(self, result: BronzeResult) -> bool:
+        """Record a 304 against the file its validator came from; False if the validator is unknown."""
+        request = result.request
+        validator = self.validator_cache.get(request.url, request.query_vars) if self.validator_cache is not None else None
+        if validator is None or not validator.bronze_filename:
+            return False
+        result.error = None
+        result.hash = validator.payload_hash
+        result.first_date = validator.bronze_from_date.isoformat() if validator.bronze_from_date else None
+        result.last_date = validator.bronze_to_date.isoformat() if validator.bronze_to_date else None
+        self._record_unchanged(result, validator.bronze_filename)
+        return True
+
+    def _remember_validator(self, result: BronzeResult) -> None:
+        """Cache the ETag / Last-Modified of an accepted, promotable 200 for the next run's conditional GET."""
+        if self.validator_cache is None or result.status_code != 200 or not result.headers:
+            return
+        etag = result.headers.get("ETag")
+        last_modified = result.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        request = result.request
+        if not result.canPromoteToSilverWith(allows_empty_content=request.allows_empty_content):
+            return
+        # The manifest row carries the file name and coverage a later 304 must point back at.
+        ingestion = DatasetInjestion.from_bronze(result)
+        self.validator_cache.remember(
+            HttpValidator(
+                cache_key=HttpValidatorCache.cache_key(request.url, request.query_vars),
+                url=request.url,
+                etag=etag,
+                last_modified=last_modified,
+                bronze_filename=ingestion.bronze_filename,
+                payload_hash=ingestion.bronze_payload_hash,
+                bronze_from_date=ingestion.bronze_from_date,
+                bronze_to_date=ingestion.bronze_to_date,
+            )
+        )
+
+    def _unchanged_payload_filename(self, result: BronzeResult) -> str | None:
+        """Return the previous file's name when ``result`` repeats the identity's last promotable payload."""
+        cache = self._payload_hash_caches.get(id(result.request.recipe))
+        if not cache or not result.hash:
+            return None
+        previous = cache.get(result.request.ticker or "")
+        if previous is None or previous[0] != result.hash:
+            return None
+        if not result.canPromoteToSilverWith(allows_empty_content=result.request.allows_empty_content):
+            return None
+        return previous[1]
+
+    def _record_unchanged(self, result: BronzeResult, previous_filename: str) -> None:
+        """Queue a lightweight manifest row pointing at the previous file; nothing is written or promoted."""
+        result.unchanged = True
+        result.filename = previous_filename
+        result.release_content()
+        self._queue_manifest(result)
+        self.run.result_bronze_unchanged(result, filename=previous_filename)
+        self.logger.info(f"Bronze payload unchanged; reusing {previous_filename} | {result.request.msg}", run_id=self.run.run_id)
+
+    def _preload_payload_hashes(self, recipe: DatasetRecipe) -> None:
+        if self._skip_unchanged and not self._backfill_to_1990 and not self._force_from_date:
+            self._payload_hash_caches[id(recipe)] = self.ops_service.get_latest_payload_hashes(
+                domain=recipe.domain,
+                source=recipe.source,
+                dataset=recipe.dataset,
+                discriminator=recipe.discriminator or "",
+            )
+
+    def _release_recipe_caches(self, recipe: DatasetRecipe) -> None:
+        self._watermarks_caches.pop(id(recipe), None)
+        self._payload_hash_caches.pop(id(recipe), None)
+
     def register_recipes(self, run: RunContext, recipes: list[DatasetRecipe]) -> "BronzeService":
         """Register recipes to be processed in the current run."""
         self.recipes.extend(recipes)
@@ -189,7 +499,7 @@ class BronzeService:
     def _persist_bronze(self, result: BronzeResult) -> str:
         """Write the Bronze payload and still record a manifest row so audits remain intact."""
         try:
-            self.result_file_adapter.write(result)
+            self._write_bronze_file(result)
         except Exception as exc:
             self.logger.error(f"Bronze persistence failed: {result.msg} | error={exc}", run_id=self.run.run_id)
             raise
@@ -211,30 +521,86 @@ class BronzeService:
         which runs on the main thread after ThreadPoolExecutor completes.
         """
         try:
-            self.result_file_adapter.write(result)
+            self._write_bronze_file(result)
         except Exception as exc:
             self.logger.error(f"Bronze persistence failed: {result.msg} | error={exc}", run_id=self.run.run_id)
             raise
+        self._queue_manifest(result)
+        return str(Folders.duckdb_absolute_path)
+
+    def _write_bronze_file(self, result: BronzeResult) -> None:
+        """Write the Bronze file, then drop the spool a streamed or raw payload was parked in."""
+        try:
+            self.result_file_adapter.write(result)
+        finally:
+            result.release_content()
+
+    def _queue_manifest(self, result: BronzeResult) -> None:
+        if self.journal is not None:
+            try:
+                self.journal.record(result)
+            except Exception as exc:
+                self.logger.error("Run journal append failed: %s", exc, run_id=self.run.run_id)
         with self._pending_lock:
             self._pending_manifests.append(result)
-        return str(Folders.duckdb_absolute_path)
 
-    def _flush_manifest_inserts(self) -> None:
-        """Insert all queued bronze manifest rows serially on the main thread.
+    def _resume_from_journal(self) -> None:
+        """Restore the manifests an interrupted attempt of this run journaled but never flushed.
+
+        Requests whose journaled outcome was not an error are skipped for the rest of the run;
+        failed ones are fetched again.
+        """
+        if self.journal is None:
+            return
+        entries = self.journal.load()
+        if not entries:
+            return
+        try:
+            restored = self.ops_service.restore_bronze_manifests([ingestion for _, ingestion in entries])
+        except Exception as exc:
+            self.logger.error("Run journal restore failed: %s", exc, run_id=self.run.run_id)
+            return
+        self._journal_completed = {key for key, ingestion in entries if not ingestion.bronze_error}
+        self.logger.info(
+            f"Resuming from run journal | entries={len(entries)} | manifests_restored={restored} | completed={len(self._journal_completed)}",
+            run_id=self.run.run_id,
+        )
+
+    def _flush_manifest_inserts(self, recipe: DatasetRecipe | None = None) -> None:
+        """Insert queued bronze manifest rows in one batch on the main thread.
 
         Must be called after _process_requests_concurrent or any sequential ticker
-        loop that used _persist_bronze_file_only.  Running the inserts serially
+        loop that used _persist_bronze_file_only.  Running the inserts on one thread
         eliminates _conn_lock contention and WAL checkpoint stalls that caused the
         observed hang (all 10 workers blocked waiting for the lock after file writes).
+        When ``recipe`` is given only that recipe's manifests are flushed; the run-wide
+        work queue uses this to flush each recipe as it completes.
         """
+        if self._writer_pool is not None:
+            # A manifest is only queued once its file is on disk.
+            self._writer_pool.drain()
         with self._pending_lock:
-            pending = self._pending_manifests[:]
-            self._pending_manifests.clear()
-        for result in pending:
+            if recipe is None:
+                pending = self._pending_manifests[:]
+                self._pending_manifests.clear()
+            else:
+                pending = [r for r in self._pending_manifests if r.request.recipe is recipe]
+                self._pending_manifests = [r for r in self._pending_manifests if r.request.recipe is not recipe]
+        # One batched MERGE; OpsService falls back to per-row inserts and logs each failure.
+        persisted: list[BronzeResult] = []
+        try:
+            persisted = self.ops_service.insert_bronze_manifests(pending, self.run)
+        except Exception as exc:
+            self.logger.error("Bronze manifest insert failed: %s", exc, run_id=self.run.run_id)
+        if self.manifest_sink is not None and persisted:
+            # Only after the insert, and only rows that made it: promoting first would let the
+            # manifest MERGE overwrite Silver's bookkeeping, and a row without a manifest has none.
+            self.manifest_sink([DatasetInjestion.from_bronze(result) for result in persisted])
+        if self.validator_cache is not None:
             try:
-                self.ops_service.insert_bronze_manifest(result, self.run)
+                self.validator_cache.flush()
             except Exception as exc:
-                self.logger.error("Bronze manifest insert failed: %s", exc, run_id=self.run.run_id)
+                self.logger.error("HTTP validator flush failed: %s", exc, run_id=self.run.run_id)
 
     def _process_requests_concurrent(self, requests: list[RunRequest]) -> None:
         """Process requests concurrently using ThreadPoolExecutor.
@@ -247,8 +613,6 @@ class BronzeService:
             - Shares RunRequestExecutor for throttling across all workers
             - Thread-safe RunContext updates via locks
         """
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-
         with ThreadPoolExecutor(max_workers=self.concurrent_requests) as executor:
             # Submit all requests to thread pool
             futures = {executor.submit(self._process_run_request, req): req for req in requests}
@@ -271,6 +635,7 @@ class BronzeService:
         """
         self.run = run
         self.request_executor.set_summary(self.run)
+        self._resume_from_journal()
 
         if self.concurrent_requests > 1 and len(requests) > 1:
             self.logger.info(
@@ -283,15 +648,13 @@ class BronzeService:
                 self._process_run_request(req)
 
         self._flush_manifest_inserts()
-
-        if self._owns_ops_service:
-            self.ops_service.close()
+        self._close_owned_resources()
 
         return self.run
 
     _BACKFILL_START = date(1990, 1, 1)
 
-    def _run_backward_fill_loop(self, request: RunRequest) -> None:
+    def _run_backward_fill_loop(self, request: RunRequest, deferred: bool = False) -> None:
         """Work backward from the earliest loaded date toward Jan 1, 1990.
 
         Chunked API requests (one per loop iteration) page backward until either:
@@ -299,9 +662,13 @@ class BronzeService:
         - we reach 1990-01-01.
 
         Progress is checkpointed in ops.dataset_watermarks.backfill_floor_date so
-        interrupted runs resume from the last committed floor.
+        interrupted runs resume from the last committed floor.  With ``deferred``
+        (concurrent backfill) the manifest and floor writes are queued and flushed
+        in batches by _run_backward_fill_concurrent instead of written per page.
         """
         domain, source, dataset, discriminator, ticker = request.ingest_identity()
+        identity = (domain, source, dataset, discriminator, ticker)
+        preloaded = self._backfill_caches.get(id(request.recipe))
 
         # Only date-range recipes support backward-fill windowing; limit-based
         # recipes (e.g. metric-ratios) have no __from__/__to__ placeholders so
@@ -314,7 +681,10 @@ class BronzeService:
             return
 
         # Skip if already fully backfilled
-        floor = self.ops_service.get_backfill_floor_date(domain, source, dataset, discriminator, ticker)
+        if preloaded is not None:
+            floor, earliest = preloaded.get(ticker or "", (None, None))
+        else:
+            floor = self.ops_service.get_backfill_floor_date(domain, source, dataset, discriminator, ticker)
         if floor is not None and floor <= self._BACKFILL_START:
             self.logger.debug(
                 f"Backward fill complete for ticker={ticker} dataset={dataset}",
@@ -323,7 +693,8 @@ class BronzeService:
             return
 
         # Need existing data to know where to start going backward
-        earliest = self.ops_service.get_earliest_bronze_from_date(domain, source, dataset, discriminator, ticker)
+        if preloaded is None:
+            earliest = self.ops_service.get_earliest_bronze_from_date(domain, source, dataset, discriminator, ticker)
         if earliest is None:
             self.logger.debug(
                 f"No loaded data for ticker={ticker} dataset={dataset} — skipping backward fill",
@@ -344,13 +715,12 @@ class BronzeService:
                 to_date=to_date.isoformat(),
             )
 
+            result = BronzeResult(now=self.universe.now(), request=bf_request)
             try:
-                response = self.request_executor.execute(
-                    lambda: requests.get(bf_request.url, params=bf_request.query_vars, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT)),
-                    f"GET {bf_request.url}",
-                )
-                result = BronzeResult(now=self.universe.now(), request=bf_request)
-                result.add_response(response)
+                self.request_executor.execute(self._fetcher(result), f"GET {bf_request.url}", source=bf_request.recipe.source)
+            except QuotaExhausted as exc:
+                self._yield_to_quota(exc, bf_request.msg)
+                break
             except requests.Timeout:
                 self.logger.warning(f"Backward fill timed out for ticker={ticker} dataset={dataset}", run_id=self.run.run_id)
                 break
@@ -365,8 +735,10 @@ class BronzeService:
                 break
 
             if not result.content:
-                # No data before to_date — mark sentinel and stop
-                self.ops_service.set_backfill_floor_date(domain, source, dataset, discriminator, ticker, floor_date=self._BACKFILL_START)
+                # No data before to_date — mark sentinel and stop.  A raw body holding no
+                # rows still has its spool open.
+                result.release_content()
+                self._checkpoint_backfill_floor(identity, self._BACKFILL_START, deferred)
                 self.logger.info(
                     f"No data before {to_date} for ticker={ticker} dataset={dataset} — backfill complete",
                     run_id=self.run.run_id,
@@ -374,7 +746,7 @@ class BronzeService:
                 break
 
             # Persist bronze
-            filename = self._persist_bronze(result)
+            filename = self._persist_bronze_file_only(result) if deferred else self._persist_bronze(result)
             self.run.result_bronze_pass(result, filename=filename)
 
             # Advance floor backward using the earliest date in the response
@@ -390,9 +762,7 @@ class BronzeService:
             # If first_date didn't go before what we requested, the API doesn't honour
             # to_date — mark sentinel and stop to avoid an infinite loop.
             if new_floor >= to_date:
-                self.ops_service.set_backfill_floor_date(
-                    domain, source, dataset, discriminator, ticker, floor_date=self._BACKFILL_START
-                )
+                self._checkpoint_backfill_floor(identity, self._BACKFILL_START, deferred)
                 self.logger.info(
                     f"API does not support to_date filtering for ticker={ticker} dataset={dataset}"
                     f" — marking backfill complete",
@@ -400,24 +770,83 @@ class BronzeService:
                 )
                 break
 
-            self.ops_service.set_backfill_floor_date(domain, source, dataset, discriminator, ticker, floor_date=new_floor)
+            self._checkpoint_backfill_floor(identity, new_floor, deferred)
             to_date = new_floor - timedelta(days=1)
 
             if to_date <= self._BACKFILL_START:
-                self.ops_service.set_backfill_floor_date(domain, source, dataset, discriminator, ticker, floor_date=self._BACKFILL_START)
+                self._checkpoint_backfill_floor(identity, self._BACKFILL_START, deferred)
                 self.logger.info(
                     f"Reached 1990 for ticker={ticker} dataset={dataset} — backfill complete",
                     run_id=self.run.run_id,
                 )
                 break
 
+    def _checkpoint_backfill_floor(self, identity: tuple, floor_date: date, deferred: bool) -> None:
+        """Record a ticker's new backfill floor, immediately or into the pending batch."""
+        if not deferred:
+            self.ops_service.set_backfill_floor_date(*identity, floor_date=floor_date)
+            return
+        with self._pending_lock:
+            self._pending_floor_dates[identity] = floor_date
+
+    def _flush_backfill_checkpoints(self) -> None:
+        """Flush queued manifests, then the floor dates they justify, in one batch each.
+
+        Manifests go first so a committed floor never points below data that ops
+        does not know about; a crash in between only causes pages to be refetched.
+        """
+        self._flush_manifest_inserts()
+        with self._pending_lock:
+            pending = [(*identity, floor) for identity, floor in self._pending_floor_dates.items()]
+            self._pending_floor_dates.clear()
+        if not pending:
+            return
+        try:
+            self.ops_service.set_backfill_floor_dates(pending)
+        except Exception as exc:
+            self.logger.error("Backfill floor checkpoint failed: %s", exc, run_id=self.run.run_id)
+
+    def _run_backward_fill_concurrent(self, recipe: DatasetRecipe, reqs: list[RunRequest]) -> None:
+        """Run many tickers' backward-fill loops in parallel.
+
+        Each ticker's loop stays on one worker, so its pages are still fetched newest
+        to oldest.  Floors and earliest dates are preloaded with one query each, and
+        manifests plus floor checkpoints are flushed from this thread every
+        BACKFILL_CHECKPOINT_SECONDS and once at the end.
+        """
+        domain, source, dataset, discriminator = recipe.domain, recipe.source, recipe.dataset, recipe.discriminator or ""
+        floors = self.ops_service.get_backfill_floor_dates(domain, source, dataset, discriminator)
+        earliest = self.ops_service.get_earliest_bronze_from_dates(domain, source, dataset, discriminator)
+        self._backfill_caches[id(recipe)] = {t: (floors.get(t), earliest.get(t)) for t in floors.keys() | earliest.keys()}
+
+        self.logger.info(
+            f"Backward fill for {len(reqs)} tickers concurrently (workers={self.concurrent_requests}) | dataset={dataset}",
+            run_id=self.run.run_id,
+        )
+        try:
+            with ThreadPoolExecutor(max_workers=self.concurrent_requests, thread_name_prefix="bronze-backfill") as pool:
+                pending = {pool.submit(self._run_backward_fill_loop, req, True): req for req in reqs}
+                while pending:
+                    done, _ = wait(pending, timeout=BACKFILL_CHECKPOINT_SECONDS)
+                    for future in done:
+                        request = pending.pop(future)
+                        try:
+                            future.result()
+                        except Exception as exc:
+                            self.logger.error(f"Worker exception for {request.msg}: {exc}", run_id=self.run.run_id)
+                    self._flush_backfill_checkpoints()
+        finally:
+            self._backfill_caches.pop(id(recipe), None)
+            self._flush_backfill_checkpoints()
+
     def _process_paginated_recipe(self, recipe: DatasetRecipe) -> None:
         """Process a non-ticker recipe that paginates via an incrementing query param.
 
         Loops from 0 upward, overriding recipe.paginate_param on each request.
         Stops when the response is empty.  Each non-empty response is persisted
         as a separate Bronze file.  The cadence/watermark gate runs once (part=0);
-        subsequent parts are always fetched within the same run.
+        subsequent parts are always fetched within the same run.  With
+        recipe.prefetch_pages = K the next K parts are fetched concurrently.
         """
         domain, source, dataset, discriminator = (
             recipe.domain, recipe.source, recipe.dataset, recipe.discriminator or "",
@@ -441,95 +870,98 @@ class BronzeService:
         else:
             from_date = self._force_from_date
 
-        part = 0
-        while True:
-            req = RunRequest.from_recipe(
-                recipe=recipe,
-                run_id=self.run.run_id,
-                from_date=from_date,
-                today=self.run.today,
-                api_key=self.fmp_api_key if recipe.source == FMP_DATA_SOURCE else None,
-            )
-            req.query_vars[recipe.paginate_param] = part
-
-            result = BronzeResult(now=self.universe.now(), request=req)
-
-            try:
-                _req = req  # capture for lambda
-                response = self.request_executor.execute(
-                    lambda r=_req: requests.get(r.url, params=r.query_vars, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT)),
-                    f"GET {req.url} {recipe.paginate_param}={part}",
-                )
-                result.add_response(response)
-            except requests.Timeout:
-                self._result_bronze_error(result, f"Connection to {req.url} timed out.")
-                break
-            except requests.ConnectionError:
-                self._result_bronze_error(result, f"Connection to {req.url} failed.")
-                break
-            except requests.RequestException as e:
-                self._result_bronze_error(result, f"Request to {req.url} failed: {e}")
-                break
-            except Exception as e:
-                self._result_bronze_error(result, f"Unexpected error: {e}")
-                break
-
-            # Empty content signals end of pages
-            if not result.content:
-                self.logger.info(
-                    f"Paginated {dataset}: empty response at {recipe.paginate_param}={part} — complete",
-                    run_id=self.run.run_id,
-                )
-                break
-
-            if not result.is_valid_bronze:
-                self._result_bronze_error(result, f"Failed bronze acceptance at {recipe.paginate_param}={part}: {result.error}")
-                break
+        # Keep up to prefetch_pages requests in flight; pages are still accepted and
+        # persisted strictly in order, and anything past the first empty page is dropped.
+        prefetch = max(1, recipe.prefetch_pages or 1)
+        pool = ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="bronze-page")
+        window: deque[Future] = deque()
+        try:
+            window.extend(pool.submit(self._fetch_page, recipe, from_date, p) for p in range(prefetch))
+            next_part = prefetch
+            part = 0
+            while window:
+                result, error = window.popleft().result()
+                if not self._accept_page(recipe, result, error, part):
+                    break
+                window.append(pool.submit(self._fetch_page, recipe, from_date, next_part))
+                next_part += 1
+                part += 1
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+            # Pages fetched past the last accepted one are dropped with their spools.
+            for future in window:
+                if not future.cancelled():
+                    future.result()[0].release_content()
+
+    def _fetch_page(self, recipe: DatasetRecipe, from_date: str, part: int) -> tuple[BronzeResult, Exception | None]:
+        """Fetch one page of a paginated recipe; errors are returned, not raised, so they surface in order."""
+        req = RunRequest.from_recipe(
+            recipe=recipe,
+            run_id=self.run.run_id,
+            from_date=from_date,
+            today=self.run.today,
+            api_key=self.fmp_api_key if recipe.source == FMP_DATA_SOURCE else None,
+        )
+        req.query_vars[recipe.paginate_param] = part
 
-            filename = self._persist_bronze_file_only(result)
-            self.run.result_bronze_pass(result, filename=filename)
+        result = BronzeResult(now=self.universe.now(), request=req)
+        try:
+            self.request_executor.execute(self._fetcher(result), f"GET {req.url} {recipe.paginate_param}={part}", source=recipe.source)
+        except Exception as e:
+            return result, e
+        return result, None
+
+    def _accept_page(self, recipe: DatasetRecipe, result: BronzeResult, error: Exception | None, part: int) -> bool:
+        """Persist a fetched page; return False when pagination should stop."""
+        dataset = recipe.dataset
+        url = result.request.url
+        if isinstance(error, QuotaExhausted):
+            self._yield_to_quota(error, result.msg)
+            return False
+        if isinstance(error, requests.Timeout):
+            self._result_bronze_error(result, f"Connection to {url} timed out.")
+            return False
+        if isinstance(error, requests.ConnectionError):
+            self._result_bronze_error(result, f"Connection to {url} failed.")
+            return False
+        if isinstance(error, requests.RequestException):
+            self._result_bronze_error(result, f"Request to {url} failed: {error}")
+            return False
+        if error is not None:
+            self._result_bronze_error(result, f"Unexpected error: {error}")
+            return False
+
+        # Empty content signals end of pages
+        if not result.content:
+            result.release_content()
             self.logger.info(
-                f"Paginated {dataset}: persisted {recipe.paginate_param}={part} | rows={len(result.content)}",
+                f"Paginated {dataset}: empty response at {recipe.paginate_param}={part} — complete",
                 run_id=self.run.run_id,
             )
-            part += 1
+            return False
 
-        self._flush_manifest_inserts()
+        if not result.is_valid_bronze:
+            self._result_bronze_error(result, f"Failed bronze acceptance at {recipe.paginate_param}={part}: {result.error}")
+            return False
+
+        filename = self._persist_bronze_file_only(result)
+        self.run.result_bronze_pass(result, filename=filename)
+        self.logger.info(
+            f"Paginated {dataset}: persisted {recipe.paginate_param}={part} | rows={len(result.content)}",
+            run_id=self.run.run_id,
+        )
+        return True
 
     def _process_dataset_recipe(self, recipe: DatasetRecipe):
         """Process a recipe for each ticker, or once if not ticker-based."""
         if recipe.is_ticker_based:
-            # Pre-load ingestion watermarks for all tickers in one query before entering the
-            # concurrent loop.  This replaces N×2 serialized per-ticker full-table scans (all
-            # serialized through _conn_lock) with a single GROUP BY query, eliminating the
-            # primary cause of the apparent hang on large universes.
-            if not self._backfill_to_1990 and not self._force_from_date:
-                self._watermarks_cache = self.ops_service.get_bulk_ingestion_watermarks(
-                    domain=recipe.domain,
-                    source=recipe.source,
-                    dataset=recipe.dataset,
-                    discriminator=recipe.discriminator or "",
-                )
-
-            # Build all requests upfront.
-            # Pass universe.today() as the wall-clock injestion_date and run.today
-            # as to_date so that an eod_date override sets __to__ without corrupting
-            # the injestion_date used by canRun() and manifest tracking.
-            reqs = [
-                RunRequest.from_recipe(
-                    recipe=recipe,
-                    run_id=self.run.run_id,
-                    from_date=self.universe.from_date,
-                    today=self.universe.today().isoformat(),
-                    to_date=self.run.today,
-                    api_key=self.fmp_api_key if recipe.source == FMP_DATA_SOURCE else None,
-                    ticker=ticker,
-                )
-                for ticker in self.run.tickers
-            ]
+            reqs = self._build_ticker_requests(recipe)
 
             try:
-                if self._backfill_to_1990:
+                if self._backfill_to_1990 and self.concurrent_requests > 1:
+                    # Tickers in parallel; each ticker's pages stay ordered on one worker.
+                    self._run_backward_fill_concurrent(recipe, reqs)
+                elif self._backfill_to_1990:
                     # Backward fill runs sequentially per ticker (order matters).
                     # _run_backward_fill_loop calls _persist_bronze directly (needs
                     # immediate manifest for floor-date tracking), so no flush needed.
@@ -550,40 +982,220 @@ class BronzeService:
                 # _run_backward_fill_loop is excluded above (no-op flush is harmless).
                 self._flush_manifest_inserts()
             finally:
-                self._watermarks_cache = None
+                self._release_recipe_caches(recipe)
         else:
             # Non-ticker recipes: use paginated loop if recipe declares paginate_param
             if recipe.paginate_param and not self._backfill_to_1990:
                 self._process_paginated_recipe(recipe)
             else:
-                req = RunRequest.from_recipe(
-                    recipe=recipe,
-                    run_id=self.run.run_id,
-                    from_date=self.universe.from_date,
-                    today=self.universe.today().isoformat(),
-                    to_date=self.run.today,
-                    api_key=self.fmp_api_key if recipe.source == FMP_DATA_SOURCE else None,
-                )
-                if self._backfill_to_1990:
-                    self._run_backward_fill_loop(req)
-                else:
-                    self._process_run_request(req)
-                self._flush_manifest_inserts()
+                try:
+                    req = self._build_single_request(recipe)
+                    if self._backfill_to_1990:
+                        self._run_backward_fill_loop(req)
+                    else:
+                        self._process_run_request(req)
+                finally:
+                    self._release_recipe_caches(recipe)
+            self._flush_manifest_inserts()
+
+    def _build_ticker_requests(self, recipe: DatasetRecipe) -> list[RunRequest]:
+        """Pre-load the recipe's watermarks and build one request per run ticker."""
+        # Pre-load ingestion watermarks for all tickers in one query before entering the
+        # concurrent loop.  This replaces N×2 serialized per-ticker full-table scans (all
+        # serialized through _conn_lock) with a single GROUP BY query, eliminating the
+        # primary cause of the apparent hang on large universes.
+        if not self._backfill_to_1990 and not self._force_from_date:
+            self._watermarks_caches[id(recipe)] = self.ops_service.get_bulk_ingestion_watermarks(
+                domain=recipe.domain,
+                source=recipe.source,
+                dataset=recipe.dataset,
+                discriminator=recipe.discriminator or "",
+            )
+        self._preload_payload_hashes(recipe)
+
+        # Build all requests upfront.
+        # Pass universe.today() as the wall-clock injestion_date and run.today
+        # as to_date so that an eod_date override sets __to__ without corrupting
+        # the injestion_date used by canRun() and manifest tracking.
+        return [
+            RunRequest.from_recipe(
+                recipe=recipe,
+                run_id=self.run.run_id,
+                from_date=self.universe.from_date,
+                today=self.universe.today().isoformat(),
+                to_date=self.run.today,
+                api_key=self.fmp_api_key if recipe.source == FMP_DATA_SOURCE else None,
+                ticker=ticker,
+            )
+            for ticker in self.run.tickers
+        ]
+
+    def _build_single_request(self, recipe: DatasetRecipe) -> RunRequest:
+        self._preload_payload_hashes(recipe)
+        return RunRequest.from_recipe(
+            recipe=recipe,
+            run_id=self.run.run_id,
+            from_date=self.universe.from_date,
+            today=self.universe.today().isoformat(),
+            to_date=self.run.today,
+            api_key=self.fmp_api_key if recipe.source == FMP_DATA_SOURCE else None,
+        )
+
+    def _recipe_tasks(self, recipe: DatasetRecipe) -> list[tuple[str, typing.Callable[[], None]]]:
+        """Flatten a recipe into independent work-queue tasks."""
+        if recipe.is_ticker_based:
+            return [(request.msg, functools.partial(self._process_queued_request, request)) for request in self._build_ticker_requests(recipe)]
+        if recipe.paginate_param:
+            # Pages are fetched until the first empty one, so the loop stays a single task.
+            return [(recipe.msg, functools.partial(self._process_paginated_recipe, recipe))]
+        request = self._build_single_request(recipe)
+        return [(request.msg, functools.partial(self._process_queued_request, request))]
+
+    def _process_recipes_queued(self, recipes: list[DatasetRecipe]) -> None:
+        """Run ``recipes`` through one run-wide work queue.
+
+        Recipes are prioritized in registration order, except that paginated recipes
+        go first: each is one long sequential task and would otherwise become the
+        run's tail.  Manifests are flushed per recipe as soon as its last task ends.
+        """
+        work_queue: BronzeWorkQueue[DatasetRecipe] = BronzeWorkQueue(self.concurrent_requests, self.logger, self.run.run_id)
+        total = 0
+        for index, recipe in enumerate(recipes):
+            try:
+                tasks = self._recipe_tasks(recipe)
+            except Exception as e:
+                self._release_recipe_caches(recipe)
+                self.logger.error(f"run recipe failure: {e}", run_id=self.run.run_id)
+                continue
+            priority = (0 if recipe.paginate_param and not recipe.is_ticker_based else 1, index)
+            work_queue.add_group(recipe, tasks, priority=priority)
+            total += len(tasks)
+
+        self.logger.info(
+            f"Processing {total} tasks from {len(recipes)} recipes on a shared queue (workers={self.concurrent_requests})",
+            run_id=self.run.run_id,
+        )
+        work_queue.run(on_group_complete=self._finish_queued_recipe)
+
+    def _process_recipes_on_event_loop(self, recipes: list[DatasetRecipe]) -> None:
+        """Run ``recipes`` on one event loop with up to ``concurrent_requests`` requests in flight."""
+        engine: AsyncFetchEngine[DatasetRecipe] = AsyncFetchEngine(self.concurrent_requests, self.logger, self.run.run_id)
+        total = 0
+        for recipe in recipes:
+            try:
+                requests = self._build_ticker_requests(recipe) if recipe.is_ticker_based else [self._build_single_request(recipe)]
+            except Exception as e:
+                self._release_recipe_caches(recipe)
+                self.logger.error(f"run recipe failure: {e}", run_id=self.run.run_id)
+                continue
+            engine.add_group(recipe, [(request.msg, functools.partial(self._process_request_async, engine.client, request)) for request in requests])
+            total += len(requests)
+
+        self.logger.info(
+            f"Processing {total} requests from {len(recipes)} recipes on the event loop (in flight={self.concurrent_requests})",
+            run_id=self.run.run_id,
+        )
+        try:
+            engine.run(on_group_complete=self._finish_queued_recipe)
+        finally:
+            self.run.record_http_requests(*engine.client.stats())
+
+    def _runs_on_event_loop(self, recipe: DatasetRecipe) -> bool:
+        """Whether the asyncio engine can fetch ``recipe``.
+
+        The event loop's client reads whole JSON bodies, so streamed bodies (CSV, raw
+        storage), conditional requests, hedged sources and the sequential page loop
+        all stay on the thread engine.
+        """
+        return (
+            self.fetch_engine == FETCH_ENGINE_ASYNCIO
+            and not recipe.paginate_param
+            and recipe.bronze_storage == BRONZE_STORAGE_PARSED
+            and recipe.query_vars.get("datatype") != "csv"
+            and self.validator_cache is None
+            and recipe.source not in self.hedge_policy.hedge_sources
+        )
+
+    def _finish_queued_recipe(self, recipe: DatasetRecipe) -> None:
+        self._release_recipe_caches(recipe)
+        self._flush_manifest_inserts(recipe)
 
     def process(self, run: RunContext) -> RunContext:
         """Run registered recipes, updating and returning the summary."""
         self.run = run
         self.request_executor.set_summary(self.run)
+        self._resume_from_journal()
+
+        if self._uses_work_queue:
+            on_loop = [recipe for recipe in self.recipes if self._runs_on_event_loop(recipe)]
+            on_threads = [recipe for recipe in self.recipes if not self._runs_on_event_loop(recipe)]
+            if on_loop:
+                self._process_recipes_on_event_loop(on_loop)
+            if on_threads:
+                self._process_recipes_queued(on_threads)
+        else:
+            for recipe in self.recipes:
+                try:
+                    self._process_dataset_recipe(recipe)
+                except Exception as e:
+                    # we should never end up here
+                    # todo: add this error to run summary
+                    self.logger.error(f"run recipe failure: {e}", run_id=self.run.run_id)
+
+        self._close_owned_resources()
+
+        return self.run
 
+    def plan(self, run: RunContext) -> RunPlan:
+        """Dry run: expand the registered recipes and apply the fetch gates without any network calls.
+
+        Watermarks come from ops exactly as in a real run, nothing is written, and the
+        counts are projected onto the configured throttle and each dataset's past latency.
+        """
+        self.run = run
+        plan = RunPlan(run_id=run.run_id, concurrent_requests=self.concurrent_requests)
         for recipe in self.recipes:
             try:
-                self._process_dataset_recipe(recipe)
+                if recipe.is_ticker_based:
+                    requests = self._build_ticker_requests(recipe)
+                else:
+                    requests = [self._build_single_request(recipe)]
+                paginated = bool(recipe.paginate_param) and not recipe.is_ticker_based
+                for request in requests:
+                    skip = self._gate_run_request(request)
+                    if paginated and skip != SKIP_DUPLICATE:
+                        # The paginated loop only applies the already-ingested-today gate.
+                        skip = None
+                    plan.add(recipe.source, recipe.dataset, skip, paginated=paginated)
             except Exception as e:
-                # we should never end up here
-                # todo: add this error to run summary
-                self.logger.error(f"run recipe failure: {e}", run_id=self.run.run_id)
+                self.logger.error(f"plan recipe failure: {e}", run_id=run.run_id)
+            finally:
+                self._release_recipe_caches(recipe)
+
+        rate_limiter = RateLimiter()
+        plan.project(rate_limiter.min_seconds, rate_limiter.global_min_seconds, self._planned_latency)
+        self._close_owned_resources()
+        return plan
 
+    def _planned_latency(self, source: str, dataset: str) -> float:
+        samples, seconds = self.ops_service.get_bronze_latency_quantile(source=source, dataset=dataset, quantile=PLAN_LATENCY_QUANTILE)
+        return seconds if samples and seconds is not None else PLAN_DEFAULT_LATENCY_SECONDS
+
+    @property
+    def _uses_work_queue(self) -> bool:
+        """The run-wide queue backs concurrent runs; backfill keeps per-recipe dispatch."""
+        return self.concurrent_requests > 1 and not self._backfill_to_1990
+
+    def _close_owned_resources(self) -> None:
+        """Close the ops connection and HTTP session pool when this service created them."""
+        if self._writer_pool is not None:
+            self._writer_pool.close()
+        if self.quota_manager is not None:
+            try:
+                self.quota_manager.release()
+            except Exception as exc:
+                self.logger.error("API quota release failed: %s", exc, run_id=self.run.run_id)
+        if self._owns_request_executor:
+            self.request_executor.close()
         if self._owns_ops_service:
             self.ops_service.close()
-
-        return self.run
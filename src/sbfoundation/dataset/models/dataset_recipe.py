@@ -28,7 +28,9 @@ class DatasetRecipe(BronzeToSilverDTO):
     discriminator: str | None = None  # an optional discriminator to build deterministic filenames, partitions to avoid collisions
     execution_phase: str = EXECUTION_PHASE_DATA_ACQUISITION  # 'instrument_discovery' or 'data_acquisition'
     paginate_param: str | None = None  # query var key to paginate on (e.g. "part"); loops 0..N until empty response
+    prefetch_pages: int = 1  # paginated recipes only: pages fetched concurrently ahead of the one being persisted
     json_content_key: str | None = None  # if set, extract response.json()[key] as content (e.g. "observations" for FRED)
+    bronze_storage: str = BRONZE_STORAGE_PARSED  # 'parsed', or 'raw'/'raw_gzip' to keep the vendor bytes verbatim
     error: str = None  # error description
 
     # todo: expand recipe metadata to include Bronze/Silver lineage hints from
@@ -60,6 +62,10 @@ class DatasetRecipe(BronzeToSilverDTO):
             self.error = "INVALID EXECUTION PHASE"
             return False
 
+        if self.bronze_storage not in BRONZE_STORAGE_MODES:
+            self.error = "INVALID BRONZE STORAGE"
+            return False
+
         self.error = None
         return True
 
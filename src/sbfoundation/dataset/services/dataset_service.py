@@ -123,7 +123,9 @@ class DatasetService:
                     "discriminator": entry.get("discriminator") or None,
                     "plans": recipe.get("plans"),
                     "paginate_param": recipe.get("paginate_param") or None,
+                    "prefetch_pages": recipe.get("prefetch_pages") or 1,
                     "json_content_key": recipe.get("json_content_key") or None,
+                    "bronze_storage": recipe.get("bronze_storage") or BRONZE_STORAGE_PARSED,
                 }
                 # Only include execution_phase if explicitly set (otherwise use default)
                 if recipe.get("execution_phase"):
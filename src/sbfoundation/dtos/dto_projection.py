@@ -6,12 +6,24 @@ import types
 import typing
 
 import pandas as pd
+from pandas.tseries.api import guess_datetime_format
 
 from sbfoundation.dtos.bronze_to_silver_dto import BronzeToSilverDTO
+from sbfoundation.dtos.projection_plan import PlannedColumn, ProjectionPlan
 from sbfoundation.dataset.models.dataset_schema import DatasetDtoSchema
 
 
 class DTOProjection:
+    """Project raw Bronze frames onto DTO columns through cached ``ProjectionPlan``s.
+
+    A plan is compiled per (schema or DTO type, source columns, ticker override) and
+    reused, so files of the same dataset skip column matching, type-hint parsing and the
+    copy of the raw frame; output columns are read straight from ``df_raw``.
+    """
+
+    def __init__(self) -> None:
+        self._plans: dict[tuple, ProjectionPlan] = {}
+
     def project(
         self,
         df_raw: pd.DataFrame,
@@ -22,70 +34,89 @@ class DTOProjection:
     ) -> pd.DataFrame:
         if df_raw.empty:
             return pd.DataFrame()
-
-        df = df_raw.copy()
-        self._add_snake_case_columns(df)
-
-        output: dict[str, pd.Series] = {}
-        if dto_schema is not None:
-            return self._project_from_schema(df, dto_schema, ticker_override)
-        if dto_type is None:
+        if dto_schema is None and dto_type is None:
             raise ValueError("DTO projection requires either dto_type or dto_schema.")
 
-        for f in fields(dto_type):
-            if not f.init:
-                continue
-            if f.name == "ticker" and ticker_override is not None:
-                output[f.name] = pd.Series([ticker_override] * len(df), index=df.index)
-                continue
-
-            source_series = self._resolve_series(df, f)
-            if source_series is None:
-                output[f.name] = pd.Series([None] * len(df), index=df.index)
-                continue
-
-            output[f.name] = self._coerce_series(source_series, f.type)
-
+        plan = self.plan_for(df_raw, dto_type=dto_type, dto_schema=dto_schema, ticker_override=ticker_override)
+        output: dict[str, pd.Series] = {}
+        for column in plan.columns:
+            if column.ticker_override:
+                output[column.name] = pd.Series([ticker_override] * len(df_raw), index=df_raw.index)
+            elif column.source is None:
+                output[column.name] = self._coerce_kind(pd.Series([None] * len(df_raw), index=df_raw.index), column.kind)
+            else:
+                series = df_raw[column.source]
+                output[column.name] = self._coerce_kind(series, column.kind, plan.date_formats.get(column.source))
         return pd.DataFrame(output)
 
-    @staticmethod
-    def _add_snake_case_columns(df: pd.DataFrame) -> None:
-        for col in list(df.columns):
-            if not isinstance(col, str):
-                continue
-            snake = BronzeToSilverDTO._camel_to_snake(col)
-            if snake and snake not in df.columns:
-                df[snake] = df[col]
+    def plan_for(
+        self,
+        df_raw: pd.DataFrame,
+        *,
+        dto_type: type[BronzeToSilverDTO] | None = None,
+        dto_schema: DatasetDtoSchema | None = None,
+        ticker_override: str | None = None,
+    ) -> ProjectionPlan:
+        """Return the cached plan for ``df_raw``'s columns, compiling it on first use."""
+        key = (dto_schema if dto_schema is not None else dto_type, tuple(df_raw.columns), ticker_override is not None)
+        plan = self._plans.get(key)
+        if plan is None:
+            plan = self._compile_plan(df_raw, dto_type, dto_schema, ticker_override is not None)
+            self._plans[key] = plan
+        return plan
+
+    def _compile_plan(
+        self,
+        df_raw: pd.DataFrame,
+        dto_type: type[BronzeToSilverDTO] | None,
+        dto_schema: DatasetDtoSchema | None,
+        ticker_overridden: bool,
+    ) -> ProjectionPlan:
+        lookup = self._column_lookup(df_raw.columns)
+        columns: list[PlannedColumn] = []
+        if dto_schema is not None:
+            for column in dto_schema.columns:
+                source = next((lookup[c] for c in self._candidate_columns(column.name, column.api) if c in lookup), None)
+                kind = self._schema_kind(column.type)
+                columns.append(PlannedColumn(column.name, source, kind, ticker_overridden and column.name == "ticker"))
+        else:
+            for f in fields(dto_type):
+                if not f.init:
+                    continue
+                api_key = f.metadata.get("api", f.name)
+                candidates = [api_key, BronzeToSilverDTO._camel_to_snake(api_key) if isinstance(api_key, str) else None, f.name]
+                source = next((lookup[c] for c in candidates if c is not None and c in lookup), None)
+                # A field without a source column stays all-None, uncoerced.
+                kind = self._type_kind(f.type) if source is not None else ""
+                columns.append(PlannedColumn(f.name, source, kind, ticker_overridden and f.name == "ticker"))
+
+        date_formats: dict[typing.Hashable, str] = {}
+        for column in columns:
+            if column.kind in {"date", "datetime"} and column.source is not None and not column.ticker_override:
+                sample = self._first_date_text(df_raw[column.source])
+                fmt = guess_datetime_format(sample) if sample is not None else None
+                if fmt:
+                    date_formats[column.source] = fmt
+        return ProjectionPlan(columns=tuple(columns), date_formats=date_formats)
 
     @staticmethod
-    def _resolve_series(df: pd.DataFrame, f) -> pd.Series | None:
-        api_key = f.metadata.get("api", f.name)
-        if api_key in df.columns:
-            return df[api_key]
-        snake_api = BronzeToSilverDTO._camel_to_snake(api_key) if isinstance(api_key, str) else None
-        if snake_api and snake_api in df.columns:
-            return df[snake_api]
-        if f.name in df.columns:
-            return df[f.name]
-        return None
-
-    def _project_from_schema(
-        self,
-        df: pd.DataFrame,
-        schema: DatasetDtoSchema,
-        ticker_override: str | None,
-    ) -> pd.DataFrame:
-        output: dict[str, pd.Series] = {}
-        for column in schema.columns:
-            if column.name == "ticker" and ticker_override is not None:
-                output[column.name] = pd.Series([ticker_override] * len(df), index=df.index)
+    def _column_lookup(source_columns: typing.Iterable[typing.Hashable]) -> dict[typing.Hashable, typing.Hashable]:
+        """Map every source column, plus a snake_case alias of each camelCase one, to the real column.
+
+        An alias never shadows a real column of the same name, and the frame is not copied.
+        """
+        lookup = {name: name for name in source_columns}
+        for name in list(lookup):
+            if not isinstance(name, str):
                 continue
+            snake = BronzeToSilverDTO._camel_to_snake(name)
+            if snake and snake not in lookup:
+                lookup[snake] = name
+        return lookup
 
-            source_series = self._resolve_column_by_name(df, column.name, api_name=column.api)
-            output[column.name] = self._coerce_schema_series(source_series, column.type)
-        return pd.DataFrame(output)
-
-    def _resolve_column_by_name(self, df: pd.DataFrame, name: str, api_name: str | None = None) -> pd.Series:
+    @staticmethod
+    def _candidate_columns(name: str, api_name: str | None = None) -> list[str]:
+        """Source column names a schema column may come from, in priority order."""
         candidates: list[str] = []
 
         # If api_name is provided, check it first (highest priority)
@@ -103,32 +134,71 @@ class DTOProjection:
         snake = BronzeToSilverDTO._camel_to_snake(name)
         if snake and snake not in candidates:
             candidates.append(snake)
+        return candidates
 
-        for candidate in candidates:
-            if candidate in df.columns:
-                return df[candidate]
-        return pd.Series([None] * len(df), index=df.index)
+    @classmethod
+    def _schema_kind(cls, type_hint: str) -> str:
+        target = cls._normalize_type_hint(type_hint)
+        if target in {"int", "int64", "bigint"}:
+            return "int"
+        if target in {"date", "datetime.date"}:
+            return "date"
+        if target in {"datetime", "datetime.datetime"}:
+            return "datetime"
+        if target in {"str", "float", "bool", "list", "dict"}:
+            return target
+        return ""
 
-    def _coerce_schema_series(self, series: pd.Series, type_hint: str) -> pd.Series:
-        target = self._normalize_type_hint(type_hint)
-        if target == "str":
+    def _coerce_kind(self, series: pd.Series, kind: str, date_format: str | None = None) -> pd.Series:
+        if kind == "str":
             return series.where(series.notna(), "").astype(str)
-        if target in {"int", "int64", "bigint"}:
+        if kind == "int":
             return pd.to_numeric(series, errors="coerce").round().astype("Int64")
-        if target == "float":
+        if kind == "float":
             return pd.to_numeric(series, errors="coerce").astype("float64")
-        if target == "bool":
+        if kind == "bool":
             return series.map(self._coerce_bool)
-        if target in {"date", "datetime.date"}:
-            return pd.to_datetime(series, errors="coerce").dt.normalize()
-        if target in {"datetime", "datetime.datetime"}:
-            return pd.to_datetime(series, errors="coerce")
-        if target == "list":
+        if kind == "date":
+            return self._to_datetime(series, date_format).dt.normalize()
+        if kind == "datetime":
+            return self._to_datetime(series, date_format)
+        if kind == "list":
             return series.map(lambda v: [] if self._is_na(v) else (v if isinstance(v, list) else [v]))
-        if target == "dict":
+        if kind == "dict":
             return series.map(lambda v: {} if self._is_na(v) else (v if isinstance(v, dict) else {}))
         return series
 
+    @classmethod
+    def _to_datetime(cls, series: pd.Series, date_format: str | None) -> pd.Series:
+        """``pd.to_datetime`` with the plan's format when this file's first date still matches it.
+
+        pandas would infer the format from that same first value, so the result is unchanged;
+        a file in another format falls back to inference.
+        """
+        if date_format is not None and series.dtype == object:
+            sample = cls._first_date_text(series)
+            if sample is not None:
+                try:
+                    datetime.strptime(sample, date_format)
+                except ValueError:
+                    pass
+                else:
+                    return pd.to_datetime(series, format=date_format, errors="coerce")
+        return pd.to_datetime(series, errors="coerce")
+
+    @staticmethod
+    def _first_date_text(series: pd.Series) -> str | None:
+        """First non-empty string in ``series``: the value pandas infers a date format from."""
+        if series.dtype != object:
+            return None
+        for value in series:
+            if isinstance(value, str):
+                if value.strip():
+                    return value
+            elif not DTOProjection._is_na(value):
+                return None
+        return None
+
     @staticmethod
     def _normalize_type_hint(value: str) -> str:
         if not value:
@@ -138,34 +208,18 @@ class DTOProjection:
             normalized = normalized.split("|")[0].strip()
         return normalized
 
-    def _coerce_series(self, series: pd.Series, target_type: typing.Any) -> pd.Series:
-        resolved = self._resolve_target_type(target_type)
-
-        if resolved is str:
-            return series.where(series.notna(), "").astype(str)
-
-        if resolved is int:
-            return pd.to_numeric(series, errors="coerce").round().astype("Int64")
-
-        if resolved is float:
-            return pd.to_numeric(series, errors="coerce").astype("float64")
-
-        if resolved is bool:
-            return series.map(self._coerce_bool)
-
-        if resolved is date:
-            return pd.to_datetime(series, errors="coerce").dt.normalize()
-
-        if resolved is datetime:
-            return pd.to_datetime(series, errors="coerce")
-
+    @classmethod
+    def _type_kind(cls, target_type: typing.Any) -> str:
+        resolved = cls._resolve_target_type(target_type)
+        for python_type, kind in ((str, "str"), (int, "int"), (float, "float"), (bool, "bool"), (date, "date"), (datetime, "datetime")):
+            if resolved is python_type:
+                return kind
         origin = typing.get_origin(resolved)
         if origin is list:
-            return series.map(lambda v: [] if self._is_na(v) else (v if isinstance(v, list) else [v]))
+            return "list"
         if origin is dict:
-            return series.map(lambda v: {} if self._is_na(v) else (v if isinstance(v, dict) else {}))
-
-        return series
+            return "dict"
+        return ""
 
     @staticmethod
     def _resolve_target_type(target_type: typing.Any) -> typing.Any:
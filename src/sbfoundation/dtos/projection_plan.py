@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import typing
+
+
+@dataclass(frozen=True)
+class PlannedColumn:
+    name: str  # output (Silver) column
+    source: typing.Hashable | None  # Bronze column it is read from; None when the payload has no match
+    kind: str  # coercion: str | int | float | bool | date | datetime | list | dict | "" (kept as is)
+    ticker_override: bool = False  # filled with the caller's ticker_override instead of a source column
+
+
+@dataclass(frozen=True)
+class ProjectionPlan:
+    """Output columns of one DTO projection, resolved against one set of Bronze columns.
+
+    Built by ``DTOProjection`` the first time it sees a (schema, source columns) pair and
+    reused for every later file with the same columns, so column matching and type-hint
+    parsing happen once per dataset rather than once per file.
+    """
+
+    columns: tuple[PlannedColumn, ...]
+    date_formats: typing.Mapping[typing.Hashable, str] = field(default_factory=dict)  # source column -> strptime format seen when planned
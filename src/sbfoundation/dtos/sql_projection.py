@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import typing
+
+from sbfoundation.dtos.dto_projection import DTOProjection
+from sbfoundation.dataset.models.dataset_schema import DatasetDtoSchema
+
+_NUMERIC_TYPES = {"TINYINT", "SMALLINT", "INTEGER", "BIGINT", "HUGEINT", "UTINYINT", "USMALLINT", "UINTEGER", "UBIGINT", "FLOAT", "DOUBLE"}
+_TRUE_TOKENS = "('true', 't', '1', 'yes', 'y')"
+
+
+class SqlProjection:
+    """Compile a keymap ``dto_schema`` into DuckDB select expressions.
+
+    The SQL counterpart of ``DTOProjection.project`` with a ``dto_schema``: columns are resolved
+    the same way (api name, then snake/camel variants) and coerced to the same types, but
+    DuckDB evaluates them over the Bronze relation so rows never become Python objects.
+    Schemas with ``list``/``dict`` columns cannot be expressed and compile to ``None``.
+    """
+
+    def compile(
+        self,
+        schema: DatasetDtoSchema,
+        source_columns: typing.Mapping[str, str],
+        ticker_override: str | None = None,
+    ) -> dict[str, str] | None:
+        """Return {silver column: SQL expression} over ``source_columns`` ({name: DuckDB type})."""
+        lookup = DTOProjection._column_lookup(source_columns)
+        output: dict[str, str] = {}
+        for column in schema.columns:
+            target = DTOProjection._normalize_type_hint(column.type)
+            if target in {"list", "dict"}:
+                return None
+            if column.name == "ticker" and ticker_override is not None:
+                output[column.name] = self.literal(ticker_override)
+                continue
+
+            source = next((lookup[c] for c in DTOProjection._candidate_columns(column.name, column.api) if c in lookup), None)
+            if source is None:
+                output[column.name] = self._coerce("NULL", "", target)
+            else:
+                output[column.name] = self._coerce(self.quote_ident(source), source_columns[source], target)
+        return output
+
+    @staticmethod
+    def _coerce(expr: str, source_type: str, target: str) -> str:
+        if target == "str":
+            return f"COALESCE(CAST({expr} AS VARCHAR), '')"
+        if target in {"int", "int64", "bigint"}:
+            return f"TRY_CAST(ROUND_EVEN(TRY_CAST({expr} AS DOUBLE), 0) AS BIGINT)"
+        if target == "float":
+            return f"TRY_CAST({expr} AS DOUBLE)"
+        if target == "bool":
+            if source_type == "BOOLEAN":
+                return f"COALESCE({expr}, FALSE)"
+            if source_type in _NUMERIC_TYPES or source_type.startswith("DECIMAL"):
+                return f"COALESCE(TRUNC(CAST({expr} AS DOUBLE)) <> 0, FALSE)"
+            if source_type == "VARCHAR":
+                return f"COALESCE(lower(trim({expr})) IN {_TRUE_TOKENS}, FALSE)"
+            return "FALSE"
+        if target in {"date", "datetime.date"}:
+            return f"CAST(date_trunc('day', TRY_CAST({expr} AS TIMESTAMP)) AS TIMESTAMP_NS)"
+        if target in {"datetime", "datetime.datetime"}:
+            return f"CAST(TRY_CAST({expr} AS TIMESTAMP) AS TIMESTAMP_NS)"
+        return expr
+
+    @staticmethod
+    def quote_ident(name: str) -> str:
+        return '"' + name.replace('"', '""') + '"'
+
+    @staticmethod
+    def literal(value: str) -> str:
+        return "'" + value.replace("'", "''") + "'"
@@ -47,6 +47,8 @@ class EodService(BulkPipelineService):
             )
             if self._enable_bronze:
                 run = self._process_recipe_list(recipes, run)
+            else:
+                self._plan_recipe_list(recipes, run)
             run = self._promote_silver(run, EOD_DOMAIN)
             self._logger.info("EOD bulk domain complete", run_id=run.run_id)
         finally:
@@ -28,6 +28,10 @@ class Folders:
     def logs_absolute_path() -> Path:
         return Folders._data_root() / LOG_FOLDER
 
+    @staticmethod
+    def run_journal_absolute_path(run_id: str) -> Path:
+        return Folders._data_root() / RUN_JOURNAL_FOLDER / f"{run_id}.jsonl"
+
     @staticmethod
     def dataset_keymap_absolute_path() -> Path:
         return Folders._repo_root() / DATASET_KEYMAP_FOLDER
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import gzip
+import json
+from pathlib import Path
+import typing
+
+import duckdb
+import pandas as pd
+
+from sbfoundation.run.dtos.spooled_rows import SpooledRows
+from sbfoundation.settings import *
+
+Rows = typing.Union[list[dict[str, typing.Any]], SpooledRows]
+
+# Stand-in for streamed content while the envelope is serialized; must not collide with real field values.
+_CONTENT_PLACEHOLDER = "\u0000sbfoundation-spooled-content\u0000"
+_ENVELOPE_KEY = "sbfoundation.envelope"
+
+
+class BronzeCodec(ABC):
+    """On-disk encoding of a parsed Bronze payload: the request/response envelope plus its rows.
+
+    ``write`` is handed the ``.json`` path derived from the request and returns the path
+    actually written, which carries the codec's extension.  ``read`` returns the envelope
+    dict with the rows under ``"content"``, i.e. the shape of the original JSON files.
+    """
+
+    name: str
+    extension: str
+
+    def path_for(self, json_path: Path) -> Path:
+        return json_path.with_name(json_path.name[: -len(".json")] + self.extension) if json_path.name.endswith(".json") else json_path
+
+    @abstractmethod
+    def write(self, json_path: Path, envelope: dict[str, typing.Any], rows: Rows) -> Path: ...
+
+    @abstractmethod
+    def read(self, path: Path) -> dict[str, typing.Any]: ...
+
+
+class JsonBronzeCodec(BronzeCodec):
+    """The original format: one pretty-printed JSON document per request."""
+
+    name = BRONZE_CODEC_JSON
+    extension = ".json"
+
+    def write(self, json_path: Path, envelope: dict[str, typing.Any], rows: Rows) -> Path:
+        path = self.path_for(json_path)
+        if not isinstance(rows, SpooledRows):
+            envelope["content"] = rows
+            path.write_bytes(json.dumps(envelope, ensure_ascii=False, indent=2, sort_keys=True).encode("utf-8"))
+            return path
+
+        # Streamed rows are copied into "content" straight from the spool.
+        envelope["content"] = _CONTENT_PLACEHOLDER
+        text = json.dumps(envelope, ensure_ascii=False, indent=2, sort_keys=True)
+        head, tail = text.split(json.dumps(_CONTENT_PLACEHOLDER), 1)
+        with path.open("wb") as fh:
+            fh.write(head.encode("utf-8"))
+            fh.write(b"[\n")
+            rows.write_json_array(fh)
+            fh.write(b"\n]" if rows else b"]")
+            fh.write(tail.encode("utf-8"))
+        return path
+
+    def read(self, path: Path) -> dict[str, typing.Any]:
+        with path.open("r", encoding="utf-8") as fh:
+            return json.load(fh)
+
+
+class JsonlGzipBronzeCodec(BronzeCodec):
+    """Gzipped JSON Lines: the envelope on the first line, then one compact row per line.
+
+    Payloads that are not row lists are kept inline in the envelope's ``"content"``.
+    """
+
+    name = BRONZE_CODEC_JSONL_GZIP
+    extension = ".jsonl.gz"
+
+    def write(self, json_path: Path, envelope: dict[str, typing.Any], rows: Rows) -> Path:
+        path = self.path_for(json_path)
+        if isinstance(rows, (list, SpooledRows)):
+            envelope.pop("content", None)
+        else:
+            # Non-row payloads (error text, vendor error dicts) stay inline in the envelope.
+            envelope["content"] = rows
+            rows = []
+        with gzip.open(path, "wb") as fh:
+            fh.write(json.dumps(envelope, ensure_ascii=False, sort_keys=True).encode("utf-8"))
+            if rows:
+                fh.write(b"\n")
+                if isinstance(rows, SpooledRows):
+                    rows.write_json_array(fh, separator=b"\n")
+                else:
+                    fh.write(b"\n".join(_row_json(row).encode("utf-8") for row in rows))
+            fh.write(b"\n")
+        return path
+
+    def read(self, path: Path) -> dict[str, typing.Any]:
+        with gzip.open(path, "rt", encoding="utf-8") as fh:
+            envelope = json.loads(fh.readline())
+            rows = [json.loads(line) for line in fh if line.strip()]
+        if "content" not in envelope:
+            envelope["content"] = rows
+        return envelope
+
+
+class ParquetBronzeCodec(BronzeCodec):
+    """zstd-compressed Parquet with the envelope stored in the file's key/value metadata.
+
+    Only flat payloads with one scalar type per column are columnar; nested or mixed
+    payloads (and empty ones, which have no schema) fall back to ``JsonlGzipBronzeCodec``.
+    Round-tripping normalizes rows to the DataFrame view Silver already takes: a key
+    missing from some rows reads back as ``None``.  Integer columns stay integers
+    (nullable ``Int64``), even when some rows have no value.
+
+    Rows are typed in one pass and then staged ``BRONZE_PARQUET_ROW_GROUP_SIZE`` at a
+    time, so streamed ``SpooledRows`` are never materialized as one list.
+    """
+
+    name = BRONZE_CODEC_PARQUET
+    extension = ".parquet"
+
+    def __init__(self, fallback: BronzeCodec | None = None) -> None:
+        self._fallback = fallback or JsonlGzipBronzeCodec()
+
+    def write(self, json_path: Path, envelope: dict[str, typing.Any], rows: Rows) -> Path:
+        columns = self.column_types(rows) if isinstance(rows, (list, SpooledRows)) else None
+        if columns is None:
+            return self._fallback.write(json_path, envelope, rows)
+
+        path = self.path_for(json_path)
+        envelope.pop("content", None)
+        metadata = json.dumps(envelope, ensure_ascii=False, sort_keys=True).replace("'", "''")
+        target = str(path).replace("'", "''")
+        names = list(columns)
+        dtypes = {name: _PANDAS_DTYPES[sql_type] for name, sql_type in columns.items()}
+        conn = duckdb.connect()
+        try:
+            conn.execute("CREATE TABLE bronze_rows (" + ", ".join(f"{_quote_ident(name)} {sql_type}" for name, sql_type in columns.items()) + ")")
+            for batch in _batches(rows, BRONZE_PARQUET_ROW_GROUP_SIZE):
+                conn.register("bronze_batch", pd.DataFrame.from_records(batch, columns=names).astype(dtypes))
+                conn.execute("INSERT INTO bronze_rows SELECT * FROM bronze_batch")
+                conn.unregister("bronze_batch")
+            conn.execute(
+                f"COPY bronze_rows TO '{target}' "
+                f"(FORMAT PARQUET, COMPRESSION ZSTD, ROW_GROUP_SIZE {BRONZE_PARQUET_ROW_GROUP_SIZE}, "
+                f"KV_METADATA {{'{_ENVELOPE_KEY}': '{metadata}'}})"
+            )
+        finally:
+            conn.close()
+        return path
+
+    def read(self, path: Path) -> dict[str, typing.Any]:
+        conn = duckdb.connect()
+        try:
+            meta = conn.execute("SELECT key, value FROM parquet_kv_metadata(?)", [str(path)]).fetchall()
+            relation = conn.read_parquet(str(path))
+            integer_columns = [name for name, sql_type in zip(relation.columns, relation.types) if str(sql_type) in _INTEGER_TYPES]
+            df = relation.df()
+        finally:
+            conn.close()
+        envelope = next((json.loads(value.decode("utf-8")) for key, value in meta if key.decode("utf-8") == _ENVELOPE_KEY), None)
+        if envelope is None:
+            raise ValueError(f"Parquet file has no Bronze envelope: {path}")
+        # DuckDB hands integer columns with NULLs to pandas as float64; restore them as nullable ints.
+        df = df.astype({name: "Int64" for name in integer_columns})
+        envelope["content"] = df.astype(object).where(df.notna(), None).to_dict("records")
+        return envelope
+
+    @classmethod
+    def is_columnar(cls, rows: typing.Iterable[typing.Any]) -> bool:
+        """True when every row is a dict of scalars and each column holds one type (ints may mix with floats)."""
+        return cls.column_types(rows) is not None
+
+    @staticmethod
+    def column_types(rows: typing.Iterable[typing.Any]) -> dict[str, str] | None:
+        """Map each column, in first-seen order, to its DuckDB type; None when ``rows`` are not columnar."""
+        seen: dict[str, set[type]] = {}
+        empty = True
+        for row in rows:
+            empty = False
+            if not isinstance(row, dict):
+                return None
+            for key, value in row.items():
+                if not isinstance(key, str):
+                    return None
+                types = seen.setdefault(key, set())
+                if value is None:
+                    continue
+                if type(value) not in (str, int, float, bool) or (type(value) is int and not _INT64_MIN <= value <= _INT64_MAX):
+                    return None
+                types.add(type(value))
+        if empty:
+            return None
+        # DuckDB column names are case-insensitive, so "Date" and "date" cannot both be columns.
+        if len({key.lower() for key in seen}) != len(seen):
+            return None
+        columns: dict[str, str] = {}
+        for key, types in seen.items():
+            sql_type = _SQL_TYPES.get(frozenset(types))
+            if sql_type is None:
+                return None
+            columns[key] = sql_type
+        return columns
+
+
+# Scalar types a column may hold -> DuckDB column type; a column that is always null is VARCHAR.
+_SQL_TYPES: dict[frozenset[type], str] = {
+    frozenset(): "VARCHAR",
+    frozenset({str}): "VARCHAR",
+    frozenset({int}): "BIGINT",
+    frozenset({float}): "DOUBLE",
+    frozenset({int, float}): "DOUBLE",
+    frozenset({bool}): "BOOLEAN",
+}
+_PANDAS_DTYPES = {"VARCHAR": object, "BIGINT": "Int64", "DOUBLE": "float64", "BOOLEAN": "boolean"}
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+_INTEGER_TYPES = {"TINYINT", "SMALLINT", "INTEGER", "BIGINT", "UTINYINT", "USMALLINT", "UINTEGER", "UBIGINT"}
+
+
+def _batches(rows: typing.Iterable[typing.Any], size: int) -> typing.Iterator[list[typing.Any]]:
+    batch: list[typing.Any] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _quote_ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _row_json(row: typing.Any) -> str:
+    return json.dumps(row, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+BRONZE_CODEC_REGISTRY: dict[str, BronzeCodec] = {
+    codec.name: codec for codec in (JsonBronzeCodec(), JsonlGzipBronzeCodec(), ParquetBronzeCodec())
+}
+
+
+def get_bronze_codec(name: str) -> BronzeCodec:
+    try:
+        return BRONZE_CODEC_REGISTRY[name]
+    except KeyError:
+        raise ValueError(f"Unknown Bronze codec {name!r}; expected one of {sorted(BRONZE_CODEC_REGISTRY)}") from None
+
+
+def codec_for_path(path: Path) -> BronzeCodec:
+    """Pick the codec that wrote ``path`` from its extension; anything else is read as JSON."""
+    for codec in BRONZE_CODEC_REGISTRY.values():
+        if codec.extension != ".json" and path.name.endswith(codec.extension):
+            return codec
+    return BRONZE_CODEC_REGISTRY[BRONZE_CODEC_JSON]
+
+
+def is_bronze_file(path: Path) -> bool:
+    return any(path.name.endswith(codec.extension) for codec in BRONZE_CODEC_REGISTRY.values())
@@ -8,15 +8,20 @@ import typing
 from sbfoundation.run.dtos.result_mapper import FMPResultMapper
 from sbfoundation.run.dtos.bronze_result import BronzeResult
 from sbfoundation.run.dtos.run_request import RunRequest
+from sbfoundation.run.dtos.raw_payload import RawPayload
+from sbfoundation.run.dtos.spooled_rows import SpooledRows
 from sbfoundation.dataset.models.dataset_recipe import DatasetRecipe
 from sbfoundation.settings import *
+from sbfoundation.infra.bronze_codecs import codec_for_path, get_bronze_codec, is_bronze_file
 from sbfoundation.infra.logger import LoggerFactory
 
 
 class ResultFileAdapter:
 
-    def __init__(self, logger_factory: typing.Optional[LoggerFactory] = None):
+    def __init__(self, logger_factory: typing.Optional[LoggerFactory] = None, codec: str = BRONZE_CODEC):
         self.logger = (logger_factory or LoggerFactory()).create_logger(self.__class__.__name__)
+        # New files use ``codec``; reads pick the codec from each file's extension.
+        self.codec = get_bronze_codec(codec)
 
     def write(self, result: BronzeResult) -> Path:
         """Persist a result to Bronze layer following append-only semantics."""
@@ -31,19 +36,32 @@ class ResultFileAdapter:
         abs_path = Folders.data_absolute_path() / str(rel_path)
         abs_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Use write_bytes for consistency with BronzeFileWriter
         payload = result.to_dict()
-        payload_bytes = json.dumps(payload, ensure_ascii=False, indent=2, sort_keys=True).encode("utf-8")
-        abs_path.write_bytes(payload_bytes)
+        if isinstance(result.content, RawPayload):
+            self._write_raw(abs_path, payload, result.content)
+        else:
+            if self.codec.name != BRONZE_CODEC_JSON:
+                # Non-JSON codecs may normalize rows on the way back; keep the fetch-time hash.
+                payload["hash"] = result.hash
+            rows = result.content if isinstance(result.content, SpooledRows) else payload.get("content")
+            abs_path = self.codec.write(abs_path, payload, rows)
+        result.filename = str(rel_path.with_name(abs_path.name))
 
         # Use clearer log message
         self.logger.info(f"Bronze payload persisted: {abs_path}")
 
         return abs_path
 
+    def _write_raw(self, abs_path: Path, payload: dict[str, typing.Any], raw: RawPayload) -> None:
+        """Write the vendor bytes to a sidecar, then the envelope that points at it."""
+        sidecar = RawPayload.sidecar_path(abs_path, raw.compression)
+        raw.write_to(sidecar)
+        payload["content"] = None
+        payload["payload"] = raw.descriptor(sidecar)
+        abs_path.write_bytes(json.dumps(payload, ensure_ascii=False, indent=2, sort_keys=True).encode("utf-8"))
+
     def read(self, file: Path) -> BronzeResult:
-        with file.open("r", encoding="utf-8") as fh:
-            payload = json.load(fh)
+        payload = codec_for_path(file).read(file)
         if isinstance(payload, dict) and "request" in payload:
             return self._read_bronze_result_payload(payload, file)
 
@@ -79,10 +97,19 @@ class ResultFileAdapter:
         result.error = payload.get("error")
         result.first_date = payload.get("first_date")
         result.last_date = payload.get("last_date")
+        raw_descriptor = payload.get("payload")
+        if isinstance(raw_descriptor, dict):
+            # Raw Bronze: the rows stay in the sidecar until someone iterates them.
+            result.content = RawPayload.from_descriptor(raw_descriptor, file)
+            result.hash = result.content.sha256
+        elif payload.get("hash"):
+            result.hash = payload["hash"]
         # hash is never serialized by BronzeResult.to_dict(); recompute from content
         # so canPromoteToSilverWith() evaluates correctly when reading files back.
-        if result.content:
+        elif result.content:
             result.hash = result._hash(result.content)
+        if request is not None:
+            result.filename = str(Path(request.bronze_relative_filename).with_name(file.name))
         return result
 
     def _parse_now(self, value: typing.Any) -> datetime:
@@ -121,7 +148,7 @@ class ResultFileAdapter:
         if path.is_file():
             files = [path]
         else:
-            files = path.rglob("*.json")
+            files = (p for p in path.rglob("*") if is_bronze_file(p) and p.is_file())
 
         return files
 
@@ -173,7 +200,7 @@ class ResultFileAdapter:
                 continue
 
             rows = getattr(result, "content", None)
-            if not isinstance(rows, list):
+            if not isinstance(rows, (list, RawPayload)):
                 continue
 
             for row in rows:
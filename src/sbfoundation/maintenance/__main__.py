@@ -1,5 +1,28 @@
-"""CLI entry point: python -m sbfoundation.maintenance"""
+"""CLI entry point: python -m sbfoundation.maintenance [reencode-bronze --codec CODEC [--dry-run]]"""
+import argparse
+
+from sbfoundation.maintenance.bronze_reencode_service import BronzeReencodeService
 from sbfoundation.maintenance.maintenance_service import MaintenanceService
+from sbfoundation.settings import BRONZE_CODEC_JSON, BRONZE_CODEC_PARQUET, BRONZE_CODECS
 
-if __name__ == "__main__":
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m sbfoundation.maintenance")
+    commands = parser.add_subparsers(dest="command")
+    reencode = commands.add_parser("reencode-bronze", help="re-encode JSON Bronze files with a compact codec")
+    reencode.add_argument("--codec", choices=[c for c in BRONZE_CODECS if c != BRONZE_CODEC_JSON], default=BRONZE_CODEC_PARQUET)
+    reencode.add_argument("--dry-run", action="store_true", help="count convertible files without writing")
+    args = parser.parse_args(argv)
+
+    if args.command == "reencode-bronze":
+        service = BronzeReencodeService(codec=args.codec)
+        try:
+            service.run(dry_run=args.dry_run)
+        finally:
+            service.close()
+        return
     MaintenanceService().run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from sbfoundation.folders import Folders
+from sbfoundation.infra.bronze_codecs import get_bronze_codec
+from sbfoundation.infra.logger import LoggerFactory, SBLogger
+from sbfoundation.infra.result_file_adaptor import ResultFileAdapter
+from sbfoundation.ops.services.ops_service import OpsService
+from sbfoundation.run.dtos.raw_payload import RawPayload
+from sbfoundation.settings import BRONZE_CODEC_JSON, BRONZE_CODEC_PARQUET, BRONZE_FOLDER
+
+
+class BronzeReencodeService:
+    """Re-encode existing JSON Bronze files with a compact codec and repoint the manifest.
+
+    Each file is rewritten next to the original, ``ops.file_ingestions.bronze_filename``
+    is updated in batches, and the JSON original is deleted only after its batch is
+    committed — an interrupted run leaves both copies and can simply be re-run.
+    Raw-storage envelopes are left alone; their payload is already verbatim.
+
+    Usage:
+        python -m sbfoundation.maintenance reencode-bronze --codec parquet
+    """
+
+    def __init__(
+        self,
+        codec: str = BRONZE_CODEC_PARQUET,
+        ops_service: OpsService | None = None,
+        file_adapter: ResultFileAdapter | None = None,
+        logger: SBLogger | None = None,
+        batch_size: int = 500,
+    ) -> None:
+        if codec == BRONZE_CODEC_JSON:
+            raise ValueError("Re-encoding targets a non-JSON codec")
+        self._codec = get_bronze_codec(codec)
+        self._logger = logger or LoggerFactory().create_logger(self.__class__.__name__)
+        self._ops_service = ops_service or OpsService()
+        self._owns_ops_service = ops_service is None
+        self._file_adapter = file_adapter or ResultFileAdapter()
+        self._batch_size = max(1, batch_size)
+
+    def close(self) -> None:
+        if self._owns_ops_service:
+            self._ops_service.close()
+
+    def run(self, dry_run: bool = False) -> int:
+        """Re-encode every JSON Bronze file; return how many were (or, when ``dry_run``, would be) converted."""
+        data_root = Folders.data_absolute_path()
+        bronze_root = data_root / BRONZE_FOLDER
+        self._logger.info(f"Bronze re-encode: start | codec={self._codec.name} | root={bronze_root} | dry_run={dry_run}")
+
+        converted = 0
+        skipped = 0
+        renames: list[tuple[str, str]] = []
+        originals: list[Path] = []
+        for file in sorted(bronze_root.rglob("*.json")) if bronze_root.exists() else []:
+            try:
+                result = self._file_adapter.read(file)
+            except Exception as exc:
+                self._logger.warning(f"Bronze re-encode skipped unreadable file | file={file} | error={exc}")
+                skipped += 1
+                continue
+            if result.request is None or isinstance(result.content, RawPayload):
+                skipped += 1
+                continue
+            converted += 1
+            if dry_run:
+                continue
+
+            envelope = result.to_dict()
+            envelope["hash"] = result.hash
+            new_file = self._codec.write(file, envelope, result.content)
+            renames.append((str(file.relative_to(data_root)), str(new_file.relative_to(data_root))))
+            originals.append(file)
+            if len(renames) >= self._batch_size:
+                self._commit(renames, originals)
+
+        if not dry_run:
+            self._commit(renames, originals)
+        self._logger.info(f"Bronze re-encode: complete | converted={converted} | skipped={skipped} | dry_run={dry_run}")
+        return converted
+
+    def _commit(self, renames: list[tuple[str, str]], originals: list[Path]) -> None:
+        if not renames:
+            return
+        self._ops_service.rename_bronze_files(renames)
+        for file in originals:
+            file.unlink(missing_ok=True)
+        renames.clear()
+        originals.clear()
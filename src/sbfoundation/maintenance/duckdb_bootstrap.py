@@ -32,6 +32,40 @@ CREATE TABLE IF NOT EXISTS ops.dataset_watermarks (
 );
 """
 
+HTTP_VALIDATORS_DDL = """
+CREATE TABLE IF NOT EXISTS ops.http_validators (
+    cache_key        VARCHAR PRIMARY KEY,
+    url              VARCHAR NOT NULL,
+    etag             VARCHAR,
+    last_modified    VARCHAR,
+    bronze_filename  VARCHAR,
+    payload_hash     VARCHAR,
+    bronze_from_date DATE,
+    bronze_to_date   DATE,
+    updated_at       TIMESTAMP NOT NULL DEFAULT now()
+);
+"""
+
+API_QUOTA_LEDGER_DDL = """
+CREATE TABLE IF NOT EXISTS ops.api_quota_ledger (
+    source       VARCHAR NOT NULL,
+    period       VARCHAR NOT NULL,
+    period_start DATE NOT NULL,
+    calls        BIGINT NOT NULL DEFAULT 0,
+    updated_at   TIMESTAMP NOT NULL DEFAULT now(),
+    PRIMARY KEY (source, period, period_start)
+);
+"""
+
+SILVER_ROW_HASHES_DDL = """
+CREATE TABLE IF NOT EXISTS ops.silver_row_hashes (
+    silver_table VARCHAR NOT NULL,
+    key_hash     UBIGINT NOT NULL,
+    row_hash     UBIGINT NOT NULL,
+    PRIMARY KEY (silver_table, key_hash)
+);
+"""
+
 OPS_COVERAGE_INDEX_DDL = """
 CREATE TABLE IF NOT EXISTS ops.coverage_index (
     domain               VARCHAR NOT NULL,
@@ -241,6 +275,9 @@ class DuckDbBootstrap:
             self._conn.execute(SCHEMA_MIGRATIONS_DDL)
             self._conn.execute(OPS_FILE_INGESTIONS_DDL)
             self._conn.execute(DATASET_WATERMARKS_DDL)
+            self._conn.execute(HTTP_VALIDATORS_DDL)
+            self._conn.execute(API_QUOTA_LEDGER_DDL)
+            self._conn.execute(SILVER_ROW_HASHES_DDL)
             self._conn.execute(OPS_COVERAGE_INDEX_DDL)
             self._conn.execute(OPS_RUN_INTEGRITY_DDL)
             self._conn.execute(UNIVERSE_SNAPSHOT_DDL)
@@ -329,6 +366,19 @@ class DuckDbBootstrap:
         parts = filename.removesuffix(".sql").split("_", 2)
         return parts[2] if len(parts) >= 3 else ""
 
+    def duplicate(self) -> "DuckDbBootstrap":
+        """Return a bootstrap over a second connection to the same database, with its own lock.
+
+        DuckDB runs separate connections of one database concurrently, so a background
+        writer on the duplicate (pipelined Silver promotion) no longer queues behind, or
+        holds up, callers of this bootstrap's lock.  Temp tables are per connection.  The
+        duplicate owns its connection; closing it leaves this one open.
+        """
+        duplicate = DuckDbBootstrap(logger=self._logger, conn=self.connect().cursor())
+        duplicate._owns_connection = True
+        duplicate._schema_initialized = True
+        return duplicate
+
     def close(self) -> None:
         """Close the database connection if owned by this bootstrap."""
         if self._conn is None:
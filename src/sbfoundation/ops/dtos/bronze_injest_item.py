@@ -18,7 +18,7 @@ class BronzeInjestItem(BronzeToSilverDTO):
     from_date: str  # ISO 8601 date representing the earliest data date, as given by the date key
     to_date: str  # ISO 8601 date representing the latest data date, as given by the date key
     filename: str  # A fully qualified bronze layer filename for the result
-    status: str  # passed, failed, too-soon, passed-silver (when moved to silver layer)
+    status: str  # passed, failed, unchanged, too-soon, passed-silver (when moved to silver layer)
     error: str = None  # error description
 
     @property
@@ -58,7 +58,8 @@ class DatasetInjestion:
         request = result.request
         start_time = cls._normalize_datetime(result.now)
         end_time = cls._calculate_end_time(start_time, result.elapsed_microseconds)
-        filename = request.bronze_relative_filename
+        # The adapter records the codec-specific name it actually wrote (or read).
+        filename = result.filename or request.bronze_relative_filename
         bronze_rows = len(result.content or [])
         return cls(
             run_id=request.run_id,
@@ -75,7 +76,8 @@ class DatasetInjestion:
             bronze_rows=bronze_rows,
             bronze_injest_start_time=start_time,
             bronze_injest_end_time=end_time,
-            bronze_can_promote=result.canPromoteToSilverWith(allows_empty_content=request.allows_empty_content),
+            # An unchanged payload was already promoted from the file it points at.
+            bronze_can_promote=not result.unchanged and result.canPromoteToSilverWith(allows_empty_content=request.allows_empty_content),
             bronze_payload_hash=result.hash,
         )
 
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+
+
+@dataclass(frozen=True)
+class HttpValidator:
+    """ETag / Last-Modified validators of the last accepted 200 response for one request identity.
+
+    ``bronze_filename`` and the coverage dates describe the Bronze file that response
+    produced, so a later ``304 Not Modified`` can be recorded against it.
+    """
+
+    cache_key: str
+    url: str
+    etag: str | None = None
+    last_modified: str | None = None
+    bronze_filename: str | None = None
+    payload_hash: str | None = None
+    bronze_from_date: date | None = None
+    bronze_to_date: date | None = None
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
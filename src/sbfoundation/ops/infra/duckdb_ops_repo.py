@@ -10,6 +10,7 @@ from sbfoundation.dataset.models.dataset_watermark import DatasetWatermark
 from sbfoundation.maintenance import DuckDbBootstrap
 from sbfoundation.infra.logger import LoggerFactory, SBLogger
 from sbfoundation.ops.dtos.file_injestion import DatasetInjestion
+from sbfoundation.ops.dtos.http_validator import HttpValidator
 
 
 class DuckDbOpsRepo:
@@ -94,6 +95,88 @@ class DuckDbOpsRepo:
         with self._bootstrap.ops_transaction() as conn:
             conn.execute(sql, params)
 
+    # ops.file_ingestions column types; DataFrame columns holding only None arrive untyped, so each is cast.
+    _FILE_INGESTION_TYPES = {
+        "run_id": "VARCHAR",
+        "file_id": "VARCHAR",
+        "domain": "VARCHAR",
+        "source": "VARCHAR",
+        "dataset": "VARCHAR",
+        "discriminator": "VARCHAR",
+        "ticker": "VARCHAR",
+        "bronze_from_date": "DATE",
+        "bronze_to_date": "DATE",
+        "bronze_filename": "VARCHAR",
+        "bronze_error": "VARCHAR",
+        "bronze_rows": "BIGINT",
+        "bronze_injest_start_time": "TIMESTAMP",
+        "bronze_injest_end_time": "TIMESTAMP",
+        "bronze_can_promote": "BOOLEAN",
+        "bronze_payload_hash": "VARCHAR",
+        "silver_from_date": "DATE",
+        "silver_to_date": "DATE",
+        "silver_tablename": "VARCHAR",
+        "silver_errors": "VARCHAR",
+        "silver_rows_created": "BIGINT",
+        "silver_rows_updated": "BIGINT",
+        "silver_rows_failed": "BIGINT",
+        "silver_injest_start_time": "TIMESTAMP",
+        "silver_injest_end_time": "TIMESTAMP",
+        "silver_can_promote": "BOOLEAN",
+    }
+
+    def upsert_file_ingestions(self, ingestions: list[DatasetInjestion]) -> int:
+        """MERGE many manifest rows from one DataFrame in a single statement and transaction.
+
+        Equivalent to calling ``upsert_file_ingestion`` per row; a later row for the same
+        (run_id, file_id) wins.  Returns the number of rows written.
+        """
+        if not ingestions:
+            return 0
+        import pandas as pd
+
+        latest = {(i.run_id, i.file_id): i for i in ingestions}
+        cols = list(self._FILE_INGESTION_TYPES)
+        df = pd.DataFrame([i.to_dict() for i in latest.values()], columns=cols)
+        updates = ", ".join(f"{col} = src.{col}" for col in cols if col not in ("run_id", "file_id"))
+        sql = f"""
+            MERGE INTO ops.file_ingestions AS target
+            USING ({self._typed_ingestions_select("df")}) AS src
+            ON target.run_id = src.run_id AND target.file_id = src.file_id
+            WHEN MATCHED THEN UPDATE SET {updates}
+            WHEN NOT MATCHED THEN INSERT ({", ".join(cols)}) VALUES ({", ".join(f"src.{col}" for col in cols)})
+        """
+        with self._bootstrap.ops_transaction() as conn:
+            conn.execute(sql)
+        return len(latest)
+
+    def insert_missing_file_ingestions(self, ingestions: list[DatasetInjestion]) -> int:
+        """Insert the manifest rows whose (run_id, file_id) is not in ops yet; existing rows are left untouched.
+
+        Returns the number of rows inserted.
+        """
+        if not ingestions:
+            return 0
+        import pandas as pd
+
+        latest = {(i.run_id, i.file_id): i for i in ingestions}
+        cols = list(self._FILE_INGESTION_TYPES)
+        df = pd.DataFrame([i.to_dict() for i in latest.values()], columns=cols)
+        sql = f"""
+            INSERT INTO ops.file_ingestions ({", ".join(cols)})
+            SELECT {", ".join(cols)} FROM ({self._typed_ingestions_select("df")}) AS src
+            WHERE NOT EXISTS (
+                SELECT 1 FROM ops.file_ingestions AS fi WHERE fi.run_id = src.run_id AND fi.file_id = src.file_id
+            )
+        """
+        with self._bootstrap.ops_transaction() as conn:
+            row = conn.execute(sql).fetchone()
+        return int(row[0]) if row else 0
+
+    def _typed_ingestions_select(self, frame: str) -> str:
+        select_list = ", ".join(f"CAST({col} AS {col_type}) AS {col}" for col, col_type in self._FILE_INGESTION_TYPES.items())
+        return f"SELECT {select_list} FROM {frame}"
+
     def get_latest_bronze_to_date(
         self,
         *,
@@ -143,6 +226,35 @@ class DuckDbOpsRepo:
             rows = conn.execute(sql, [domain, source, dataset, discriminator_token]).fetchall()
         return {row[0]: (row[1], row[2]) for row in rows}
 
+    def get_latest_payload_hashes(
+        self,
+        *,
+        domain: str,
+        source: str,
+        dataset: str,
+        discriminator: str,
+    ) -> dict[str, tuple[str, str]]:
+        """Return {ticker: (payload_hash, bronze_filename)} of each ticker's latest successful Bronze file.
+
+        Promotion to Silver clears ``bronze_can_promote``, so rows are selected on their
+        Bronze outcome instead.  "Unchanged" rows repeat the hash and file name of the file
+        they point at, so they keep the same reference.
+        """
+        discriminator_token = discriminator or ""
+        sql = (
+            "SELECT "
+            "    COALESCE(ticker, '') AS ticker, "
+            "    arg_max(bronze_payload_hash, bronze_injest_start_time) AS payload_hash, "
+            "    arg_max(bronze_filename, bronze_injest_start_time) AS bronze_filename "
+            "FROM ops.file_ingestions "
+            "WHERE domain = ? AND source = ? AND dataset = ? AND COALESCE(discriminator, '') = ? "
+            "AND bronze_error IS NULL AND bronze_payload_hash IS NOT NULL "
+            "GROUP BY COALESCE(ticker, '')"
+        )
+        with self._bootstrap.read_connection() as conn:
+            rows = conn.execute(sql, [domain, source, dataset, discriminator_token]).fetchall()
+        return {row[0]: (row[1], row[2]) for row in rows}
+
     def get_latest_bronze_ingestion_time(
         self,
         *,
@@ -200,6 +312,28 @@ class DuckDbOpsRepo:
             row = conn.execute(sql, [domain, source, dataset, discriminator_token, ticker_token]).fetchone()
         return row[0] if row else None
 
+    def get_bulk_silver_watermarks(
+        self,
+        *,
+        domain: str,
+        source: str,
+        dataset: str,
+    ) -> dict[tuple[str, str], datetime.date | None]:
+        """Return MAX(silver_to_date) per (discriminator, ticker) of a dataset in one query.
+
+        Batch counterpart of get_latest_silver_to_date; missing keys have no watermark.
+        """
+        sql = (
+            "SELECT COALESCE(discriminator, '') AS discriminator, COALESCE(ticker, '') AS ticker, "
+            "MAX(silver_to_date) AS silver_to_date "
+            "FROM ops.file_ingestions "
+            "WHERE domain = ? AND source = ? AND dataset = ? "
+            "GROUP BY COALESCE(discriminator, ''), COALESCE(ticker, '')"
+        )
+        with self._bootstrap.read_connection() as conn:
+            rows = conn.execute(sql, [domain, source, dataset]).fetchall()
+        return {(row[0], row[1]): row[2] for row in rows}
+
     def get_latest_silver_to_date_for_dataset(
         self,
         *,
@@ -349,6 +483,173 @@ class DuckDbOpsRepo:
         with self._bootstrap.ops_transaction() as conn:
             conn.execute(sql, [domain, source, dataset, discriminator, ticker, floor_date])
 
+    def get_backfill_floor_dates(
+        self,
+        *,
+        domain: str,
+        source: str,
+        dataset: str,
+        discriminator: str,
+    ) -> dict[str, datetime.date]:
+        """Return {ticker: backfill_floor_date} for every ticker of a dataset in one query."""
+        sql = (
+            "SELECT ticker, backfill_floor_date FROM ops.dataset_watermarks "
+            "WHERE domain = ? AND source = ? AND dataset = ? AND discriminator = ? "
+            "AND backfill_floor_date IS NOT NULL"
+        )
+        with self._bootstrap.read_connection() as conn:
+            rows = conn.execute(sql, [domain, source, dataset, discriminator or ""]).fetchall()
+        return {row[0]: row[1] for row in rows}
+
+    def get_earliest_bronze_from_dates(
+        self,
+        *,
+        domain: str,
+        source: str,
+        dataset: str,
+        discriminator: str,
+    ) -> dict[str, datetime.date]:
+        """Return {ticker: MIN(bronze_from_date)} over successful ingestions of a dataset in one query."""
+        sql = (
+            "SELECT COALESCE(ticker, '') AS ticker, MIN(bronze_from_date) FROM ops.file_ingestions "
+            "WHERE domain = ? AND source = ? AND dataset = ? "
+            "AND COALESCE(discriminator, '') = ? AND bronze_error IS NULL "
+            "GROUP BY COALESCE(ticker, '')"
+        )
+        with self._bootstrap.read_connection() as conn:
+            rows = conn.execute(sql, [domain, source, dataset, discriminator or ""]).fetchall()
+        return {row[0]: row[1] for row in rows if row[1] is not None}
+
+    _BACKFILL_FLOOR_COLS = ("domain", "source", "dataset", "discriminator", "ticker", "backfill_floor_date")
+
+    def upsert_backfill_floor_dates(self, rows: list[tuple]) -> int:
+        """UPSERT many backfill_floor_date checkpoints in a single statement and transaction.
+
+        Each row is (domain, source, dataset, discriminator, ticker, floor_date); a later
+        row for the same identity wins.  Returns the number of identities written.
+        """
+        if not rows:
+            return 0
+        import pandas as pd
+
+        latest = {tuple(row[:5]): row[5] for row in rows}
+        df = pd.DataFrame([(*key, floor) for key, floor in latest.items()], columns=list(self._BACKFILL_FLOOR_COLS))
+        col_list = ", ".join(self._BACKFILL_FLOOR_COLS)
+        sql = f"""
+            INSERT INTO ops.dataset_watermarks ({col_list})
+            SELECT {col_list} FROM df
+            ON CONFLICT (domain, source, dataset, discriminator, ticker)
+            DO UPDATE SET backfill_floor_date = EXCLUDED.backfill_floor_date
+        """
+        with self._bootstrap.ops_transaction() as conn:
+            conn.execute(sql)
+        return len(latest)
+
+    def update_bronze_filenames(self, renames: list[tuple[str, str]]) -> int:
+        """Point manifest rows at re-encoded Bronze files in one statement.
+
+        Each rename is (old_bronze_filename, new_bronze_filename).  Returns the number of
+        renames applied.
+        """
+        if not renames:
+            return 0
+        import pandas as pd
+
+        df = pd.DataFrame(renames, columns=["old_filename", "new_filename"])
+        sql = """
+            UPDATE ops.file_ingestions AS fi
+            SET bronze_filename = df.new_filename
+            FROM df
+            WHERE fi.bronze_filename = df.old_filename
+        """
+        with self._bootstrap.ops_transaction() as conn:
+            conn.execute(sql)
+        return len(renames)
+
+    # --- HTTP VALIDATORS ---#
+
+    _HTTP_VALIDATOR_COLS = (
+        "cache_key", "url", "etag", "last_modified",
+        "bronze_filename", "payload_hash", "bronze_from_date", "bronze_to_date",
+    )
+
+    def get_http_validators(self, url: str) -> dict[str, HttpValidator]:
+        """Return {cache_key: HttpValidator} for every stored request identity of ``url``."""
+        sql = f"SELECT {', '.join(self._HTTP_VALIDATOR_COLS)} FROM ops.http_validators WHERE url = ?"
+        with self._bootstrap.read_connection() as conn:
+            rows = conn.execute(sql, [url]).fetchall()
+        return {row[0]: HttpValidator(*row) for row in rows}
+
+    def upsert_http_validators(self, validators: list[HttpValidator]) -> int:
+        """UPSERT many validators in a single statement; a later entry for the same key wins."""
+        if not validators:
+            return 0
+        import pandas as pd
+
+        latest = {v.cache_key: v for v in validators}
+        df = pd.DataFrame(
+            [tuple(getattr(v, col) for col in self._HTTP_VALIDATOR_COLS) for v in latest.values()],
+            columns=list(self._HTTP_VALIDATOR_COLS),
+        )
+        col_list = ", ".join(self._HTTP_VALIDATOR_COLS)
+        updates = ", ".join(f"{col} = EXCLUDED.{col}" for col in self._HTTP_VALIDATOR_COLS[1:])
+        sql = f"""
+            INSERT INTO ops.http_validators ({col_list}, updated_at)
+            SELECT {col_list}, now() FROM df
+            ON CONFLICT (cache_key)
+            DO UPDATE SET {updates}, updated_at = EXCLUDED.updated_at
+        """
+        with self._bootstrap.ops_transaction() as conn:
+            conn.execute(sql)
+        return len(latest)
+
+    # --- API QUOTA LEDGER ---#
+
+    def reserve_api_quota(self, *, source: str, ceilings: dict[str, tuple[date, int]], calls: int) -> int:
+        """Reserve up to ``calls`` against every budget period in ``ceilings``.
+
+        ``ceilings`` maps period -> (period_start, ceiling).  The grant is what the tightest
+        period still has below its ceiling; every period is charged the grant in the same
+        transaction.  Returns the grant, 0 when any period is exhausted.
+        """
+        if calls <= 0 or not ceilings:
+            return 0
+        with self._bootstrap.ops_transaction() as conn:
+            granted = calls
+            for period, (period_start, ceiling) in ceilings.items():
+                row = conn.execute(
+                    "SELECT calls FROM ops.api_quota_ledger WHERE source = ? AND period = ? AND period_start = ?",
+                    [source, period, period_start],
+                ).fetchone()
+                used = int(row[0]) if row else 0
+                granted = min(granted, max(0, ceiling - used))
+            if granted:
+                for period, (period_start, _ceiling) in ceilings.items():
+                    conn.execute(
+                        """
+                        INSERT INTO ops.api_quota_ledger (source, period, period_start, calls, updated_at)
+                        VALUES (?, ?, ?, ?, now())
+                        ON CONFLICT (source, period, period_start)
+                        DO UPDATE SET calls = api_quota_ledger.calls + EXCLUDED.calls, updated_at = EXCLUDED.updated_at
+                        """,
+                        [source, period, period_start, granted],
+                    )
+        return granted
+
+    def release_api_quota(self, *, source: str, periods: dict[str, date], calls: int) -> None:
+        """Give back ``calls`` reserved but never spent in each period."""
+        if calls <= 0 or not periods:
+            return
+        with self._bootstrap.ops_transaction() as conn:
+            for period, period_start in periods.items():
+                conn.execute(
+                    """
+                    UPDATE ops.api_quota_ledger SET calls = GREATEST(0, calls - ?), updated_at = now()
+                    WHERE source = ? AND period = ? AND period_start = ?
+                    """,
+                    [calls, source, period, period_start],
+                )
+
     # --- COVERAGE INDEX ---#
 
     _COVERAGE_COLS = (
@@ -629,6 +930,21 @@ class DuckDbOpsRepo:
         )
         return self._fetch_dicts(sql, [])
 
+    def get_bronze_latency_quantile(self, *, source: str, dataset: str, quantile: float) -> tuple[int, float | None]:
+        """Return (samples, seconds) for the given quantile of one dataset's Bronze request latency."""
+        sql = (
+            "SELECT "
+            "    COUNT(*) AS samples, "
+            "    QUANTILE_CONT(datediff('millisecond', bronze_injest_start_time, bronze_injest_end_time), ?) / 1000.0 AS seconds "
+            "FROM ops.file_ingestions "
+            "WHERE source = ? AND dataset = ? "
+            "  AND bronze_injest_start_time IS NOT NULL "
+            "  AND bronze_injest_end_time > bronze_injest_start_time"
+        )
+        with self._bootstrap.read_connection() as conn:
+            row = conn.execute(sql, [quantile, source, dataset]).fetchone()
+        return (int(row[0]), row[1]) if row else (0, None)
+
     def get_hash_stability(self) -> list[dict[str, Any]]:
         """Per-dataset payload hash stability.
 
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from sbfoundation.settings import SILVER_BATCH_MODES, SILVER_DEDUPE_MODES, SILVER_ENGINES
+
 
 @dataclass(frozen=True)
 class PromotionConfig:
@@ -13,3 +15,20 @@ class PromotionConfig:
     watermark_mode: str = "max_key_date"  # max_key_date | bronze_file_only | none
     write_partitioning: list[str] = field(default_factory=list)
     row_group_size: int | None = None
+    batch_mode: str = "file"  # file | table (one dedupe + MERGE per Silver table)
+    max_files_per_batch: int = 1000
+    engine: str = "pandas"  # pandas | duckdb (project + MERGE in SQL; falls back to pandas per file)
+
+    def __post_init__(self) -> None:
+        for name, allowed in (("batch_mode", SILVER_BATCH_MODES), ("engine", SILVER_ENGINES), ("dedupe_mode", SILVER_DEDUPE_MODES)):
+            if getattr(self, name) not in allowed:
+                raise ValueError(f"Invalid {name}: {getattr(self, name)!r}. Must be one of {allowed}")
+
+    @property
+    def filters_by_watermark(self) -> bool:
+        """True when rows at or before the watermark are dropped before dedupe.
+
+        ``hash_only`` compares every row's content hash instead, so a restated value dated
+        at or before the watermark still reaches the comparison.
+        """
+        return self.watermark_mode != "none" and self.dedupe_mode != "hash_only"
@@ -6,6 +6,7 @@ import duckdb
 
 
 from sbfoundation.ops.dtos.file_injestion import DatasetInjestion
+from sbfoundation.ops.dtos.http_validator import HttpValidator
 from sbfoundation.ops.infra.duckdb_ops_repo import DuckDbOpsRepo
 from sbfoundation.infra.logger import LoggerFactory, SBLogger
 from sbfoundation.run.dtos.bronze_result import BronzeResult
@@ -71,6 +72,33 @@ class OpsService:
             self._logger.error("File ingestion persistence failed: %s", exc, run_id=run_id)
             raise
 
+    def insert_bronze_manifests(self, results: list[BronzeResult], run: RunContext | None = None) -> list[BronzeResult]:
+        """Persist many Bronze manifests in one batch, falling back to per-row inserts if it fails.
+
+        The fallback isolates the offending rows: each failure is logged with its file and
+        the remaining rows are still written.  Returns the results whose manifests were persisted.
+        """
+        if not results:
+            return []
+        run_id = run.run_id if run is not None else "unknown"
+        try:
+            self._ops_repo.upsert_file_ingestions([DatasetInjestion.from_bronze(result=result) for result in results])
+            return list(results)
+        except Exception as exc:
+            self._logger.error("Bulk file ingestion persistence failed for %d rows, retrying per row: %s", len(results), exc, run_id=run_id)
+        written: list[BronzeResult] = []
+        for result in results:
+            try:
+                self.insert_bronze_manifest(result, run)
+                written.append(result)
+            except Exception as exc:
+                self._logger.error("File ingestion persistence failed for %s: %s", result.request.msg, exc, run_id=run_id)
+        return written
+
+    def restore_bronze_manifests(self, ingestions: list[DatasetInjestion]) -> int:
+        """Insert journaled manifests that never reached ops; rows already present are kept as they are."""
+        return self._ops_repo.insert_missing_file_ingestions(ingestions)
+
     def get_bulk_ingestion_watermarks(
         self,
         *,
@@ -121,6 +149,18 @@ class OpsService:
         except Exception as exc:
             self._logger.warning("Silver start persistence failed: %s", exc, run_id=ingestion.run_id)
 
+    def start_silver_ingestions(self, ingestions: list[DatasetInjestion]) -> None:
+        """Batch form of ``start_silver_ingestion``: stamp every start time and persist them in one MERGE."""
+        if not ingestions:
+            return
+        now = self._universe.now()
+        for ingestion in ingestions:
+            ingestion.silver_injest_start_time = now
+        try:
+            self._ops_repo.upsert_file_ingestions(ingestions)
+        except Exception as exc:
+            self._logger.warning("Silver start persistence failed for %d rows: %s", len(ingestions), exc, run_id=ingestions[0].run_id)
+
     def finish_silver_ingestion(
         self,
         ingestion: DatasetInjestion,
@@ -133,6 +173,41 @@ class OpsService:
         coverage_to: date | None,
         error: str | None,
     ) -> None:
+        self.set_silver_outcome(
+            ingestion,
+            rows_written=rows_written,
+            rows_failed=rows_failed,
+            table_name=table_name,
+            coverage_from=coverage_from,
+            coverage_to=coverage_to,
+            error=error,
+        )
+        try:
+            self._ops_repo.upsert_file_ingestion(ingestion)
+        except Exception as exc:
+            self._logger.warning("Silver finish persistence failed: %s", exc, run_id=ingestion.run_id)
+
+    def finish_silver_ingestions(self, ingestions: list[DatasetInjestion]) -> None:
+        """Persist a batch whose outcomes were applied with ``set_silver_outcome`` in one MERGE."""
+        if not ingestions:
+            return
+        try:
+            self._ops_repo.upsert_file_ingestions(ingestions)
+        except Exception as exc:
+            self._logger.warning("Silver finish persistence failed for %d rows: %s", len(ingestions), exc, run_id=ingestions[0].run_id)
+
+    def set_silver_outcome(
+        self,
+        ingestion: DatasetInjestion,
+        *,
+        rows_written: int,
+        rows_failed: int,
+        table_name: str | None,
+        coverage_from: date | None,
+        coverage_to: date | None,
+        error: str | None,
+    ) -> None:
+        """Record a Silver outcome on ``ingestion`` without persisting it (see ``finish_silver_ingestions``)."""
         ingestion.silver_rows_created = rows_written
         ingestion.silver_rows_updated = 0
         ingestion.silver_rows_failed = rows_failed
@@ -144,10 +219,6 @@ class OpsService:
         ingestion.silver_can_promote = error is None
         if error is None:
             ingestion.bronze_can_promote = False
-        try:
-            self._ops_repo.upsert_file_ingestion(ingestion)
-        except Exception as exc:
-            self._logger.warning("Silver finish persistence failed: %s", exc, run_id=ingestion.run_id)
 
     def get_silver_watermark(
         self,
@@ -166,6 +237,10 @@ class OpsService:
             ticker=ticker,
         )
 
+    def get_bulk_silver_watermarks(self, *, domain: str, source: str, dataset: str) -> dict[tuple[str, str], date | None]:
+        """Return {(discriminator, ticker): silver watermark} for a whole dataset in one query."""
+        return self._ops_repo.get_bulk_silver_watermarks(domain=domain, source=source, dataset=dataset)
+
     def get_silver_watermark_for_dataset(
         self,
         *,
@@ -267,6 +342,48 @@ class OpsService:
             discriminator=discriminator, ticker=ticker, floor_date=floor_date,
         )
 
+    def get_backfill_floor_dates(self, domain: str, source: str, dataset: str, discriminator: str) -> dict[str, date]:
+        """Return {ticker: backfill_floor_date} for all tickers of a dataset in one query."""
+        return self._ops_repo.get_backfill_floor_dates(
+            domain=domain, source=source, dataset=dataset, discriminator=discriminator,
+        )
+
+    def get_earliest_bronze_from_dates(self, domain: str, source: str, dataset: str, discriminator: str) -> dict[str, date]:
+        """Return {ticker: earliest bronze_from_date} for all tickers of a dataset in one query."""
+        return self._ops_repo.get_earliest_bronze_from_dates(
+            domain=domain, source=source, dataset=dataset, discriminator=discriminator,
+        )
+
+    def set_backfill_floor_dates(self, rows: list[tuple]) -> int:
+        """Write many (domain, source, dataset, discriminator, ticker, floor_date) checkpoints at once."""
+        return self._ops_repo.upsert_backfill_floor_dates(rows)
+
+    def get_latest_payload_hashes(self, *, domain: str, source: str, dataset: str, discriminator: str) -> dict[str, tuple[str, str]]:
+        """Return {ticker: (payload_hash, bronze_filename)} of each ticker's latest promotable Bronze file."""
+        return self._ops_repo.get_latest_payload_hashes(domain=domain, source=source, dataset=dataset, discriminator=discriminator)
+
+    def rename_bronze_files(self, renames: list[tuple[str, str]]) -> int:
+        """Repoint manifest rows from old to new Bronze filenames after a re-encode."""
+        return self._ops_repo.update_bronze_filenames(renames)
+
+    def get_bronze_latency_quantile(self, *, source: str, dataset: str, quantile: float) -> tuple[int, float | None]:
+        """Return (samples, seconds) for a latency quantile of the dataset's past Bronze requests."""
+        return self._ops_repo.get_bronze_latency_quantile(source=source, dataset=dataset, quantile=quantile)
+
+    def reserve_api_quota(self, *, source: str, ceilings: dict[str, tuple[date, int]], calls: int) -> int:
+        """Reserve up to ``calls`` in the persistent quota ledger; returns how many were granted."""
+        return self._ops_repo.reserve_api_quota(source=source, ceilings=ceilings, calls=calls)
+
+    def release_api_quota(self, *, source: str, periods: dict[str, date], calls: int) -> None:
+        self._ops_repo.release_api_quota(source=source, periods=periods, calls=calls)
+
+    def get_http_validators(self, url: str) -> dict[str, HttpValidator]:
+        """Return the stored conditional-request validators for ``url`` keyed by cache key."""
+        return self._ops_repo.get_http_validators(url)
+
+    def upsert_http_validators(self, validators: list[HttpValidator]) -> int:
+        return self._ops_repo.upsert_http_validators(validators)
+
     def start_gold_build(self, *, run_id: str, model_version: str, started_at: datetime) -> int:
         return self._ops_repo.start_gold_build(run_id=run_id, model_version=model_version, started_at=started_at)
 
@@ -6,7 +6,7 @@ from datetime import date
 from prefect import flow, task, get_run_logger
 
 from sbfoundation.api import SBFoundationAPI, RunCommand
-from sbfoundation.settings import EOD_DOMAIN
+from sbfoundation.settings import EOD_DOMAIN, RUN_PRIORITY_HIGH
 
 
 @task(name="eod-bulk-bronze-silver", retries=1, retry_delay_seconds=60)
@@ -20,6 +20,7 @@ def run_eod_pipeline(today: str | None = None) -> dict:
         enable_bronze=True,
         enable_silver=True,
         enable_gold=True,
+        priority=RUN_PRIORITY_HIGH,  # the scheduled daily flow may spend the API budget that backfills leave
     )
     api = SBFoundationAPI(today=today)
     result = api.run(command)
@@ -62,6 +62,8 @@ class QuarterService(BulkPipelineService):
             )
             if self._enable_bronze:
                 run = self._process_recipe_list(recipes, run)
+            else:
+                self._plan_recipe_list(recipes, run)
             run = self._promote_silver(run, QUARTER_DOMAIN)
             self._logger.info("Quarter bulk domain complete", run_id=run.run_id)
         finally:
@@ -35,7 +35,7 @@ class BronzeRecoveryService:
 
         Both conditions must hold:
         - The ops table has zero rows (fresh or wiped DB).
-        - At least one .json file exists under the bronze root folder.
+        - At least one Bronze file (any codec) exists under the bronze root folder.
         """
         try:
             if not self._repo.is_ops_ingestions_empty():
@@ -48,10 +48,10 @@ class BronzeRecoveryService:
         if not bronze_root.exists():
             return False
 
-        return any(bronze_root.rglob("*.json"))
+        return any(self._file_adapter.get_file_paths(bronze_root))
 
     def recover(self) -> int:
-        """Scan all bronze JSON files and upsert rows into ops.file_ingestions.
+        """Scan all bronze files and upsert rows into ops.file_ingestions.
 
         Returns the number of records successfully upserted.
         Files that cannot be parsed (corrupt, legacy format, no request field)
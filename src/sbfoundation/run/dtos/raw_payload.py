@@ -0,0 +1,208 @@
+import contextlib
+import csv
+import gzip
+import io
+import json
+import shutil
+import tempfile
+import threading
+import typing
+from pathlib import Path
+
+import duckdb
+import pandas as pd
+
+from sbfoundation.settings import BRONZE_SPOOL_MAX_MEMORY_BYTES, SILVER_DUCKDB_MAX_JSON_OBJECT_BYTES
+
+RAW_FORMAT_CSV = "csv"
+RAW_FORMAT_JSON = "json"
+RAW_COMPRESSION_GZIP = "gzip"
+
+
+def normalize_json_payload(payload: typing.Any, json_content_key: str | None) -> typing.Any:
+    """Apply the Bronze content conventions to a decoded JSON body.
+
+    Envelope dicts (e.g. FRED's ``{"observations": [...]}``) are unwrapped with the
+    recipe's ``json_content_key`` and ``list[str]`` payloads become ``[{"value": ...}]``.
+    """
+    if json_content_key and isinstance(payload, dict):
+        return payload.get(json_content_key) or []
+    if isinstance(payload, list) and payload and isinstance(payload[0], str):
+        return [{"value": item} for item in payload]
+    return payload
+
+
+_scanner: duckdb.DuckDBPyConnection | None = None
+_scanner_lock = threading.Lock()
+
+
+def scan_json_rows(path: Path, json_content_key: str | None, date_key: str | None) -> tuple[int, list[str]] | None:
+    """Count the rows of a JSON body on disk and collect its distinct ``date_key`` values.
+
+    DuckDB's JSON reader does the scan, so the body never becomes Python objects and the
+    GIL is free while it runs.  Returns None unless the body is a complete array of row
+    objects (or an object holding one under ``json_content_key``); callers then fall back
+    to ``json.load`` and ``normalize_json_payload``.
+    """
+    with open(path, "rb") as fh:
+        head = fh.read(64).lstrip()[:1]
+        fh.seek(max(0, path.stat().st_size - 64))
+        tail = fh.read().rstrip()[-1:]
+    # DuckDB stops at the last complete row of a truncated array; leave those to json.load.
+    expected = (b"{", b"}") if json_content_key else (b"[", b"]")
+    if (head, tail) != expected:
+        return None
+
+    column = _quote_ident(date_key or "date")  # any column type-checks the rows; dates are only read with a date_key
+    options = f"records = true, maximum_object_size = {SILVER_DUCKDB_MAX_JSON_OBJECT_BYTES}"
+    if json_content_key:
+        sql = (
+            f"SELECT count(r), list_distinct(list(r.{column})) FROM ("
+            f"SELECT unnest({_quote_ident(json_content_key)}) AS r FROM read_json($path, format = 'unstructured', {options}, "
+            f"columns = {{{_literal(json_content_key)}: 'STRUCT({column} VARCHAR)[]'}}))"
+        )
+    else:
+        sql = f"SELECT count(*), list_distinct(list({column})) FROM read_json($path, format = 'array', {options}, columns = {{{_literal(date_key or 'date')}: 'VARCHAR'}})"
+    try:
+        rows, dates = _scanner_cursor().execute(sql, {"path": str(path)}).fetchone()
+    except duckdb.Error:
+        return None
+    return rows, ([d for d in dates or [] if d is not None] if date_key else [])
+
+
+def _scanner_cursor() -> duckdb.DuckDBPyConnection:
+    global _scanner
+    with _scanner_lock:
+        if _scanner is None:
+            _scanner = duckdb.connect()
+        return _scanner.cursor()
+
+
+def _quote_ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+class RawPayload:
+    """Vendor response body kept byte-for-byte for raw Bronze storage.
+
+    While a result is in flight the bytes live in a temp file (``new_spool``); once read back
+    from Bronze the payload points at its sidecar file next to the JSON envelope.
+    Rows are only parsed on demand — iterating yields row dicts, ``to_frame()`` loads
+    the body straight into a DataFrame — so the fetch path never builds them.
+    ``len()`` is the row count recorded when the response was scanned.
+    """
+
+    def __init__(
+        self,
+        *,
+        fmt: str,
+        sha256: str,
+        rows: int,
+        compression: str | None = None,
+        json_content_key: str | None = None,
+        spool: typing.BinaryIO | None = None,
+        spool_path: Path | None = None,
+        path: Path | None = None,
+    ) -> None:
+        self.fmt = fmt
+        self.sha256 = sha256
+        self.rows = rows
+        self.compression = compression
+        self.json_content_key = json_content_key
+        self._spool = spool
+        self._spool_path = spool_path  # named spool file, deleted on close
+        self.path = path
+
+    @staticmethod
+    def new_spool(named: bool = False) -> typing.BinaryIO:
+        """Temp file for an in-flight body; ``named`` ones skip the in-memory stage so DuckDB can scan them by path."""
+        if named:
+            return tempfile.NamedTemporaryFile(mode="w+b", suffix=".json", delete=False)
+        return tempfile.SpooledTemporaryFile(max_size=BRONZE_SPOOL_MAX_MEMORY_BYTES, mode="w+b")
+
+    @staticmethod
+    def discard_spool(spool: typing.BinaryIO, spool_path: Path | None = None) -> None:
+        spool.close()
+        if spool_path is not None:
+            spool_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def sidecar_path(envelope_path: Path, compression: str | None) -> Path:
+        """``<stem>.payload`` (or ``<stem>.payload.gz``) next to the ``<stem>.json`` envelope."""
+        suffix = ".payload.gz" if compression == RAW_COMPRESSION_GZIP else ".payload"
+        return envelope_path.with_name(envelope_path.stem + suffix)
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __bool__(self) -> bool:
+        return self.rows > 0
+
+    def __iter__(self) -> typing.Iterator[dict[str, typing.Any]]:
+        with self._open() as fh:
+            if self.fmt == RAW_FORMAT_CSV:
+                text = io.TextIOWrapper(fh, encoding="utf-8", newline="")
+                try:
+                    yield from csv.DictReader(text)
+                finally:
+                    text.detach()
+            else:
+                yield from normalize_json_payload(json.load(fh), self.json_content_key) or []
+
+    def to_frame(self) -> pd.DataFrame:
+        """Parse the body into a DataFrame of string-typed columns, as the parsed Bronze path would."""
+        if self.fmt != RAW_FORMAT_CSV:
+            return pd.DataFrame(list(self))
+        if not self.rows:
+            return pd.DataFrame()
+        with self._open() as fh:
+            return pd.read_csv(fh, dtype=str, keep_default_na=False)
+
+    def descriptor(self, sidecar: Path) -> dict[str, typing.Any]:
+        """Envelope entry describing the sidecar file."""
+        return {
+            "file": sidecar.name,
+            "format": self.fmt,
+            "compression": self.compression,
+            "sha256": self.sha256,
+            "rows": self.rows,
+            "json_content_key": self.json_content_key,
+        }
+
+    @classmethod
+    def from_descriptor(cls, descriptor: typing.Mapping[str, typing.Any], envelope_path: Path) -> "RawPayload":
+        return cls(
+            fmt=descriptor.get("format") or RAW_FORMAT_JSON,
+            sha256=descriptor.get("sha256"),
+            rows=int(descriptor.get("rows") or 0),
+            compression=descriptor.get("compression"),
+            json_content_key=descriptor.get("json_content_key"),
+            path=envelope_path.with_name(descriptor["file"]),
+        )
+
+    def write_to(self, path: Path) -> None:
+        """Copy the verbatim bytes to ``path``, compressing if requested."""
+        opener = gzip.open if self.compression == RAW_COMPRESSION_GZIP else open
+        with self._open() as src, opener(path, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+
+    def close(self) -> None:
+        if self._spool is not None:
+            self.discard_spool(self._spool, self._spool_path)
+
+    @contextlib.contextmanager
+    def _open(self) -> typing.Iterator[typing.BinaryIO]:
+        if self._spool is not None:
+            self._spool.flush()
+            self._spool.seek(0)
+            yield self._spool
+            return
+        if self.path is None:
+            raise ValueError("RawPayload has neither a spool nor a sidecar path")
+        opener = gzip.open if self.compression == RAW_COMPRESSION_GZIP else open
+        with opener(self.path, "rb") as fh:
+            yield fh
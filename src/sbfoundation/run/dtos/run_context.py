@@ -22,11 +22,27 @@ class RunContext(BronzeToSilverDTO):
     finished_at: datetime = None
     bronze_files_passed: int = 0
     bronze_files_failed: int = 0
+    bronze_files_unchanged: int = 0  # payload hash matched the identity's last promotable file; no file written
+    bronze_requests_resumed: int = 0  # requests a resumed run skipped because its journal shows them done
     silver_dto_count: int = 0
     silver_failed_count: int = 0
     throttle_wait_count: int = 0
     throttle_sleep_seconds: float = 0.0
     throttle_max_queue_depth: int = 0
+    throttle_wait_seconds_by_source: dict[str, float] = field(default_factory=dict)
+    throttle_max_queue_depth_by_source: dict[str, int] = field(default_factory=dict)
+    throttle_backoffs_by_source: dict[str, int] = field(default_factory=dict)  # 429/503 responses that cut the source's rate
+    retries_deferred_by_source: dict[str, int] = field(default_factory=dict)  # failed attempts parked on the work queue's retry heap
+    circuit_opens_by_source: dict[str, int] = field(default_factory=dict)  # times repeated failures paused a source
+    quota_yields_by_source: dict[str, int] = field(default_factory=dict)  # requests not sent because the source's API budget ran low for this priority
+    hedged_requests: int = 0  # slow requests raced against a duplicate GET
+    hedge_wins: int = 0  # hedged requests won by the duplicate
+    bronze_writes: int = 0  # Bronze files persisted by the writer pool
+    bronze_write_seconds: float = 0.0  # total time the writer pool spent encoding and writing those files
+    bronze_write_wait_seconds: float = 0.0  # total time results queued before a writer picked them up
+    bronze_writer_max_queue_depth: int = 0  # largest writer backlog a fetch worker queued a result behind
+    http_requests: int = 0  # requests sent over pooled keep-alive sessions
+    http_connections_opened: int = 0  # new TCP/TLS connections those requests needed
     status: str | None = None
 
     bronze_injest_items: list[BronzeInjestItem] = field(default_factory=list)
@@ -39,11 +55,19 @@ class RunContext(BronzeToSilverDTO):
     def elapsed_seconds(self) -> float:
         return round((self.finished_at - self.started_at).total_seconds(), 2)
 
+    @property
+    def http_connection_reuse_ratio(self) -> float:
+        """Share of pooled requests that reused an already-open connection."""
+        if not self.http_requests:
+            return 0.0
+        return round(1 - self.http_connections_opened / self.http_requests, 4)
+
     @property
     def msg(self) -> str:
         return (
             f"elapsed_seconds={self.elapsed_seconds:.2f} | bronze_files_written={self.bronze_files_passed}"
-            f" | bronze_files_failed={self.bronze_files_failed} | silver_dto_count={self.silver_dto_count}"
+            f" | bronze_files_failed={self.bronze_files_failed} | bronze_files_unchanged={self.bronze_files_unchanged}"
+            f" | silver_dto_count={self.silver_dto_count}"
         )
 
     @property
@@ -61,6 +85,51 @@ class RunContext(BronzeToSilverDTO):
         minutes, seconds = divmod(remainder, 60)
         return f"{hours}h {minutes}m {seconds}s"
 
+    def record_throttle(self, source: str, sleep_seconds: float, queue_depth: int) -> None:
+        """Record one rate-limiter reservation for ``source``."""
+        with self._lock:
+            if queue_depth > self.throttle_max_queue_depth:
+                self.throttle_max_queue_depth = queue_depth
+            if queue_depth > self.throttle_max_queue_depth_by_source.get(source, 0):
+                self.throttle_max_queue_depth_by_source[source] = queue_depth
+            if sleep_seconds > 0:
+                self.throttle_wait_count += 1
+                self.throttle_sleep_seconds += sleep_seconds
+                self.throttle_wait_seconds_by_source[source] = self.throttle_wait_seconds_by_source.get(source, 0.0) + sleep_seconds
+
+    def record_http_requests(self, requests_sent: int, connections_opened: int) -> None:
+        with self._lock:
+            self.http_requests += requests_sent
+            self.http_connections_opened += connections_opened
+
+    def record_throttle_backoff(self, source: str) -> None:
+        with self._lock:
+            self.throttle_backoffs_by_source[source] = self.throttle_backoffs_by_source.get(source, 0) + 1
+
+    def record_bronze_write(self, write_seconds: float, wait_seconds: float, queue_depth: int) -> None:
+        with self._lock:
+            self.bronze_writes += 1
+            self.bronze_write_seconds += write_seconds
+            self.bronze_write_wait_seconds += wait_seconds
+            if queue_depth > self.bronze_writer_max_queue_depth:
+                self.bronze_writer_max_queue_depth = queue_depth
+
+    def record_resumed_request(self) -> None:
+        with self._lock:
+            self.bronze_requests_resumed += 1
+
+    def record_deferred_retry(self, source: str) -> None:
+        with self._lock:
+            self.retries_deferred_by_source[source] = self.retries_deferred_by_source.get(source, 0) + 1
+
+    def record_quota_yield(self, source: str) -> None:
+        with self._lock:
+            self.quota_yields_by_source[source] = self.quota_yields_by_source.get(source, 0) + 1
+
+    def record_circuit_open(self, source: str) -> None:
+        with self._lock:
+            self.circuit_opens_by_source[source] = self.circuit_opens_by_source.get(source, 0) + 1
+
     def result_bronze_error(self, result: BronzeResult, e: str, filename: str | None = None) -> BronzeInjestItem:
         filename = filename or result.request.bronze_absolute_filename
         item = BronzeInjestItem(
@@ -99,6 +168,25 @@ class RunContext(BronzeToSilverDTO):
             self.bronze_injest_items.append(item)
         return item
 
+    def result_bronze_unchanged(self, result: BronzeResult, filename: str) -> BronzeInjestItem:
+        """Record a fetch whose payload matched the previous file at ``filename``."""
+        item = BronzeInjestItem(
+            domain=result.request.recipe.domain,
+            source=result.request.recipe.source,
+            dataset=result.request.recipe.dataset,
+            discriminator=result.request.recipe.discriminator,
+            ticker=result.request.ticker,
+            from_date=result.first_date,
+            to_date=result.last_date,
+            filename=filename,
+            status="unchanged",
+            error=result.error,
+        )
+        with self._lock:
+            self.bronze_files_unchanged += 1
+            self.bronze_injest_items.append(item)
+        return item
+
     def result_silver_pass(self, result: BronzeResult, dto: BronzeToSilverDTO) -> SilverInjestItem:
         item = SilverInjestItem(
             domain=result.request.recipe.domain,
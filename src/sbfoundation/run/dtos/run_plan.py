@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import typing
+
+SKIP_RESUMED = "resumed"  # the run journal shows the request already completed
+SKIP_DUPLICATE = "duplicate"  # ingested today already
+SKIP_TOO_SOON = "too_soon"  # inside the dataset's min_age_days cadence
+SKIP_REJECTED = "rejected"  # RunRequest.canRun() failed
+
+
+@dataclass(slots=True)
+class PlannedDataset:
+    source: str
+    dataset: str
+    requests: int = 0  # requests that pass every gate and would be fetched
+    skipped_duplicate: int = 0
+    skipped_too_soon: int = 0
+    rejected: int = 0
+    resumed: int = 0
+    paginated: bool = False  # page count is unknown until fetched; counted as one request
+    latency_seconds: float = 0.0  # assumed seconds per request
+
+    @property
+    def msg(self) -> str:
+        pages = " (paginated, at least)" if self.paginated else ""
+        return (
+            f"{self.source}/{self.dataset}: requests={self.requests}{pages} | duplicate={self.skipped_duplicate}"
+            f" | too_soon={self.skipped_too_soon} | rejected={self.rejected} | resumed={self.resumed}"
+            f" | latency={self.latency_seconds:.2f}s"
+        )
+
+
+@dataclass(slots=True)
+class RunPlan:
+    """What a Bronze run would fetch, built from the dedup/cadence gates without network calls.
+
+    ``project`` turns the request counts into a runtime estimate: each source needs at
+    least the time its token bucket takes to release its requests, all requests share
+    ``concurrent_requests`` workers for their latency, and the run takes the longest of
+    those.  ``throttle_wait_seconds_by_source`` is the part of a source's time spent
+    waiting on its bucket rather than on the network.
+    """
+
+    run_id: str
+    concurrent_requests: int
+    datasets: dict[tuple[str, str], PlannedDataset] = field(default_factory=dict)
+    throttle_wait_seconds_by_source: dict[str, float] = field(default_factory=dict)
+    projected_seconds: float = 0.0
+
+    def add(self, source: str, dataset: str, skip: str | None, paginated: bool = False) -> None:
+        line = self.datasets.get((source, dataset))
+        if line is None:
+            line = self.datasets[(source, dataset)] = PlannedDataset(source=source, dataset=dataset)
+        line.paginated = line.paginated or paginated
+        if skip is None:
+            line.requests += 1
+        elif skip == SKIP_DUPLICATE:
+            line.skipped_duplicate += 1
+        elif skip == SKIP_TOO_SOON:
+            line.skipped_too_soon += 1
+        elif skip == SKIP_RESUMED:
+            line.resumed += 1
+        else:
+            line.rejected += 1
+
+    @property
+    def requests(self) -> int:
+        return sum(line.requests for line in self.datasets.values())
+
+    @property
+    def requests_by_source(self) -> dict[str, int]:
+        out: dict[str, int] = {}
+        for line in self.datasets.values():
+            out[line.source] = out.get(line.source, 0) + line.requests
+        return out
+
+    def project(
+        self,
+        min_seconds: typing.Callable[[str, int], float],
+        global_min_seconds: typing.Callable[[int], float],
+        latency_for: typing.Callable[[str, str], float],
+    ) -> "RunPlan":
+        """Fill in latencies, throttle waits and the projected wall time; returns self."""
+        workers = max(1, self.concurrent_requests)
+        network_by_source: dict[str, float] = {}
+        for line in self.datasets.values():
+            line.latency_seconds = latency_for(line.source, line.dataset)
+            network_by_source[line.source] = network_by_source.get(line.source, 0.0) + line.requests * line.latency_seconds
+        source_seconds: list[float] = []
+        for source, calls in self.requests_by_source.items():
+            floor = min_seconds(source, calls)
+            network = network_by_source.get(source, 0.0) / workers
+            self.throttle_wait_seconds_by_source[source] = max(0.0, floor - network)
+            source_seconds.append(max(floor, network))
+        self.projected_seconds = max(
+            [*source_seconds, sum(network_by_source.values()) / workers, global_min_seconds(self.requests)]
+        )
+        return self
+
+    @property
+    def msg(self) -> str:
+        waits = ", ".join(f"{source}={seconds:.0f}s" for source, seconds in sorted(self.throttle_wait_seconds_by_source.items()))
+        return (
+            f"run_id={self.run_id} | requests={self.requests} | workers={self.concurrent_requests}"
+            f" | throttle_wait=[{waits}] | projected={self.projected_seconds / 60:.1f} min"
+        )
@@ -0,0 +1,53 @@
+import json
+import tempfile
+import typing
+
+from sbfoundation.settings import BRONZE_SPOOL_MAX_MEMORY_BYTES
+
+
+class SpooledRows:
+    """Append-only sequence of row dicts parked in a spooled temp file instead of a list.
+
+    Rows are stored as compact JSON lines; they stay in memory up to ``max_memory``
+    bytes and spill to disk beyond that.  The object supports ``len()``, truthiness and
+    repeated iteration, so Bronze gates that only count or scan rows treat it like
+    the ``list[dict]`` it replaces, while ``write_json_array`` lets the file adapter
+    copy the rows out without materializing them.
+    """
+
+    def __init__(self, max_memory: int = BRONZE_SPOOL_MAX_MEMORY_BYTES) -> None:
+        self._file = tempfile.SpooledTemporaryFile(max_size=max_memory, mode="w+b")
+        self._count = 0
+
+    def append_json(self, row_json: str) -> None:
+        """Append one row already serialized as a single-line JSON object."""
+        self._file.write(row_json.encode("utf-8"))
+        self._file.write(b"\n")
+        self._count += 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    def __iter__(self) -> typing.Iterator[dict[str, typing.Any]]:
+        for line in self._lines():
+            yield json.loads(line)
+
+    def write_json_array(self, out: typing.BinaryIO, separator: bytes = b",\n") -> None:
+        """Write the rows to ``out`` as the items of a JSON array (without the brackets)."""
+        for i, line in enumerate(self._lines()):
+            if i:
+                out.write(separator)
+            out.write(line)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def _lines(self) -> typing.Iterator[bytes]:
+        self._file.flush()
+        self._file.seek(0)
+        for line in self._file:
+            yield line.rstrip(b"\n")
+        self._file.seek(0, 2)
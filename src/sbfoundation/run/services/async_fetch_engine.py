@@ -0,0 +1,78 @@
+import asyncio
+import queue
+import threading
+import typing
+
+from sbfoundation.run.services.async_http_client import AsyncHttpClient
+
+T = typing.TypeVar("T")
+
+AsyncTask = tuple[str, typing.Callable[[], typing.Awaitable[None]]]  # (label for logging, coroutine function)
+
+_DONE = object()
+
+
+class AsyncFetchEngine(typing.Generic[T]):
+    """Run groups of Bronze fetch coroutines on one asyncio event loop.
+
+    The event-loop counterpart of ``BronzeWorkQueue``: every task of every group is
+    scheduled at once and an ``asyncio.Semaphore`` keeps at most ``max_in_flight`` of
+    them running, so thousands of requests can be waiting on the network or on their
+    source's rate limiter without a thread each.  The loop runs on its own thread and
+    shares ``client`` across tasks; when a group's last task ends the group is handed
+    back to the thread that called ``run()`` via ``on_group_complete``, which is where
+    per-recipe manifest flushes happen.
+    """
+
+    def __init__(
+        self, max_in_flight: int, logger: typing.Any, run_id: str | None = None, client: AsyncHttpClient | None = None
+    ) -> None:
+        self._max_in_flight = max(1, max_in_flight)
+        self._logger = logger
+        self._run_id = run_id
+        self.client = client or AsyncHttpClient()
+        self._groups: list[tuple[T, list[AsyncTask]]] = []
+
+    def add_group(self, group: T, tasks: list[AsyncTask]) -> None:
+        """Queue ``tasks`` for ``group``; groups are started in the order they were added."""
+        self._groups.append((group, tasks))
+
+    def run(self, on_group_complete: typing.Callable[[T], None]) -> None:
+        """Drive every task to completion, calling ``on_group_complete`` on this thread as each group finishes."""
+        completed: queue.Queue = queue.Queue()
+        loop_thread = threading.Thread(target=self._drive, args=(completed,), name="bronze-event-loop", daemon=True)
+        loop_thread.start()
+        while (group := completed.get()) is not _DONE:
+            try:
+                on_group_complete(group)
+            except Exception as exc:
+                self._logger.error(f"Group completion failed: {exc}", run_id=self._run_id)
+        loop_thread.join()
+
+    def _drive(self, completed: queue.Queue) -> None:
+        try:
+            asyncio.run(self._run_all(completed))
+        except Exception as exc:
+            self._logger.error(f"Event loop failed: {exc}", run_id=self._run_id)
+        finally:
+            completed.put(_DONE)
+
+    async def _run_all(self, completed: queue.Queue) -> None:
+        semaphore = asyncio.Semaphore(self._max_in_flight)
+        try:
+            await asyncio.gather(*(self._run_group(semaphore, group, tasks, completed) for group, tasks in self._groups))
+        finally:
+            await self.client.aclose()
+
+    async def _run_group(self, semaphore: asyncio.Semaphore, group: T, tasks: list[AsyncTask], completed: queue.Queue) -> None:
+        try:
+            await asyncio.gather(*(self._run_task(semaphore, label, task) for label, task in tasks))
+        finally:
+            completed.put(group)
+
+    async def _run_task(self, semaphore: asyncio.Semaphore, label: str, task: typing.Callable[[], typing.Awaitable[None]]) -> None:
+        async with semaphore:
+            try:
+                await task()
+            except Exception as exc:
+                self._logger.error(f"Task {label} failed: {exc}", run_id=self._run_id)
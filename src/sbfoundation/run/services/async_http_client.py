@@ -0,0 +1,272 @@
+import asyncio
+import ssl
+import time
+import typing
+import zlib
+from datetime import timedelta
+from urllib.parse import urljoin, urlsplit
+
+import requests
+from requests.certs import where as ca_bundle
+from requests.structures import CaseInsensitiveDict
+from requests.utils import default_user_agent, get_encoding_from_headers
+
+from sbfoundation.settings import CONNECT_TIMEOUT, HTTP_POOL_DEFAULT_MAXSIZE, READ_TIMEOUT
+
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
+_BODYLESS_CODES = (204, 304)
+_READ_CHUNK_BYTES = 64 * 1024
+
+
+class _StaleConnection(Exception):
+    """A reused keep-alive connection was closed by the server before it answered."""
+
+
+class _Connection:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class AsyncHttpClient:
+    """Minimal HTTP/1.1 GET client on asyncio streams, used by the event-loop fetch engine.
+
+    Connections are kept alive per origin (up to ``max_idle_per_origin`` idle ones), and
+    Content-Length, chunked and read-to-close bodies are supported, as are gzip/deflate
+    encodings and redirects.  The body is read in full, so the result is a consumed
+    ``requests.Response``.  Transport failures are raised as the matching ``requests``
+    exceptions, so ``RunRequestExecutor`` retries them and ``BronzeService`` records
+    them exactly as it does for the blocking session pool.  Streaming, conditional
+    requests and hedging are not supported; recipes that need them stay on threads.
+    """
+
+    def __init__(
+        self,
+        connect_timeout: float = CONNECT_TIMEOUT,
+        read_timeout: float = READ_TIMEOUT,
+        max_idle_per_origin: int = HTTP_POOL_DEFAULT_MAXSIZE,
+    ) -> None:
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_idle_per_origin = max_idle_per_origin
+        self._idle: dict[tuple[str, str, int], list[_Connection]] = {}
+        self._ssl_context: ssl.SSLContext | None = None
+        self._requests_sent = 0
+        self._connections_opened = 0
+
+    def stats(self) -> tuple[int, int]:
+        """Return ``(requests_sent, connections_opened)``, as ``HttpSessionPool.stats`` does."""
+        return self._requests_sent, self._connections_opened
+
+    async def get(self, url: str, params: dict | None = None) -> requests.Response:
+        """GET ``url`` with ``params`` encoded as ``requests`` would, following redirects."""
+        prepared = requests.Request("GET", url, params=params).prepare()
+        started = time.monotonic()
+        target = prepared.url
+        for _ in range(requests.models.DEFAULT_REDIRECT_LIMIT + 1):
+            response = await self._send(target)
+            location = response.headers.get("Location")
+            if response.status_code not in _REDIRECT_CODES or not location:
+                response.elapsed = timedelta(seconds=time.monotonic() - started)
+                response.request = prepared
+                return response
+            target = urljoin(target, location)
+        raise requests.TooManyRedirects(f"Exceeded {requests.models.DEFAULT_REDIRECT_LIMIT} redirects.", request=prepared)
+
+    async def aclose(self) -> None:
+        """Close every idle connection."""
+        idle = [connection for connections in self._idle.values() for connection in connections]
+        self._idle.clear()
+        for connection in idle:
+            connection.close()
+        for connection in idle:
+            try:
+                await connection.writer.wait_closed()
+            except Exception:
+                pass
+
+    async def _send(self, url: str) -> requests.Response:
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise requests.exceptions.InvalidURL(f"Invalid URL {url!r}")
+        origin = (parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == "https" else 80))
+        connection = self._checkout(origin)
+        if connection is not None:
+            try:
+                return await self._exchange(connection, origin, parts, url, reused=True)
+            except _StaleConnection:
+                pass
+        connection = await self._connect(origin)
+        return await self._exchange(connection, origin, parts, url, reused=False)
+
+    def _checkout(self, origin: tuple[str, str, int]) -> _Connection | None:
+        idle = self._idle.get(origin)
+        while idle:
+            connection = idle.pop()
+            if not connection.reader.at_eof() and not connection.writer.is_closing():
+                return connection
+            connection.close()
+        return None
+
+    def _checkin(self, origin: tuple[str, str, int], connection: _Connection) -> None:
+        idle = self._idle.setdefault(origin, [])
+        if len(idle) < self.max_idle_per_origin:
+            idle.append(connection)
+        else:
+            connection.close()
+
+    async def _connect(self, origin: tuple[str, str, int]) -> _Connection:
+        scheme, host, port = origin
+        ssl_context = self._tls() if scheme == "https" else None
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(host, port, ssl=ssl_context, server_hostname=host if ssl_context else None),
+                self.connect_timeout,
+            )
+        except asyncio.TimeoutError as exc:
+            raise requests.ConnectTimeout(f"Connection to {host}:{port} timed out") from exc
+        except ssl.SSLError as exc:
+            raise requests.exceptions.SSLError(f"TLS handshake with {host}:{port} failed: {exc}") from exc
+        except OSError as exc:
+            raise requests.ConnectionError(f"Connection to {host}:{port} failed: {exc}") from exc
+        self._connections_opened += 1
+        return _Connection(reader, writer)
+
+    def _tls(self) -> ssl.SSLContext:
+        if self._ssl_context is None:
+            self._ssl_context = ssl.create_default_context(cafile=ca_bundle())
+        return self._ssl_context
+
+    async def _exchange(self, connection: _Connection, origin: tuple[str, str, int], parts, url: str, reused: bool) -> requests.Response:
+        """Send one GET and read its response; the connection goes back to the pool if it can be reused."""
+        scheme, host, port = origin
+        default_port = 443 if scheme == "https" else 80
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        head = (
+            f"GET {path} HTTP/1.1\r\n"
+            f"Host: {host if port == default_port else f'{host}:{port}'}\r\n"
+            f"User-Agent: {default_user_agent()}\r\n"
+            "Accept-Encoding: gzip, deflate\r\n"
+            "Accept: */*\r\n"
+            "Connection: keep-alive\r\n\r\n"
+        )
+        received_head = False
+        try:
+            connection.writer.write(head.encode("latin-1"))
+            await self._timed(connection.writer.drain())
+            self._requests_sent += 1
+            raw_head = await self._timed(connection.reader.readuntil(b"\r\n\r\n"))
+            received_head = True
+            version, status_code, reason, headers = self._parse_head(raw_head)
+            body, keep_alive = await self._read_body(connection.reader, status_code, headers)
+        except asyncio.TimeoutError as exc:
+            connection.close()
+            raise requests.ReadTimeout(f"Read from {host}:{port} timed out") from exc
+        except (asyncio.IncompleteReadError, ConnectionError) as exc:
+            connection.close()
+            if reused and not received_head:
+                raise _StaleConnection() from exc
+            if received_head:
+                raise requests.exceptions.ChunkedEncodingError(f"Connection to {host}:{port} broken mid-body: {exc!r}") from exc
+            raise requests.ConnectionError(f"Connection to {host}:{port} closed without a response: {exc!r}") from exc
+        except (asyncio.LimitOverrunError, ValueError) as exc:
+            connection.close()
+            raise requests.ConnectionError(f"Malformed response from {host}:{port}: {exc}") from exc
+        except BaseException:
+            connection.close()
+            raise
+
+        if keep_alive and version == "HTTP/1.1" and headers.get("Connection", "").lower() != "close":
+            self._checkin(origin, connection)
+        else:
+            connection.close()
+
+        response = requests.Response()
+        response.status_code = status_code
+        response.reason = reason
+        response.headers = headers
+        response.url = url
+        response.encoding = get_encoding_from_headers(headers)
+        response._content = self._decode(body, headers.get("Content-Encoding", ""))
+        response._content_consumed = True
+        return response
+
+    async def _timed(self, awaitable: typing.Awaitable[typing.Any]) -> typing.Any:
+        return await asyncio.wait_for(awaitable, self.read_timeout)
+
+    @staticmethod
+    def _parse_head(raw_head: bytes) -> tuple[str, int, str, CaseInsensitiveDict]:
+        lines = raw_head.decode("latin-1").split("\r\n")
+        version, _, rest = lines[0].partition(" ")
+        code, _, reason = rest.partition(" ")
+        if not version.startswith("HTTP/"):
+            raise ValueError(f"bad status line {lines[0]!r}")
+        headers: CaseInsensitiveDict = CaseInsensitiveDict()
+        for line in lines[1:]:
+            if not line:
+                continue
+            name, sep, value = line.partition(":")
+            if not sep:
+                raise ValueError(f"bad header line {line!r}")
+            name, value = name.strip(), value.strip()
+            headers[name] = f"{headers[name]}, {value}" if name in headers else value
+        return version, int(code), reason, headers
+
+    async def _read_body(self, reader: asyncio.StreamReader, status_code: int, headers: CaseInsensitiveDict) -> tuple[bytes, bool]:
+        """Return the body and whether the connection is still usable for the next request."""
+        if status_code < 200 or status_code in _BODYLESS_CODES:
+            return b"", True
+        if "chunked" in headers.get("Transfer-Encoding", "").lower():
+            return await self._read_chunked(reader), True
+        length = headers.get("Content-Length")
+        if length is not None:
+            return await self._read_exactly(reader, int(length)), True
+        # No framing: the body runs until the server closes the connection.
+        chunks = []
+        while chunk := await self._timed(reader.read(_READ_CHUNK_BYTES)):
+            chunks.append(chunk)
+        return b"".join(chunks), False
+
+    async def _read_chunked(self, reader: asyncio.StreamReader) -> bytes:
+        chunks = []
+        while True:
+            size_line = await self._timed(reader.readuntil(b"\r\n"))
+            size = int(size_line.split(b";", 1)[0].strip(), 16)
+            if size == 0:
+                # Skip any trailers up to the blank line that ends the message.
+                while await self._timed(reader.readuntil(b"\r\n")) != b"\r\n":
+                    pass
+                return b"".join(chunks)
+            chunks.append(await self._read_exactly(reader, size))
+            await self._timed(reader.readexactly(2))
+
+    async def _read_exactly(self, reader: asyncio.StreamReader, size: int) -> bytes:
+        # The read timeout applies between chunks, as it does for requests, not to the whole body.
+        chunks = []
+        while size > 0:
+            chunk = await self._timed(reader.readexactly(min(size, _READ_CHUNK_BYTES)))
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+
+    @staticmethod
+    def _decode(body: bytes, content_encoding: str) -> bytes:
+        encoding = content_encoding.strip().lower()
+        if not body or encoding in ("", "identity"):
+            return body
+        try:
+            if encoding == "gzip":
+                return zlib.decompress(body, 16 + zlib.MAX_WBITS)
+            if encoding == "deflate":
+                try:
+                    return zlib.decompress(body)
+                except zlib.error:
+                    return zlib.decompress(body, -zlib.MAX_WBITS)
+        except zlib.error as exc:
+            raise requests.exceptions.ContentDecodingError(f"Failed to decode {encoding} body: {exc}") from exc
+        return body
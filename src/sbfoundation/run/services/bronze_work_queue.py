@@ -0,0 +1,123 @@
+import heapq
+import itertools
+import queue
+import threading
+import time
+import typing
+
+from sbfoundation.run.services.run_request_executor import DeferredRetry
+
+T = typing.TypeVar("T")
+
+Task = tuple[str, typing.Callable[[], None]]  # (label for logging, callable)
+
+
+class BronzeWorkQueue(typing.Generic[T]):
+    """Run-wide prioritized work queue shared by every registered recipe.
+
+    Tasks from all groups (one group per recipe) go into a single heap ordered by
+    ``(priority, submission order)``; ``workers`` threads pop from it until it is
+    empty, so no worker idles while another recipe still has work.  When the last
+    task of a group finishes, the group is handed back to the thread that called
+    ``run()`` via ``on_group_complete`` — serial, off the workers — which is where
+    per-recipe manifest flushes happen.
+
+    A task that raises ``DeferredRetry`` is not finished: its ``resume`` callable is
+    parked on a delayed heap and moved back onto the main heap, at its original
+    position, once due.  The worker moves straight on to the next task instead of
+    sleeping through the back-off, and stays alive while retries are pending.
+    """
+
+    def __init__(
+        self, workers: int, logger: typing.Any, run_id: str | None = None, clock: typing.Callable[[], float] = time.monotonic
+    ) -> None:
+        self._workers = max(1, workers)
+        self._logger = logger
+        self._run_id = run_id
+        self._clock = clock
+        self._heap: list[tuple[typing.Any, int, int, Task]] = []
+        self._delayed: list[tuple[float, typing.Any, int, int, Task]] = []
+        self._seq = itertools.count()
+        self._groups: dict[int, T] = {}
+        self._outstanding: dict[int, int] = {}
+        self._running = 0
+        self._lock = threading.Lock()
+        self._ready = threading.Condition(self._lock)
+        self._completed: queue.Queue[T] = queue.Queue()
+
+    def add_group(self, group: T, tasks: list[Task], priority: typing.Any = 0) -> None:
+        """Queue ``tasks`` for ``group``; lower ``priority`` values are started first."""
+        key = id(group)
+        with self._lock:
+            self._groups[key] = group
+            self._outstanding[key] = len(tasks)
+            for task in tasks:
+                heapq.heappush(self._heap, (priority, next(self._seq), key, task))
+        if not tasks:
+            self._completed.put(group)
+
+    def run(self, on_group_complete: typing.Callable[[T], None]) -> None:
+        """Drain the queue, calling ``on_group_complete`` on this thread as each group finishes."""
+        remaining = len(self._groups)
+        threads = [
+            threading.Thread(target=self._worker, name=f"bronze-worker-{i}", daemon=True)
+            for i in range(min(self._workers, len(self._heap)))
+        ]
+        for thread in threads:
+            thread.start()
+        while remaining:
+            group = self._completed.get()
+            remaining -= 1
+            try:
+                on_group_complete(group)
+            except Exception as exc:
+                self._logger.error(f"Group completion failed: {exc}", run_id=self._run_id)
+        for thread in threads:
+            thread.join()
+
+    def _worker(self) -> None:
+        while True:
+            item = self._next_task()
+            if item is None:
+                return
+            priority, seq, key, (label, task) = item
+            done = False
+            try:
+                task()
+            except DeferredRetry as retry:
+                if retry.resume is None:
+                    self._logger.error(f"Worker exception for {label}: {retry} (no resume callable)", run_id=self._run_id)
+                    done = True
+                else:
+                    with self._lock:
+                        heapq.heappush(self._delayed, (self._clock() + retry.delay, priority, seq, key, (label, retry.resume)))
+            except Exception as exc:
+                self._logger.error(f"Worker exception for {label}: {exc}", run_id=self._run_id)
+                done = True
+            else:
+                done = True
+            finally:
+                with self._ready:
+                    self._running -= 1
+                    if done:
+                        self._outstanding[key] -= 1
+                        done = self._outstanding[key] == 0
+                    self._ready.notify_all()
+            if done:
+                self._completed.put(self._groups[key])
+
+    def _next_task(self) -> tuple[typing.Any, int, int, Task] | None:
+        """Pop the next ready task, waiting for parked retries; None once nothing is left anywhere."""
+        with self._ready:
+            while True:
+                now = self._clock()
+                while self._delayed and self._delayed[0][0] <= now:
+                    _, priority, seq, key, task = heapq.heappop(self._delayed)
+                    heapq.heappush(self._heap, (priority, seq, key, task))
+                if self._heap:
+                    self._running += 1
+                    return heapq.heappop(self._heap)
+                if not self._delayed and not self._running:
+                    return None
+                # Sleep until the next retry is due or a running task parks a new one.
+                self._ready.wait(self._delayed[0][0] - now if self._delayed else None)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+import typing
+
+from sbfoundation.run.dtos.bronze_result import BronzeResult
+from sbfoundation.run.dtos.run_context import RunContext
+from sbfoundation.settings import BRONZE_WRITER_QUEUE_SIZE
+
+_CLOSE = object()
+
+
+class BronzeWriterPool:
+    """Serialize and persist Bronze results on dedicated writer threads.
+
+    Fetch workers hand each accepted result to ``submit`` and go back to HTTP; the writers
+    run ``write`` (encoding, directory creation, file write) and then ``on_written`` with the
+    result.  The queue is bounded, so when disk falls behind ``submit`` blocks the fetch
+    worker instead of letting payloads pile up in memory.  ``drain`` waits until every
+    submitted result is written; callers drain before flushing manifests.
+
+    Queue depth and write latency are recorded on ``run`` for each write.
+    """
+
+    def __init__(
+        self,
+        write: typing.Callable[[BronzeResult], typing.Any],
+        workers: int,
+        logger: typing.Any,
+        maxsize: int = BRONZE_WRITER_QUEUE_SIZE,
+    ) -> None:
+        self._write = write
+        self._workers = max(1, workers)
+        self._logger = logger
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, maxsize))
+        self._threads: list[threading.Thread] = []
+        self._start_lock = threading.Lock()
+
+    def submit(self, result: BronzeResult, run: RunContext, on_written: typing.Callable[[BronzeResult], None]) -> None:
+        """Queue a result for writing, blocking while the queue is full."""
+        self._ensure_started()
+        depth = self._queue.qsize() + 1  # backlog this result joins, itself included
+        self._queue.put((result, run, on_written, time.monotonic(), depth))
+
+    def drain(self) -> None:
+        """Block until every submitted result has been written and its callback has run."""
+        if self._threads:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Drain and stop the writer threads; a later ``submit`` starts them again."""
+        with self._start_lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._queue.put(_CLOSE)
+        for thread in threads:
+            thread.join()
+
+    def _ensure_started(self) -> None:
+        with self._start_lock:
+            if self._threads:
+                return
+            for index in range(self._workers):
+                thread = threading.Thread(target=self._worker, name=f"bronze-writer-{index}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def _worker(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _CLOSE:
+                    return
+                result, run, on_written, queued_at, depth = item
+                started = time.monotonic()
+                try:
+                    self._write(result)
+                except Exception as exc:
+                    self._logger.error(f"Bronze persistence failed: {result.msg} | error={exc}", run_id=run.run_id)
+                    continue
+                run.record_bronze_write(time.monotonic() - started, started - queued_at, depth)
+                try:
+                    on_written(result)
+                except Exception as exc:
+                    self._logger.error(f"Bronze post-write bookkeeping failed: {result.msg} | error={exc}", run_id=run.run_id)
+            finally:
+                self._queue.task_done()
@@ -11,8 +11,12 @@ from sbfoundation.infra.logger import LoggerFactory, SBLogger
 from sbfoundation.maintenance import DuckDbBootstrap
 from sbfoundation.ops.services.ops_service import OpsService
 from sbfoundation.run.dtos.run_context import RunContext
+from sbfoundation.run.dtos.run_plan import RunPlan
+from sbfoundation.run.services.quota_manager import QuotaManager
+from sbfoundation.run.services.run_journal import RunJournal
 from sbfoundation.ops.requests.promotion_config import PromotionConfig
-from sbfoundation.silver import SilverService
+from sbfoundation.silver import SilverPromotionPipeline, SilverService
+from sbfoundation.settings import FETCH_ENGINE_THREADS, RUN_PRIORITY_NORMAL
 
 
 class BulkPipelineService(ABC):
@@ -35,6 +39,16 @@ class BulkPipelineService(ABC):
         concurrent_requests: int,
         force_from_date: str | None,
         today: str,
+        skip_unchanged_bronze: bool = False,
+        conditional_requests: bool = False,
+        pipeline_silver: bool = False,
+        bronze_writer_workers: int = 0,
+        fetch_engine: str = FETCH_ENGINE_THREADS,
+        priority: str = RUN_PRIORITY_NORMAL,
+        silver_workers: int = 0,
+        silver_batch_mode: str = "file",
+        silver_engine: str = "pandas",
+        silver_dedupe_mode: str = "anti_join",
     ) -> None:
         self._ops_service = ops_service
         self._dataset_service = dataset_service
@@ -45,6 +59,16 @@ class BulkPipelineService(ABC):
         self._concurrent_requests = concurrent_requests
         self._force_from_date = force_from_date
         self._today = today
+        self._skip_unchanged_bronze = skip_unchanged_bronze
+        self._conditional_requests = conditional_requests
+        self._pipeline_silver = pipeline_silver
+        self._bronze_writer_workers = bronze_writer_workers
+        self._fetch_engine = fetch_engine
+        self._priority = priority
+        self._silver_workers = silver_workers
+        self._silver_batch_mode = silver_batch_mode
+        self._silver_engine = silver_engine
+        self._silver_dedupe_mode = silver_dedupe_mode
 
     @abstractmethod
     def run(self, run: RunContext) -> RunContext:
@@ -58,13 +82,30 @@ class BulkPipelineService(ABC):
         return f"PROCESSING {layer} | " if enabled else f"DRY-RUN {layer} |"
 
     def _process_recipe_list(self, recipes: list[DatasetRecipe], run: RunContext) -> RunContext:
-        """Process a list of recipes through the Bronze layer."""
+        """Process a list of recipes through the Bronze layer.
+
+        With ``pipeline_silver`` each flushed batch of Bronze files is promoted to Silver on a
+        background thread while fetching continues; the domain's ``_promote_silver`` call that
+        follows then only sweeps up whatever the pipeline did not cover.  The pipeline MERGEs
+        on a duplicate DuckDB connection, so a long MERGE does not hold the lock Bronze's
+        manifest flushes wait on.
+        """
         if not recipes:
             return run
+        silver_bootstrap = self._bootstrap.duplicate() if self._pipeline_silver and self._enable_silver else None
+        silver_service = self._silver_service(bootstrap=silver_bootstrap) if silver_bootstrap is not None else None
+        pipeline = SilverPromotionPipeline(silver_service, self._logger, run.run_id) if silver_service is not None else None
         bronze_service = BronzeService(
             ops_service=self._ops_service,
             concurrent_requests=self._concurrent_requests,
             force_from_date=self._force_from_date,
+            skip_unchanged=self._skip_unchanged_bronze,
+            conditional_requests=self._conditional_requests,
+            manifest_sink=pipeline.submit if pipeline is not None else None,
+            journal=RunJournal.for_run(run.run_id),
+            writer_workers=self._bronze_writer_workers,
+            quota_manager=QuotaManager(self._ops_service, priority=self._priority),
+            fetch_engine=self._fetch_engine,
         )
         try:
             return bronze_service.register_recipes(run, recipes).process(run)
@@ -72,19 +113,57 @@ class BulkPipelineService(ABC):
             self._logger.error("Bronze ingestion failed: %s", exc, run_id=run.run_id)
             traceback.print_exc()
             return run
+        finally:
+            if pipeline is not None:
+                promoted_ids, promoted_rows = pipeline.close()
+                silver_service.close()
+                silver_bootstrap.close()
+                run.silver_dto_count += promoted_rows
+                self._logger.info(
+                    f"PIPELINED SILVER | complete | bronze_files={len(promoted_ids)} | rows={promoted_rows}",
+                    run_id=run.run_id,
+                )
 
-    def _promote_silver(self, run: RunContext, domain: str | None = None) -> RunContext:
-        """Promote Bronze data to Silver, restricted to the given domain."""
-        # When force_from_date is set (backfill/year-specific fetch), disable the watermark
-        # filter so rows with dates before the current watermark are not silently dropped.
-        promotion_config = PromotionConfig(watermark_mode="none") if self._force_from_date else None
-        silver_service = SilverService(
+    def _plan_recipe_list(self, recipes: list[DatasetRecipe], run: RunContext) -> RunPlan | None:
+        """Dry-run counterpart of ``_process_recipe_list``: log what Bronze would fetch and how long it would take."""
+        if not recipes:
+            return None
+        bronze_service = BronzeService(
+            ops_service=self._ops_service,
+            concurrent_requests=self._concurrent_requests,
+            force_from_date=self._force_from_date,
+        )
+        try:
+            plan = bronze_service.register_recipes(run, recipes).plan(run)
+        except Exception as exc:
+            self._logger.error("Bronze planning failed: %s", exc, run_id=run.run_id)
+            return None
+        for line in plan.datasets.values():
+            self._logger.info(f"PLAN BRONZE | {line.msg}", run_id=run.run_id)
+        self._logger.info(f"PLAN BRONZE | {plan.msg}", run_id=run.run_id)
+        return plan
+
+    def _silver_service(self, bootstrap: DuckDbBootstrap | None = None) -> SilverService:
+        promotion_config = PromotionConfig(
+            batch_mode=self._silver_batch_mode,
+            engine=self._silver_engine,
+            dedupe_mode=self._silver_dedupe_mode,
+            # When force_from_date is set (backfill/year-specific fetch), disable the watermark
+            # filter so rows with dates before the current watermark are not silently dropped.
+            watermark_mode="none" if self._force_from_date else PromotionConfig.watermark_mode,
+        )
+        return SilverService(
             enabled=self._enable_silver,
             ops_service=self._ops_service,
             keymap_service=self._dataset_service,
-            bootstrap=self._bootstrap,
+            bootstrap=bootstrap or self._bootstrap,
             promotion_config=promotion_config,
+            workers=self._silver_workers,
         )
+
+    def _promote_silver(self, run: RunContext, domain: str | None = None) -> RunContext:
+        """Promote Bronze data to Silver, restricted to the given domain."""
+        silver_service = self._silver_service()
         try:
             _promoted_ids, promoted_rows = silver_service.promote(run, domain=domain)
         except Exception as e:
@@ -0,0 +1,104 @@
+import threading
+import time
+import typing
+
+from sbfoundation.settings import (
+    CIRCUIT_BREAKER_COOLDOWN_SECONDS,
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_PROBE_POLL_SECONDS,
+    CIRCUIT_BREAKER_PROBE_TIMEOUT_SECONDS,
+)
+
+
+class CircuitBreaker:
+    """Per-source breaker that pauses a host after repeated transport failures.
+
+    ``failure_threshold`` consecutive failures open the circuit for ``cooldown_seconds``.
+    Once the cooldown has passed the circuit is half-open: ``acquire`` lets a single probe
+    through and holds every other request back until it reports.  A success closes the
+    circuit, a failure re-opens it straight away.  A probe that never reports (its caller
+    gave up) is replaced after ``probe_timeout_seconds``.  Failures reported while the
+    circuit is open, or by calls that started before it opened, neither extend the
+    cooldown nor count as a fresh opening.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        cooldown_seconds: float = CIRCUIT_BREAKER_COOLDOWN_SECONDS,
+        clock: typing.Callable[[], float] = time.monotonic,
+        probe_poll_seconds: float = CIRCUIT_BREAKER_PROBE_POLL_SECONDS,
+        probe_timeout_seconds: float = CIRCUIT_BREAKER_PROBE_TIMEOUT_SECONDS,
+    ) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown_seconds = cooldown_seconds
+        self.probe_poll_seconds = probe_poll_seconds
+        self.probe_timeout_seconds = probe_timeout_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures: dict[str, int] = {}
+        self._open_until: dict[str, float] = {}
+        self._opened_at: dict[str, float] = {}
+        self._probe_until: dict[str, float] = {}
+
+    def now(self) -> float:
+        """The breaker's clock; pass the value read before a call as ``started_at`` to ``record_failure``."""
+        return self._clock()
+
+    def remaining(self, source: str | None) -> float:
+        """Seconds until ``source`` may be called again; 0 when the circuit is closed or half-open."""
+        with self._lock:
+            return max(0.0, self._open_until.get(source or "", 0.0) - self._clock())
+
+    def acquire(self, source: str | None) -> float:
+        """Ask to call ``source``: 0 grants the call, otherwise the seconds to wait before asking again.
+
+        A closed circuit grants every call; a half-open one grants only the probe.
+        """
+        key = source or ""
+        with self._lock:
+            open_until = self._open_until.get(key)
+            if open_until is None:
+                return 0.0
+            now = self._clock()
+            if now < open_until:
+                return open_until - now
+            probe_until = self._probe_until.get(key)
+            if probe_until is not None and now < probe_until:
+                return min(self.probe_poll_seconds, probe_until - now)
+            self._probe_until[key] = now + self.probe_timeout_seconds
+            return 0.0
+
+    def record_success(self, source: str | None) -> None:
+        key = source or ""
+        with self._lock:
+            self._failures.pop(key, None)
+            self._open_until.pop(key, None)
+            self._opened_at.pop(key, None)
+            self._probe_until.pop(key, None)
+
+    def record_failure(self, source: str | None, started_at: float | None = None) -> bool:
+        """Count a failure; return True only when it opens the circuit (closed or half-open to open).
+
+        ``started_at`` is ``now()`` as read before the failed call.  A call that was already
+        in flight when the circuit opened is ignored: its failure is the one already counted.
+        """
+        key = source or ""
+        with self._lock:
+            now = self._clock()
+            open_until = self._open_until.get(key)
+            if open_until is not None:
+                if started_at is not None and started_at < self._opened_at[key]:
+                    return False
+                if now < open_until:
+                    return False
+                # Half-open (cooldown elapsed, no success since): the probe failed, so re-open.
+            else:
+                failures = self._failures.get(key, 0) + 1
+                self._failures[key] = failures
+                if failures < self.failure_threshold:
+                    return False
+            self._probe_until.pop(key, None)
+            self._open_until[key] = now + self.cooldown_seconds
+            self._opened_at[key] = now
+            return True
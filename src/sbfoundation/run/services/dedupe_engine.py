@@ -5,10 +5,41 @@ from typing import Iterable
 import duckdb
 import pandas as pd
 
+from sbfoundation.settings import SILVER_DEDUPE_MODES
+
+DEDUPE_MODES = tuple(SILVER_DEDUPE_MODES)
+ROW_HASH_COLUMN = "row_hash"
+ROW_HASH_INDEX = "ops.silver_row_hashes"
+# Lineage changes on every promotion of the same data, so it is left out of the content hash.
+_LINEAGE_COLUMNS = frozenset({"bronze_file_id", "run_id", "ingested_at", ROW_HASH_COLUMN})
+
 
 class DedupeEngine:
-    def __init__(self, *, use_duckdb_engine: bool = True) -> None:
+    """Select the candidate rows worth merging into a Silver table.
+
+    ``anti_join`` keeps only rows whose key is not in the table yet (existing rows win),
+    ``none`` merges every row, and ``hash_only`` adds a ``row_hash`` content hash to each
+    row and keeps the rows whose hash differs from the one recorded for their key in
+    ``ops.silver_row_hashes`` - new keys and restated values - so unchanged rows of an
+    overlapping Bronze window are not rewritten.  In every mode a key repeated within the
+    candidates keeps its last row.
+    """
+
+    def __init__(self, *, use_duckdb_engine: bool = True, mode: str = "anti_join") -> None:
+        mode = (mode or "anti_join").strip().lower()
+        if mode not in DEDUPE_MODES:
+            raise ValueError(f"Invalid dedupe mode: {mode!r}. Must be one of {DEDUPE_MODES}")
         self._use_duckdb_engine = use_duckdb_engine
+        self._mode = mode
+
+    @property
+    def uses_row_hashes(self) -> bool:
+        return self._mode == "hash_only"
+
+    @property
+    def keeps_existing_rows(self) -> bool:
+        """True when a key already in the table is left alone, so the first row merged for it wins."""
+        return self._mode == "anti_join" and self._use_duckdb_engine
 
     def dedupe_against_table(
         self,
@@ -19,16 +50,26 @@ class DedupeEngine:
         target_table: str,
         table_exists: bool,
     ) -> pd.DataFrame:
-        if df_candidate.empty or not table_exists:
+        key_cols = tuple(key_cols)
+        if df_candidate.empty:
             return df_candidate
 
-        key_cols = tuple(key_cols)
-        if not key_cols:
+        if self.uses_row_hashes:
+            if key_cols:
+                df_candidate = df_candidate.drop_duplicates(subset=list(key_cols), keep="last")
+            conn.register("_candidate_rows", df_candidate)
+            try:
+                sql = self._changed_rows_sql("_candidate_rows", df_candidate.columns, key_cols, target_table, table_exists)
+                return conn.execute(sql).df()
+            finally:
+                conn.unregister("_candidate_rows")
+
+        if not table_exists or not key_cols:
             return df_candidate
 
         df_candidate = df_candidate.drop_duplicates(subset=list(key_cols), keep="last")
 
-        if not self._use_duckdb_engine:
+        if self._mode == "none" or not self._use_duckdb_engine:
             return df_candidate
 
         conn.register("_candidate_rows", df_candidate)
@@ -43,3 +84,107 @@ class DedupeEngine:
             return conn.execute(sql).df()
         finally:
             conn.unregister("_candidate_rows")
+
+    def dedupe_relation_sql(
+        self,
+        *,
+        source: str,
+        key_cols: Iterable[str],
+        target_table: str,
+        table_exists: bool,
+        order_col: str,
+        columns: Iterable[str] = (),
+    ) -> str:
+        """SQL form of ``dedupe_against_table`` over a DuckDB relation.
+
+        ``order_col`` holds each row's position in the source so the last duplicate wins,
+        as with ``drop_duplicates(keep="last")``; it is dropped from the result.  ``columns``
+        are the source's Silver columns, hashed in ``hash_only`` mode.
+        """
+        order = f'"{order_col}"'
+        key_cols = tuple(key_cols)
+        using_cols = ", ".join(f'"{col}"' for col in key_cols)
+        latest = f"SELECT * FROM {source} QUALIFY row_number() OVER (PARTITION BY {using_cols} ORDER BY {order} DESC) = 1"
+
+        if self.uses_row_hashes:
+            deduped = f"SELECT * EXCLUDE ({order}) FROM ({latest if key_cols else f'SELECT * FROM {source}'})"
+            return self._changed_rows_sql(f"({deduped})", columns, key_cols, target_table, table_exists)
+
+        if not table_exists or not key_cols:
+            return f"SELECT * EXCLUDE ({order}) FROM {source}"
+        if self._mode == "none" or not self._use_duckdb_engine:
+            return f"SELECT * EXCLUDE ({order}) FROM ({latest})"
+        return (
+            f"SELECT c.* EXCLUDE ({order}) FROM ({latest}) c "
+            f"LEFT JOIN {target_table} t USING ({using_cols}) "
+            f"WHERE t.\"{key_cols[0]}\" IS NULL"
+        )
+
+    def merge_columns(self, columns: Iterable[str]) -> list[str]:
+        """Columns of the rows this engine returns, given the candidates' ``columns``."""
+        columns = [col for col in columns if col != ROW_HASH_COLUMN]
+        return columns + [ROW_HASH_COLUMN] if self.uses_row_hashes else columns
+
+    def prepare_target(self, conn: duckdb.DuckDBPyConnection, *, target_table: str, created: bool) -> None:
+        """Ready ``target_table`` and the hash index for a MERGE; call inside the write transaction.
+
+        In ``hash_only`` mode a table created by this write starts with no index entries, so stale ones left by a
+        dropped table cannot hide its rows; an existing table gains the ``row_hash`` column.
+        The other modes do not hash what they write, so they drop the table's index entries:
+        a later ``hash_only`` run then compares against nothing and rewrites the table once,
+        instead of trusting hashes of rows that have since been overwritten.
+        """
+        if not self.uses_row_hashes or created:
+            conn.execute(f"DELETE FROM {ROW_HASH_INDEX} WHERE silver_table = ?", [target_table])
+        else:
+            conn.execute(f'ALTER TABLE {target_table} ADD COLUMN IF NOT EXISTS "{ROW_HASH_COLUMN}" UBIGINT')
+
+    def record_hashes(self, conn: duckdb.DuckDBPyConnection, *, source: str, key_cols: Iterable[str], target_table: str) -> None:
+        """Record the row hashes of the rows in ``source`` just merged into ``target_table``."""
+        key_cols = tuple(key_cols)
+        if not self.uses_row_hashes or not key_cols:
+            return
+        conn.execute(
+            f"""
+            INSERT INTO {ROW_HASH_INDEX} (silver_table, key_hash, row_hash)
+            SELECT ?, {self._key_hash_expr(key_cols)}, "{ROW_HASH_COLUMN}" FROM {source}
+            ON CONFLICT (silver_table, key_hash) DO UPDATE SET row_hash = excluded.row_hash
+            """,
+            [target_table],
+        )
+
+    def _changed_rows_sql(
+        self,
+        source: str,
+        columns: Iterable[str],
+        key_cols: tuple[str, ...],
+        target_table: str,
+        table_exists: bool,
+    ) -> str:
+        content = sorted(col for col in columns if col not in _LINEAGE_COLUMNS)
+        row_hash = self._stable_hash_expr(f'"{col}"' for col in content)
+        hashed = f'SELECT *, {row_hash} AS "{ROW_HASH_COLUMN}" FROM {source}'
+        if not table_exists or not key_cols:
+            return hashed
+        table_literal = "'" + target_table.replace("'", "''") + "'"
+        return (
+            f"SELECT c.* FROM ({hashed}) c "
+            f"LEFT JOIN {ROW_HASH_INDEX} h "
+            f"ON h.silver_table = {table_literal} AND h.key_hash = {self._key_hash_expr(key_cols, alias='c')} "
+            f'WHERE h.row_hash IS DISTINCT FROM c."{ROW_HASH_COLUMN}"'
+        )
+
+    @staticmethod
+    def _key_hash_expr(key_cols: tuple[str, ...], alias: str | None = None) -> str:
+        prefix = f"{alias}." if alias else ""
+        return DedupeEngine._stable_hash_expr(f'{prefix}"{col}"' for col in key_cols)
+
+    @staticmethod
+    def _stable_hash_expr(exprs: Iterable[str]) -> str:
+        """UBIGINT hash of ``exprs``: the first 64 bits of the md5 of their VARCHAR values.
+
+        DuckDB's ``hash()`` may change between releases, which would make every recorded
+        hash in ``ops.silver_row_hashes`` look stale; md5 of the values does not.
+        """
+        values = ", ".join(f"CAST({expr} AS VARCHAR)" for expr in exprs)
+        return f"('0x' || left(md5(CAST(list_value({values}) AS VARCHAR)), 16))::UBIGINT"
@@ -0,0 +1,68 @@
+import collections
+import threading
+import typing
+
+from sbfoundation.settings import (
+    DATA_SOURCES_CONFIG,
+    HEDGE_LATENCY_QUANTILE,
+    HEDGE_MIN_DELAY_SECONDS,
+    HEDGE_MIN_SAMPLES,
+    HEDGE_REQUESTS,
+    HEDGE_WINDOW_SAMPLES,
+)
+
+
+class HedgePolicy:
+    """Decide when a Bronze GET is slow enough to hedge with a duplicate.
+
+    Hedging is opt-in per source (``DATA_SOURCES_CONFIG[source][HEDGE_REQUESTS]``).  The
+    delay is the dataset's observed latency quantile (p90 by default): seeded from
+    ``ops.file_ingestions`` the first time a dataset is seen, then tracked over a window of
+    this run's own latencies.  Datasets with too few samples are not hedged.
+    """
+
+    def __init__(
+        self,
+        ops_service: typing.Any,
+        hedge_sources: typing.Iterable[str] | None = None,
+        quantile: float = HEDGE_LATENCY_QUANTILE,
+        min_samples: int = HEDGE_MIN_SAMPLES,
+        min_delay: float = HEDGE_MIN_DELAY_SECONDS,
+    ) -> None:
+        self.ops_service = ops_service
+        if hedge_sources is None:
+            hedge_sources = [source for source, cfg in DATA_SOURCES_CONFIG.items() if cfg.get(HEDGE_REQUESTS)]
+        self.hedge_sources = frozenset(hedge_sources)
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self._lock = threading.Lock()
+        self._seeds: dict[tuple[str, str], tuple[int, float | None]] = {}
+        self._samples: dict[tuple[str, str], collections.deque[float]] = {}
+
+    def delay_for(self, source: str, dataset: str) -> float | None:
+        """Seconds to wait before hedging a request, or None when it should not be hedged."""
+        if source not in self.hedge_sources:
+            return None
+        key = (source, dataset)
+        with self._lock:
+            seed = self._seeds.get(key)
+        if seed is None:
+            # Query outside the lock so workers asking about other datasets are not held up.
+            seed = self.ops_service.get_bronze_latency_quantile(source=source, dataset=dataset, quantile=self.quantile)
+        with self._lock:
+            seed_count, seed_delay = self._seeds.setdefault(key, seed)
+            samples = sorted(self._samples.get(key, ()))
+        if len(samples) >= self.min_samples:
+            delay = samples[min(len(samples) - 1, int(self.quantile * len(samples)))]
+        elif seed_count >= self.min_samples and seed_delay is not None:
+            delay = seed_delay
+        else:
+            return None
+        return max(self.min_delay, delay)
+
+    def observe(self, source: str, dataset: str, seconds: float) -> None:
+        if source not in self.hedge_sources:
+            return
+        with self._lock:
+            self._samples.setdefault((source, dataset), collections.deque(maxlen=HEDGE_WINDOW_SAMPLES)).append(seconds)
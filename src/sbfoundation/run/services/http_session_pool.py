@@ -0,0 +1,80 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from sbfoundation.settings import DATA_SOURCES_CONFIG, HTTP_POOL_DEFAULT_MAXSIZE, HTTP_POOL_MAXSIZE
+
+
+class HttpSessionPool:
+    """Keep-alive HTTP sessions, one connection pool per data source.
+
+    Each source (``fmp``, ``fred`` …) gets a single ``HTTPAdapter`` whose urllib3
+    pool keeps up to ``DATA_SOURCES_CONFIG[source][HTTP_POOL_MAXSIZE]`` connections
+    open between requests.  Worker threads each get their own ``requests.Session``
+    (cookie jars and header state are not shared) mounted on that shared adapter,
+    so TCP/TLS connections are reused across threads without sharing a Session.
+    """
+
+    def __init__(self, pool_sizes: dict[str, int] | None = None) -> None:
+        self._pool_sizes = pool_sizes or {}
+        self._lock = threading.Lock()
+        self._adapters: dict[str, HTTPAdapter] = {}
+        self._local = threading.local()
+
+    def pool_size(self, source: str) -> int:
+        if source in self._pool_sizes:
+            return self._pool_sizes[source]
+        return DATA_SOURCES_CONFIG.get(source, {}).get(HTTP_POOL_MAXSIZE, HTTP_POOL_DEFAULT_MAXSIZE)
+
+    def session(self, source: str) -> requests.Session:
+        """Return the calling thread's session for ``source``."""
+        sessions: dict[str, requests.Session] | None = getattr(self._local, "sessions", None)
+        if sessions is None:
+            sessions = self._local.sessions = {}
+        session = sessions.get(source)
+        if session is None:
+            adapter = self._adapter(source)
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            sessions[source] = session
+        return session
+
+    def get(self, source: str, url: str, **kwargs) -> requests.Response:
+        return self.session(source).get(url, **kwargs)
+
+    def stats(self) -> tuple[int, int]:
+        """Return ``(requests_sent, connections_opened)`` summed over every source pool."""
+        requests_sent = 0
+        connections_opened = 0
+        with self._lock:
+            adapters = list(self._adapters.values())
+        for adapter in adapters:
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                try:
+                    pool = pools[key]
+                except KeyError:
+                    continue
+                requests_sent += pool.num_requests
+                connections_opened += pool.num_connections
+        return requests_sent, connections_opened
+
+    def close(self) -> None:
+        """Close every pooled connection.  Sessions created afterwards reconnect lazily."""
+        with self._lock:
+            adapters = list(self._adapters.values())
+            self._adapters.clear()
+        for adapter in adapters:
+            adapter.close()
+        self._local = threading.local()
+
+    def _adapter(self, source: str) -> HTTPAdapter:
+        with self._lock:
+            adapter = self._adapters.get(source)
+            if adapter is None:
+                size = self.pool_size(source)
+                adapter = HTTPAdapter(pool_maxsize=size)
+                self._adapters[source] = adapter
+            return adapter
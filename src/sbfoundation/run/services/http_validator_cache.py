@@ -0,0 +1,62 @@
+import threading
+import typing
+from urllib.parse import urlencode
+
+from sbfoundation.ops.dtos.http_validator import HttpValidator
+from sbfoundation.settings import API_KEY_QUERY_PARAM, DATA_SOURCES_CONFIG
+
+# Query parameters that carry credentials; they never take part in a request's identity.
+_API_KEY_PARAMS = frozenset({"apikey"} | {cfg[API_KEY_QUERY_PARAM] for cfg in DATA_SOURCES_CONFIG.values() if API_KEY_QUERY_PARAM in cfg})
+
+
+class HttpValidatorCache:
+    """Persistent ETag / Last-Modified cache backing conditional Bronze requests.
+
+    Entries live in ``ops.http_validators`` and are loaded lazily, one URL at a time, the
+    first time a request for that URL is sent.  Validators learnt during the run are
+    queued by ``remember`` and written in one batch by ``flush`` on the main thread, like
+    the Bronze manifests.
+    """
+
+    def __init__(self, ops_service: typing.Any) -> None:
+        self.ops_service = ops_service
+        self._lock = threading.Lock()
+        self._validators: dict[str, dict[str, HttpValidator]] = {}
+        self._pending: list[HttpValidator] = []
+
+    @staticmethod
+    def cache_key(url: str, params: typing.Mapping[str, typing.Any] | None) -> str:
+        """URL plus its query vars sorted by name, with API keys left out."""
+        query = sorted((str(k), str(v)) for k, v in (params or {}).items() if k not in _API_KEY_PARAMS and v is not None)
+        return f"{url}?{urlencode(query)}" if query else url
+
+    def get(self, url: str, params: typing.Mapping[str, typing.Any] | None) -> HttpValidator | None:
+        return self._for_url(url).get(self.cache_key(url, params))
+
+    def conditional_headers(self, url: str, params: typing.Mapping[str, typing.Any] | None) -> dict[str, str]:
+        validator = self.get(url, params)
+        return validator.conditional_headers() if validator is not None else {}
+
+    def remember(self, validator: HttpValidator) -> None:
+        cached = self._for_url(validator.url)
+        with self._lock:
+            cached[validator.cache_key] = validator
+            self._pending.append(validator)
+
+    def flush(self) -> int:
+        """Persist validators queued since the last flush; returns the number written."""
+        with self._lock:
+            pending = self._pending[:]
+            self._pending.clear()
+        return self.ops_service.upsert_http_validators(pending) if pending else 0
+
+    def _for_url(self, url: str) -> dict[str, HttpValidator]:
+        with self._lock:
+            cached = self._validators.get(url)
+        if cached is not None:
+            return cached
+        # Load outside the lock so a cache miss does not stall the other workers; if another
+        # worker loaded the URL meanwhile, its entry (and anything remembered into it) wins.
+        loaded = dict(self.ops_service.get_http_validators(url))
+        with self._lock:
+            return self._validators.setdefault(url, loaded)
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import os
+import threading
+import typing
+from datetime import date
+
+from sbfoundation.settings import (
+    API_PLAN_ENV,
+    API_QUOTAS,
+    QUOTA_DAILY,
+    QUOTA_HEADROOM_BY_PRIORITY,
+    QUOTA_MONTHLY,
+    QUOTA_RESERVE_BLOCK,
+    RUN_PRIORITIES,
+    RUN_PRIORITY_NORMAL,
+)
+
+
+class QuotaExhausted(Exception):
+    """Raised before dispatch when a source's budget has no calls left for this run's priority."""
+
+    def __init__(self, source: str, priority: str) -> None:
+        super().__init__(f"API quota exhausted for source={source} at priority={priority}")
+        self.source = source
+        self.priority = priority
+
+
+def configured_budgets() -> dict[str, dict[str, int]]:
+    """Budgets of each source's active plan tier (``API_PLAN_ENV``); sources without a plan are unlimited."""
+    budgets: dict[str, dict[str, int]] = {}
+    for source, env_var in API_PLAN_ENV.items():
+        plan = os.getenv(env_var, "").strip().lower()
+        tier = API_QUOTAS.get(source, {}).get(plan)
+        if tier:
+            budgets[source] = dict(tier)
+    return budgets
+
+
+class QuotaManager:
+    """Reserve calls against the persistent daily/monthly budgets in ``ops.api_quota_ledger``.
+
+    Every run on the same key charges the same ledger, so a backfill and the scheduled EOD
+    flow see each other's spend.  A run of a given priority may only take a budget down to
+    its ``QUOTA_HEADROOM_BY_PRIORITY`` share; below that ``reserve`` raises ``QuotaExhausted``
+    and the request yields, leaving the remainder to higher-priority runs.
+
+    Calls are reserved from the ledger ``block_size`` at a time to keep it off the hot path;
+    ``release`` returns whatever a run reserved but did not spend.
+    """
+
+    def __init__(
+        self,
+        ops_service: typing.Any,
+        priority: str = RUN_PRIORITY_NORMAL,
+        budgets: dict[str, dict[str, int]] | None = None,
+        today: typing.Callable[[], date] = date.today,
+        block_size: int = QUOTA_RESERVE_BLOCK,
+    ) -> None:
+        if priority not in RUN_PRIORITIES:
+            raise ValueError(f"Invalid priority: {priority!r}. Must be one of {RUN_PRIORITIES}")
+        self.ops_service = ops_service
+        self.priority = priority
+        self.budgets = configured_budgets() if budgets is None else budgets
+        self._today = today
+        self._block_size = max(1, block_size)
+        self._lock = threading.Lock()
+        # {source: (period starts the held calls were charged to, calls still held)}
+        self._held: dict[str, tuple[dict[str, date], int]] = {}
+        # {source: period starts the ledger refused a block for}; cleared by a new day or month.
+        self._exhausted: dict[str, dict[str, date]] = {}
+        # One ledger round-trip per source at a time; other sources are never held up by it.
+        self._refill_locks: dict[str, threading.Lock] = {}
+
+    def reserve(self, source: str) -> None:
+        """Take one call from ``source``'s budget, or raise ``QuotaExhausted``."""
+        budget = self.budgets.get(source)
+        if not budget:
+            return
+        periods = self._period_starts(budget)
+        while True:
+            if self._take_held(source, periods):
+                return
+            with self._refill_lock(source):
+                # Another worker may have refilled (or found the budget spent) while we waited.
+                if self._take_held(source, periods):
+                    return
+                granted = self.ops_service.reserve_api_quota(source=source, ceilings=self._ceilings(budget, periods), calls=self._block_size)
+                with self._lock:
+                    if granted == 0:
+                        self._exhausted[source] = periods
+                        raise QuotaExhausted(source, self.priority)
+                    self._held[source] = (periods, granted)
+
+    def _take_held(self, source: str, periods: dict[str, date]) -> bool:
+        """Spend a held call; False when a block must be reserved first.  Raises once the period is spent."""
+        stale: tuple[dict[str, date], int] | None = None
+        try:
+            with self._lock:
+                if self._exhausted.get(source) == periods:
+                    raise QuotaExhausted(source, self.priority)
+                held_periods, held = self._held.get(source, (periods, 0))
+                if held_periods != periods:
+                    # A new day or month: calls held for the old period no longer apply.
+                    stale = self._held.pop(source)
+                    held = 0
+                if held == 0:
+                    return False
+                self._held[source] = (periods, held - 1)
+                return True
+        finally:
+            if stale is not None:
+                self._release(source, *stale)
+
+    def _refill_lock(self, source: str) -> threading.Lock:
+        with self._lock:
+            return self._refill_locks.setdefault(source, threading.Lock())
+
+    def release(self) -> None:
+        """Return the calls reserved but not spent; call once the run's requests are done."""
+        with self._lock:
+            held, self._held = self._held, {}
+        for source, (periods, calls) in held.items():
+            self._release(source, periods, calls)
+
+    def _release(self, source: str, periods: dict[str, date], calls: int) -> None:
+        if calls > 0:
+            self.ops_service.release_api_quota(source=source, periods=periods, calls=calls)
+
+    def _period_starts(self, budget: dict[str, int]) -> dict[str, date]:
+        today = self._today()
+        starts = {QUOTA_DAILY: today, QUOTA_MONTHLY: today.replace(day=1)}
+        return {period: starts[period] for period in budget}
+
+    def _ceilings(self, budget: dict[str, int], periods: dict[str, date]) -> dict[str, tuple[date, int]]:
+        headroom = QUOTA_HEADROOM_BY_PRIORITY[self.priority]
+        return {period: (periods[period], int(limit * (1 - headroom))) for period, limit in budget.items()}
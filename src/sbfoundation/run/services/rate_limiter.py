@@ -0,0 +1,205 @@
+import math
+import threading
+import time
+import typing
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from sbfoundation.settings import (
+    DATA_SOURCES_CONFIG,
+    THROTTLE_BACKOFF_FACTOR,
+    THROTTLE_BURST,
+    THROTTLE_GLOBAL_MAX_CALLS,
+    THROTTLE_MAX_CALLS,
+    THROTTLE_MAX_CALLS_PER_MINUTE,
+    THROTTLE_MAX_RETRY_AFTER_SECONDS,
+    THROTTLE_MIN_RATE_FACTOR,
+    THROTTLE_PENALTY_COOLDOWN_SECONDS,
+    THROTTLE_PERIOD_SECONDS,
+    THROTTLE_RECOVERY_SECONDS,
+)
+
+DEFAULT_BUCKET = "default"
+GLOBAL_BUCKET = "global"
+
+
+def parse_retry_after(value: str | None, now: datetime | None = None) -> float | None:
+    """Parse a ``Retry-After`` header (delta-seconds or HTTP-date) into seconds, capped."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - (now or datetime.now(timezone.utc))).total_seconds()
+    return min(max(0.0, seconds), THROTTLE_MAX_RETRY_AFTER_SECONDS)
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at ``rate`` tokens per second, holding at most ``capacity``.
+
+    Callers *reserve* a token instead of polling for one: the balance may go negative,
+    and each caller sleeps exactly long enough for its own token to be refilled.
+    A negative balance of ``-n`` therefore means ``n`` callers are queued.
+
+    The rate adapts to upstream pushback: ``penalize()`` cuts it multiplicatively and,
+    given a ``Retry-After``, stops refilling until that instant for every caller.  The
+    rate then ramps linearly back to ``base_rate`` over ``recovery_seconds``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate: float,
+        capacity: float,
+        clock: typing.Callable[[], float] = time.monotonic,
+        min_rate: float | None = None,
+        backoff_factor: float = THROTTLE_BACKOFF_FACTOR,
+        recovery_seconds: float = THROTTLE_RECOVERY_SECONDS,
+        penalty_cooldown_seconds: float = THROTTLE_PENALTY_COOLDOWN_SECONDS,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError(f"TokenBucket {name!r} rate must be positive, got {rate}")
+        self.name = name
+        self.base_rate = rate
+        self.rate = rate
+        self.min_rate = min(rate, min_rate) if min_rate else rate * THROTTLE_MIN_RATE_FACTOR
+        self.capacity = max(1.0, capacity)
+        self._backoff_factor = backoff_factor
+        self._recovery_seconds = recovery_seconds
+        self._penalty_cooldown_seconds = penalty_cooldown_seconds
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._blocked_until = -math.inf
+        self._last_penalty = -math.inf
+        self._lock = threading.Lock()
+
+    @property
+    def blocked_until(self) -> float:
+        return self._blocked_until
+
+    def reserve(self) -> tuple[float, int]:
+        """Take one token; return ``(seconds_to_wait, callers_waiting)`` including this caller."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= 1
+            blocked = max(0.0, self._blocked_until - now)
+            if self._tokens >= 0 and not blocked:
+                return 0.0, 0
+            return blocked + max(0.0, -self._tokens) / self.rate, max(1, math.ceil(-self._tokens))
+
+    def wait_seconds(self) -> float:
+        """Seconds until a token could be reserved without waiting; nothing is taken."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            return max(0.0, self._blocked_until - now) + max(0.0, 1.0 - self._tokens) / self.rate
+
+    def penalize(self, retry_after: float | None = None) -> None:
+        """React to a throttled response: cut the rate and honour ``retry_after`` for all callers."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            # Concurrent workers tend to be throttled together; count a burst of 429s as one cut.
+            if now - self._last_penalty >= self._penalty_cooldown_seconds:
+                self.rate = max(self.min_rate, self.rate * self._backoff_factor)
+                self._last_penalty = now
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+
+    def _refill(self, now: float) -> None:
+        start = max(self._updated, self._blocked_until)
+        if now > start:
+            elapsed = now - start
+            if self.rate < self.base_rate:
+                self.rate = min(self.base_rate, self.rate + self.base_rate * elapsed / self._recovery_seconds)
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = max(self._updated, now)
+
+
+class RateLimiter:
+    """Per-source token buckets built from ``DATA_SOURCES_CONFIG``, plus an optional global cap.
+
+    Each source runs at its own ``THROTTLE_MAX_CALLS_PER_MINUTE`` with bursts of up to
+    ``THROTTLE_BURST`` calls, so a slow source (FRED) no longer holds back a fast one
+    (FMP).  Requests without a known source share the ``default`` bucket sized by
+    ``THROTTLE_MAX_CALLS``.  When ``global_max_calls`` is set every request also draws
+    from a shared bucket.
+    """
+
+    def __init__(
+        self,
+        global_max_calls: int | None = THROTTLE_GLOBAL_MAX_CALLS,
+        period_seconds: float = THROTTLE_PERIOD_SECONDS,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._period_seconds = period_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets: dict[str, TokenBucket] = {}
+        self._global: TokenBucket | None = None
+        if global_max_calls:
+            self._global = self._new_bucket(GLOBAL_BUCKET, global_max_calls, None)
+
+    def bucket(self, source: str | None) -> TokenBucket:
+        name = source or DEFAULT_BUCKET
+        with self._lock:
+            bucket = self._buckets.get(name)
+            if bucket is None:
+                config = DATA_SOURCES_CONFIG.get(name, {})
+                bucket = self._new_bucket(name, config.get(THROTTLE_MAX_CALLS_PER_MINUTE, THROTTLE_MAX_CALLS), config.get(THROTTLE_BURST))
+                self._buckets[name] = bucket
+            return bucket
+
+    def reserve(self, source: str | None) -> tuple[float, int]:
+        """Reserve a call slot for ``source``; return ``(seconds_to_wait, queue_depth)``."""
+        wait, depth = self.bucket(source).reserve()
+        if self._global is not None:
+            global_wait, global_depth = self._global.reserve()
+            wait, depth = max(wait, global_wait), max(depth, global_depth)
+        return wait, depth
+
+    def wait_seconds(self, source: str | None) -> float:
+        """Seconds until a call to ``source`` could go out without waiting; no slot is reserved."""
+        wait = self.bucket(source).wait_seconds()
+        if self._global is not None:
+            wait = max(wait, self._global.wait_seconds())
+        return wait
+
+    def blocked_seconds(self, source: str | None) -> float:
+        """Seconds left of a ``Retry-After`` pause on ``source`` (or on the global bucket)."""
+        blocked_until = self.bucket(source).blocked_until
+        if self._global is not None:
+            blocked_until = max(blocked_until, self._global.blocked_until)
+        return max(0.0, blocked_until - self._clock())
+
+    def penalize(self, source: str | None, retry_after: float | None = None) -> None:
+        """Slow ``source`` down after a throttled response; other sources are unaffected."""
+        self.bucket(source).penalize(retry_after)
+
+    def min_seconds(self, source: str | None, calls: int) -> float:
+        """Shortest time ``calls`` requests to ``source`` can take, starting from a full bucket."""
+        return self._drain_seconds(self.bucket(source), calls)
+
+    def global_min_seconds(self, calls: int) -> float:
+        """Shortest time ``calls`` requests across all sources can take under the global cap (0 without one)."""
+        return self._drain_seconds(self._global, calls) if self._global is not None else 0.0
+
+    @staticmethod
+    def _drain_seconds(bucket: TokenBucket, calls: int) -> float:
+        return max(0.0, calls - bucket.capacity) / bucket.base_rate
+
+    def _new_bucket(self, name: str, max_calls: int, burst: int | None) -> TokenBucket:
+        rate = max_calls / self._period_seconds
+        # Without an explicit burst, allow roughly one second of traffic back-to-back.
+        capacity = burst if burst else max(1.0, rate)
+        return TokenBucket(name, rate=rate, capacity=capacity, clock=self._clock)
@@ -0,0 +1,80 @@
+import json
+import threading
+import typing
+from datetime import date, datetime
+from pathlib import Path
+
+from sbfoundation.folders import Folders
+from sbfoundation.ops.dtos.file_injestion import DatasetInjestion
+from sbfoundation.run.dtos.bronze_result import BronzeResult
+from sbfoundation.run.dtos.run_request import RunRequest
+
+JournalKey = tuple[str, ...]  # RunRequest.ingest_identity() + (to_date,)
+
+_DATE_FIELDS = ("bronze_from_date", "bronze_to_date", "silver_from_date", "silver_to_date")
+_DATETIME_FIELDS = ("bronze_injest_start_time", "bronze_injest_end_time", "silver_injest_start_time", "silver_injest_end_time")
+
+
+class RunJournal:
+    """Append-only JSONL journal of the Bronze requests a run has completed.
+
+    One line is appended as soon as a request's Bronze file is on disk (or its unchanged
+    outcome is known), carrying the request key and its manifest row.  Lines are
+    flushed immediately, so they survive the process being killed before the queued
+    manifests reach ``ops.file_ingestions``.  A run restarted with the same run_id loads
+    the journal, restores the missing manifests and skips the requests already done.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_run(cls, run_id: str) -> "RunJournal":
+        return cls(Folders.run_journal_absolute_path(run_id))
+
+    @staticmethod
+    def key(request: RunRequest) -> JournalKey:
+        """Identity plus ``to_date``: date-loop snapshot batches share an identity across dates."""
+        return (*request.ingest_identity(), request.to_date or "")
+
+    def record(self, result: BronzeResult) -> None:
+        entry = {
+            "key": list(self.key(result.request)),
+            "ingestion": DatasetInjestion.from_bronze(result).to_dict(),
+        }
+        line = json.dumps(entry, default=_json_default, ensure_ascii=False, sort_keys=True) + "\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as fh:
+                fh.write(line)
+                fh.flush()
+
+    def load(self) -> list[tuple[JournalKey, DatasetInjestion]]:
+        """Return the journaled (key, manifest) pairs; a line torn by a crash is ignored."""
+        if not self.path.exists():
+            return []
+        entries: list[tuple[JournalKey, DatasetInjestion]] = []
+        with self.path.open("r", encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                row = entry["ingestion"]
+                for key in _DATE_FIELDS:
+                    row[key] = date.fromisoformat(row[key]) if row.get(key) else None
+                for key in _DATETIME_FIELDS:
+                    row[key] = datetime.fromisoformat(row[key]) if row.get(key) else None
+                entries.append((tuple(entry["key"]), DatasetInjestion.from_row(row)))
+        return entries
+
+    def discard(self) -> None:
+        """Remove the journal once its run has completed."""
+        self.path.unlink(missing_ok=True)
+
+
+def _json_default(value: typing.Any) -> str:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
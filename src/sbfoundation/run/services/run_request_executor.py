@@ -1,63 +1,341 @@
+import asyncio
+import random
 import threading
 import time
 import typing
+from concurrent.futures import Future, ThreadPoolExecutor
 import requests
-from collections import deque
 
 from sbfoundation.run.dtos.run_context import RunContext
-from sbfoundation.settings import RETRY_BASE_DELAY, RETRY_MAX_ATTEMPS, THROTTLE_MAX_CALLS, THROTTLE_PERIOD_SECONDS
+from sbfoundation.run.services.circuit_breaker import CircuitBreaker
+from sbfoundation.run.services.http_session_pool import HttpSessionPool
+from sbfoundation.run.services.http_validator_cache import HttpValidatorCache
+from sbfoundation.run.services.quota_manager import QuotaExhausted, QuotaManager
+from sbfoundation.run.services.rate_limiter import DEFAULT_BUCKET, RateLimiter, parse_retry_after
+from sbfoundation.settings import (
+    CONNECT_TIMEOUT,
+    HEDGE_POOL_MAX_WORKERS,
+    READ_TIMEOUT,
+    RETRY_BASE_DELAY,
+    RETRY_JITTER,
+    RETRY_MAX_ATTEMPS,
+    THROTTLE_STATUS_CODES,
+)
+
+
+class DeferredRetry(Exception):
+    """Raised by ``execute_once`` instead of sleeping: retry the request after ``delay`` seconds.
+
+    ``attempt`` is the number of attempts already spent.  The caller sets ``resume`` to the
+    callable that picks the request up again; ``BronzeWorkQueue`` parks it until it is due.
+    """
+
+    def __init__(self, delay: float, attempt: int, source: str | None = None) -> None:
+        super().__init__(f"retry deferred by {delay:.2f}s after attempt {attempt}")
+        self.delay = delay
+        self.attempt = attempt
+        self.source = source
+        self.resume: typing.Callable[[], None] | None = None
 
 
 class RunRequestExecutor:
-    def __init__(self, logger: typing.Any, summary: typing.Optional[RunContext] = None) -> None:
+    def __init__(
+        self,
+        logger: typing.Any,
+        summary: typing.Optional[RunContext] = None,
+        session_pool: typing.Optional[HttpSessionPool] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
+    ) -> None:
         self.logger = logger
         self.summary = summary
-        self.throttle_lock = threading.Lock()
-        self.call_timestamps: deque[float] = deque()
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.session_pool = session_pool or HttpSessionPool()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self._stats_lock = threading.Lock()
+        self._reported_http_requests = 0
+        self._reported_http_connections = 0
+        self.validator_cache: typing.Optional[HttpValidatorCache] = None
+        self.quota_manager: typing.Optional[QuotaManager] = None
+        self._hedge_pool: ThreadPoolExecutor | None = None
 
     def set_summary(self, summary: RunContext) -> None:
         self.summary = summary
 
-    def execute(self, func: typing.Callable[..., typing.Any], log_str: str) -> typing.Any:
-        self._throttle()
-        return self._with_retries(func, log_str)
+    def set_validator_cache(self, cache: typing.Optional[HttpValidatorCache]) -> None:
+        self.validator_cache = cache
+
+    def set_quota_manager(self, quota_manager: typing.Optional[QuotaManager]) -> None:
+        self.quota_manager = quota_manager
+
+    def close(self) -> None:
+        """Publish outstanding pool stats and drop all keep-alive connections."""
+        self._record_http_stats()
+        with self._stats_lock:
+            if self._hedge_pool is not None:
+                self._hedge_pool.shutdown(wait=False, cancel_futures=True)
+                self._hedge_pool = None
+            self.session_pool.close()
+            self._reported_http_requests = 0
+            self._reported_http_connections = 0
+
+    def http_get(
+        self,
+        source: str,
+        url: str,
+        params: dict | None = None,
+        stream: bool = False,
+        conditional: bool = False,
+        hedge_after: float | None = None,
+    ) -> requests.Response:
+        """GET ``url`` over the keep-alive pool for ``source`` and record connection reuse.
+
+        With ``stream=True`` the body is left on the socket for the caller to consume.
+        With ``conditional=True`` and a validator cache set, the cached ETag / Last-Modified
+        are sent as If-None-Match / If-Modified-Since, so the response may be a 304.
+        With ``hedge_after`` set, a duplicate is fired if no response arrived in that many seconds.
+        """
+        headers = self.validator_cache.conditional_headers(url, params) if conditional and self.validator_cache is not None else None
+        kwargs = dict(params=params, headers=headers or None, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT), stream=stream)
+        try:
+            if hedge_after is None:
+                return self.session_pool.get(source, url, **kwargs)
+            return self._hedged_get(source, url, hedge_after, kwargs)
+        finally:
+            self._record_http_stats()
+
+    def _hedged_get(self, source: str, url: str, hedge_after: float, kwargs: dict[str, typing.Any]) -> requests.Response:
+        """Send the GET on this thread and race a duplicate fired from the hedge pool after ``hedge_after`` seconds.
+
+        The duplicate takes its own rate-limiter slot and is only sent if the primary is still
+        running by then.  The primary cannot be interrupted, so the duplicate wins when it has
+        answered by the time the primary returns, or when the primary fails; the losing
+        response is closed.  The request only fails if both attempts fail.
+        """
+        primary_done = threading.Event()
+        hedge_at = time.monotonic() + hedge_after
+        duplicate = self._hedge_executor().submit(self._send_hedge, primary_done, source, url, hedge_at, kwargs)
+        try:
+            response = self.session_pool.get(source, url, **kwargs)
+        except Exception:
+            primary_done.set()
+            hedge = self._hedge_response(duplicate, block=True)
+            if hedge is None:
+                raise
+            self._record_hedge_win()
+            return hedge
+        primary_done.set()
+        hedge = self._hedge_response(duplicate, block=False)
+        if hedge is None:
+            self._discard(duplicate)
+            return response
+        response.close()
+        self._record_hedge_win()
+        return hedge
+
+    def _send_hedge(
+        self, primary_done: threading.Event, source: str, url: str, hedge_at: float, kwargs: dict[str, typing.Any]
+    ) -> requests.Response | None:
+        """Hedge-pool task: wait until ``hedge_at`` (monotonic) and send the duplicate unless the primary has returned."""
+        if primary_done.wait(max(0.0, hedge_at - time.monotonic())):
+            return None
+        try:
+            self._throttle(source)
+        except QuotaExhausted:
+            # The primary is already paid for; without budget for a duplicate, just wait for it.
+            self.logger.debug(f"Hedge skipped, quota exhausted | source={source} | {url}")
+            return None
+        if primary_done.is_set():
+            return None
+        self.logger.debug(f"Hedged GET {url}")
+        self._record_hedge()
+        return self.session_pool.get(source, url, **kwargs)
+
+    @staticmethod
+    def _hedge_response(duplicate: Future, block: bool) -> requests.Response | None:
+        """The duplicate's response if it was sent and succeeded; with ``block`` wait for it to finish."""
+        if not block and not duplicate.done():
+            return None
+        try:
+            return duplicate.result()
+        except Exception:
+            return None
+
+    @staticmethod
+    def _discard(future: Future) -> None:
+        if not future.cancel():
+            future.add_done_callback(lambda f: f.exception() is None and f.result() is not None and f.result().close())
+
+    def _hedge_executor(self) -> ThreadPoolExecutor:
+        with self._stats_lock:
+            if self._hedge_pool is None:
+                self._hedge_pool = ThreadPoolExecutor(max_workers=HEDGE_POOL_MAX_WORKERS, thread_name_prefix="bronze-hedge")
+            return self._hedge_pool
+
+    def _record_hedge(self) -> None:
+        if self.summary is not None:
+            with self.summary._lock:
+                self.summary.hedged_requests += 1
+
+    def _record_hedge_win(self) -> None:
+        if self.summary is not None:
+            with self.summary._lock:
+                self.summary.hedge_wins += 1
+
+    def _record_http_stats(self) -> None:
+        """Add pool counter deltas since the last report to the run summary."""
+        with self._stats_lock:
+            requests_sent, connections_opened = self.session_pool.stats()
+            new_requests = requests_sent - self._reported_http_requests
+            new_connections = connections_opened - self._reported_http_connections
+            self._reported_http_requests = requests_sent
+            self._reported_http_connections = connections_opened
+        if self.summary is not None and (new_requests or new_connections):
+            self.summary.record_http_requests(new_requests, new_connections)
+
+    def execute(self, func: typing.Callable[..., typing.Any], log_str: str, source: str | None = None) -> typing.Any:
+        """Call ``func`` with retries, sleeping through back-offs and Retry-After pauses on this thread.
+
+        Used by the sequential, per-recipe pool, paginated and backfill paths; the run-wide
+        work queue uses ``execute_once`` so its workers never sleep.
+        """
+        self._throttle(source)
+        return self._with_retries(func, log_str, source)
 
-    def _with_retries(self, func: typing.Callable[..., typing.Any], log_str: str) -> typing.Any:
+    def execute_once(self, func: typing.Callable[..., typing.Any], log_str: str, source: str | None = None, attempt: int = 0) -> typing.Any:
+        """Make one attempt and raise ``DeferredRetry`` rather than sleeping between attempts.
+
+        ``attempt`` is the number of attempts already spent on this request.  Used by the
+        run-wide work queue so a flaky request frees its worker while it waits: transport
+        errors back off with jitter, throttled responses are parked until the source's bucket
+        has a token again, a source paused by Retry-After is not called until the pause ends,
+        and while its circuit is open (or a half-open probe is out) it is not called at all.
+        Once attempts are exhausted the error (or throttled response) surfaces as in ``execute``.
+        """
+        paused_for = self.rate_limiter.blocked_seconds(source) or self.circuit_breaker.acquire(source)
+        if paused_for > 0:
+            raise DeferredRetry(paused_for, attempt, source)
+        self._throttle(source)
+        log = f"{log_str} | attempt={attempt + 1}/{RETRY_MAX_ATTEMPS}"
+        started_at = self.circuit_breaker.now()
+        try:
+            self.logger.debug(log)
+            response = func()
+        except requests.RequestException as e:
+            attempt += 1
+            if self.circuit_breaker.record_failure(source, started_at):
+                self.logger.warning(f"Circuit open for source={source} | pausing {self.circuit_breaker.cooldown_seconds:.0f}s | {log}")
+                if self.summary is not None:
+                    self.summary.record_circuit_open(source or DEFAULT_BUCKET)
+            raise DeferredRetry(self._retry_backoff(log, attempt, e), attempt, source) from e
+        attempt += 1
+        # Any response, throttled or not, shows the source is reachable (and settles a probe).
+        self.circuit_breaker.record_success(source)
+        if self._retry_throttled(response, log, attempt, source):
+            # Park the retry until the penalized bucket (Retry-After included) would let it through.
+            raise DeferredRetry(self.rate_limiter.wait_seconds(source), attempt, source)
+        return response
+
+    def _with_retries(self, func: typing.Callable[..., typing.Any], log_str: str, source: str | None = None) -> typing.Any:
         attempt = 0
         while True:
             log = f"{log_str} | attempt={attempt + 1}/{RETRY_MAX_ATTEMPS}"
             try:
                 self.logger.debug(log)
-                return func()
+                response = func()
             except requests.RequestException as e:
                 attempt += 1
-                if attempt >= RETRY_MAX_ATTEMPS:
-                    msg = f"FAILED: {log}: exception={e}"
-                    self.logger.error(msg)
-                    raise RuntimeError(msg) from e
-                backoff = RETRY_BASE_DELAY * (2 ** (attempt - 1))
-                self.logger.warning(f"Transient error:  {log} | Retrying in {backoff:.2f}s")
-                time.sleep(backoff)
-
-    def _throttle(self) -> None:
+                time.sleep(self._retry_backoff(log, attempt, e))
+                # Like every attempt, the retry takes a rate-limiter slot and is charged to the quota.
+                self._throttle(source)
+                continue
+            attempt += 1
+            if not self._retry_throttled(response, log, attempt, source):
+                return response
+            # The penalized bucket decides how long this retry (and every other caller) waits.
+            self._throttle(source)
+
+    async def execute_async(
+        self, func: typing.Callable[[], typing.Awaitable[typing.Any]], log_str: str, source: str | None = None
+    ) -> typing.Any:
+        """Event-loop counterpart of ``execute``: ``func`` is awaited and throttle waits and back-offs are ``asyncio.sleep``s.
+
+        Retries, Retry-After handling and quota charges follow ``execute`` exactly, so a
+        request parked on its source's bucket costs a coroutine rather than a thread.
+        """
+        await self._throttle_async(source)
+        attempt = 0
         while True:
-            with self.throttle_lock:
-                now = time.time()
-                window_start = now - THROTTLE_PERIOD_SECONDS
-                while self.call_timestamps and self.call_timestamps[0] <= window_start:
-                    self.call_timestamps.popleft()
-                if self.summary is not None and len(self.call_timestamps) > self.summary.throttle_max_queue_depth:
-                    self.summary.throttle_max_queue_depth = len(self.call_timestamps)
-                if len(self.call_timestamps) < THROTTLE_MAX_CALLS:
-                    self.call_timestamps.append(now)
-                    return
-                sleep_for = THROTTLE_PERIOD_SECONDS - (now - self.call_timestamps[0])
-            if sleep_for > 0:
-                if self.summary is not None:
-                    with self.summary._lock:
-                        self.summary.throttle_wait_count += 1
-                        self.summary.throttle_sleep_seconds += sleep_for
-                self.logger.debug(f"Throttle sleeping | {sleep_for}")
-                time.sleep(sleep_for)
-            else:
-                time.sleep(0)
+            log = f"{log_str} | attempt={attempt + 1}/{RETRY_MAX_ATTEMPS}"
+            try:
+                self.logger.debug(log)
+                response = await func()
+            except requests.RequestException as e:
+                attempt += 1
+                await asyncio.sleep(self._retry_backoff(log, attempt, e))
+                await self._throttle_async(source)
+                continue
+            attempt += 1
+            if not self._retry_throttled(response, log, attempt, source):
+                return response
+            await self._throttle_async(source)
+
+    def _retry_throttled(self, response: typing.Any, log: str, attempt: int, source: str | None) -> bool:
+        """Feed a 429/503 back into the source's bucket; return True if the request should be retried.
+
+        Once attempts are exhausted the throttled response is returned to the caller
+        and archived like any other non-200 Bronze result.
+        """
+        status_code = getattr(response, "status_code", None)
+        if status_code not in THROTTLE_STATUS_CODES:
+            return False
+        retry_after = parse_retry_after(response.headers.get("Retry-After")) if response.headers else None
+        self.rate_limiter.penalize(source, retry_after)
+        if self.summary is not None:
+            self.summary.record_throttle_backoff(source or DEFAULT_BUCKET)
+        if attempt >= RETRY_MAX_ATTEMPS:
+            self.logger.warning(f"Throttled: {log} | status={status_code} | attempts exhausted")
+            return False
+        self.logger.warning(f"Throttled: {log} | status={status_code} | retry_after={retry_after}")
+        response.close()
+        return True
+
+    def _retry_backoff(self, log: str, attempt: int, e: Exception) -> float:
+        """Return the back-off before the next attempt, or raise once attempts are exhausted."""
+        if attempt >= RETRY_MAX_ATTEMPS:
+            msg = f"FAILED: {log}: exception={e}"
+            self.logger.error(msg)
+            raise RuntimeError(msg) from e
+        backoff = RETRY_BASE_DELAY * (2 ** (attempt - 1))
+        backoff *= 1 - RETRY_JITTER * random.random()
+        self.logger.warning(f"Transient error:  {log} | Retrying in {backoff:.2f}s")
+        return backoff
+
+    def _throttle(self, source: str | None = None) -> None:
+        sleep_for = self._reserve_call_slot(source)
+        if sleep_for > 0:
+            time.sleep(sleep_for)
+
+    async def _throttle_async(self, source: str | None = None) -> None:
+        if self.quota_manager is not None:
+            # Refilling a quota block writes to the ops DB, so reserve off the event loop.
+            sleep_for = await asyncio.to_thread(self._reserve_call_slot, source)
+        else:
+            sleep_for = self._reserve_call_slot(source)
+        if sleep_for > 0:
+            await asyncio.sleep(sleep_for)
+
+    def _reserve_call_slot(self, source: str | None) -> float:
+        """Reserve a token from the source's bucket and return how long to wait for it.
+
+        Every call (retries and hedges included) is first charged to the source's persistent
+        quota; ``QuotaExhausted`` propagates to the caller before anything is sent.
+        """
+        if self.quota_manager is not None:
+            self.quota_manager.reserve(source or DEFAULT_BUCKET)
+        sleep_for, queue_depth = self.rate_limiter.reserve(source)
+        if self.summary is not None:
+            self.summary.record_throttle(source or DEFAULT_BUCKET, sleep_for, queue_depth)
+        if sleep_for > 0:
+            self.logger.debug(f"Throttle sleeping | source={source} | {sleep_for:.3f}s | queued={queue_depth}")
+        return sleep_for
@@ -121,6 +121,9 @@ DATA_SOURCES: list = [FMP_DATA_SOURCE, AV_DATA_SOURCE, ALPACA_DATA_SOURCE, SCHWA
 RETRY_MAX_ATTEMPTS = "retry_max_attemps"
 RETRY_BASE_DELAY = "retry_base_delay"
 THROTTLE_MAX_CALLS_PER_MINUTE = "throttle_max_calls"
+THROTTLE_BURST = "throttle_burst"  # token-bucket capacity: calls allowed back-to-back before the steady rate applies
+HTTP_POOL_MAXSIZE = "http_pool_maxsize"  # keep-alive connections retained per source host
+HEDGE_REQUESTS = "hedge_requests"  # True fires a duplicate GET when a request outlives its dataset's p90 latency (default: off)
 API_KEY = "API_KEY"  # this defines the label for the actual key in the .env file
 API_KEY_QUERY_PARAM = "api_key_query_param"  # the query-parameter name used to pass the API key (default: "apikey")
 BASE_URL = "base_url"
@@ -131,6 +134,8 @@ DATA_SOURCES_CONFIG = {
         RETRY_MAX_ATTEMPTS: 3,
         RETRY_BASE_DELAY: 0.5,
         THROTTLE_MAX_CALLS_PER_MINUTE: 3000,
+        THROTTLE_BURST: 50,
+        HTTP_POOL_MAXSIZE: 32,
         API_KEY: "FMP_API_KEY",
         BASE_URL: FMP_BASE_URL_STABLE,
     },
@@ -138,6 +143,8 @@ DATA_SOURCES_CONFIG = {
         RETRY_MAX_ATTEMPTS: 3,
         RETRY_BASE_DELAY: 0.5,
         THROTTLE_MAX_CALLS_PER_MINUTE: 120,
+        THROTTLE_BURST: 2,
+        HTTP_POOL_MAXSIZE: 4,
         API_KEY: "FRED_API_KEY",
         BASE_URL: FRED_BASE_URL,
         API_KEY_QUERY_PARAM: "api_key",  # FRED uses "api_key", not "apikey"
@@ -157,6 +164,7 @@ DUCKDB_FOLDER = "duckdb"
 DUCKDB_FILENAME = "SBFoundation.duckdb"
 MIGRATIONS_FOLDER = "db/migrations"
 LOG_FOLDER = "logs"
+RUN_JOURNAL_FOLDER = "journal"  # per-run JSONL journals of completed Bronze requests, used to resume a crashed run
 DATASET_KEYMAP_FOLDER = "config"
 DATASET_KEYMAP_FILENAME = os.environ.get("DATASET_KEYMAP_FILENAME", "dataset_keymap.yaml")
 
@@ -167,6 +175,28 @@ FMP_PREMIUM_PLAN = "premium"
 FMP_ULTIMATE_PLAN = "ultimate"
 FMP_PLANS = [FMP_BASIC_PLAN, FMP_STARTER_PLAN, FMP_PREMIUM_PLAN, FMP_ULTIMATE_PLAN]
 
+# --- API QUOTAS (persistent budgets shared by every run on the same key; see ops.api_quota_ledger) ---
+QUOTA_DAILY = "daily"
+QUOTA_MONTHLY = "monthly"
+QUOTA_PERIODS = [QUOTA_DAILY, QUOTA_MONTHLY]
+API_PLAN_ENV = {FMP_DATA_SOURCE: "FMP_PLAN"}  # env var naming each source's active plan tier; unset disables its quota
+API_QUOTAS = {
+    FMP_DATA_SOURCE: {
+        FMP_BASIC_PLAN: {QUOTA_DAILY: 250},  # the free tier's hard daily cap
+        # Paid tiers are rate- and bandwidth-limited rather than call-capped; these are house
+        # budgets that keep one flow from spending the key for everyone else.
+        FMP_STARTER_PLAN: {QUOTA_DAILY: 50_000, QUOTA_MONTHLY: 1_000_000},
+        FMP_PREMIUM_PLAN: {QUOTA_DAILY: 150_000, QUOTA_MONTHLY: 3_000_000},
+        FMP_ULTIMATE_PLAN: {QUOTA_DAILY: 500_000, QUOTA_MONTHLY: 10_000_000},
+    },
+}
+RUN_PRIORITY_HIGH = "high"  # scheduled flows (EOD); may spend a budget to the last call
+RUN_PRIORITY_NORMAL = "normal"
+RUN_PRIORITY_LOW = "low"  # backfills and ad-hoc runs; the first to yield when a budget runs low
+RUN_PRIORITIES = [RUN_PRIORITY_HIGH, RUN_PRIORITY_NORMAL, RUN_PRIORITY_LOW]
+QUOTA_HEADROOM_BY_PRIORITY = {RUN_PRIORITY_HIGH: 0.0, RUN_PRIORITY_NORMAL: 0.1, RUN_PRIORITY_LOW: 0.3}  # share of each budget left for higher priorities
+QUOTA_RESERVE_BLOCK = 25  # calls reserved per ledger write; a run returns its unused calls when it ends
+
 FROM_DATE = "1980-01-01"
 
 
@@ -174,6 +204,56 @@ FROM_DATE = "1980-01-01"
 RETRY_MAX_ATTEMPS = 3
 RETRY_BASE_DELAY = 0.5
 THROTTLE_PERIOD_SECONDS = 60
-THROTTLE_MAX_CALLS = 2000
+THROTTLE_MAX_CALLS = 2000  # per-period rate for sources without THROTTLE_MAX_CALLS_PER_MINUTE
+THROTTLE_GLOBAL_MAX_CALLS: int | None = None  # optional cap across all sources per THROTTLE_PERIOD_SECONDS; None disables
+HTTP_NOT_MODIFIED = 304  # conditional-GET answer: the cached validator still matches, so the previous Bronze file is reused
+THROTTLE_STATUS_CODES = (429, 503)  # responses that cut the source's rate and are retried after Retry-After
+THROTTLE_BACKOFF_FACTOR = 0.5  # multiplicative rate cut per throttled response
+THROTTLE_MIN_RATE_FACTOR = 0.1  # adaptive rate floor, as a fraction of the configured rate
+THROTTLE_RECOVERY_SECONDS = 120  # time for a cut rate to ramp linearly back to the configured rate
+THROTTLE_PENALTY_COOLDOWN_SECONDS = 1.0  # throttled responses within this window count as a single rate cut
+THROTTLE_MAX_RETRY_AFTER_SECONDS = 300  # cap on honoured Retry-After values
+RETRY_JITTER = 0.5  # fraction of each retry back-off that is randomized so failed requests do not retry in lockstep
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5  # consecutive transport failures that pause a source
+CIRCUIT_BREAKER_COOLDOWN_SECONDS = 30.0  # how long a paused source is left alone before it is probed again
+CIRCUIT_BREAKER_PROBE_POLL_SECONDS = 1.0  # how often requests held back by a half-open circuit check on its probe
+CIRCUIT_BREAKER_PROBE_TIMEOUT_SECONDS = 40.0  # a probe that never reports back lets another one through after this
+HEDGE_LATENCY_QUANTILE = 0.9  # a request still running after this quantile of its dataset's latency is hedged
+HEDGE_MIN_SAMPLES = 20  # latency samples needed before a dataset's quantile is trusted
+HEDGE_MIN_DELAY_SECONDS = 0.25  # never hedge sooner than this, however fast the dataset usually is
+HEDGE_WINDOW_SAMPLES = 500  # most recent in-run latencies kept per dataset
+HEDGE_POOL_MAX_WORKERS = 64  # threads timing and sending hedge duplicates (the primary runs on the caller)
 CONNECT_TIMEOUT = 5
 READ_TIMEOUT = 30
+HTTP_POOL_DEFAULT_MAXSIZE = 10  # fallback keep-alive pool size for sources without HTTP_POOL_MAXSIZE
+FETCH_ENGINE_THREADS = "threads"  # Bronze requests run on worker threads over the keep-alive session pool
+FETCH_ENGINE_ASYNCIO = "asyncio"  # eligible recipes run on one event loop; concurrent_requests caps requests in flight
+FETCH_ENGINES = [FETCH_ENGINE_THREADS, FETCH_ENGINE_ASYNCIO]
+
+SILVER_PIPELINE_QUEUE_SIZE = 64  # Bronze files waiting for pipelined Silver promotion before Bronze blocks
+BRONZE_WRITER_QUEUE_SIZE = 32  # accepted results waiting for a Bronze writer thread before fetch workers block
+PLAN_LATENCY_QUANTILE = 0.5  # past Bronze latency the dry-run planner assumes per request
+PLAN_DEFAULT_LATENCY_SECONDS = 1.0  # assumed latency for datasets without recorded history
+SILVER_DUCKDB_MAX_JSON_OBJECT_BYTES = 1024**3  # largest JSON document DuckDB will scan (promotion engine, raw Bronze row stats)
+SILVER_BATCH_MODES = ["file", "table"]  # table: one dedupe + MERGE per Silver table instead of per Bronze file
+SILVER_ENGINES = ["pandas", "duckdb"]  # duckdb: project + MERGE in SQL, falling back to pandas per file
+SILVER_DEDUPE_MODES = ["anti_join", "hash_only", "none"]  # how candidate rows are matched against existing Silver rows
+
+# --- Bronze storage modes (DatasetRecipe.bronze_storage) ---
+BRONZE_STORAGE_PARSED = "parsed"  # payload parsed at fetch time and stored as the envelope's JSON "content"
+BRONZE_STORAGE_RAW = "raw"  # vendor bytes stored verbatim in a sidecar; parsed lazily at Silver time
+BRONZE_STORAGE_RAW_GZIP = "raw_gzip"  # as "raw", gzip-compressed
+BRONZE_STORAGE_MODES = [BRONZE_STORAGE_PARSED, BRONZE_STORAGE_RAW, BRONZE_STORAGE_RAW_GZIP]
+
+# --- Bronze codecs (on-disk encoding of parsed Bronze payloads) ---
+BRONZE_CODEC_JSON = "json"  # pretty-printed JSON document (original format)
+BRONZE_CODEC_JSONL_GZIP = "jsonl_gzip"  # gzipped JSON Lines, envelope on the first line
+BRONZE_CODEC_PARQUET = "parquet"  # zstd Parquet, envelope in key/value metadata; nested payloads fall back to jsonl_gzip
+BRONZE_CODECS = [BRONZE_CODEC_JSON, BRONZE_CODEC_JSONL_GZIP, BRONZE_CODEC_PARQUET]
+BRONZE_CODEC = BRONZE_CODEC_JSON  # codec for newly written Bronze files; readers accept every codec
+BRONZE_PARQUET_ROW_GROUP_SIZE = 122_880  # rows per Parquet row group; streamed rows are also staged in batches of this size
+
+BRONZE_STREAM_CHUNK_BYTES = 1024 * 1024  # read size for streamed CSV responses
+BRONZE_SPOOL_MAX_MEMORY_BYTES = 8 * 1024 * 1024  # streamed rows stay in memory up to this size, then spill to a temp file
+
+BACKFILL_CHECKPOINT_SECONDS = 30  # concurrent backfill: interval between batched manifest + floor-date flushes
@@ -1,4 +1,5 @@
 from sbfoundation.silver.silver_service import SilverService
 from sbfoundation.silver.instrument_promotion_service import InstrumentPromotionService
+from sbfoundation.silver.silver_promotion_pipeline import SilverPromotionPipeline
 
-__all__ = ["SilverService", "InstrumentPromotionService"]
+__all__ = ["SilverService", "InstrumentPromotionService", "SilverPromotionPipeline"]
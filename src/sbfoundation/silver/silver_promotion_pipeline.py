@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import queue
+import threading
+import typing
+
+from sbfoundation.ops.dtos.file_injestion import DatasetInjestion
+from sbfoundation.settings import SILVER_PIPELINE_QUEUE_SIZE
+
+_CLOSE = object()
+
+
+class SilverPromotionPipeline:
+    """Promote Bronze files into Silver on a background thread while Bronze keeps fetching.
+
+    Bronze hands over each batch of manifests once they are flushed (a file is only
+    promotable after its manifest row exists).  Files wait on a bounded queue; when
+    promotion falls behind, ``submit`` blocks the Bronze main thread until a slot frees up,
+    which is the backpressure that keeps unpromoted files from piling up.  ``close`` drains
+    the queue and returns ``(promoted_file_ids, rows_written)`` like ``SilverService.promote``.
+    """
+
+    def __init__(self, silver_service: typing.Any, logger: typing.Any, run_id: str | None = None, maxsize: int = SILVER_PIPELINE_QUEUE_SIZE) -> None:
+        self._silver_service = silver_service
+        self._logger = logger
+        self._run_id = run_id
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, maxsize))
+        self._promoted: list[str] = []
+        self._rows = 0
+        self._thread = threading.Thread(target=self._worker, name="silver-pipeline", daemon=True)
+        self._thread.start()
+
+    def submit(self, ingestions: typing.Iterable[DatasetInjestion]) -> None:
+        """Queue promotable manifests, blocking while the queue is full."""
+        for ingestion in ingestions:
+            if ingestion.bronze_can_promote:
+                self._queue.put(ingestion)
+
+    def close(self) -> tuple[list[str], int]:
+        self._queue.put(_CLOSE)
+        self._thread.join()
+        return self._promoted, self._rows
+
+    def _worker(self) -> None:
+        while True:
+            ingestion = self._queue.get()
+            if ingestion is _CLOSE:
+                return
+            try:
+                rows_written = self._silver_service.promote_ingestion(ingestion)
+            except Exception as exc:
+                self._logger.error(f"Pipelined Silver promotion failed for {ingestion.msg}: {exc}", run_id=self._run_id)
+                continue
+            if rows_written is not None:
+                self._promoted.append(ingestion.file_id)
+                self._rows += rows_written
@@ -1,7 +1,10 @@
 ﻿from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 import importlib
-from datetime import date
+import multiprocessing
+from datetime import date, datetime
 from pathlib import Path
 
 import duckdb
@@ -16,6 +19,7 @@ from sbfoundation.settings import *
 from sbfoundation.dataset.models.dataset_identity import DatasetIdentity
 from sbfoundation.dataset.models.dataset_keymap import DatasetKeymap
 from sbfoundation.dataset.models.dataset_keymap_entry import DatasetKeymapEntry
+from sbfoundation.dataset.models.dataset_schema import DatasetDtoSchema
 from sbfoundation.dataset.services.dataset_service import DatasetService
 from sbfoundation.maintenance import DuckDbBootstrap
 from sbfoundation.infra.logger import LoggerFactory, SBLogger
@@ -23,12 +27,18 @@ from sbfoundation.bronze import BronzeBatchReader
 from sbfoundation.run.services.chunk_engine import ChunkEngine
 from sbfoundation.run.services.dedupe_engine import DedupeEngine
 from sbfoundation.dtos.dto_projection import DTOProjection
+from sbfoundation.dtos.sql_projection import SqlProjection
 from sbfoundation.dtos.models import BronzeManifestRow
 from sbfoundation.ops.requests.promotion_config import PromotionConfig
 from sbfoundation.infra.result_file_adaptor import ResultFileAdapter
+from sbfoundation.ops.dtos.file_injestion import DatasetInjestion
 from sbfoundation.ops.services.ops_service import OpsService
 
 
+class _DuckDbScanFailed(Exception):
+    """DuckDB could not project a Bronze file; it is promoted with pandas instead."""
+
+
 class SilverService:
     """Promote Bronze manifest rows into Silver DuckDB tables."""
 
@@ -42,20 +52,33 @@ class SilverService:
         promotion_config: PromotionConfig | None = None,
         bronze_batch_reader: BronzeBatchReader | None = None,
         dto_projection: DTOProjection | None = None,
+        sql_projection: SqlProjection | None = None,
         chunk_engine: ChunkEngine | None = None,
         dedupe_engine: DedupeEngine | None = None,
         ops_service: OpsService | None = None,
+        workers: int = 0,
     ) -> None:
         self._enabled = enabled
+        self._workers = workers
+        self._promotion_config = promotion_config or PromotionConfig()
+        if workers > 0 and self._promotion_config.engine == "duckdb":
+            # Worker processes project with pandas; the DuckDB engine runs on the writer's connection.
+            raise ValueError("Silver workers project with pandas and cannot be combined with engine='duckdb'")
+        if self._promotion_config.batch_mode == "table" and (workers > 0 or self._promotion_config.engine == "duckdb"):
+            # Table batches dedupe and MERGE on the writer with pandas; neither workers nor the DuckDB engine would run.
+            raise ValueError("batch_mode='table' cannot be combined with Silver workers or engine='duckdb'")
         self._logger = logger or LoggerFactory().create_logger(self.__class__.__name__)
         self._bootstrap = bootstrap or DuckDbBootstrap()
         self._owns_bootstrap = bootstrap is None
         self._result_file_adapter = result_file_adapter or ResultFileAdapter()
-        self._promotion_config = promotion_config or PromotionConfig()
         self._bronze_batch_reader = bronze_batch_reader or BronzeBatchReader(self._result_file_adapter)
         self._dto_projection = dto_projection or DTOProjection()
+        self._sql_projection = sql_projection or SqlProjection()
         self._chunk_engine = chunk_engine or ChunkEngine(strategy=self._promotion_config.chunk_strategy)
-        self._dedupe_engine = dedupe_engine or DedupeEngine(use_duckdb_engine=self._promotion_config.use_duckdb_engine)
+        self._dedupe_engine = dedupe_engine or DedupeEngine(
+            use_duckdb_engine=self._promotion_config.use_duckdb_engine,
+            mode=self._promotion_config.dedupe_mode,
+        )
         self._ops_service = ops_service or OpsService()
         self._owns_ops_service = ops_service is None
         keymap_service = keymap_service or DatasetService()
@@ -85,43 +108,17 @@ class SilverService:
         promoted: list[str] = []
         promoted_rows = 0
 
-        for ingestion in ingestions:
-            self._logger.info(f"{prefix} | promoting | {ingestion.msg}", run_id=ingestion.run_id)
-            self._ops_service.start_silver_ingestion(ingestion)
-            manifest_row = ingestion.to_bronze_manifest_row()
-            try:
-                rows_seen, rows_written, coverage_from, coverage_to, table_name = self._promote_row(manifest_row, self.keymap)
-            except Exception as exc:
-                self._logger.warning(
-                    "Silver promotion failed | file_id=%s | dataset=%s | error=%s",
-                    ingestion.file_id,
-                    ingestion.dataset,
-                    exc,
-                    run_id=ingestion.run_id,
-                )
-                self._ops_service.finish_silver_ingestion(
-                    ingestion,
-                    rows_seen=0,
-                    rows_written=0,
-                    rows_failed=0,
-                    table_name=None,
-                    coverage_from=None,
-                    coverage_to=None,
-                    error=str(exc),
-                )
-                continue
-            self._ops_service.finish_silver_ingestion(
-                ingestion,
-                rows_seen=rows_seen,
-                rows_written=rows_written,
-                rows_failed=max(rows_seen - rows_written, 0),
-                table_name=table_name,
-                coverage_from=coverage_from,
-                coverage_to=coverage_to,
-                error=None,
-            )
-            promoted.append(ingestion.file_id)
-            promoted_rows += rows_written
+        if self._promotion_config.batch_mode == "table":
+            promoted, promoted_rows = self._promote_batched(ingestions, prefix)
+        elif self._workers > 0:
+            promoted, promoted_rows = self._promote_parallel(ingestions, prefix)
+        else:
+            for ingestion in ingestions:
+                rows_written = self.promote_ingestion(ingestion, prefix)
+                if rows_written is None:
+                    continue
+                promoted.append(ingestion.file_id)
+                promoted_rows += rows_written
 
         self._logger.info(
             "PROCESSING SILVER | complete | bronze_files=%s | rows=%s",
@@ -131,6 +128,103 @@ class SilverService:
         )
         return promoted, promoted_rows
 
+    def promote_ingestion(self, ingestion: DatasetInjestion, prefix: str = "PROCESSING SILVER") -> int | None:
+        """Promote one Bronze file and record the outcome; return rows written, or None if it failed."""
+        self._logger.info(f"{prefix} | promoting | {ingestion.msg}", run_id=ingestion.run_id)
+        self._ops_service.start_silver_ingestion(ingestion)
+        manifest_row = ingestion.to_bronze_manifest_row()
+        try:
+            outcome = self._promote_row(manifest_row, self.keymap)
+        except Exception as exc:
+            return self._finish_ingestion(ingestion, error=exc)
+        return self._finish_ingestion(ingestion, outcome)
+
+    def _finish_ingestion(
+        self,
+        ingestion: DatasetInjestion,
+        outcome: tuple[int, int, date | None, date | None, str] | None = None,
+        error: Exception | None = None,
+    ) -> int | None:
+        """Record a file's promotion outcome (or ``error``); return rows written, or None if it failed."""
+        if error is not None or outcome is None:
+            self._logger.warning(
+                "Silver promotion failed | file_id=%s | dataset=%s | error=%s",
+                ingestion.file_id,
+                ingestion.dataset,
+                error,
+                run_id=ingestion.run_id,
+            )
+            self._ops_service.finish_silver_ingestion(
+                ingestion,
+                rows_seen=0,
+                rows_written=0,
+                rows_failed=0,
+                table_name=None,
+                coverage_from=None,
+                coverage_to=None,
+                error=str(error),
+            )
+            return None
+        rows_seen, rows_written, coverage_from, coverage_to, table_name = outcome
+        self._ops_service.finish_silver_ingestion(
+            ingestion,
+            rows_seen=rows_seen,
+            rows_written=rows_written,
+            rows_failed=max(rows_seen - rows_written, 0),
+            table_name=table_name,
+            coverage_from=coverage_from,
+            coverage_to=coverage_to,
+            error=None,
+        )
+        return rows_written
+
+    def _promote_parallel(self, ingestions: list[DatasetInjestion], prefix: str) -> tuple[list[str], int]:
+        """Project Bronze files on ``workers`` processes while this process writes them one at a time.
+
+        Reading, ``transform_df_content`` and ``DTOProjection`` run in the pool, each worker
+        using a copy of this service's ``BronzeBatchReader`` and ``DTOProjection``; the watermark,
+        dedupe, MERGE and ops updates stay here, on the single DuckDB connection.  Files are
+        written in submission order, so duplicate keys resolve exactly as in sequential promotion.
+        At most ``2 * workers`` projected files wait for the writer at a time.
+        """
+        promoted: list[str] = []
+        promoted_rows = 0
+        in_flight: deque[tuple[DatasetInjestion, DatasetKeymapEntry, Future]] = deque()
+
+        def write_next() -> None:
+            nonlocal promoted_rows
+            ingestion, entry, future = in_flight.popleft()
+            try:
+                df_projected, row_date_col = future.result()
+                outcome = self._write_projected(ingestion.to_bronze_manifest_row(), entry, df_projected, row_date_col)
+            except Exception as exc:
+                self._finish_ingestion(ingestion, error=exc)
+                return
+            promoted.append(ingestion.file_id)
+            promoted_rows += self._finish_ingestion(ingestion, outcome)
+
+        with ProcessPoolExecutor(
+            max_workers=self._workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_projection_worker,
+            initargs=(self._bronze_batch_reader, self._dto_projection),
+        ) as pool:
+            for ingestion in ingestions:
+                manifest_row = ingestion.to_bronze_manifest_row()
+                entry = self._resolve_keymap_entry_safe(manifest_row, self.keymap)
+                if entry is None:
+                    # Let the per-file path raise and record the keymap error for this file.
+                    self.promote_ingestion(ingestion, prefix)
+                    continue
+                self._logger.info(f"{prefix} | promoting | {ingestion.msg}", run_id=ingestion.run_id)
+                self._ops_service.start_silver_ingestion(ingestion)
+                in_flight.append((ingestion, entry, pool.submit(_project_in_worker, manifest_row, entry)))
+                while len(in_flight) > 2 * self._workers:
+                    write_next()
+            while in_flight:
+                write_next()
+        return promoted, promoted_rows
+
     def _resolve_keymap_entry_safe(self, row: BronzeManifestRow, keymap: DatasetKeymap) -> DatasetKeymapEntry | None:
         """Safely resolve keymap entry, returning None on failure."""
         try:
@@ -140,32 +234,84 @@ class SilverService:
 
     def _promote_row(self, row: BronzeManifestRow, keymap: DatasetKeymap) -> tuple[int, int, date | None, date | None, str]:
         entry = self._resolve_keymap_entry(row, keymap)
+        if self._promotion_config.engine == "duckdb":
+            promoted = self._promote_row_duckdb(row, entry)
+            if promoted is not None:
+                return promoted
+
+        df_projected, row_date_col = self._project_row(row, entry)
+        return self._write_projected(row, entry, df_projected, row_date_col)
+
+    def _write_projected(
+        self,
+        row: BronzeManifestRow,
+        entry: DatasetKeymapEntry,
+        df_projected: pd.DataFrame,
+        row_date_col: str,
+    ) -> tuple[int, int, date | None, date | None, str]:
+        """Apply the watermark to one file's projected rows and MERGE them."""
+        if df_projected.empty:
+            return 0, 0, None, None, ""
+
+        if self._promotion_config.filters_by_watermark:
+            watermark = self._ops_service.get_silver_watermark(
+                domain=row.domain,
+                source=row.source,
+                dataset=row.dataset,
+                discriminator=row.discriminator or "",
+                ticker=row.ticker or "",
+            )
+            if watermark:
+                df_projected = self._apply_watermark(df_projected, row_date_col, watermark)
 
+        if df_projected.empty:
+            return 0, 0, None, None, ""
+
+        df_projected, rows_written, target_table = self._write_rows(entry, df_projected, row_date_col)
+        rows_seen = len(df_projected)
+        coverage_from, coverage_to = self._coverage_dates(df_projected, row_date_col)
+        return rows_seen, rows_written, coverage_from, coverage_to, target_table
+
+    def _project_row(self, row: BronzeManifestRow, entry: DatasetKeymapEntry) -> tuple[pd.DataFrame, str]:
+        return self._project_file(row, entry, self._bronze_batch_reader, self._dto_projection)
+
+    @staticmethod
+    def _project_file(
+        row: BronzeManifestRow,
+        entry: DatasetKeymapEntry,
+        bronze_batch_reader: BronzeBatchReader,
+        dto_projection: DTOProjection,
+    ) -> tuple[pd.DataFrame, str]:
+        """Read one Bronze file and project it to Silver columns with lineage; return (rows, row_date_col).
+
+        Touches neither DuckDB nor ops, so it can run in a worker process (see ``_promote_parallel``).
+        """
         # SILVER LAYER: Clean, standalone datasets only
         # NO surrogate keys (instrument_sk), NO relationships, NO Gold dependencies
         # Surrogate key resolution and relationships are Gold layer concerns
 
-        batch = self._bronze_batch_reader.read(row)
+        row_date_col = entry.row_date_col or "as_of_date"
+        batch = bronze_batch_reader.read(row)
         dto_schema = entry.dto_schema
         dto_type = None
         if dto_schema is None:
-            dto_type = self._resolve_dto_type(row, batch.result)
+            dto_type = SilverService._resolve_dto_type(row, batch.result)
 
         df_content = batch.df_content
         if dto_schema is not None and dto_schema.dto_type:
-            dto_cls = self._resolve_dto_class(dto_schema.dto_type)
+            dto_cls = SilverService._resolve_dto_class(dto_schema.dto_type)
             if dto_cls is not None:
                 df_content = dto_cls.transform_df_content(df_content)
 
         ticker_override = row.ticker if entry.ticker_scope == "per_ticker" and row.ticker else None
-        df_projected = self._dto_projection.project(
+        df_projected = dto_projection.project(
             df_content,
             dto_type=dto_type,
             dto_schema=dto_schema,
             ticker_override=ticker_override,
         )
         if df_projected.empty:
-            return 0, 0, None, None, ""
+            return df_projected, row_date_col
 
         df_projected["bronze_file_id"] = row.bronze_file_id
         df_projected["run_id"] = row.run_id
@@ -173,47 +319,259 @@ class SilverService:
         if "discriminator" in entry.key_cols:
             df_projected["discriminator"] = row.discriminator or ""
 
-        row_date_col = entry.row_date_col or "as_of_date"
-        self._ensure_row_date(df_projected, row_date_col, row)
-        self._ensure_key_cols_df(df_projected, entry.key_cols, row)
-        self._coerce_numeric_columns(df_projected, ["market_cap"])
-
-        watermark = self._ops_service.get_silver_watermark(
-            domain=row.domain,
-            source=row.source,
-            dataset=row.dataset,
-            discriminator=row.discriminator or "",
-            ticker=row.ticker or "",
-        )
-        if watermark and self._promotion_config.watermark_mode != "none":
-            df_projected = self._apply_watermark(df_projected, row_date_col, watermark)
-
-        if df_projected.empty:
-            return 0, 0, None, None, ""
+        SilverService._ensure_row_date(df_projected, row_date_col, row)
+        SilverService._ensure_key_cols_df(df_projected, entry.key_cols, row)
+        SilverService._coerce_numeric_columns(df_projected, ["market_cap"])
+        return df_projected, row_date_col
 
-        conn = self._bootstrap.connect()
-        table_exists = self._table_exists(conn, entry.silver_schema, entry.silver_table)
+    def _write_rows(self, entry: DatasetKeymapEntry, df: pd.DataFrame, row_date_col: str) -> tuple[pd.DataFrame, int, str]:
+        """Dedupe rows against the target table and MERGE them; return (deduped rows, rows written, table)."""
         target_table = self._qualified_table(entry.silver_schema, entry.silver_table)
-        df_projected = self._dedupe_engine.dedupe_against_table(
-            conn,
-            df_candidate=df_projected,
-            key_cols=entry.key_cols,
-            target_table=target_table,
-            table_exists=table_exists,
-        )
+        # Runs on the promotion pipeline's writer thread too, so the read takes the connection lock.
+        with self._bootstrap.read_connection() as conn:
+            table_exists = self._table_exists(conn, entry.silver_schema, entry.silver_table)
+            df = self._dedupe_engine.dedupe_against_table(
+                conn,
+                df_candidate=df,
+                key_cols=entry.key_cols,
+                target_table=target_table,
+                table_exists=table_exists,
+            )
 
-        rows_seen = len(df_projected)
-        coverage_from, coverage_to = self._coverage_dates(df_projected, row_date_col)
         rows_written = 0
-        for chunk in self._chunk_engine.chunk(df_projected, row_date_col=row_date_col):
+        for chunk in self._chunk_engine.chunk(df, row_date_col=row_date_col):
             if chunk.df.empty:
                 continue
             with self._bootstrap.silver_transaction() as txn:
                 self._merge_rows(txn, entry, chunk.df, table_exists=table_exists)
             rows_written += len(chunk.df)
             table_exists = True
+        return df, rows_written, target_table
 
-        return rows_seen, rows_written, coverage_from, coverage_to, target_table
+    def _promote_row_duckdb(self, row: BronzeManifestRow, entry: DatasetKeymapEntry) -> tuple[int, int, date | None, date | None, str] | None:
+        """Project, dedupe and MERGE one Bronze file inside DuckDB; None when it needs the pandas path.
+
+        Only files whose rows DuckDB can scan (``BronzeBatchReader.relation_sql``) and whose
+        ``dto_schema`` compiles to SQL qualify; a DTO that overrides ``transform_df_content``
+        needs pandas.  The whole file is merged in one statement, without ``ChunkEngine``.
+        """
+        dto_schema = entry.dto_schema
+        if dto_schema is None:
+            return None
+        if dto_schema.dto_type:
+            dto_cls = self._resolve_dto_class(dto_schema.dto_type)
+            if dto_cls is not None and dto_cls.transform_df_content.__func__ is not BronzeToSilverDTO.transform_df_content.__func__:
+                return None
+        relation = self._bronze_batch_reader.relation_sql(row)
+        if relation is None:
+            return None
+        try:
+            with self._bootstrap.read_connection() as conn:
+                described = conn.execute(f"DESCRIBE SELECT * FROM {relation}").fetchall()
+        except duckdb.Error as exc:
+            self._logger.info("DuckDB promotion unavailable, using pandas | file_id=%s | error=%s", row.bronze_file_id, exc, run_id=row.run_id)
+            return None
+
+        ticker_override = row.ticker if entry.ticker_scope == "per_ticker" and row.ticker else None
+        columns = self._sql_projection.compile(dto_schema, {described_row[0]: described_row[1] for described_row in described}, ticker_override)
+        if columns is None:
+            return None
+
+        params: dict[str, object] = {"bronze_file_id": row.bronze_file_id, "run_id": row.run_id, "ingested_at": row.ingested_at}
+        columns["bronze_file_id"] = "$bronze_file_id"
+        columns["run_id"] = "$run_id"
+        columns["ingested_at"] = "CAST($ingested_at AS TIMESTAMP)"
+        if "discriminator" in entry.key_cols:
+            columns["discriminator"] = "$discriminator"
+            params["discriminator"] = row.discriminator or ""
+
+        row_date_col = entry.row_date_col or "as_of_date"
+        if row_date_col not in columns:
+            fallback = row.coverage_to_date or row.coverage_from_date or row.ingested_at
+            # Same column types pandas gives: dates become ns timestamps, datetimes stay us.
+            columns[row_date_col] = "CAST($row_date AS TIMESTAMP)" if isinstance(fallback, datetime) else "CAST($row_date AS TIMESTAMP_NS)"
+            params["row_date"] = fallback
+        elif not self._is_temporal_column(dto_schema, row_date_col):
+            columns[row_date_col] = f"TRY_CAST({columns[row_date_col]} AS TIMESTAMP_NS)"
+        if "market_cap" in columns:
+            columns["market_cap"] = f"TRY_CAST({columns['market_cap']} AS DOUBLE)"
+        missing = [col for col in entry.key_cols if col not in columns]
+        if missing:
+            raise ValueError(f"Silver rows missing key columns {missing} for {row.dataset}")
+
+        select_list = ", ".join(f"{expr} AS {self._quote_ident(name)}" for name, expr in columns.items())
+        projected = f"SELECT * FROM (SELECT {select_list}, row_number() OVER () AS _silver_row FROM {relation})"
+        if self._promotion_config.filters_by_watermark:
+            watermark = self._ops_service.get_silver_watermark(
+                domain=row.domain,
+                source=row.source,
+                dataset=row.dataset,
+                discriminator=row.discriminator or "",
+                ticker=row.ticker or "",
+            )
+            if watermark:
+                projected += f" WHERE CAST({self._quote_ident(row_date_col)} AS DATE) > $watermark"
+                params["watermark"] = watermark
+
+        target_table = self._qualified_table(entry.silver_schema, entry.silver_table)
+        row_date = self._quote_ident(row_date_col)
+        try:
+            with self._bootstrap.silver_transaction() as txn:
+                try:
+                    txn.execute(f"CREATE OR REPLACE TEMP TABLE _silver_projected AS {projected}", params)
+                except duckdb.Error as exc:
+                    # Values DuckDB cannot convert (or a file it cannot scan after all): raising
+                    # rolls the transaction back, and the file goes through pandas instead.
+                    raise _DuckDbScanFailed(exc) from exc
+                if not txn.execute("SELECT COUNT(*) FROM _silver_projected").fetchone()[0]:
+                    txn.execute("DROP TABLE _silver_projected")
+                    return 0, 0, None, None, ""
+
+                table_exists = self._table_exists(txn, entry.silver_schema, entry.silver_table)
+                deduped = self._dedupe_engine.dedupe_relation_sql(
+                    source="_silver_projected",
+                    key_cols=entry.key_cols,
+                    target_table=target_table,
+                    table_exists=table_exists,
+                    order_col="_silver_row",
+                    columns=columns,
+                )
+                txn.execute(f"CREATE OR REPLACE TEMP TABLE _silver_candidate AS {deduped}")
+                rows_seen, coverage_from, coverage_to = txn.execute(
+                    f"SELECT COUNT(*), MIN(CAST({row_date} AS DATE)), MAX(CAST({row_date} AS DATE)) FROM _silver_candidate"
+                ).fetchone()
+                if rows_seen:
+                    self._merge_relation(txn, entry, "_silver_candidate", self._dedupe_engine.merge_columns(columns), table_exists=table_exists)
+                txn.execute("DROP TABLE _silver_projected")
+                txn.execute("DROP TABLE _silver_candidate")
+        except _DuckDbScanFailed as exc:
+            self._logger.info("DuckDB promotion failed, using pandas | file_id=%s | error=%s", row.bronze_file_id, exc, run_id=row.run_id)
+            return None
+        return rows_seen, rows_seen, coverage_from, coverage_to, target_table
+
+    @staticmethod
+    def _is_temporal_column(schema: DatasetDtoSchema, name: str) -> bool:
+        for column in schema.columns:
+            if column.name == name:
+                return DTOProjection._normalize_type_hint(column.type) in {"date", "datetime.date", "datetime", "datetime.datetime"}
+        return False
+
+    def _promote_batched(self, ingestions: list[DatasetInjestion], prefix: str) -> tuple[list[str], int]:
+        """Promote ingestions grouped by target Silver table, ``max_files_per_batch`` files per MERGE."""
+        promoted: list[str] = []
+        promoted_rows = 0
+        groups: dict[tuple, list[tuple[DatasetInjestion, DatasetKeymapEntry]]] = {}
+        for ingestion in ingestions:
+            entry = self._resolve_keymap_entry_safe(ingestion.to_bronze_manifest_row(), self.keymap)
+            if entry is None:
+                # Let the per-file path raise and record the keymap error for this file.
+                rows_written = self.promote_ingestion(ingestion, prefix)
+                if rows_written is not None:
+                    promoted.append(ingestion.file_id)
+                    promoted_rows += rows_written
+                continue
+            table_key = (entry.silver_schema, entry.silver_table, entry.key_cols, entry.row_date_col or "as_of_date")
+            groups.setdefault(table_key, []).append((ingestion, entry))
+
+        batch_size = max(1, self._promotion_config.max_files_per_batch)
+        for items in groups.values():
+            for start in range(0, len(items), batch_size):
+                batch_promoted, batch_rows = self._promote_batch(items[start : start + batch_size], prefix)
+                promoted.extend(batch_promoted)
+                promoted_rows += batch_rows
+        return promoted, promoted_rows
+
+    def _promote_batch(self, items: list[tuple[DatasetInjestion, DatasetKeymapEntry]], prefix: str) -> tuple[list[str], int]:
+        """Project every file of one table, dedupe and MERGE the rows once, and record per-file outcomes.
+
+        Watermarks are read once per dataset before the batch.  Unlike sequential promotion,
+        a file is not filtered by the watermark an earlier file of the same batch would have
+        advanced; keys that several files share are settled by the first/last-file rule below.
+        """
+        ingestions = [ingestion for ingestion, _ in items]
+        table_entry = items[0][1]
+        row_date_col = table_entry.row_date_col or "as_of_date"
+        target_table = self._qualified_table(table_entry.silver_schema, table_entry.silver_table)
+        self._logger.info(f"{prefix} | promoting batch | table={target_table} | files={len(items)}", run_id=ingestions[0].run_id)
+        self._ops_service.start_silver_ingestions(ingestions)
+
+        watermarks: dict[tuple[str, str, str], dict[tuple[str, str], date | None]] = {}
+        frames: list[pd.DataFrame] = []
+        projected: list[DatasetInjestion] = []
+        for order, (ingestion, entry) in enumerate(items):
+            row = ingestion.to_bronze_manifest_row()
+            try:
+                df, _ = self._project_row(row, entry)
+                if not df.empty and self._promotion_config.filters_by_watermark:
+                    dataset_key = (row.domain, row.source, row.dataset)
+                    if dataset_key not in watermarks:
+                        watermarks[dataset_key] = self._ops_service.get_bulk_silver_watermarks(
+                            domain=row.domain, source=row.source, dataset=row.dataset
+                        )
+                    watermark = watermarks[dataset_key].get((row.discriminator or "", row.ticker or ""))
+                    if watermark:
+                        df = self._apply_watermark(df, row_date_col, watermark)
+            except Exception as exc:
+                self._record_batch_failure(ingestion, exc)
+                continue
+            projected.append(ingestion)
+            if not df.empty:
+                frames.append(df.assign(_batch_order=order))
+
+        written = pd.DataFrame()
+        if frames:
+            df_batch = pd.concat(frames, ignore_index=True)
+            # A key repeated across files resolves as sequential promotion would: when existing rows
+            # win (anti_join) the earliest file keeps it, otherwise each later file overwrites it.
+            pick = "min" if self._dedupe_engine.keeps_existing_rows else "max"
+            winner = df_batch.groupby(list(table_entry.key_cols), dropna=False)["_batch_order"].transform(pick)
+            df_batch = df_batch.loc[df_batch["_batch_order"] == winner].drop(columns="_batch_order")
+            try:
+                written, _, target_table = self._write_rows(table_entry, df_batch, row_date_col)
+            except Exception as exc:
+                for ingestion in projected:
+                    self._record_batch_failure(ingestion, exc)
+                self._ops_service.finish_silver_ingestions(ingestions)
+                return [], 0
+
+        stats: dict[str, tuple[int, date | None, date | None]] = {}
+        if not written.empty:
+            for file_id, df_file in written.groupby("bronze_file_id", sort=False):
+                stats[file_id] = (len(df_file), *self._coverage_dates(df_file, row_date_col))
+
+        promoted_rows = 0
+        for ingestion in projected:
+            rows, coverage_from, coverage_to = stats.get(ingestion.file_id, (0, None, None))
+            self._ops_service.set_silver_outcome(
+                ingestion,
+                rows_written=rows,
+                rows_failed=0,
+                table_name=target_table,
+                coverage_from=coverage_from,
+                coverage_to=coverage_to,
+                error=None,
+            )
+            promoted_rows += rows
+        self._ops_service.finish_silver_ingestions(ingestions)
+        return [ingestion.file_id for ingestion in projected], promoted_rows
+
+    def _record_batch_failure(self, ingestion: DatasetInjestion, exc: Exception) -> None:
+        self._logger.warning(
+            "Silver promotion failed | file_id=%s | dataset=%s | error=%s",
+            ingestion.file_id,
+            ingestion.dataset,
+            exc,
+            run_id=ingestion.run_id,
+        )
+        self._ops_service.set_silver_outcome(
+            ingestion,
+            rows_written=0,
+            rows_failed=0,
+            table_name=None,
+            coverage_from=None,
+            coverage_to=None,
+            error=str(exc),
+        )
 
     def _resolve_keymap_entry(self, row: BronzeManifestRow, keymap: DatasetKeymap) -> DatasetKeymapEntry:
         """Resolve the shared dataset keymap entry and enforce ticker requirements."""
@@ -281,7 +639,8 @@ class SilverService:
         except Exception:
             return None
 
-    def _resolve_dto_type(self, row: BronzeManifestRow, result: BronzeResult) -> type[BronzeToSilverDTO]:
+    @staticmethod
+    def _resolve_dto_type(row: BronzeManifestRow, result: BronzeResult) -> type[BronzeToSilverDTO]:
         dto_type = None
         request = getattr(result, "request", None)
         if request is not None:
@@ -292,18 +651,21 @@ class SilverService:
             raise ValueError(f"Missing DTO mapping for dataset {row.dataset}")
         return dto_type
 
-    def _ensure_row_date(self, df: pd.DataFrame, row_date_col: str, row: BronzeManifestRow) -> None:
+    @staticmethod
+    def _ensure_row_date(df: pd.DataFrame, row_date_col: str, row: BronzeManifestRow) -> None:
         if row_date_col not in df.columns:
             fallback = row.coverage_to_date or row.coverage_from_date or row.ingested_at
             df[row_date_col] = fallback
         df[row_date_col] = pd.to_datetime(df[row_date_col], errors="coerce")
 
-    def _coerce_numeric_columns(self, df: pd.DataFrame, columns: list[str]) -> None:
+    @staticmethod
+    def _coerce_numeric_columns(df: pd.DataFrame, columns: list[str]) -> None:
         for column in columns:
             if column in df.columns:
                 df[column] = pd.to_numeric(df[column], errors="coerce").astype("float64")
 
-    def _ensure_key_cols_df(self, df: pd.DataFrame, key_cols: tuple[str, ...], row: BronzeManifestRow) -> None:
+    @staticmethod
+    def _ensure_key_cols_df(df: pd.DataFrame, key_cols: tuple[str, ...], row: BronzeManifestRow) -> None:
         missing = [col for col in key_cols if col not in df.columns]
         if missing:
             raise ValueError(f"Silver rows missing key columns {missing} for {row.dataset}")
@@ -320,29 +682,44 @@ class SilverService:
             return
         conn.register("_silver_rows", df)
         try:
-            full_table = self._qualified_table(entry.silver_schema, entry.silver_table)
-            if not table_exists and not self._table_exists(conn, entry.silver_schema, entry.silver_table):
-                conn.execute(f"CREATE TABLE {full_table} AS SELECT * FROM _silver_rows")
-                return
-
-            key_cols = entry.key_cols
-            on_clause = " AND ".join(f"{self._qualified_ident('target', col)} = {self._qualified_ident('source', col)}" for col in key_cols)
-            update_cols = list(df.columns)
-            update_set = ", ".join(f"{self._quote_ident(col)} = {self._qualified_ident('source', col)}" for col in update_cols)
-            insert_cols = ", ".join(self._quote_ident(col) for col in update_cols)
-            insert_vals = ", ".join(self._qualified_ident("source", col) for col in update_cols)
-
-            sql = (
-                f"MERGE INTO {full_table} AS target "
-                "USING _silver_rows AS source "
-                f"ON {on_clause} "
-                f"WHEN MATCHED THEN UPDATE SET {update_set} "
-                f"WHEN NOT MATCHED THEN INSERT ({insert_cols}) VALUES ({insert_vals})"
-            )
-            conn.execute(sql)
+            self._merge_relation(conn, entry, "_silver_rows", list(df.columns), table_exists=table_exists)
         finally:
             conn.unregister("_silver_rows")
 
+    def _merge_relation(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        entry: DatasetKeymapEntry,
+        source: str,
+        columns: list[str],
+        *,
+        table_exists: bool,
+    ) -> None:
+        """MERGE the rows of the table or view ``source`` into the entry's Silver table, creating it if needed."""
+        full_table = self._qualified_table(entry.silver_schema, entry.silver_table)
+        if not table_exists and not self._table_exists(conn, entry.silver_schema, entry.silver_table):
+            self._dedupe_engine.prepare_target(conn, target_table=full_table, created=True)
+            conn.execute(f"CREATE TABLE {full_table} AS SELECT * FROM {source}")
+            self._dedupe_engine.record_hashes(conn, source=source, key_cols=entry.key_cols, target_table=full_table)
+            return
+
+        key_cols = entry.key_cols
+        on_clause = " AND ".join(f"{self._qualified_ident('target', col)} = {self._qualified_ident('source', col)}" for col in key_cols)
+        update_set = ", ".join(f"{self._quote_ident(col)} = {self._qualified_ident('source', col)}" for col in columns)
+        insert_cols = ", ".join(self._quote_ident(col) for col in columns)
+        insert_vals = ", ".join(self._qualified_ident("source", col) for col in columns)
+
+        sql = (
+            f"MERGE INTO {full_table} AS target "
+            f"USING {source} AS source "
+            f"ON {on_clause} "
+            f"WHEN MATCHED THEN UPDATE SET {update_set} "
+            f"WHEN NOT MATCHED THEN INSERT ({insert_cols}) VALUES ({insert_vals})"
+        )
+        self._dedupe_engine.prepare_target(conn, target_table=full_table, created=False)
+        conn.execute(sql)
+        self._dedupe_engine.record_hashes(conn, source=source, key_cols=key_cols, target_table=full_table)
+
     @staticmethod
     def _apply_watermark(df: pd.DataFrame, row_date_col: str, watermark: date) -> pd.DataFrame:
         if row_date_col not in df.columns:
@@ -376,3 +753,19 @@ class SilverService:
             [schema, table],
         ).fetchone()
         return bool(row and row[0] > 0)
+
+
+_worker_projection: tuple[BronzeBatchReader, DTOProjection] | None = None
+
+
+def _init_projection_worker(bronze_batch_reader: BronzeBatchReader, dto_projection: DTOProjection) -> None:
+    """Process-pool initializer: keep the service's (pickled) reader and projection for this worker."""
+    global _worker_projection
+    _worker_projection = (bronze_batch_reader, dto_projection)
+
+
+def _project_in_worker(row: BronzeManifestRow, entry: DatasetKeymapEntry) -> tuple[pd.DataFrame, str]:
+    """Process-pool entry point for ``SilverService._promote_parallel``."""
+    if _worker_projection is None:
+        raise RuntimeError("Silver projection worker was not initialized")
+    return SilverService._project_file(row, entry, *_worker_projection)
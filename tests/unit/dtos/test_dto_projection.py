@@ -165,38 +165,101 @@ class TestProjectWithSchema:
         assert result.iloc[0]["ticker"] == "MSFT"
 
 
-# --- Tests for snake case conversion ---
+class TestProjectionPlanCache:
+    _SCHEMA = DatasetDtoSchema(
+        dto_type=None,
+        columns=(
+            SchemaColumn(name="ticker", type="str", nullable=False),
+            SchemaColumn(name="company_name", type="str", nullable=True),
+            SchemaColumn(name="as_of_date", type="date", nullable=True),
+        ),
+    )
 
+    def test_plan_is_compiled_once_per_source_columns(self, projection: DTOProjection) -> None:
+        first = pd.DataFrame({"ticker": ["AAPL"], "CompanyName": ["Apple"], "asOfDate": ["2026-01-15"]})
+        second = pd.DataFrame({"ticker": ["MSFT"], "CompanyName": ["Microsoft"], "asOfDate": ["2026-01-16"]})
+        renamed = pd.DataFrame({"ticker": ["IBM"], "company_name": ["IBM"]})
 
-class TestSnakeCaseColumns:
-    def test_add_snake_case_columns(self, projection: DTOProjection) -> None:
+        plan = projection.plan_for(first, dto_schema=self._SCHEMA)
+
+        assert projection.plan_for(second, dto_schema=self._SCHEMA) is plan
+        assert projection.plan_for(renamed, dto_schema=self._SCHEMA) is not plan
+        assert [(c.name, c.source, c.kind) for c in plan.columns] == [
+            ("ticker", "ticker", "str"),
+            ("company_name", "CompanyName", "str"),
+            ("as_of_date", "asOfDate", "date"),
+        ]
+        assert plan.date_formats == {"asOfDate": "%Y-%m-%d"}
+
+    def test_project_reads_raw_frame_without_copying_or_aliasing(self, projection: DTOProjection) -> None:
+        df = pd.DataFrame({"ticker": ["AAPL"], "CompanyName": ["Apple"], "asOfDate": ["2026-01-15"]})
+
+        result = projection.project(df, dto_schema=self._SCHEMA)
+
+        assert list(df.columns) == ["ticker", "CompanyName", "asOfDate"]
+        assert result.iloc[0]["company_name"] == "Apple"
+        assert result.iloc[0]["as_of_date"] == pd.Timestamp("2026-01-15")
+
+    def test_cached_date_format_falls_back_when_a_file_differs(self, projection: DTOProjection) -> None:
+        projection.project(pd.DataFrame({"ticker": ["AAPL"], "asOfDate": ["2026-01-15"]}), dto_schema=self._SCHEMA)
+
+        result = projection.project(pd.DataFrame({"ticker": ["AAPL"], "asOfDate": ["01/16/2026"]}), dto_schema=self._SCHEMA)
+
+        assert result.iloc[0]["as_of_date"] == pd.Timestamp("2026-01-16")
+
+    def test_ticker_override_is_part_of_the_plan_key(self, projection: DTOProjection) -> None:
+        df = pd.DataFrame({"ticker": ["IGNORED"], "asOfDate": ["2026-01-15"]})
+
+        assert projection.project(df, dto_schema=self._SCHEMA, ticker_override="MSFT").iloc[0]["ticker"] == "MSFT"
+        assert projection.project(df, dto_schema=self._SCHEMA).iloc[0]["ticker"] == "IGNORED"
+
+
+# --- Tests for column resolution ---
+
+
+def _schema_project(projection: DTOProjection, type_hint: str, values: list) -> pd.Series:
+    """Project ``values`` through a one-column keymap schema of ``type_hint``."""
+    schema = DatasetDtoSchema(dto_type=None, columns=(SchemaColumn(name="value", type=type_hint, nullable=True),))
+    return projection.project(pd.DataFrame({"value": values}), dto_schema=schema)["value"]
+
+
+class TestColumnResolution:
+    def test_camel_case_source_resolves_snake_case_field(self, projection: DTOProjection) -> None:
         df = pd.DataFrame({
             "companyName": ["Apple"],
             "fullTimeEmployees": [100000],
         })
-        DTOProjection._add_snake_case_columns(df)
+        schema = DatasetDtoSchema(
+            dto_type=None,
+            columns=(
+                SchemaColumn(name="company_name", type="str", nullable=True),
+                SchemaColumn(name="full_time_employees", type="int", nullable=True),
+            ),
+        )
+        result = projection.project(df, dto_schema=schema)
 
-        assert "company_name" in df.columns
-        assert "full_time_employees" in df.columns
-        assert df["company_name"].iloc[0] == "Apple"
+        assert result.iloc[0]["company_name"] == "Apple"
+        assert result.iloc[0]["full_time_employees"] == 100000
+        assert list(df.columns) == ["companyName", "fullTimeEmployees"]
 
-    def test_snake_case_does_not_override_existing(self, projection: DTOProjection) -> None:
+    def test_snake_case_alias_does_not_override_existing(self, projection: DTOProjection) -> None:
         df = pd.DataFrame({
-            "companyName": ["CamelCase"],
+            "CompanyName": ["CamelCase"],
             "company_name": ["SnakeCase"],
         })
-        DTOProjection._add_snake_case_columns(df)
+        plan = projection.plan_for(df, dto_type=_SimpleDTO)
 
-        assert df["company_name"].iloc[0] == "SnakeCase"
+        assert {c.name: c.source for c in plan.columns}["company_name"] == "company_name"
+        assert projection.project(df, dto_type=_SimpleDTO).iloc[0]["company_name"] == "SnakeCase"
 
 
-# --- Tests for type coercion ---
+# --- Tests for type coercion (the kind a DTO field plans to, applied as project() does) ---
 
 
 class TestCoerceSeriesStrings:
     def test_coerce_string(self, projection: DTOProjection) -> None:
         series = pd.Series([123, None, "text"])
-        result = projection._coerce_series(series, str)
+        result = projection._coerce_kind(series, DTOProjection._type_kind(str))
 
         assert result.iloc[0] == "123"
         assert result.iloc[1] == ""
@@ -206,7 +269,7 @@ class TestCoerceSeriesStrings:
 class TestCoerceSeriesNumbers:
     def test_coerce_int(self, projection: DTOProjection) -> None:
         series = pd.Series(["100", 200.5, None])
-        result = projection._coerce_series(series, int)
+        result = projection._coerce_kind(series, DTOProjection._type_kind(int))
 
         assert result.iloc[0] == 100
         assert result.iloc[1] == 200
@@ -214,7 +277,7 @@ class TestCoerceSeriesNumbers:
 
     def test_coerce_float(self, projection: DTOProjection) -> None:
         series = pd.Series(["3.14", 2, None])
-        result = projection._coerce_series(series, float)
+        result = projection._coerce_kind(series, DTOProjection._type_kind(float))
 
         assert result.iloc[0] == pytest.approx(3.14)
         assert result.iloc[1] == 2.0
@@ -224,21 +287,21 @@ class TestCoerceSeriesNumbers:
 class TestCoerceSeriesBool:
     def test_coerce_bool_true_values(self, projection: DTOProjection) -> None:
         series = pd.Series(["true", "T", "1", "yes", "Y", True, 1])
-        result = projection._coerce_series(series, bool)
+        result = projection._coerce_kind(series, DTOProjection._type_kind(bool))
 
         for i in range(len(series)):
             assert result.iloc[i] == True  # noqa: E712 - comparing numpy bool
 
     def test_coerce_bool_false_values(self, projection: DTOProjection) -> None:
         series = pd.Series(["false", "F", "0", "no", "N", False, 0])
-        result = projection._coerce_series(series, bool)
+        result = projection._coerce_kind(series, DTOProjection._type_kind(bool))
 
         for i in range(len(series)):
             assert result.iloc[i] == False  # noqa: E712 - comparing numpy bool
 
     def test_coerce_bool_none_returns_false(self, projection: DTOProjection) -> None:
         series = pd.Series([None])
-        result = projection._coerce_series(series, bool)
+        result = projection._coerce_kind(series, DTOProjection._type_kind(bool))
 
         assert result.iloc[0] == False  # noqa: E712 - comparing numpy bool
 
@@ -246,7 +309,7 @@ class TestCoerceSeriesBool:
 class TestCoerceSeriesDates:
     def test_coerce_date(self, projection: DTOProjection) -> None:
         series = pd.Series(["2026-01-15", "2026-02-20", None])
-        result = projection._coerce_series(series, date)
+        result = projection._coerce_kind(series, DTOProjection._type_kind(date))
 
         assert pd.notna(result.iloc[0])
         assert pd.notna(result.iloc[1])
@@ -254,7 +317,7 @@ class TestCoerceSeriesDates:
 
     def test_coerce_datetime(self, projection: DTOProjection) -> None:
         series = pd.Series(["2026-01-15 10:30:00", None])
-        result = projection._coerce_series(series, datetime)
+        result = projection._coerce_kind(series, DTOProjection._type_kind(datetime))
 
         assert pd.notna(result.iloc[0])
         assert pd.isna(result.iloc[1])
@@ -263,7 +326,7 @@ class TestCoerceSeriesDates:
 class TestCoerceSeriesCollections:
     def test_coerce_list_from_list(self, projection: DTOProjection) -> None:
         series = pd.Series([["a", "b"], None, "single"])
-        result = projection._coerce_series(series, list[str])
+        result = projection._coerce_kind(series, DTOProjection._type_kind(list[str]))
 
         assert result.iloc[0] == ["a", "b"]
         assert result.iloc[1] == []
@@ -271,7 +334,7 @@ class TestCoerceSeriesCollections:
 
     def test_coerce_dict_from_dict(self, projection: DTOProjection) -> None:
         series = pd.Series([{"key": "value"}, None, "not a dict"])
-        result = projection._coerce_series(series, dict[str, str])
+        result = projection._coerce_kind(series, DTOProjection._type_kind(dict[str, str]))
 
         assert result.iloc[0] == {"key": "value"}
         assert result.iloc[1] == {}
@@ -283,74 +346,63 @@ class TestCoerceSeriesCollections:
 
 class TestCoerceSchemaSeriesTypes:
     def test_coerce_schema_str(self, projection: DTOProjection) -> None:
-        series = pd.Series(["hello", None])
-        result = projection._coerce_schema_series(series, "str")
+        result = _schema_project(projection, "str", ["hello", None])
 
         assert result.iloc[0] == "hello"
         assert result.iloc[1] == ""
 
     def test_coerce_schema_int(self, projection: DTOProjection) -> None:
-        series = pd.Series(["100", None])
-        result = projection._coerce_schema_series(series, "int")
+        result = _schema_project(projection, "int", ["100", None])
 
         assert result.iloc[0] == 100
         assert pd.isna(result.iloc[1])
 
     def test_coerce_schema_int64(self, projection: DTOProjection) -> None:
-        series = pd.Series([9999999999999, None])
-        result = projection._coerce_schema_series(series, "int64")
+        result = _schema_project(projection, "int64", [9999999999999, None])
 
         assert result.iloc[0] == 9999999999999
 
     def test_coerce_schema_bigint(self, projection: DTOProjection) -> None:
-        series = pd.Series([9999999999999, None])
-        result = projection._coerce_schema_series(series, "bigint")
+        result = _schema_project(projection, "bigint", [9999999999999, None])
 
         assert result.iloc[0] == 9999999999999
 
     def test_coerce_schema_float(self, projection: DTOProjection) -> None:
-        series = pd.Series(["3.14", None])
-        result = projection._coerce_schema_series(series, "float")
+        result = _schema_project(projection, "float", ["3.14", None])
 
         assert result.iloc[0] == pytest.approx(3.14)
 
     def test_coerce_schema_bool(self, projection: DTOProjection) -> None:
-        series = pd.Series(["true", "false", None])
-        result = projection._coerce_schema_series(series, "bool")
+        result = _schema_project(projection, "bool", ["true", "false", None])
 
         assert result.iloc[0] == True  # noqa: E712 - comparing numpy bool
         assert result.iloc[1] == False  # noqa: E712 - comparing numpy bool
         assert result.iloc[2] == False  # noqa: E712 - comparing numpy bool
 
     def test_coerce_schema_date(self, projection: DTOProjection) -> None:
-        series = pd.Series(["2026-01-15", None])
-        result = projection._coerce_schema_series(series, "date")
+        result = _schema_project(projection, "date", ["2026-01-15", None])
 
         assert pd.notna(result.iloc[0])
         assert pd.isna(result.iloc[1])
 
     def test_coerce_schema_datetime_date(self, projection: DTOProjection) -> None:
-        series = pd.Series(["2026-01-15", None])
-        result = projection._coerce_schema_series(series, "datetime.date")
+        result = _schema_project(projection, "datetime.date", ["2026-01-15", None])
 
         assert pd.notna(result.iloc[0])
 
     def test_coerce_schema_datetime(self, projection: DTOProjection) -> None:
-        series = pd.Series(["2026-01-15 10:30:00", None])
-        result = projection._coerce_schema_series(series, "datetime")
+        result = _schema_project(projection, "datetime", ["2026-01-15 10:30:00", None])
 
         assert pd.notna(result.iloc[0])
 
     def test_coerce_schema_list(self, projection: DTOProjection) -> None:
-        series = pd.Series([["a", "b"], None])
-        result = projection._coerce_schema_series(series, "list")
+        result = _schema_project(projection, "list", [["a", "b"], None])
 
         assert result.iloc[0] == ["a", "b"]
         assert result.iloc[1] == []
 
     def test_coerce_schema_dict(self, projection: DTOProjection) -> None:
-        series = pd.Series([{"key": "value"}, None])
-        result = projection._coerce_schema_series(series, "dict")
+        result = _schema_project(projection, "dict", [{"key": "value"}, None])
 
         assert result.iloc[0] == {"key": "value"}
         assert result.iloc[1] == {}
@@ -440,66 +492,76 @@ class TestCoerceBool:
         assert DTOProjection._coerce_bool("") is False
 
 
-# --- Tests for _resolve_series ---
+# --- Tests for DTO field resolution ---
 
 
-class TestResolveSeries:
-    def test_resolve_by_api_key(self, projection: DTOProjection) -> None:
-        @dataclass
-        class _TestDTO:
-            pass
+@dataclass(slots=True, kw_only=True, order=True)
+class _ResolveDTO(BronzeToSilverDTO):
+    field_name: int | None = field(default=None, metadata={"api": "apiKeyName"})
+    plain_field: int | None = None
+
+    @classmethod
+    def from_row(cls, row, ticker=None):
+        return cls.build_from_row(row, ticker_override=ticker)
 
-        field_mock = type("Field", (), {"metadata": {"api": "apiKey"}, "name": "field_name"})()
-        df = pd.DataFrame({"apiKey": [1, 2, 3]})
+    def to_dict(self):
+        return self.build_to_dict()
 
-        result = DTOProjection._resolve_series(df, field_mock)
-        assert list(result) == [1, 2, 3]
+
+class TestResolveDtoFields:
+    def test_resolve_by_api_key(self, projection: DTOProjection) -> None:
+        df = pd.DataFrame({"apiKeyName": [1, 2, 3]})
+
+        result = projection.project(df, dto_type=_ResolveDTO)
+        assert list(result["field_name"]) == [1, 2, 3]
 
     def test_resolve_by_snake_case_api_key(self, projection: DTOProjection) -> None:
-        field_mock = type("Field", (), {"metadata": {"api": "apiKeyName"}, "name": "field_name"})()
         df = pd.DataFrame({"api_key_name": [1, 2, 3]})
 
-        result = DTOProjection._resolve_series(df, field_mock)
-        assert list(result) == [1, 2, 3]
+        result = projection.project(df, dto_type=_ResolveDTO)
+        assert list(result["field_name"]) == [1, 2, 3]
 
     def test_resolve_by_field_name(self, projection: DTOProjection) -> None:
-        field_mock = type("Field", (), {"metadata": {}, "name": "field_name"})()
-        df = pd.DataFrame({"field_name": [1, 2, 3]})
+        df = pd.DataFrame({"plain_field": [1, 2, 3]})
 
-        result = DTOProjection._resolve_series(df, field_mock)
-        assert list(result) == [1, 2, 3]
+        result = projection.project(df, dto_type=_ResolveDTO)
+        assert list(result["plain_field"]) == [1, 2, 3]
 
-    def test_resolve_returns_none_when_not_found(self, projection: DTOProjection) -> None:
-        field_mock = type("Field", (), {"metadata": {"api": "missing"}, "name": "also_missing"})()
+    def test_unresolved_field_has_no_source(self, projection: DTOProjection) -> None:
         df = pd.DataFrame({"other_col": [1, 2, 3]})
 
-        result = DTOProjection._resolve_series(df, field_mock)
-        assert result is None
+        plan = projection.plan_for(df, dto_type=_ResolveDTO)
+        assert [(c.name, c.source, c.kind) for c in plan.columns][-2:] == [("field_name", None, ""), ("plain_field", None, "")]
+        assert projection.project(df, dto_type=_ResolveDTO)["field_name"].tolist() == [None, None, None]
 
 
-# --- Tests for _resolve_column_by_name ---
+# --- Tests for schema column resolution ---
 
 
-class TestResolveColumnByName:
+class TestResolveSchemaColumns:
+    @staticmethod
+    def _source_of(projection: DTOProjection, df: pd.DataFrame, name: str):
+        schema = DatasetDtoSchema(dto_type=None, columns=(SchemaColumn(name=name, type="str", nullable=True),))
+        return projection.plan_for(df, dto_schema=schema).columns[0].source
+
     def test_resolve_exact_match(self, projection: DTOProjection) -> None:
         df = pd.DataFrame({"ticker": ["AAPL"]})
-        result = projection._resolve_column_by_name(df, "ticker")
-        assert result.iloc[0] == "AAPL"
+        assert self._source_of(projection, df, "ticker") == "ticker"
 
     def test_resolve_snake_to_camel(self, projection: DTOProjection) -> None:
         df = pd.DataFrame({"companyName": ["Apple"]})
-        result = projection._resolve_column_by_name(df, "company_name")
-        assert result.iloc[0] == "Apple"
+        assert self._source_of(projection, df, "company_name") == "companyName"
 
     def test_resolve_camel_to_snake(self, projection: DTOProjection) -> None:
         df = pd.DataFrame({"company_name": ["Apple"]})
-        result = projection._resolve_column_by_name(df, "companyName")
-        assert result.iloc[0] == "Apple"
+        assert self._source_of(projection, df, "companyName") == "company_name"
 
-    def test_resolve_returns_none_series_when_not_found(self, projection: DTOProjection) -> None:
+    def test_unresolved_column_projects_as_empty(self, projection: DTOProjection) -> None:
         df = pd.DataFrame({"other": ["value"]})
-        result = projection._resolve_column_by_name(df, "missing")
-        assert result.iloc[0] is None
+        schema = DatasetDtoSchema(dto_type=None, columns=(SchemaColumn(name="missing", type="str", nullable=True),))
+
+        assert projection.plan_for(df, dto_schema=schema).columns[0].source is None
+        assert projection.project(df, dto_schema=schema).iloc[0]["missing"] == ""
 
 
 # --- Integration tests ---
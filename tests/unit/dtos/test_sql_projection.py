@@ -0,0 +1,84 @@
+"""Unit tests for SqlProjection: compiled SQL must project like DTOProjection."""
+
+from __future__ import annotations
+
+import duckdb
+import pandas as pd
+import pytest
+
+from sbfoundation.dtos.dto_projection import DTOProjection
+from sbfoundation.dtos.sql_projection import SqlProjection
+from sbfoundation.dataset.models.dataset_schema import DatasetDtoSchema, SchemaColumn
+
+
+def _schema(*columns: tuple[str, str, str | None]) -> DatasetDtoSchema:
+    return DatasetDtoSchema(
+        dto_type=None,
+        columns=tuple(SchemaColumn(name=name, type=type_, nullable=True, api=api) for name, type_, api in columns),
+    )
+
+
+def _run_sql(df: pd.DataFrame, schema: DatasetDtoSchema, ticker_override: str | None = None) -> pd.DataFrame:
+    conn = duckdb.connect()
+    try:
+        conn.register("raw", df)
+        source_columns = {row[0]: row[1] for row in conn.execute("DESCRIBE SELECT * FROM raw").fetchall()}
+        columns = SqlProjection().compile(schema, source_columns, ticker_override)
+        select_list = ", ".join(f'{expr} AS "{name}"' for name, expr in columns.items())
+        return conn.execute(f"SELECT {select_list} FROM raw").df()
+    finally:
+        conn.close()
+
+
+def test_compile_matches_dto_projection() -> None:
+    df = pd.DataFrame(
+        {
+            "symbol": ["AAPL", None],
+            "companyName": ["Apple Inc", "Microsoft"],
+            "volume": ["10.5", "x"],
+            "close": ["1.25", ""],
+            "isEtf": ["yes", "0"],
+            "date": ["2026-01-15", "not-a-date"],
+        }
+    )
+    schema = _schema(
+        ("symbol", "str", None),
+        ("company_name", "str", None),
+        ("volume", "int", None),
+        ("close", "float", None),
+        ("is_etf", "bool", None),
+        ("as_of_date", "date", "date"),
+        ("missing_text", "str", None),
+        ("missing_number", "float", None),
+    )
+
+    expected = DTOProjection().project(df, dto_schema=schema)
+    actual = _run_sql(df, schema)
+
+    assert actual["symbol"].tolist() == expected["symbol"].tolist()
+    assert actual["company_name"].tolist() == expected["company_name"].tolist()
+    assert actual["volume"].tolist()[0] == expected["volume"].tolist()[0] == 10
+    assert pd.isna(actual["volume"].tolist()[1]) and pd.isna(expected["volume"].tolist()[1])
+    assert actual["close"].tolist()[0] == expected["close"].tolist()[0] == 1.25
+    assert actual["is_etf"].tolist() == expected["is_etf"].tolist() == [True, False]
+    assert actual["as_of_date"].tolist()[0] == expected["as_of_date"].tolist()[0]
+    assert pd.isna(actual["as_of_date"].tolist()[1])
+    assert actual["missing_text"].tolist() == expected["missing_text"].tolist() == ["", ""]
+    assert actual["missing_number"].isna().all()
+
+
+def test_compile_numeric_bools_and_ticker_override() -> None:
+    df = pd.DataFrame({"ticker": ["IGNORED", "IGNORED"], "flag": [2, 0]})
+    schema = _schema(("ticker", "str", None), ("flag", "bool", None))
+
+    actual = _run_sql(df, schema, ticker_override="O'NEIL")
+
+    assert actual["ticker"].tolist() == ["O'NEIL", "O'NEIL"]
+    assert actual["flag"].tolist() == [True, False]
+
+
+@pytest.mark.parametrize("type_hint", ["list", "dict"])
+def test_compile_rejects_nested_columns(type_hint: str) -> None:
+    schema = _schema(("ticker", "str", None), ("items", type_hint, None))
+
+    assert SqlProjection().compile(schema, {"ticker": "VARCHAR", "items": "VARCHAR[]"}) is None
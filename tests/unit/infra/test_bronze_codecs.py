@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from sbfoundation.infra import bronze_codecs
+from sbfoundation.infra.bronze_codecs import (
+    JsonlGzipBronzeCodec,
+    ParquetBronzeCodec,
+    codec_for_path,
+    get_bronze_codec,
+)
+from sbfoundation.infra.result_file_adaptor import ResultFileAdapter
+from sbfoundation.run.dtos.spooled_rows import SpooledRows
+from sbfoundation.maintenance.bronze_reencode_service import BronzeReencodeService
+from sbfoundation.settings import BRONZE_CODEC_JSONL_GZIP, BRONZE_CODEC_PARQUET
+from tests.unit.helpers import make_bronze_result
+
+_ROWS = [
+    {"date": "2026-01-26", "close": 1.5, "volume": 10, "symbol": "AAPL"},
+    {"date": "2026-01-27", "close": 2, "volume": None, "symbol": "Zürich 'q'"},
+]
+
+
+def test_jsonl_gzip_roundtrip_keeps_envelope_and_rows(tmp_path: Path) -> None:
+    codec = JsonlGzipBronzeCodec()
+    path = codec.write(tmp_path / "f.json", {"status_code": 200, "content": _ROWS}, _ROWS)
+
+    assert path.name == "f.jsonl.gz"
+    assert json.loads(gzip.decompress(path.read_bytes()).splitlines()[0]) == {"status_code": 200}
+    assert codec.read(path) == {"status_code": 200, "content": _ROWS}
+
+
+def test_jsonl_gzip_keeps_non_row_content_inline(tmp_path: Path) -> None:
+    codec = JsonlGzipBronzeCodec()
+    path = codec.write(tmp_path / "f.json", {"content": "Server Error"}, "Server Error")
+
+    assert codec.read(path)["content"] == "Server Error"
+
+
+def test_parquet_roundtrip_stores_envelope_in_metadata(tmp_path: Path) -> None:
+    codec = ParquetBronzeCodec()
+    path = codec.write(tmp_path / "f.json", {"status_code": 200, "reason": "it's OK"}, _ROWS)
+
+    assert path.name == "f.parquet"
+    payload = codec.read(path)
+    assert payload["reason"] == "it's OK"
+    assert payload["content"][0] == {"date": "2026-01-26", "close": 1.5, "volume": 10, "symbol": "AAPL"}
+    assert type(payload["content"][0]["volume"]) is int
+    assert payload["content"][1]["volume"] is None
+    assert payload["content"][1]["symbol"] == "Zürich 'q'"
+
+
+def test_parquet_streams_spooled_rows_in_batches(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(bronze_codecs, "BRONZE_PARQUET_ROW_GROUP_SIZE", 2)
+    rows = [{"date": f"2026-01-2{i}", "volume": None if i == 3 else i, "flag": None} for i in range(5)]
+    spooled = SpooledRows()
+    for row in rows:
+        spooled.append_json(json.dumps(row))
+
+    path = ParquetBronzeCodec().write(tmp_path / "f.json", {"status_code": 200}, spooled)
+
+    assert path.name == "f.parquet"
+    assert ParquetBronzeCodec().read(path)["content"] == rows
+
+
+@pytest.mark.parametrize(
+    "rows",
+    [
+        [],
+        [{"date": "2026-01-26", "nested": {"a": 1}}],
+        [{"value": 1}, {"value": "one"}],
+        [{"Date": "x", "date": "y"}],
+        [{"value": 2**64}],
+    ],
+)
+def test_parquet_falls_back_to_jsonl_for_non_columnar_rows(tmp_path: Path, rows: list) -> None:
+    path = ParquetBronzeCodec().write(tmp_path / "f.json", {"status_code": 200}, rows)
+
+    assert path.name == "f.jsonl.gz"
+    assert codec_for_path(path).read(path)["content"] == rows
+
+
+def test_unknown_codec_is_rejected() -> None:
+    with pytest.raises(ValueError, match="Unknown Bronze codec"):
+        get_bronze_codec("xml")
+
+
+def test_adapter_reads_any_codec_and_keeps_fetch_hash(patch_folders) -> None:
+    adapter = ResultFileAdapter(codec=BRONZE_CODEC_PARQUET)
+    result = make_bronze_result(overrides={"content": [{"date": "2026-01-26", "close": 1}], "hash": "fetch-hash"})
+
+    path = adapter.write(result)
+
+    assert path.suffix == ".parquet"
+    assert result.filename == str(Path(result.request.bronze_relative_filename).with_name(path.name))
+    rehydrated = ResultFileAdapter().read(path)
+    assert rehydrated.hash == "fetch-hash"
+    assert rehydrated.filename == result.filename
+    assert rehydrated.content == [{"date": "2026-01-26", "close": 1}]
+    assert list(adapter.get_file_paths(path.parents[3])) == [path]
+
+
+class _RenameOps:
+    def __init__(self) -> None:
+        self.renames: list[tuple[str, str]] = []
+
+    def rename_bronze_files(self, renames: list[tuple[str, str]]) -> int:
+        self.renames.extend(renames)
+        return len(renames)
+
+
+def test_reencode_converts_json_files_and_repoints_manifest(patch_folders) -> None:
+    data_root, _ = patch_folders
+    json_path = ResultFileAdapter().write(make_bronze_result())
+    ops = _RenameOps()
+    service = BronzeReencodeService(codec=BRONZE_CODEC_JSONL_GZIP, ops_service=ops)
+
+    assert service.run(dry_run=True) == 1
+    assert json_path.exists() and not ops.renames
+
+    assert service.run() == 1
+    new_path = json_path.with_name(json_path.stem + ".jsonl.gz")
+    assert not json_path.exists()
+    assert ops.renames == [(str(json_path.relative_to(data_root)), str(new_path.relative_to(data_root)))]
+    assert ResultFileAdapter().read(new_path).content == [{"date": "2026-01-26"}]
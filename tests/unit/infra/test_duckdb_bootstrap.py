@@ -58,3 +58,39 @@ def test_transaction_commits_and_rolls_back(patch_folders) -> None:
         assert tx is conn
     with bootstrap.silver_transaction() as tx:
         assert tx is conn
+
+
+def test_duplicate_connection_does_not_wait_on_the_original_lock(patch_folders, monkeypatch: pytest.MonkeyPatch) -> None:
+    import threading
+
+    import duckdb
+
+    conn = duckdb.connect(":memory:")
+    bootstrap = DuckDbBootstrap(conn=conn)
+    bootstrap.connect()
+    duplicate = bootstrap.duplicate()
+    monkeypatch.setattr(DuckDbBootstrap, "_LOCK_TIMEOUT_SECONDS", 0.5)
+    merging, release = threading.Event(), threading.Event()
+
+    def slow_promote() -> None:
+        with duplicate.silver_transaction() as txn:
+            txn.execute("CREATE TABLE silver.slow AS SELECT 1 AS x")
+            merging.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=slow_promote)
+    thread.start()
+    assert merging.wait(5)
+    try:
+        # Without a separate connection this would time out behind the MERGE.
+        with bootstrap.ops_transaction() as txn:
+            txn.execute("CREATE TABLE ops.flush AS SELECT 1 AS x")
+    finally:
+        release.set()
+        thread.join(5)
+
+    with bootstrap.read_connection() as read:
+        assert read.execute("SELECT x FROM silver.slow").fetchall() == [(1,)]
+    duplicate.close()
+    assert conn.execute("SELECT x FROM ops.flush").fetchall() == [(1,)]
+    bootstrap.close()
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
-from datetime import date
+from datetime import date, datetime, timedelta
 
 import duckdb
+import pytest
 
+from sbfoundation.maintenance.duckdb_bootstrap import API_QUOTA_LEDGER_DDL, HTTP_VALIDATORS_DDL
 from sbfoundation.ops.dtos.file_injestion import DatasetInjestion
+from sbfoundation.ops.dtos.http_validator import HttpValidator
 from sbfoundation.ops.infra.duckdb_ops_repo import DuckDbOpsRepo
 
 
@@ -79,6 +82,22 @@ def test_upsert_updates_existing_row() -> None:
     assert row == 5
 
 
+def test_update_bronze_filenames_repoints_matching_rows() -> None:
+    conn = _create_connection()
+    repo = _make_repo(conn)
+    for file_id in ("file-1", "file-2"):
+        repo.upsert_file_ingestion(
+            DatasetInjestion(
+                run_id="run-1", file_id=file_id, domain="company", source="fmp", dataset="company-profile", bronze_filename=f"bronze/{file_id}.json"
+            )
+        )
+
+    assert repo.update_bronze_filenames([("bronze/file-1.json", "bronze/file-1.parquet")]) == 1
+
+    rows = conn.execute("SELECT file_id, bronze_filename FROM ops.file_ingestions ORDER BY file_id").fetchall()
+    assert rows == [("file-1", "bronze/file-1.parquet"), ("file-2", "bronze/file-2.json")]
+
+
 def test_latest_dates_handle_nulls() -> None:
     conn = _create_connection()
     repo = _make_repo(conn)
@@ -97,6 +116,32 @@ def test_latest_dates_handle_nulls() -> None:
     assert repo.get_latest_silver_to_date(domain="company", source="fmp", dataset="company-profile", discriminator="", ticker="") == date(2026, 1, 21)
 
 
+def test_get_bulk_silver_watermarks_groups_by_discriminator_and_ticker() -> None:
+    conn = _create_connection()
+    repo = _make_repo(conn)
+    for file_id, ticker, silver_to in (
+        ("file-1", "AAPL", date(2026, 1, 10)),
+        ("file-2", "AAPL", date(2026, 1, 12)),
+        ("file-3", None, date(2026, 1, 5)),
+        ("file-4", "MSFT", None),
+    ):
+        repo.upsert_file_ingestion(
+            DatasetInjestion(
+                run_id="run-1",
+                file_id=file_id,
+                domain="company",
+                source="fmp",
+                dataset="company-profile",
+                ticker=ticker,
+                silver_to_date=silver_to,
+            )
+        )
+
+    watermarks = repo.get_bulk_silver_watermarks(domain="company", source="fmp", dataset="company-profile")
+
+    assert watermarks == {("", "AAPL"): date(2026, 1, 12), ("", ""): date(2026, 1, 5), ("", "MSFT"): None}
+
+
 def test_list_promotable_file_ingestions_filters() -> None:
     conn = _create_connection()
     repo = _make_repo(conn)
@@ -140,3 +185,124 @@ def test_load_input_watermarks_serializes_identity() -> None:
     watermarks = repo.load_input_watermarks(conn, datasets={"company-profile"})
     assert watermarks
     assert "company|fmp|company-profile" in watermarks[0]
+
+
+def test_get_latest_payload_hashes_uses_successful_bronze_rows() -> None:
+    conn = _create_connection()
+    repo = _make_repo(conn)
+    base = dict(domain="company", source="fmp", dataset="company-profile", ticker="AAPL")
+    rows = [
+        ("file-1", "bronze/f1.json", "h1", True, None, datetime(2026, 1, 1)),
+        ("file-2", "bronze/f2.json", "h2", False, None, datetime(2026, 1, 2)),  # promoted to Silver
+        ("file-3", "bronze/f2.json", "h2", False, None, datetime(2026, 1, 3)),  # "unchanged" row
+        ("file-4", "bronze/f4.json", "h4", False, "HTTP 500", datetime(2026, 1, 4)),
+    ]
+    for file_id, filename, payload_hash, can_promote, error, started in rows:
+        repo.upsert_file_ingestion(
+            DatasetInjestion(
+                run_id="run-1",
+                file_id=file_id,
+                bronze_filename=filename,
+                bronze_payload_hash=payload_hash,
+                bronze_can_promote=can_promote,
+                bronze_error=error,
+                bronze_injest_start_time=started,
+                **base,
+            )
+        )
+
+    hashes = repo.get_latest_payload_hashes(domain="company", source="fmp", dataset="company-profile", discriminator="")
+
+    assert hashes == {"AAPL": ("h2", "bronze/f2.json")}
+
+
+def test_upsert_http_validators_replaces_by_cache_key() -> None:
+    conn = _create_connection()
+    conn.execute(HTTP_VALIDATORS_DDL)
+    repo = _make_repo(conn)
+    url = "https://example.com/prices"
+    first = HttpValidator(cache_key=f"{url}?symbol=AAPL", url=url, etag='"v1"', bronze_filename="bronze/f1.json", bronze_to_date=date(2026, 1, 1))
+    other = HttpValidator(cache_key="https://example.com/other", url="https://example.com/other", etag='"x"')
+    repo.upsert_http_validators([first, other])
+    second = HttpValidator(cache_key=first.cache_key, url=url, last_modified="Tue, 27 Jan 2026 00:00:00 GMT", bronze_filename="bronze/f2.json")
+
+    assert repo.upsert_http_validators([second]) == 1
+    assert repo.get_http_validators(url) == {first.cache_key: second}
+
+
+def test_get_bronze_latency_quantile_is_per_dataset() -> None:
+    conn = _create_connection()
+    repo = _make_repo(conn)
+    start = datetime(2026, 1, 1)
+    for i in range(10):
+        repo.upsert_file_ingestion(
+            DatasetInjestion(
+                run_id="run-1",
+                file_id=f"file-{i}",
+                domain="company",
+                source="fmp",
+                dataset="company-profile",
+                bronze_injest_start_time=start,
+                bronze_injest_end_time=start + timedelta(seconds=i + 1),
+            )
+        )
+
+    samples, seconds = repo.get_bronze_latency_quantile(source="fmp", dataset="company-profile", quantile=0.9)
+
+    assert samples == 10
+    assert seconds == pytest.approx(9.1)
+    assert repo.get_bronze_latency_quantile(source="fmp", dataset="other", quantile=0.9) == (0, None)
+
+
+def test_upsert_file_ingestions_merges_batch_like_single_upserts() -> None:
+    conn = _create_connection()
+    repo = _make_repo(conn)
+    base = dict(run_id="run-1", domain="company", source="fmp", dataset="company-profile")
+    repo.upsert_file_ingestion(DatasetInjestion(file_id="file-1", ticker="AAPL", bronze_rows=1, **base))
+    batch = [
+        DatasetInjestion(file_id="file-1", ticker="AAPL", bronze_rows=7, bronze_can_promote=True, bronze_to_date=date(2026, 1, 2), **base),
+        DatasetInjestion(file_id="file-2", ticker="MSFT", bronze_injest_start_time=datetime(2026, 1, 3, 4, 5), **base),
+    ]
+
+    assert repo.upsert_file_ingestions(batch) == 2
+    rows = conn.execute(
+        "SELECT file_id, ticker, bronze_rows, bronze_can_promote, bronze_to_date, bronze_injest_start_time "
+        "FROM ops.file_ingestions ORDER BY file_id"
+    ).fetchall()
+    assert rows == [
+        ("file-1", "AAPL", 7, True, date(2026, 1, 2), None),
+        ("file-2", "MSFT", 0, None, None, datetime(2026, 1, 3, 4, 5)),
+    ]
+
+
+def test_insert_missing_file_ingestions_keeps_existing_rows() -> None:
+    conn = _create_connection()
+    repo = _make_repo(conn)
+    base = dict(run_id="run-1", domain="company", source="fmp", dataset="company-profile")
+    repo.upsert_file_ingestion(DatasetInjestion(file_id="file-1", ticker="AAPL", bronze_rows=1, silver_rows_created=5, **base))
+    journaled = [
+        DatasetInjestion(file_id="file-1", ticker="AAPL", bronze_rows=1, **base),
+        DatasetInjestion(file_id="file-2", ticker="MSFT", bronze_rows=3, bronze_to_date=date(2026, 1, 2), **base),
+    ]
+
+    assert repo.insert_missing_file_ingestions(journaled) == 1
+    rows = conn.execute(
+        "SELECT file_id, bronze_rows, silver_rows_created, bronze_to_date FROM ops.file_ingestions ORDER BY file_id"
+    ).fetchall()
+    assert rows == [("file-1", 1, 5, None), ("file-2", 3, 0, date(2026, 1, 2))]
+
+
+def test_reserve_api_quota_grants_what_the_tightest_period_allows() -> None:
+    conn = _create_connection()
+    conn.execute(API_QUOTA_LEDGER_DDL)
+    repo = _make_repo(conn)
+    day, month = date(2026, 3, 9), date(2026, 3, 1)
+    ceilings = {"daily": (day, 30), "monthly": (month, 100)}
+
+    assert repo.reserve_api_quota(source="fmp", ceilings=ceilings, calls=25) == 25
+    assert repo.reserve_api_quota(source="fmp", ceilings=ceilings, calls=25) == 5
+    assert repo.reserve_api_quota(source="fmp", ceilings=ceilings, calls=25) == 0
+    repo.release_api_quota(source="fmp", periods={"daily": day, "monthly": month}, calls=4)
+
+    rows = conn.execute("SELECT period, calls FROM ops.api_quota_ledger WHERE source = 'fmp' ORDER BY period").fetchall()
+    assert rows == [("daily", 26), ("monthly", 26)]
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import gzip
 import json
 from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
+
+import duckdb
 
 import pytest
 
 from sbfoundation.infra.result_file_adaptor import ResultFileAdapter
+from sbfoundation.bronze.bronze_batch_reader import BronzeBatchReader
+from sbfoundation.run.dtos.raw_payload import RAW_COMPRESSION_GZIP, RAW_FORMAT_CSV, RawPayload
+from sbfoundation.run.dtos.spooled_rows import SpooledRows
+from sbfoundation.settings import BRONZE_CODEC_JSONL_GZIP
 from tests.unit.helpers import make_bronze_result
 
 
@@ -73,3 +81,96 @@ def test_write_persists_payload(patch_folders) -> None:
 
     payload = json.loads(target.read_text(encoding="utf-8"))
     assert payload["request"]["run_id"] == result.request.run_id
+
+
+def test_write_streams_spooled_rows_into_content(patch_folders) -> None:
+    rows = [{"date": "2026-01-26", "name": "Zürich"}, {"date": "2026-01-27", "name": 'say "hi"'}]
+    spool = SpooledRows(max_memory=16)  # force a spill to disk
+    for row in rows:
+        spool.append_json(json.dumps(row, sort_keys=True, separators=(",", ":"), ensure_ascii=False))
+    adapter = ResultFileAdapter()
+    result = make_bronze_result(overrides={"content": spool})
+
+    file_path = adapter.write(result)
+
+    payload = json.loads(file_path.read_text(encoding="utf-8"))
+    assert payload["content"] == rows
+    assert payload["status_code"] == 200
+    rehydrated = adapter.read(file_path)
+    assert rehydrated.content == rows
+    assert rehydrated.hash == result._hash(rows)
+
+
+def test_write_empty_spooled_rows_as_empty_list(patch_folders) -> None:
+    file_path = ResultFileAdapter().write(make_bronze_result(overrides={"content": SpooledRows()}))
+
+    assert json.loads(file_path.read_text(encoding="utf-8"))["content"] == []
+
+
+def test_write_raw_payload_to_gzip_sidecar_and_read_lazily(patch_folders) -> None:
+    body = b"date,close\n2026-01-26,1.5\n2026-01-27,\n"
+    spool = RawPayload.new_spool()
+    spool.write(body)
+    raw = RawPayload(fmt=RAW_FORMAT_CSV, sha256="sha", rows=2, compression=RAW_COMPRESSION_GZIP, spool=spool)
+    adapter = ResultFileAdapter()
+
+    file_path = adapter.write(make_bronze_result(overrides={"content": raw}))
+
+    sidecar = file_path.with_name(file_path.stem + ".payload.gz")
+    assert gzip.decompress(sidecar.read_bytes()) == body
+    envelope = json.loads(file_path.read_text(encoding="utf-8"))
+    assert envelope["content"] is None
+    assert envelope["payload"]["file"] == sidecar.name
+    rehydrated = adapter.read(file_path)
+    assert isinstance(rehydrated.content, RawPayload)
+    assert rehydrated.hash == "sha"
+    assert len(rehydrated.content) == 2
+    assert list(rehydrated.content)[1] == {"date": "2026-01-27", "close": ""}
+
+    data_root, _ = patch_folders
+    row = SimpleNamespace(file_path_rel=str(file_path.relative_to(data_root)))
+    df = BronzeBatchReader(adapter).read(row).df_content
+    assert df.to_dict("records") == [{"date": "2026-01-26", "close": "1.5"}, {"date": "2026-01-27", "close": ""}]
+
+
+def _relation_rows(relation: str, columns: str = "*") -> list[tuple]:
+    conn = duckdb.connect()
+    try:
+        return conn.execute(f"SELECT {columns} FROM {relation}").fetchall()
+    finally:
+        conn.close()
+
+
+def test_relation_sql_scans_parsed_json_content(patch_folders) -> None:
+    adapter = ResultFileAdapter()
+    content = [{"symbol": "AAPL", "close": 1.5}, {"symbol": "MSFT", "close": 2.5}]
+    file_path = adapter.write(make_bronze_result(overrides={"content": content}))
+    data_root, _ = patch_folders
+    row = SimpleNamespace(file_path_rel=str(file_path.relative_to(data_root)))
+
+    relation = BronzeBatchReader(adapter).relation_sql(row)
+
+    assert _relation_rows(relation, "symbol, close") == [("AAPL", 1.5), ("MSFT", 2.5)]
+
+
+def test_relation_sql_scans_raw_csv_sidecar_as_text(patch_folders) -> None:
+    spool = RawPayload.new_spool()
+    spool.write(b"date,close\n2026-01-26,1.5\n2026-01-27,\n")
+    raw = RawPayload(fmt=RAW_FORMAT_CSV, sha256="sha", rows=2, compression=RAW_COMPRESSION_GZIP, spool=spool)
+    adapter = ResultFileAdapter()
+    file_path = adapter.write(make_bronze_result(overrides={"content": raw}))
+    data_root, _ = patch_folders
+    row = SimpleNamespace(file_path_rel=str(file_path.relative_to(data_root)))
+
+    relation = BronzeBatchReader(adapter).relation_sql(row)
+
+    assert _relation_rows(relation) == [("2026-01-26", "1.5"), ("2026-01-27", None)]
+
+
+def test_relation_sql_leaves_jsonl_to_python(patch_folders) -> None:
+    adapter = ResultFileAdapter(codec=BRONZE_CODEC_JSONL_GZIP)
+    file_path = adapter.write(make_bronze_result())
+    data_root, _ = patch_folders
+    row = SimpleNamespace(file_path_rel=str(file_path.relative_to(data_root)))
+
+    assert BronzeBatchReader(adapter).relation_sql(row) is None
@@ -129,3 +129,37 @@ def test_get_earliest_bronze_from_date_returns_none_when_no_rows() -> None:
     repo = _make_repo(conn)
     result = repo.get_earliest_bronze_from_date(**_IDENTITY)
     assert result is None
+
+
+# ── bulk backfill lookups / checkpoints ────────────────────────────────────
+
+_DATASET = {k: v for k, v in _IDENTITY.items() if k != "ticker"}
+
+
+def test_upsert_backfill_floor_dates_batch_last_row_wins() -> None:
+    conn = _create_connection()
+    repo = _make_repo(conn)
+    repo.upsert_backfill_floor_date(**_IDENTITY, floor_date=date(2021, 1, 1))
+    key = tuple(_DATASET.values())
+
+    written = repo.upsert_backfill_floor_dates(
+        [
+            (*key, "AAPL", date(2015, 1, 1)),
+            (*key, "MSFT", date(2018, 1, 1)),
+            (*key, "MSFT", date(2010, 1, 1)),
+        ]
+    )
+
+    assert written == 2
+    assert repo.get_backfill_floor_dates(**_DATASET) == {"AAPL": date(2015, 1, 1), "MSFT": date(2010, 1, 1)}
+    assert repo.upsert_backfill_floor_dates([]) == 0
+
+
+def test_get_earliest_bronze_from_dates_groups_by_ticker() -> None:
+    conn = _create_connection()
+    repo = _make_repo(conn)
+    _insert_ingestion(conn, run_id="r1", file_id="f1", from_date=date(2022, 1, 1))
+    _insert_ingestion(conn, run_id="r2", file_id="f2", from_date=date(2020, 6, 15))
+    _insert_ingestion(conn, run_id="r3", file_id="f3", from_date=date(1995, 1, 1), error="TIMEOUT")
+
+    assert repo.get_earliest_bronze_from_dates(**_DATASET) == {"AAPL": date(2020, 6, 15)}
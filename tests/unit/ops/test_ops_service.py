@@ -7,7 +7,7 @@ from sbfoundation.ops.dtos.file_injestion import DatasetInjestion
 from sbfoundation.ops.services.ops_service import OpsService
 import pytest
 
-from tests.unit.helpers import make_run_context, make_bronze_result
+from tests.unit.helpers import make_run_context, make_bronze_result, make_run_request
 
 
 class _StubUniverse:
@@ -89,6 +89,25 @@ def test_insert_bronze_manifest_surfaces_repo_errors() -> None:
         service.insert_bronze_manifest(make_bronze_result())
 
 
+class _BatchFailingRepo(_StubRepo):
+    def upsert_file_ingestions(self, ingestions: list[DatasetInjestion]) -> int:
+        raise RuntimeError("batch boom")
+
+    def upsert_file_ingestion(self, ingestion: DatasetInjestion) -> None:
+        if ingestion.ticker == "BAD":
+            raise RuntimeError("row boom")
+        super().upsert_file_ingestion(ingestion)
+
+
+def test_insert_bronze_manifests_falls_back_to_per_row_inserts() -> None:
+    repo = _BatchFailingRepo()
+    service = OpsService(ops_repo=repo, universe=_StubUniverse())
+    results = [make_bronze_result(request=make_run_request(overrides={"ticker": t})) for t in ("AAPL", "BAD", "MSFT")]
+
+    assert service.insert_bronze_manifests(results, make_run_context()) == [results[0], results[2]]
+    assert [i.ticker for i in repo.upserts] == ["AAPL", "MSFT"]
+
+
 def test_silver_ingestion_flags_toggle() -> None:
     universe = _StubUniverse()
     repo = _StubRepo()
@@ -1,3 +1,8 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from sbfoundation.eod import EodService
 from sbfoundation.ops.requests.promotion_config import PromotionConfig
 
 
@@ -14,3 +19,45 @@ def test_promotion_config_custom_values_preserved() -> None:
     assert cfg.watermark_mode == "bronze_file_only"
     assert cfg.row_group_size == 1_000
     assert cfg.use_duckdb_engine is False
+
+
+def test_promotion_config_defaults_to_per_file_pandas_promotion() -> None:
+    cfg = PromotionConfig()
+    assert cfg.batch_mode == "file"
+    assert cfg.engine == "pandas"
+
+
+@pytest.mark.parametrize("field", ["batch_mode", "engine", "dedupe_mode"])
+def test_promotion_config_rejects_unknown_modes(field: str) -> None:
+    with pytest.raises(ValueError, match=f"Invalid {field}"):
+        PromotionConfig(**{field: "tabel"})
+
+
+@pytest.mark.parametrize(
+    ("dedupe_mode", "watermark_mode", "expected"),
+    [("anti_join", "max_key_date", True), ("anti_join", "none", False), ("hash_only", "max_key_date", False)],
+)
+def test_promotion_config_hash_only_does_not_filter_by_watermark(dedupe_mode: str, watermark_mode: str, expected: bool) -> None:
+    assert PromotionConfig(dedupe_mode=dedupe_mode, watermark_mode=watermark_mode).filters_by_watermark is expected
+
+
+@pytest.mark.parametrize("batch_mode, engine", [("table", "pandas"), ("file", "duckdb")])
+def test_bulk_pipeline_passes_silver_options_to_promotion(batch_mode: str, engine: str) -> None:
+    service = EodService(
+        ops_service=MagicMock(),
+        dataset_service=MagicMock(),
+        bootstrap=MagicMock(),
+        enable_bronze=False,
+        enable_silver=True,
+        concurrent_requests=1,
+        force_from_date=None,
+        today="2026-01-27",
+        silver_batch_mode=batch_mode,
+        silver_engine=engine,
+        silver_dedupe_mode="hash_only",
+    )
+
+    cfg = service._silver_service()._promotion_config
+
+    assert (cfg.batch_mode, cfg.engine, cfg.dedupe_mode) == (batch_mode, engine, "hash_only")
+    assert cfg.watermark_mode == "max_key_date"
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import pytest
+
+from sbfoundation.run.dtos.run_plan import SKIP_DUPLICATE, SKIP_REJECTED, SKIP_TOO_SOON, RunPlan
+
+
+def test_add_counts_requests_and_skips_per_dataset() -> None:
+    plan = RunPlan(run_id="run-1", concurrent_requests=4)
+    for skip in (None, None, SKIP_DUPLICATE, SKIP_TOO_SOON, SKIP_REJECTED):
+        plan.add("fmp", "eod", skip)
+    plan.add("fred", "series", None, paginated=True)
+
+    eod = plan.datasets[("fmp", "eod")]
+    assert (eod.requests, eod.skipped_duplicate, eod.skipped_too_soon, eod.rejected) == (2, 1, 1, 1)
+    assert plan.datasets[("fred", "series")].paginated
+    assert plan.requests == 3
+    assert plan.requests_by_source == {"fmp": 2, "fred": 1}
+
+
+def test_project_takes_the_slower_of_throttle_and_network() -> None:
+    plan = RunPlan(run_id="run-1", concurrent_requests=2)
+    for _ in range(10):
+        plan.add("fmp", "eod", None)
+    for _ in range(4):
+        plan.add("fred", "series", None)
+
+    plan.project(
+        min_seconds=lambda source, calls: {"fmp": 0.0, "fred": 60.0}[source],
+        global_min_seconds=lambda calls: 0.0,
+        latency_for=lambda source, dataset: 2.0,
+    )
+
+    assert plan.datasets[("fmp", "eod")].latency_seconds == 2.0
+    # fmp: 10 x 2s over 2 workers = 10s of network, no bucket wait; fred: 4s of network inside a 60s bucket floor.
+    assert plan.throttle_wait_seconds_by_source == {"fmp": 0.0, "fred": pytest.approx(56.0)}
+    assert plan.projected_seconds == pytest.approx(60.0)
+
+
+def test_project_is_bounded_by_shared_workers_and_global_cap() -> None:
+    plan = RunPlan(run_id="run-1", concurrent_requests=1)
+    plan.add("fmp", "eod", None)
+    plan.add("fred", "series", None)
+
+    plan.project(lambda source, calls: 0.0, lambda calls: 0.0, lambda source, dataset: 3.0)
+    assert plan.projected_seconds == pytest.approx(6.0)
+
+    plan.project(lambda source, calls: 0.0, lambda calls: 100.0, lambda source, dataset: 3.0)
+    assert plan.projected_seconds == pytest.approx(100.0)
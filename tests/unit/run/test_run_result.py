@@ -1,4 +1,18 @@
-from tests.unit.helpers import make_bronze_result
+import hashlib
+import io
+import json
+from datetime import datetime, timedelta
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+import sbfoundation.run.dtos.bronze_result as bronze_result_module
+from sbfoundation.run.dtos.bronze_result import BronzeResult
+from sbfoundation.run.dtos.raw_payload import RawPayload
+from sbfoundation.run.dtos.spooled_rows import SpooledRows
+from sbfoundation.settings import BRONZE_STORAGE_RAW
+from tests.unit.helpers import make_bronze_result, make_dataset_recipe, make_run_request
 
 
 def test_bronze_result_is_valid_bronze_success() -> None:
@@ -27,3 +41,133 @@ def test_bronze_result_cannot_promote_with_empty_payload() -> None:
     result = make_bronze_result(overrides={"content": [], "hash": "hash"})
     assert not result.canPromoteToSilver
     assert not result.canPromoteToSilverWith(allows_empty_content=False)
+
+
+def _csv_response(body: bytes, status_code: int = 200) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.reason = "OK"
+    response.headers = CaseInsensitiveDict({"content-type": "text/csv"})
+    response.elapsed = timedelta(microseconds=5)
+    response.raw = io.BytesIO(body)
+    return response
+
+
+def _csv_request(**recipe_overrides: object):
+    recipe = make_dataset_recipe(**recipe_overrides)
+    return make_run_request(recipe=recipe, overrides={"query_vars": {"datatype": "csv"}})
+
+
+def test_bronze_result_records_the_full_response_time() -> None:
+    response = _csv_response(b"date\n2026-01-20\n")
+    response.elapsed = timedelta(seconds=2, microseconds=500)
+    result = BronzeResult(now=datetime(2026, 1, 27), request=_csv_request())
+    result.add_response(response)
+
+    assert result.elapsed_microseconds == 2_000_500
+
+
+def test_bronze_result_streams_csv_with_list_equivalent_hash_and_dates() -> None:
+    body = "date,symbol,name\n2026-01-20,AAPL,Apple\r\n2026-01-05,MSFT,\"Micro\nsoft\"\n2026-01-12,ÉTÉ,Été\n".encode("utf-8")
+    result = BronzeResult(now=datetime(2026, 1, 27), request=_csv_request())
+    result.add_response(_csv_response(body))
+
+    expected = [
+        {"date": "2026-01-20", "symbol": "AAPL", "name": "Apple"},
+        {"date": "2026-01-05", "symbol": "MSFT", "name": "Micro\nsoft"},
+        {"date": "2026-01-12", "symbol": "ÉTÉ", "name": "Été"},
+    ]
+    assert isinstance(result.content, SpooledRows)
+    assert len(result.content) == 3
+    assert list(result.content) == expected
+    assert result.hash == result._hash(expected)
+    assert (result.first_date, result.last_date) == ("2026-01-05", "2026-01-20")
+    assert result.is_valid_bronze
+    assert result.canPromoteToSilver
+
+
+def test_bronze_result_streamed_csv_splits_multibyte_chars_across_chunks(monkeypatch) -> None:
+    monkeypatch.setattr(bronze_result_module, "BRONZE_STREAM_CHUNK_BYTES", 3)
+    result = BronzeResult(now=datetime(2026, 1, 27), request=_csv_request())
+    result.add_response(_csv_response("date,name\n2026-01-01,Zürich\n".encode("utf-8")))
+
+    assert list(result.content) == [{"date": "2026-01-01", "name": "Zürich"}]
+
+
+def test_bronze_result_streamed_csv_empty_body_reports_no_data() -> None:
+    result = BronzeResult(now=datetime(2026, 1, 27), request=_csv_request())
+    result.add_response(_csv_response(b""))
+
+    assert result.content == []
+    assert result.error == "Response appears to have no data.  Returning empty List."
+    assert result.hash == result._hash([])
+
+
+def test_bronze_result_raw_csv_keeps_bytes_and_scans_dates() -> None:
+    body = b"symbol,date\nAAPL,2026-01-20\n\nMSFT,2026-01-05\n"
+    result = BronzeResult(now=datetime(2026, 1, 27), request=_csv_request(bronze_storage=BRONZE_STORAGE_RAW))
+    result.add_response(_csv_response(body))
+
+    assert isinstance(result.content, RawPayload)
+    assert len(result.content) == 2
+    assert result.hash == hashlib.sha256(body).hexdigest()
+    assert (result.first_date, result.last_date) == ("2026-01-05", "2026-01-20")
+    assert list(result.content) == [{"symbol": "AAPL", "date": "2026-01-20"}, {"symbol": "MSFT", "date": "2026-01-05"}]
+    assert result.is_valid_bronze
+    assert result.canPromoteToSilver
+
+
+def test_bronze_result_raw_json_unwraps_content_key_lazily() -> None:
+    body = b'{"observations": [{"date": "2026-01-02", "value": "1.5"}]}'
+    recipe = make_dataset_recipe(bronze_storage=BRONZE_STORAGE_RAW, json_content_key="observations")
+    result = BronzeResult(now=datetime(2026, 1, 27), request=make_run_request(recipe=recipe, overrides={"query_vars": {}}))
+    result.add_response(_csv_response(body))
+
+    assert isinstance(result.content, RawPayload)
+    assert len(result.content) == 1
+    assert result.first_date == "2026-01-02"
+    assert list(result.content) == [{"date": "2026-01-02", "value": "1.5"}]
+
+
+def test_bronze_result_raw_json_error_dict_falls_back_to_parsed_content() -> None:
+    recipe = make_dataset_recipe(bronze_storage=BRONZE_STORAGE_RAW)
+    result = BronzeResult(now=datetime(2026, 1, 27), request=make_run_request(recipe=recipe, overrides={"query_vars": {}}))
+    result.add_response(_csv_response(b'{"Error Message": "Limit reached"}'))
+
+    assert result.content == {"Error Message": "Limit reached"}
+    assert not result.is_valid_bronze
+
+
+def test_bronze_result_raw_json_rows_are_counted_without_json_load(monkeypatch) -> None:
+    body = b'[{"date": "2026-01-20", "close": 1.5}, {"date": "2026-01-05", "close": 2}, {"close": 3}]'
+    recipe = make_dataset_recipe(bronze_storage=BRONZE_STORAGE_RAW)
+    result = BronzeResult(now=datetime(2026, 1, 27), request=make_run_request(recipe=recipe, overrides={"query_vars": {}}))
+    monkeypatch.setattr(bronze_result_module.json, "load", lambda fh: pytest.fail("raw JSON was parsed at fetch time"))
+    result.add_response(_csv_response(body))
+
+    assert isinstance(result.content, RawPayload)
+    assert len(result.content) == 3
+    assert (result.first_date, result.last_date) == ("2026-01-05", "2026-01-20")
+    assert result.hash == hashlib.sha256(body).hexdigest()
+    assert result.canPromoteToSilver
+
+
+def test_bronze_result_raw_json_truncated_body_still_fails() -> None:
+    recipe = make_dataset_recipe(bronze_storage=BRONZE_STORAGE_RAW)
+    result = BronzeResult(now=datetime(2026, 1, 27), request=make_run_request(recipe=recipe, overrides={"query_vars": {}}))
+
+    with pytest.raises(json.JSONDecodeError):
+        result.add_response(_csv_response(b'[{"date": "2026-01-20"}, {"date": "2026-'))
+
+
+def test_raw_payload_close_deletes_its_spool_file() -> None:
+    recipe = make_dataset_recipe(bronze_storage=BRONZE_STORAGE_RAW)
+    result = BronzeResult(now=datetime(2026, 1, 27), request=make_run_request(recipe=recipe, overrides={"query_vars": {}}))
+    result.add_response(_csv_response(b'[{"date": "2026-01-20"}]'))
+    spool_path = result.content._spool_path
+    assert spool_path.exists()
+
+    result.release_content()
+
+    assert not spool_path.exists()
+    assert len(result.content) == 1
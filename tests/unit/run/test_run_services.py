@@ -1,8 +1,11 @@
+import hashlib
 import logging
 
 import duckdb
 import pandas as pd
+import pytest
 
+from sbfoundation.maintenance.duckdb_bootstrap import SILVER_ROW_HASHES_DDL
 from sbfoundation.run.services.chunk_engine import ChunkEngine
 from sbfoundation.run.services.dedupe_engine import DedupeEngine
 from sbfoundation.run.services.orchestration_ticker_chunk_service import OrchestrationTickerChunkService
@@ -42,6 +45,49 @@ def test_dedupe_engine_filters_duplicates_without_duckdb() -> None:
     conn.close()
 
 
+def test_dedupe_engine_hash_only_keeps_new_and_changed_rows() -> None:
+    engine = DedupeEngine(mode="hash_only")
+    conn = duckdb.connect()
+    conn.execute("CREATE SCHEMA ops")
+    conn.execute(SILVER_ROW_HASHES_DDL)
+    conn.execute("CREATE TABLE target AS SELECT 1 AS id, 'first' AS value")
+    seen = pd.DataFrame([{"id": 1, "value": "first", "run_id": "run-1"}, {"id": 2, "value": "second", "run_id": "run-1"}])
+    first = engine.dedupe_against_table(conn, df_candidate=seen, key_cols=["id"], target_table="target", table_exists=False)
+    conn.register("_seen", first)
+    engine.record_hashes(conn, source="_seen", key_cols=["id"], target_table="target")
+
+    df_candidate = pd.DataFrame(
+        [
+            {"id": 1, "value": "first", "run_id": "run-2"},
+            {"id": 2, "value": "restated", "run_id": "run-2"},
+            {"id": 3, "value": "new", "run_id": "run-2"},
+        ]
+    )
+    deduped = engine.dedupe_against_table(conn, df_candidate=df_candidate, key_cols=["id"], target_table="target", table_exists=True)
+
+    assert deduped.sort_values("id")["value"].tolist() == ["restated", "new"]
+    assert "row_hash" in deduped.columns
+    conn.close()
+
+
+def test_dedupe_engine_row_hashes_are_md5_derived() -> None:
+    engine = DedupeEngine(mode="hash_only")
+    conn = duckdb.connect()
+    df_candidate = pd.DataFrame([{"value": "a,b", "id": 1, "run_id": "run-1"}])
+
+    deduped = engine.dedupe_against_table(conn, df_candidate=df_candidate, key_cols=["id"], target_table="target", table_exists=False)
+
+    # Content columns in name order, each as VARCHAR; lineage columns are left out.
+    expected = int(hashlib.md5("[1, 'a,b']".encode()).hexdigest()[:16], 16)
+    assert int(deduped.iloc[0]["row_hash"]) == expected
+    conn.close()
+
+
+def test_dedupe_engine_rejects_unknown_mode() -> None:
+    with pytest.raises(ValueError, match="Invalid dedupe mode"):
+        DedupeEngine(mode="fuzzy")
+
+
 def test_orchestration_service_process_triggers_chunks_and_promotions() -> None:
     recipes = [make_dataset_recipe(), make_dataset_recipe(), make_dataset_recipe()]
     ctx = make_run_context()
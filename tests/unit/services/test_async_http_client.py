@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+
+import pytest
+import requests
+
+from sbfoundation.run.services.async_http_client import AsyncHttpClient
+
+
+def _serve(responses: list[bytes], seen: list[str]):
+    """Connection handler answering successive requests with ``responses``; an empty entry drops the connection."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while responses:
+                head = await reader.readuntil(b"\r\n\r\n")
+                seen.append(head.decode("latin-1").split("\r\n")[0])
+                answer = responses.pop(0)
+                if not answer:
+                    break
+                writer.write(answer)
+                await writer.drain()
+        except asyncio.IncompleteReadError:
+            pass
+        finally:
+            writer.close()
+
+    return handle
+
+
+def _run(responses: list[bytes], scenario) -> list[str]:
+    seen: list[str] = []
+
+    async def main() -> None:
+        server = await asyncio.start_server(_serve(responses, seen), "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        client = AsyncHttpClient(connect_timeout=1, read_timeout=0.5)
+        try:
+            await scenario(client, f"http://127.0.0.1:{port}")
+        finally:
+            await client.aclose()
+            server.close()
+            await server.wait_closed()
+
+    asyncio.run(main())
+    return seen
+
+
+def _json_response(payload: object, extra: str = "") -> bytes:
+    body = json.dumps(payload).encode()
+    return f"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: {len(body)}\r\n{extra}\r\n".encode() + body
+
+
+def test_get_encodes_params_and_reuses_the_connection() -> None:
+    responses = [_json_response([{"date": "2026-01-26"}]), _json_response([])]
+    results: list[requests.Response] = []
+
+    async def scenario(client: AsyncHttpClient, base: str) -> None:
+        results.append(await client.get(f"{base}/quote", params={"symbol": "AAPL", "apikey": "k"}))
+        results.append(await client.get(f"{base}/quote", params={"symbol": "MSFT"}))
+        assert client.stats() == (2, 1)
+
+    seen = _run(responses, scenario)
+
+    assert seen == ["GET /quote?symbol=AAPL&apikey=k HTTP/1.1", "GET /quote?symbol=MSFT HTTP/1.1"]
+    assert results[0].status_code == 200
+    assert results[0].json() == [{"date": "2026-01-26"}]
+    assert results[1].json() == []
+
+
+def test_get_reads_chunked_gzip_bodies_and_follows_redirects() -> None:
+    body = gzip.compress(b'{"ok": true}')
+    chunked = b"".join(b"%x\r\n%s\r\n" % (len(part), part) for part in (body[:7], body[7:])) + b"0\r\n\r\n"
+    responses = [
+        b"HTTP/1.1 302 Found\r\nLocation: /moved\r\nContent-Length: 0\r\n\r\n",
+        b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\nContent-Encoding: gzip\r\n\r\n" + chunked,
+    ]
+    results: list[requests.Response] = []
+
+    async def scenario(client: AsyncHttpClient, base: str) -> None:
+        results.append(await client.get(f"{base}/start"))
+
+    seen = _run(responses, scenario)
+
+    assert seen == ["GET /start HTTP/1.1", "GET /moved HTTP/1.1"]
+    assert results[0].json() == {"ok": True}
+    assert results[0].url.endswith("/moved")
+
+
+def test_get_retries_a_keep_alive_connection_the_server_closed() -> None:
+    # The server answers once and closes; the pooled connection is stale on the second GET.
+    responses = [_json_response([1], extra="Keep-Alive: timeout=0\r\n"), b"", _json_response([2])]
+    results: list[requests.Response] = []
+
+    async def scenario(client: AsyncHttpClient, base: str) -> None:
+        results.append(await client.get(f"{base}/a"))
+        await asyncio.sleep(0.05)
+        results.append(await client.get(f"{base}/b"))
+
+    _run(responses, scenario)
+
+    assert [r.json() for r in results] == [[1], [2]]
+
+
+def test_body_cut_short_raises_a_retryable_requests_error() -> None:
+    responses = [b"HTTP/1.1 200 OK\r\nContent-Length: 100\r\n\r\n[1, 2"]
+
+    async def scenario(client: AsyncHttpClient, base: str) -> None:
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            await client.get(f"{base}/a")
+
+    _run(responses, scenario)
+
+
+def test_silent_server_raises_read_timeout() -> None:
+    async def main() -> None:
+        async def never_answer(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            await reader.read()
+            writer.close()
+
+        server = await asyncio.start_server(never_answer, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        client = AsyncHttpClient(connect_timeout=1, read_timeout=0.1)
+        try:
+            with pytest.raises(requests.ReadTimeout):
+                await client.get(f"http://127.0.0.1:{port}/")
+        finally:
+            server.close()
+
+    asyncio.run(main())
+
+
+def test_refused_connection_raises_connection_error() -> None:
+    async def main() -> None:
+        server = await asyncio.start_server(lambda r, w: None, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        server.close()
+        await server.wait_closed()
+        with pytest.raises(requests.ConnectionError):
+            await AsyncHttpClient(connect_timeout=1).get(f"http://127.0.0.1:{port}/")
+
+    asyncio.run(main())
@@ -1,9 +1,9 @@
 """Tests for BronzeService._run_backward_fill_loop()."""
 from __future__ import annotations
 
-from datetime import date, datetime
+import threading
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from types import SimpleNamespace
 
 from requests.structures import CaseInsensitiveDict
 
@@ -25,7 +25,7 @@ class _FakeResponse:
 
     def __init__(self, content: list[dict] | None = None) -> None:
         self._content_data = content if content is not None else [{"date": "2023-06-01"}]
-        self.elapsed = SimpleNamespace(microseconds=10)
+        self.elapsed = timedelta(microseconds=10)
         self.headers = CaseInsensitiveDict({"content-type": "application/json"})
         self.status_code = 200
         self.reason = "OK"
@@ -55,7 +55,10 @@ class _MultiResponseExecutor:
         self._responses = list(responses)
         self.calls = 0
 
-    def execute(self, func, log_str: str) -> _FakeResponse:
+    def execute(self, func, log_str: str, source: str | None = None) -> _FakeResponse:
+        return func()
+
+    def http_get(self, source: str, url: str, **kwargs) -> _FakeResponse:
         idx = min(self.calls, len(self._responses) - 1)
         self.calls += 1
         return self._responses[idx]
@@ -264,3 +267,74 @@ def test_skip_limit_based_recipe() -> None:
 
     assert executor.calls == 0
     assert len(ops.set_floor_calls) == 0
+
+
+class _BulkBackfillOps(_StubOpsServiceForBackfill):
+    """Adds the bulk lookups / batched checkpoint used by concurrent backfill."""
+
+    def __init__(self, earliest: dict[str, date]) -> None:
+        super().__init__()
+        self._earliest = earliest
+        self.batches: list[list[tuple]] = []
+
+    def get_backfill_floor_dates(self, domain, source, dataset, discriminator) -> dict[str, date]:
+        return {}
+
+    def get_earliest_bronze_from_dates(self, domain, source, dataset, discriminator) -> dict[str, date]:
+        return self._earliest
+
+    def set_backfill_floor_dates(self, rows: list[tuple]) -> int:
+        self.batches.append(rows)
+        return len(rows)
+
+    def insert_bronze_manifest(self, result, run=None) -> None:
+        self.bronze_manifests.append(result)
+
+    def insert_bronze_manifests(self, results: list, run=None) -> list:
+        self.bronze_manifests.extend(results)
+        return list(results)
+
+
+class _PerTickerExecutor:
+    """Runs the fetch callable; paired with a per-ticker _http_get stub."""
+
+    def __init__(self) -> None:
+        self.calls: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def execute(self, func, log_str: str, source: str | None = None) -> _FakeResponse:
+        return func()
+
+    def http_get(self, request, **kwargs) -> _FakeResponse:
+        """One page dated 2023-06-01 per ticker, then empty."""
+        with self._lock:
+            n = self.calls[request.ticker] = self.calls.get(request.ticker, 0) + 1
+        return _FakeResponse(content=[{"date": "2023-06-01"}]) if n == 1 else _EmptyResponse()
+
+
+def test_concurrent_backfill_batches_floor_checkpoints() -> None:
+    tickers = ["AAPL", "MSFT", "NVDA"]
+    ops = _BulkBackfillOps(earliest={t: date(2024, 1, 1) for t in tickers})
+    executor = _PerTickerExecutor()
+    service = BronzeService(
+        universe=_StubUniverse(),
+        result_file_adapter=_StubResultAdapter(),
+        request_executor=executor,
+        ops_service=ops,
+        backfill_to_1990=True,
+        concurrent_requests=3,
+    )
+    service._http_get = executor.http_get
+    service.run = make_run_context(tickers=tickers)
+    recipe = make_dataset_recipe(query_vars={"from": FROM_DATE_PLACEHOLDER, "to": TO_DATE_PLACEHOLDER})
+    reqs = [make_run_request(recipe=recipe, overrides={"ticker": t}) for t in tickers]
+
+    service._run_backward_fill_concurrent(recipe, reqs)
+
+    # Per-page checkpoints never hit the single-row upsert; they arrive as batches.
+    assert ops.set_floor_calls == []
+    final = {row[4]: row[5] for batch in ops.batches for row in batch}
+    assert final == {t: date(1990, 1, 1) for t in tickers}
+    assert len(ops.bronze_manifests) == len(tickers)
+    assert executor.calls == {t: 2 for t in tickers}
+    assert service._backfill_caches == {}
@@ -1,14 +1,28 @@
 from __future__ import annotations
 
-from datetime import date, datetime
+import io
+import json
+import threading
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from types import SimpleNamespace
 
+import pytest
+import requests
 from requests.structures import CaseInsensitiveDict
+from unittest.mock import MagicMock
 
 from sbfoundation.services.bronze.bronze_service import BronzeService
+from sbfoundation.ops.dtos.file_injestion import DatasetInjestion
+from sbfoundation.ops.services.ops_service import OpsService
+from sbfoundation.run.dtos.raw_payload import RawPayload
 from sbfoundation.run.dtos.run_request import RunRequest
-from tests.unit.helpers import make_run_context, make_run_request
+from sbfoundation.run.dtos.spooled_rows import SpooledRows
+from sbfoundation.run.services import async_fetch_engine as async_fetch_engine_module
+from sbfoundation.run.services import run_request_executor as run_request_executor_module
+from sbfoundation.run.services.run_request_executor import DeferredRetry, RunRequestExecutor
+from sbfoundation.settings import BRONZE_STORAGE_RAW, FETCH_ENGINE_ASYNCIO
+from tests.unit.helpers import make_bronze_result, make_run_context, make_run_request
+from tests.unit.infra.test_duckdb_ops_repo import _create_connection, _make_repo
 
 
 class _StubUniverse:
@@ -30,7 +44,7 @@ class _StubUniverse:
 
 class _FakeResponse:
     def __init__(self) -> None:
-        self.elapsed = SimpleNamespace(microseconds=10)
+        self.elapsed = timedelta(microseconds=10)
         self.headers = CaseInsensitiveDict({"content-type": "application/json"})
         self.status_code = 200
         self.reason = "OK"
@@ -49,10 +63,22 @@ class _StubExecutor:
         self.response = response
         self.calls = 0
 
-    def execute(self, func, log_str: str) -> _FakeResponse:
+    def execute(self, func, log_str: str, source: str | None = None) -> _FakeResponse:
         self.calls += 1
+        return func()
+
+    def http_get(self, source: str, url: str, **kwargs) -> _FakeResponse:
         return self.response or _FakeResponse()
 
+    def execute_once(self, func, log_str: str, source: str | None = None, attempt: int = 0) -> _FakeResponse:
+        return self.execute(func, log_str, source)
+
+    def set_summary(self, summary) -> None:
+        pass
+
+    def set_validator_cache(self, cache) -> None:
+        self.validator_cache = cache
+
 
 class _StubResultAdapter:
     def __init__(self) -> None:
@@ -86,6 +112,11 @@ class _StubOpsService:
     def insert_bronze_manifest(self, result: RunRequest, run=None) -> None:
         self.inserted.append(result)
 
+    def insert_bronze_manifests(self, results: list, run=None) -> list:
+        for result in results:
+            self.insert_bronze_manifest(result, run)
+        return list(results)
+
 
 def _make_service(executor: _StubExecutor | None = None) -> BronzeService:
     return BronzeService(
@@ -154,6 +185,247 @@ def test_concurrent_mode_processes_all_requests() -> None:
     assert executor.calls == len(requests)
 
 
+def test_writer_pool_persists_results_before_manifests_are_flushed() -> None:
+    executor = _StubExecutor(response=_FakeResponse())
+    service = BronzeService(
+        result_file_adapter=_StubResultAdapter(),
+        request_executor=executor,
+        ops_service=_StubOpsService(),
+        concurrent_requests=5,
+        writer_workers=2,
+    )
+    summary = make_run_context(tickers=["AAPL", "MSFT", "GOOGL", "TSLA", "NVDA"])
+    requests = [make_run_request(overrides={"ticker": ticker}) for ticker in summary.tickers]
+
+    service.execute_requests(requests, summary)
+
+    assert len(service.result_file_adapter.results) == len(requests)
+    assert len(service.ops_service.inserted) == len(requests)
+    assert summary.bronze_files_passed == summary.bronze_writes == len(requests)
+
+
+@pytest.mark.parametrize("writer_workers", [0, 2])
+def test_written_results_release_their_spool(writer_workers: int) -> None:
+    service = BronzeService(
+        result_file_adapter=_StubResultAdapter(),
+        request_executor=_StubExecutor(),
+        ops_service=_StubOpsService(),
+        writer_workers=writer_workers,
+    )
+    service.run = make_run_context()
+    rows = SpooledRows()
+    rows.append_json('{"date":"2026-01-26"}')
+    result = make_bronze_result(overrides={"content": rows})
+
+    service._accept_bronze_result(result)
+    if service._writer_pool is not None:
+        service._writer_pool.drain()
+
+    assert service.result_file_adapter.results == [result]
+    assert rows._file.closed
+    assert len(result.content) == 1
+
+
+class _HashOpsService(_StubOpsService):
+    def __init__(self, hashes: dict[str, tuple[str, str]]) -> None:
+        super().__init__()
+        self.hashes = hashes
+
+    def get_latest_payload_hashes(self, *, domain: str, source: str, dataset: str, discriminator: str) -> dict:
+        return self.hashes
+
+
+def test_skip_unchanged_records_manifest_pointing_at_previous_file() -> None:
+    recipe = make_run_request().recipe
+    unchanged_hash = make_bronze_result()._hash([{"date": "2026-01-26"}])
+    ops = _HashOpsService({"AAPL": (unchanged_hash, "bronze/prev.json"), "MSFT": ("stale-hash", "bronze/old.json")})
+    service = BronzeService(
+        result_file_adapter=_StubResultAdapter(),
+        request_executor=_StubExecutor(response=_FakeResponse()),
+        ops_service=ops,
+        skip_unchanged=True,
+    )
+    summary = make_run_context(tickers=["AAPL", "MSFT"])
+    service.run = summary
+    service._preload_payload_hashes(recipe)
+
+    for ticker in summary.tickers:
+        service._process_run_request(make_run_request(recipe=recipe, overrides={"ticker": ticker}))
+    service._flush_manifest_inserts()
+
+    assert [r.request.ticker for r in service.result_file_adapter.results] == ["MSFT"]
+    assert summary.bronze_files_passed == 1
+    assert summary.bronze_files_unchanged == 1
+    unchanged = next(r for r in ops.inserted if r.request.ticker == "AAPL")
+    ingestion = DatasetInjestion.from_bronze(unchanged)
+    assert ingestion.bronze_filename == "bronze/prev.json"
+    assert ingestion.bronze_can_promote is False
+    assert ingestion.bronze_payload_hash == unchanged_hash
+
+
+def test_skip_unchanged_still_fires_after_silver_promoted_the_previous_file() -> None:
+    conn = _create_connection()
+    ops = OpsService(ops_repo=_make_repo(conn), universe=_StubUniverse(date(2026, 1, 27)), logger=MagicMock())
+    recipe = make_run_request().recipe
+    service = BronzeService(
+        result_file_adapter=_StubResultAdapter(),
+        request_executor=_StubExecutor(response=_FakeResponse()),
+        ops_service=ops,
+        universe=_StubUniverse(date(2026, 1, 27)),
+        skip_unchanged=True,
+    )
+    summary = make_run_context()
+    service.run = summary
+    service._preload_payload_hashes(recipe)
+    first_request = make_run_request(recipe=recipe)
+    service._process_run_request(first_request)
+    service._flush_manifest_inserts()
+    service._release_recipe_caches(recipe)
+
+    # Silver promotes the first file, which clears its bronze_can_promote flag.
+    (ingestion,) = ops.load_promotable_file_ingestions()
+    ops.set_silver_outcome(ingestion, rows_written=1, rows_failed=0, table_name="silver.t", coverage_from=None, coverage_to=None, error=None)
+    ops.finish_silver_ingestions([ingestion])
+
+    # The next day's fetch returns the same payload.
+    service.universe = _StubUniverse(date(2026, 1, 28))
+    service._preload_payload_hashes(recipe)
+    service._process_run_request(make_run_request(recipe=recipe, overrides={"injestion_date": "2026-01-28", "to_date": "2026-01-28"}))
+    service._flush_manifest_inserts()
+
+    assert len(service.result_file_adapter.results) == 1
+    assert summary.bronze_files_unchanged == 1
+    assert service.ops_service.load_promotable_file_ingestions() == []
+    conn.close()
+
+
+class _ValidatorOpsService(_StubOpsService):
+    def __init__(self) -> None:
+        super().__init__()
+        self.validators: dict = {}
+
+    def get_http_validators(self, url: str) -> dict:
+        return {key: v for key, v in self.validators.items() if v.url == url}
+
+    def upsert_http_validators(self, validators: list) -> int:
+        self.validators.update({v.cache_key: v for v in validators})
+        return len(validators)
+
+
+def test_not_modified_response_reuses_file_from_cached_validator() -> None:
+    recipe = make_run_request().recipe
+    ops = _ValidatorOpsService()
+    first = _FakeResponse()
+    first.headers = CaseInsensitiveDict({"content-type": "application/json", "ETag": '"v1"'})
+    executor = _StubExecutor(response=first)
+    service = BronzeService(
+        result_file_adapter=_StubResultAdapter(),
+        request_executor=executor,
+        ops_service=ops,
+        conditional_requests=True,
+    )
+    summary = make_run_context()
+    service.run = summary
+    assert executor.validator_cache is service.validator_cache
+
+    first_request = make_run_request(recipe=recipe)
+    service._process_run_request(first_request)
+    service._flush_manifest_inserts()
+    (validator,) = ops.validators.values()
+    assert validator.etag == '"v1"'
+    assert validator.bronze_filename == first_request.bronze_relative_filename
+
+    not_modified = _FakeResponse()
+    not_modified.status_code = 304
+    not_modified.reason = "Not Modified"
+    not_modified.content = b""
+    executor.response = not_modified
+    service._process_run_request(make_run_request(recipe=recipe))
+    service._flush_manifest_inserts()
+
+    assert len(service.result_file_adapter.results) == 1
+    assert summary.bronze_files_passed == 1
+    assert summary.bronze_files_unchanged == 1
+    ingestion = DatasetInjestion.from_bronze(ops.inserted[-1])
+    assert ingestion.bronze_filename == first_request.bronze_relative_filename
+    assert ingestion.bronze_error is None
+    assert ingestion.bronze_can_promote is False
+    assert ingestion.bronze_payload_hash == validator.payload_hash
+    assert ingestion.bronze_to_date == date(2026, 1, 26)
+
+
+def test_manifest_sink_receives_batches_after_they_are_inserted() -> None:
+    events: list[str] = []
+
+    class _OrderedOps(_StubOpsService):
+        def insert_bronze_manifests(self, results: list, run=None) -> list:
+            events.append(f"insert:{len(results)}")
+            return super().insert_bronze_manifests(results, run)
+
+    service = BronzeService(
+        result_file_adapter=_StubResultAdapter(),
+        request_executor=_StubExecutor(response=_FakeResponse()),
+        ops_service=_OrderedOps(),
+        manifest_sink=lambda ingestions: events.append(f"sink:{[i.ticker for i in ingestions]}"),
+    )
+    service.run = make_run_context()
+    service._process_run_request(make_run_request())
+    service._flush_manifest_inserts()
+    service._flush_manifest_inserts()
+
+    assert events == ["insert:1", "sink:['AAPL']", "insert:0"]
+
+
+def test_manifest_sink_only_receives_persisted_manifests() -> None:
+    sunk: list[list[str]] = []
+
+    class _PartialOps(_StubOpsService):
+        def insert_bronze_manifests(self, results: list, run=None) -> list:
+            return [result for result in results if result.request.ticker != "BAD"]
+
+    class _FailingOps(_StubOpsService):
+        def insert_bronze_manifests(self, results: list, run=None) -> list:
+            raise RuntimeError("ops down")
+
+    for ops in (_PartialOps(), _FailingOps()):
+        service = BronzeService(
+            result_file_adapter=_StubResultAdapter(),
+            request_executor=_StubExecutor(response=_FakeResponse()),
+            ops_service=ops,
+            manifest_sink=lambda ingestions: sunk.append([i.ticker for i in ingestions]),
+        )
+        service.run = make_run_context()
+        for ticker in ("AAPL", "BAD"):
+            service._process_run_request(make_run_request(overrides={"ticker": ticker}))
+        service._flush_manifest_inserts()
+
+    assert sunk == [["AAPL"]]
+
+
+def test_request_over_quota_yields_without_a_bronze_file() -> None:
+    from sbfoundation.run.services.quota_manager import QuotaExhausted
+
+    class _QuotaExecutor(_StubExecutor):
+        def execute(self, func, log_str: str, source: str | None = None):
+            raise QuotaExhausted(source, "low")
+
+    service = BronzeService(
+        result_file_adapter=_StubResultAdapter(),
+        request_executor=_QuotaExecutor(),
+        ops_service=_StubOpsService(),
+    )
+    summary = make_run_context()
+    service.run = summary
+
+    service._process_run_request(make_run_request())
+    service._flush_manifest_inserts()
+
+    assert summary.quota_yields_by_source == {"fmp": 1}
+    assert summary.bronze_files_failed == 0
+    assert service.result_file_adapter.results == []
+    assert service.ops_service.inserted == []
+
+
 def test_force_from_date_bypasses_watermark_and_duplicate_check() -> None:
     """When force_from_date is set, watermark and duplicate-ingestion lookups are skipped."""
     from datetime import date
@@ -299,3 +571,352 @@ def test_sync_mode_when_concurrent_requests_is_one() -> None:
     # Verify all requests were processed (sequential mode)
     assert summary.bronze_files_passed == len(summary.tickers)
     assert executor.calls == len(summary.tickers)
+
+
+def test_process_flattens_recipes_into_shared_queue() -> None:
+    """Concurrent runs schedule every recipe's requests on one queue and flush per recipe."""
+    from tests.unit.helpers import make_dataset_recipe
+
+    class _RecordingOps(_StubOpsService):
+        def insert_bronze_manifest(self, result, run=None) -> None:
+            super().insert_bronze_manifest(result, run)
+            self.flushed_datasets = getattr(self, "flushed_datasets", []) + [result.request.recipe.discriminator]
+
+    ops = _RecordingOps()
+    executor = _StubExecutor(response=_FakeResponse())
+    service = BronzeService(
+        result_file_adapter=_StubResultAdapter(),
+        request_executor=executor,
+        ops_service=ops,
+        concurrent_requests=4,
+    )
+    summary = make_run_context(tickers=["AAPL", "MSFT", "GOOGL"])
+    recipes = [make_dataset_recipe(discriminator="a"), make_dataset_recipe(discriminator="b")]
+    service.register_recipes(summary, recipes).process(summary)
+
+    assert executor.calls == 6
+    assert summary.bronze_files_passed == 6
+    assert len(ops.inserted) == 6
+    # Each recipe's manifests are flushed together once that recipe completes.
+    flushed = ops.flushed_datasets
+    assert sorted(flushed[:3]) == [flushed[0]] * 3
+    assert sorted(flushed[3:]) == [flushed[3]] * 3
+    assert service._watermarks_caches == {}
+
+
+def test_plan_applies_gates_from_watermarks_without_fetching() -> None:
+    from tests.unit.helpers import make_dataset_recipe
+
+    today = date(2026, 1, 27)
+
+    class _PlanOps(_StubOpsService):
+        def get_bulk_ingestion_watermarks(self, **kwargs: object) -> dict:
+            return {"MSFT": (today, today), "NVDA": (date(2026, 1, 25), date(2026, 1, 25))}
+
+        def get_bronze_latency_quantile(self, *, source: str, dataset: str, quantile: float):
+            return 40, 2.0
+
+    executor = _StubExecutor(response=_FakeResponse())
+    service = BronzeService(
+        result_file_adapter=_StubResultAdapter(),
+        request_executor=executor,
+        ops_service=_PlanOps(),
+        universe=_StubUniverse(today),
+        concurrent_requests=2,
+    )
+    summary = make_run_context(tickers=["AAPL", "MSFT", "NVDA"])
+    recipe = make_dataset_recipe(min_age_days=5)
+
+    plan = service.register_recipes(summary, [recipe]).plan(summary)
+
+    line = plan.datasets[(recipe.source, recipe.dataset)]
+    assert (line.requests, line.skipped_duplicate, line.skipped_too_soon) == (1, 1, 1)
+    assert line.latency_seconds == 2.0
+    assert plan.projected_seconds >= 1.0
+    assert executor.calls == 0
+    assert service.result_file_adapter.results == []
+    assert summary.bronze_files_failed == summary.bronze_files_passed == 0
+
+
+class _LoopClient:
+    """Stands in for AsyncHttpClient: records which thread each GET ran on."""
+
+    def __init__(self) -> None:
+        self.threads: set[str] = set()
+        self.closed = False
+
+    async def get(self, url: str, params: dict | None = None) -> requests.Response:
+        self.threads.add(threading.current_thread().name)
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict({"content-type": "application/json"})
+        response._content = b'[{"date":"2026-01-26"}]'
+        return response
+
+    def stats(self) -> tuple[int, int]:
+        return 6, 1
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+class _LoopExecutor(_StubExecutor):
+    async def execute_async(self, func, log_str: str, source: str | None = None) -> requests.Response:
+        self.calls += 1
+        return await func()
+
+
+def test_asyncio_engine_fetches_eligible_recipes_on_the_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    from tests.unit.helpers import make_dataset_recipe
+
+    client = _LoopClient()
+    monkeypatch.setattr(async_fetch_engine_module, "AsyncHttpClient", lambda: client)
+
+    class _RecordingOps(_StubOpsService):
+        def insert_bronze_manifests(self, results: list, run=None) -> list:
+            self.batches = getattr(self, "batches", []) + [sorted({r.request.recipe.discriminator for r in results})]
+            return super().insert_bronze_manifests(results, run)
+
+    ops = _RecordingOps()
+    executor = _LoopExecutor()
+    service = BronzeService(
+        result_file_adapter=_StubResultAdapter(),
+        request_executor=executor,
+        ops_service=ops,
+        concurrent_requests=4,
+        fetch_engine=FETCH_ENGINE_ASYNCIO,
+    )
+    summary = make_run_context(tickers=["AAPL", "MSFT", "GOOGL"])
+    recipes = [make_dataset_recipe(discriminator="a"), make_dataset_recipe(discriminator="b")]
+    service.register_recipes(summary, recipes).process(summary)
+
+    assert executor.calls == 6
+    assert client.threads == {"bronze-event-loop"}
+    assert client.closed
+    assert summary.bronze_files_passed == 6
+    assert len(ops.inserted) == 6
+    # Manifests are still flushed once per recipe, off the loop.
+    assert sorted(ops.batches) == [["a"], ["b"]]
+    assert (summary.http_requests, summary.http_connections_opened) == (6, 1)
+    assert service._watermarks_caches == {}
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"query_vars": {"datatype": "csv"}},
+        {"bronze_storage": BRONZE_STORAGE_RAW},
+        {"is_ticker_based": False, "paginate_param": "part"},
+    ],
+)
+def test_asyncio_engine_leaves_streamed_and_paginated_recipes_on_threads(overrides: dict) -> None:
+    from tests.unit.helpers import make_dataset_recipe
+
+    service = BronzeService(
+        result_file_adapter=_StubResultAdapter(),
+        request_executor=_StubExecutor(),
+        ops_service=_StubOpsService(),
+        concurrent_requests=4,
+        fetch_engine=FETCH_ENGINE_ASYNCIO,
+    )
+
+    assert service._runs_on_event_loop(make_dataset_recipe())
+    assert not service._runs_on_event_loop(make_dataset_recipe(**overrides))
+
+
+def test_queued_requests_park_failed_attempts_and_resume() -> None:
+    """A deferred attempt frees the worker and the request resumes with its attempt count."""
+
+    class _FlakyExecutor(_StubExecutor):
+        def __init__(self) -> None:
+            super().__init__(response=_FakeResponse())
+            self.attempts: list[int] = []
+            self._lock = threading.Lock()
+
+        def execute_once(self, func, log_str: str, source: str | None = None, attempt: int = 0) -> _FakeResponse:
+            with self._lock:
+                self.attempts.append(attempt)
+            if attempt == 0:
+                raise DeferredRetry(0.0, attempt + 1, source)
+            return self.execute(func, log_str, source)
+
+    executor = _FlakyExecutor()
+    service = BronzeService(
+        result_file_adapter=_StubResultAdapter(),
+        request_executor=executor,
+        ops_service=_StubOpsService(),
+        concurrent_requests=2,
+    )
+    summary = make_run_context(tickers=["AAPL", "MSFT", "GOOGL"])
+    recipe = make_run_request().recipe
+    service.register_recipes(summary, [recipe]).process(summary)
+
+    assert sorted(executor.attempts) == [0, 0, 0, 1, 1, 1]
+    assert summary.bronze_files_passed == 3
+    assert summary.retries_deferred_by_source == {recipe.source: 3}
+
+
+class _DroppingCsvResponse(requests.Response):
+    """CSV response whose body stream fails after the first chunk when ``drop`` is set."""
+
+    def __init__(self, body: bytes, drop: bool) -> None:
+        super().__init__()
+        self.status_code = 200
+        self.reason = "OK"
+        self.headers = CaseInsensitiveDict({"content-type": "text/csv"})
+        self.elapsed = timedelta(microseconds=5)
+        self.raw = io.BytesIO()
+        self._body = body
+        self._drop = drop
+
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        yield self._body[:10]
+        if self._drop:
+            raise requests.exceptions.ChunkedEncodingError("Connection broken: IncompleteRead")
+        yield self._body[10:]
+
+
+def test_body_dropped_mid_stream_is_retried_by_the_executor(monkeypatch) -> None:
+    monkeypatch.setattr(run_request_executor_module.time, "sleep", lambda _: None)
+    body = b"date,close\n2026-01-26,1.5\n2026-01-27,2.5\n"
+    sent: list[dict] = []
+
+    class _Pool:
+        def get(self, source: str, url: str, **kwargs) -> requests.Response:
+            sent.append(dict(kwargs["params"]))
+            return _DroppingCsvResponse(body, drop=len(sent) == 1)
+
+        def stats(self) -> tuple[int, int]:
+            return 0, 0
+
+    service = BronzeService(
+        result_file_adapter=_StubResultAdapter(),
+        request_executor=RunRequestExecutor(logger=MagicMock(), session_pool=_Pool()),
+        ops_service=_StubOpsService(),
+    )
+    service.run = make_run_context()
+    request = make_run_request(overrides={"query_vars": {"datatype": "csv", "apikey": "secret"}})
+
+    service._process_run_request(request)
+
+    assert len(sent) == 2
+    assert sent[1]["apikey"] == "secret"
+    assert service.run.bronze_files_passed == 1
+    (result,) = service.result_file_adapter.results
+    assert len(result.content) == 2
+    assert (result.first_date, result.last_date) == ("2026-01-26", "2026-01-27")
+
+
+class _PageResponse(_FakeResponse):
+    def __init__(self, rows: list[dict[str, str]]) -> None:
+        super().__init__()
+        self._rows = rows
+
+    def json(self) -> list[dict[str, str]]:
+        return self._rows
+
+
+class _PagedExecutor:
+    """Serves ``pages`` non-empty pages keyed by the ``part`` query parameter."""
+
+    def __init__(self, pages: int) -> None:
+        self.pages = pages
+        self.parts: list[int] = []
+        self._lock = threading.Lock()
+
+    def execute(self, func, log_str: str, source: str | None = None) -> _PageResponse:
+        return func()
+
+    def http_get(self, source: str, url: str, params: dict, **kwargs) -> _PageResponse:
+        part = params["part"]
+        with self._lock:
+            self.parts.append(part)
+        return _PageResponse([{"date": "2026-01-26", "part": str(part)}] if part < self.pages else [])
+
+
+def test_paginated_recipe_prefetches_and_persists_in_order() -> None:
+    from tests.unit.helpers import make_dataset_recipe
+
+    executor = _PagedExecutor(pages=5)
+    service = _make_service(executor)
+    service.run = make_run_context()
+    recipe = make_dataset_recipe(is_ticker_based=False, paginate_param="part", prefetch_pages=3)
+
+    service._process_paginated_recipe(recipe)
+
+    persisted = [r.request.query_vars["part"] for r in service.result_file_adapter.results]
+    assert persisted == [0, 1, 2, 3, 4]
+    assert service.run.bronze_files_passed == 5
+    # Pages past the first empty one may be fetched speculatively but are never persisted.
+    assert set(range(6)) <= set(executor.parts) <= set(range(5 + 3))
+
+
+def test_paginated_raw_run_leaves_no_spool_files(monkeypatch) -> None:
+    from tests.unit.helpers import make_dataset_recipe
+
+    spools: list[Path] = []
+    new_spool = RawPayload.new_spool
+
+    def tracked_spool(named: bool = False):
+        spool = new_spool(named)
+        if named:
+            spools.append(Path(spool.name))
+        return spool
+
+    monkeypatch.setattr(RawPayload, "new_spool", staticmethod(tracked_spool))
+
+    class _RawPagedExecutor(_PagedExecutor):
+        def http_get(self, source: str, url: str, params: dict, **kwargs) -> requests.Response:
+            rows = super().http_get(source, url, params).json()
+            response = requests.Response()
+            response.status_code = 200
+            response.reason = "OK"
+            response.headers = CaseInsensitiveDict({"content-type": "application/json"})
+            response.elapsed = timedelta(microseconds=5)
+            response.raw = io.BytesIO(json.dumps(rows).encode("utf-8"))
+            return response
+
+    service = _make_service(_RawPagedExecutor(pages=2))
+    service.run = make_run_context()
+    recipe = make_dataset_recipe(is_ticker_based=False, paginate_param="part", prefetch_pages=4, bronze_storage=BRONZE_STORAGE_RAW)
+
+    service._process_paginated_recipe(recipe)
+
+    assert service.run.bronze_files_passed == 2
+    # Two persisted pages, the empty page that ended the run and pages prefetched past it.
+    assert len(spools) >= 3
+    assert [path for path in spools if path.exists()] == []
+
+
+def test_resumed_run_restores_journaled_manifests_and_skips_completed_requests(tmp_path) -> None:
+    from sbfoundation.run.services.run_journal import RunJournal
+
+    journal = RunJournal(tmp_path / "run-123.jsonl")
+    done, failed, fresh = (make_run_request(overrides={"ticker": ticker}) for ticker in ("AAPL", "MSFT", "NVDA"))
+    journal.record(make_bronze_result(request=done))
+    journal.record(make_bronze_result(request=failed, overrides={"error": "HTTP 500"}))
+
+    class _ResumeOps(_StubOpsService):
+        def __init__(self) -> None:
+            super().__init__()
+            self.restored: list[DatasetInjestion] = []
+
+        def restore_bronze_manifests(self, ingestions: list[DatasetInjestion]) -> int:
+            self.restored.extend(ingestions)
+            return len(ingestions)
+
+    executor = _StubExecutor(response=_FakeResponse())
+    service = BronzeService(
+        result_file_adapter=_StubResultAdapter(),
+        request_executor=executor,
+        ops_service=_ResumeOps(),
+        journal=journal,
+    )
+    run = service.execute_requests([done, failed, fresh], make_run_context())
+
+    assert [i.ticker for i in service.ops_service.restored] == ["AAPL", "MSFT"]
+    assert executor.calls == 2
+    assert run.bronze_requests_resumed == 1
+    # The retried and the new request are journaled behind the entries that were resumed.
+    assert [key[-2] for key, _ in journal.load()] == ["AAPL", "MSFT", "MSFT", "NVDA"]
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import threading
+
+from sbfoundation.run.services.bronze_work_queue import BronzeWorkQueue
+from sbfoundation.run.services.run_request_executor import DeferredRetry
+
+
+class _StubLogger:
+    def __init__(self) -> None:
+        self.errors: list[str] = []
+
+    def error(self, msg: str, *args: object, **kwargs: object) -> None:
+        self.errors.append(msg)
+
+
+def test_single_worker_runs_tasks_in_priority_order() -> None:
+    order: list[str] = []
+    work_queue: BronzeWorkQueue[str] = BronzeWorkQueue(1, _StubLogger())
+    work_queue.add_group("late", [("l1", lambda: order.append("l1"))], priority=2)
+    work_queue.add_group("early", [("e1", lambda: order.append("e1")), ("e2", lambda: order.append("e2"))], priority=1)
+
+    completed: list[str] = []
+    work_queue.run(on_group_complete=completed.append)
+
+    assert order == ["e1", "e2", "l1"]
+    assert completed == ["early", "late"]
+
+
+def test_group_completion_runs_on_calling_thread() -> None:
+    caller = threading.current_thread()
+    seen: list[bool] = []
+    work_queue: BronzeWorkQueue[str] = BronzeWorkQueue(4, _StubLogger())
+    work_queue.add_group("a", [(f"t{i}", lambda: None) for i in range(10)])
+    work_queue.add_group("b", [])
+
+    work_queue.run(on_group_complete=lambda _group: seen.append(threading.current_thread() is caller))
+
+    assert seen == [True, True]
+
+
+def test_failed_task_still_completes_group() -> None:
+    logger = _StubLogger()
+    work_queue: BronzeWorkQueue[str] = BronzeWorkQueue(2, logger)
+
+    def boom() -> None:
+        raise RuntimeError("boom")
+
+    work_queue.add_group("a", [("bad", boom), ("good", lambda: None)])
+    completed: list[str] = []
+    work_queue.run(on_group_complete=completed.append)
+
+    assert completed == ["a"]
+    assert logger.errors == ["Worker exception for bad: boom"]
+
+
+def test_deferred_task_is_parked_and_resumed_after_other_work() -> None:
+    order: list[str] = []
+    work_queue: BronzeWorkQueue[str] = BronzeWorkQueue(1, _StubLogger())
+
+    def flaky() -> None:
+        order.append("flaky")
+        retry = DeferredRetry(0.05, 1)
+        retry.resume = lambda: order.append("flaky-retry")
+        raise retry
+
+    work_queue.add_group("a", [("flaky", flaky), ("a2", lambda: order.append("a2"))])
+    work_queue.add_group("b", [("b1", lambda: order.append("b1"))], priority=1)
+    completed: list[str] = []
+    work_queue.run(on_group_complete=completed.append)
+
+    # The single worker runs the healthy tasks instead of sleeping through the back-off.
+    assert order == ["flaky", "a2", "b1", "flaky-retry"]
+    assert completed == ["b", "a"]
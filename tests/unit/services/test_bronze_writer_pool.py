@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import threading
+
+from sbfoundation.run.services.bronze_writer_pool import BronzeWriterPool
+from tests.unit.helpers import make_bronze_result, make_run_context, make_run_request
+
+
+class _StubLogger:
+    def __init__(self) -> None:
+        self.errors: list[str] = []
+
+    def error(self, msg: str, *args: object, **kwargs: object) -> None:
+        self.errors.append(msg)
+
+
+def _result(ticker: str):
+    return make_bronze_result(request=make_run_request(overrides={"ticker": ticker}))
+
+
+def test_pool_writes_then_calls_back_and_records_latency() -> None:
+    run = make_run_context()
+    written: list[str] = []
+    finished: list[str] = []
+    pool = BronzeWriterPool(lambda result: written.append(result.request.ticker), workers=2, logger=_StubLogger())
+
+    for ticker in ("AAPL", "MSFT", "NVDA"):
+        pool.submit(_result(ticker), run, lambda result: finished.append(result.request.ticker))
+    pool.drain()
+
+    assert sorted(written) == sorted(finished) == ["AAPL", "MSFT", "NVDA"]
+    assert run.bronze_writes == 3
+    assert run.bronze_write_seconds >= 0.0
+    pool.close()
+
+
+def test_full_queue_blocks_submit_until_a_writer_frees_a_slot() -> None:
+    run = make_run_context()
+    gate = threading.Event()
+    pool = BronzeWriterPool(lambda result: gate.wait(), workers=1, logger=_StubLogger(), maxsize=1)
+    pool.submit(_result("AAPL"), run, lambda result: None)  # taken by the writer, which blocks on the gate
+    pool.submit(_result("MSFT"), run, lambda result: None)  # fills the queue
+
+    blocked = threading.Thread(target=pool.submit, args=(_result("NVDA"), run, lambda result: None))
+    blocked.start()
+    blocked.join(timeout=0.1)
+    assert blocked.is_alive()
+
+    gate.set()
+    blocked.join(timeout=2)
+    pool.close()
+
+    assert not blocked.is_alive()
+    assert run.bronze_writes == 3
+    assert run.bronze_writer_max_queue_depth >= 1
+
+
+def test_failed_write_is_logged_and_skips_the_callback() -> None:
+    logger = _StubLogger()
+    run = make_run_context()
+    finished: list[str] = []
+
+    def write(result) -> None:
+        if result.request.ticker == "BAD":
+            raise OSError("disk full")
+
+    pool = BronzeWriterPool(write, workers=1, logger=logger)
+    for ticker in ("BAD", "AAPL"):
+        pool.submit(_result(ticker), run, lambda result: finished.append(result.request.ticker))
+    pool.close()
+
+    assert finished == ["AAPL"]
+    assert run.bronze_writes == 1
+    assert len(logger.errors) == 1 and "disk full" in logger.errors[0]
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import pytest
+
+from sbfoundation.run.services.hedge_policy import HedgePolicy
+from sbfoundation.settings import FMP_DATA_SOURCE, FRED_DATA_SOURCE
+
+
+class _LatencyOps:
+    def __init__(self, samples: int, seconds: float | None) -> None:
+        self.result = (samples, seconds)
+        self.calls = 0
+
+    def get_bronze_latency_quantile(self, *, source: str, dataset: str, quantile: float) -> tuple[int, float | None]:
+        self.calls += 1
+        return self.result
+
+
+def test_sources_that_do_not_opt_in_are_never_hedged() -> None:
+    ops = _LatencyOps(100, 2.0)
+    policy = HedgePolicy(ops, hedge_sources=[FMP_DATA_SOURCE])
+
+    assert policy.delay_for(FRED_DATA_SOURCE, "series") is None
+    assert ops.calls == 0
+
+
+def test_delay_is_seeded_from_history_then_tracks_run_latencies() -> None:
+    ops = _LatencyOps(100, 2.0)
+    policy = HedgePolicy(ops, hedge_sources=[FMP_DATA_SOURCE], min_samples=10, min_delay=0.1)
+
+    assert policy.delay_for(FMP_DATA_SOURCE, "eod") == pytest.approx(2.0)
+    for i in range(10):
+        policy.observe(FMP_DATA_SOURCE, "eod", 0.1 * (i + 1))
+
+    assert policy.delay_for(FMP_DATA_SOURCE, "eod") == pytest.approx(1.0)
+    assert ops.calls == 1
+
+
+def test_datasets_without_enough_history_are_not_hedged() -> None:
+    policy = HedgePolicy(_LatencyOps(3, 5.0), hedge_sources=[FMP_DATA_SOURCE])
+
+    assert policy.delay_for(FMP_DATA_SOURCE, "eod") is None
+
+
+def test_history_is_queried_outside_the_lock() -> None:
+    class _LockCheckingOps(_LatencyOps):
+        def get_bronze_latency_quantile(self, *, source: str, dataset: str, quantile: float) -> tuple[int, float | None]:
+            assert policy._lock.acquire(blocking=False), "seeded while holding the policy lock"
+            policy._lock.release()
+            return super().get_bronze_latency_quantile(source=source, dataset=dataset, quantile=quantile)
+
+    policy = HedgePolicy(_LockCheckingOps(100, 2.0), hedge_sources=[FMP_DATA_SOURCE], min_samples=10, min_delay=0.1)
+
+    assert policy.delay_for(FMP_DATA_SOURCE, "eod") == pytest.approx(2.0)
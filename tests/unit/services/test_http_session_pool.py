@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import threading
+
+from sbfoundation.run.services.http_session_pool import HttpSessionPool
+from sbfoundation.run.services.run_request_executor import RunRequestExecutor
+from sbfoundation.settings import DATA_SOURCES_CONFIG, FMP_DATA_SOURCE, FRED_DATA_SOURCE, HTTP_POOL_DEFAULT_MAXSIZE, HTTP_POOL_MAXSIZE
+from tests.unit.helpers import make_run_context
+
+
+class _StubLogger:
+    def debug(self, *_args: object, **_kwargs: object) -> None:
+        pass
+
+
+class _CountingPool:
+    """Stands in for HttpSessionPool with hand-set urllib3-style counters."""
+
+    def __init__(self) -> None:
+        self.requests_sent = 0
+        self.connections_opened = 0
+        self.closed = False
+
+    def get(self, source: str, url: str, **kwargs: object) -> str:
+        self.requests_sent += 1
+        if self.requests_sent == 1:
+            self.connections_opened += 1
+        return "response"
+
+    def stats(self) -> tuple[int, int]:
+        return self.requests_sent, self.connections_opened
+
+    def close(self) -> None:
+        self.closed = True
+        self.requests_sent = 0
+        self.connections_opened = 0
+
+
+def test_pool_size_comes_from_source_config() -> None:
+    pool = HttpSessionPool()
+    assert pool.pool_size(FMP_DATA_SOURCE) == DATA_SOURCES_CONFIG[FMP_DATA_SOURCE][HTTP_POOL_MAXSIZE]
+    assert pool.pool_size(FRED_DATA_SOURCE) == DATA_SOURCES_CONFIG[FRED_DATA_SOURCE][HTTP_POOL_MAXSIZE]
+    assert pool.pool_size("unknown") == HTTP_POOL_DEFAULT_MAXSIZE
+    assert HttpSessionPool(pool_sizes={FMP_DATA_SOURCE: 2}).pool_size(FMP_DATA_SOURCE) == 2
+
+
+def test_sessions_are_per_thread_but_share_source_adapter() -> None:
+    pool = HttpSessionPool()
+    main_session = pool.session(FMP_DATA_SOURCE)
+    assert pool.session(FMP_DATA_SOURCE) is main_session
+
+    other: dict[str, object] = {}
+    thread = threading.Thread(target=lambda: other.setdefault("session", pool.session(FMP_DATA_SOURCE)))
+    thread.start()
+    thread.join()
+
+    assert other["session"] is not main_session
+    assert other["session"].get_adapter("https://x") is main_session.get_adapter("https://x")
+    assert pool.session(FRED_DATA_SOURCE).get_adapter("https://x") is not main_session.get_adapter("https://x")
+    pool.close()
+
+
+def test_http_get_records_connection_reuse_on_summary() -> None:
+    summary = make_run_context()
+    pool = _CountingPool()
+    executor = RunRequestExecutor(logger=_StubLogger(), summary=summary, session_pool=pool)
+
+    for _ in range(4):
+        assert executor.http_get(FMP_DATA_SOURCE, "https://example.com") == "response"
+
+    assert summary.http_requests == 4
+    assert summary.http_connections_opened == 1
+    assert summary.http_connection_reuse_ratio == 0.75
+
+    executor.close()
+    assert pool.closed
+    executor.http_get(FMP_DATA_SOURCE, "https://example.com")
+    assert summary.http_requests == 5
+    assert summary.http_connections_opened == 2
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from sbfoundation.run.services.quota_manager import QuotaExhausted, QuotaManager
+from sbfoundation.settings import QUOTA_DAILY, QUOTA_MONTHLY, RUN_PRIORITY_HIGH, RUN_PRIORITY_LOW
+
+
+class _LedgerOps:
+    """In-memory stand-in for the ops.api_quota_ledger reserve/release calls."""
+
+    def __init__(self) -> None:
+        self.ledger: dict[tuple[str, str, date], int] = {}
+        self.reserve_calls = 0
+
+    def reserve_api_quota(self, *, source: str, ceilings: dict, calls: int) -> int:
+        self.reserve_calls += 1
+        granted = calls
+        for period, (start, ceiling) in ceilings.items():
+            granted = min(granted, max(0, ceiling - self.ledger.get((source, period, start), 0)))
+        for period, (start, _ceiling) in ceilings.items():
+            self.ledger[(source, period, start)] = self.ledger.get((source, period, start), 0) + granted
+        return granted
+
+    def release_api_quota(self, *, source: str, periods: dict, calls: int) -> None:
+        for period, start in periods.items():
+            self.ledger[(source, period, start)] -= calls
+
+
+def test_reserves_in_blocks_and_returns_unused_calls() -> None:
+    ops = _LedgerOps()
+    manager = QuotaManager(ops, RUN_PRIORITY_HIGH, budgets={"fmp": {QUOTA_DAILY: 100, QUOTA_MONTHLY: 1000}}, today=lambda: date(2026, 3, 9), block_size=10)
+
+    for _ in range(12):
+        manager.reserve("fmp")
+    assert ops.reserve_calls == 2
+    assert ops.ledger[("fmp", QUOTA_DAILY, date(2026, 3, 9))] == 20
+    assert ops.ledger[("fmp", QUOTA_MONTHLY, date(2026, 3, 1))] == 20
+
+    manager.release()
+    assert ops.ledger[("fmp", QUOTA_DAILY, date(2026, 3, 9))] == 12
+    assert ops.ledger[("fmp", QUOTA_MONTHLY, date(2026, 3, 1))] == 12
+
+
+def test_low_priority_yields_while_high_priority_spends_the_headroom() -> None:
+    ops = _LedgerOps()
+    budgets = {"fmp": {QUOTA_DAILY: 10}}
+    low = QuotaManager(ops, RUN_PRIORITY_LOW, budgets=budgets, today=lambda: date(2026, 3, 9), block_size=1)
+    high = QuotaManager(ops, RUN_PRIORITY_HIGH, budgets=budgets, today=lambda: date(2026, 3, 9), block_size=1)
+
+    for _ in range(7):  # low priority leaves 30% of the budget
+        low.reserve("fmp")
+    with pytest.raises(QuotaExhausted) as exc_info:
+        low.reserve("fmp")
+    assert exc_info.value.source == "fmp"
+
+    for _ in range(3):
+        high.reserve("fmp")
+    with pytest.raises(QuotaExhausted):
+        high.reserve("fmp")
+
+
+def test_sources_without_a_budget_are_unlimited_and_new_day_starts_fresh() -> None:
+    ops = _LedgerOps()
+    day = {"value": date(2026, 3, 9)}
+    manager = QuotaManager(ops, RUN_PRIORITY_HIGH, budgets={"fmp": {QUOTA_DAILY: 5}}, today=lambda: day["value"], block_size=5)
+
+    manager.reserve("fred")
+    manager.reserve("fmp")
+    day["value"] = date(2026, 3, 10)
+    manager.reserve("fmp")
+
+    assert ("fred", QUOTA_DAILY, date(2026, 3, 9)) not in ops.ledger
+    assert ops.ledger[("fmp", QUOTA_DAILY, date(2026, 3, 9))] == 1  # the unused part of the old block went back
+    assert ops.ledger[("fmp", QUOTA_DAILY, date(2026, 3, 10))] == 5
+
+
+def test_rejects_unknown_priority() -> None:
+    with pytest.raises(ValueError, match="priority"):
+        QuotaManager(_LedgerOps(), "urgent", budgets={})
+
+
+def test_exhausted_source_is_not_queried_again_until_the_next_day() -> None:
+    ops = _LedgerOps()
+    day = {"value": date(2026, 3, 9)}
+    manager = QuotaManager(ops, RUN_PRIORITY_HIGH, budgets={"fmp": {QUOTA_DAILY: 2}}, today=lambda: day["value"], block_size=2)
+
+    manager.reserve("fmp")
+    manager.reserve("fmp")
+    for _ in range(3):
+        with pytest.raises(QuotaExhausted):
+            manager.reserve("fmp")
+    assert ops.reserve_calls == 2
+
+    day["value"] = date(2026, 3, 10)
+    manager.reserve("fmp")
+    assert ops.reserve_calls == 3
+
+
+def test_ledger_is_queried_outside_the_manager_lock() -> None:
+    manager: QuotaManager
+
+    class _LockCheckingOps(_LedgerOps):
+        def reserve_api_quota(self, *, source: str, ceilings: dict, calls: int) -> int:
+            assert manager._lock.acquire(blocking=False), "ledger queried while holding the manager lock"
+            manager._lock.release()
+            return super().reserve_api_quota(source=source, ceilings=ceilings, calls=calls)
+
+    manager = QuotaManager(_LockCheckingOps(), RUN_PRIORITY_HIGH, budgets={"fmp": {QUOTA_DAILY: 10}}, today=lambda: date(2026, 3, 9), block_size=5)
+
+    for _ in range(6):
+        manager.reserve("fmp")
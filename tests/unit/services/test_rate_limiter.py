@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from sbfoundation.run.services.rate_limiter import DEFAULT_BUCKET, RateLimiter, TokenBucket, parse_retry_after
+from sbfoundation.settings import (
+    DATA_SOURCES_CONFIG,
+    FMP_DATA_SOURCE,
+    FRED_DATA_SOURCE,
+    THROTTLE_MAX_CALLS_PER_MINUTE,
+    THROTTLE_MAX_RETRY_AFTER_SECONDS,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def __call__(self) -> float:
+        return self.value
+
+
+def test_bucket_allows_burst_then_spaces_reservations() -> None:
+    clock = _Clock()
+    bucket = TokenBucket("t", rate=2.0, capacity=2, clock=clock)
+
+    assert bucket.reserve() == (0.0, 0)
+    assert bucket.reserve() == (0.0, 0)
+    assert bucket.reserve() == (pytest.approx(0.5), 1)
+    assert bucket.reserve() == (pytest.approx(1.0), 2)
+
+    clock.value = 1.0  # two tokens refilled, both already promised to the queued callers
+    assert bucket.reserve() == (pytest.approx(0.5), 1)
+
+
+def test_bucket_refill_is_capped_at_capacity() -> None:
+    clock = _Clock()
+    bucket = TokenBucket("t", rate=1.0, capacity=1, clock=clock)
+    bucket.reserve()
+    clock.value = 100.0
+    assert bucket.reserve() == (0.0, 0)
+    assert bucket.reserve()[0] == pytest.approx(1.0)
+
+
+def test_bucket_rejects_non_positive_rate() -> None:
+    with pytest.raises(ValueError):
+        TokenBucket("t", rate=0, capacity=1)
+
+
+def test_limiter_uses_per_source_config_rates() -> None:
+    limiter = RateLimiter()
+    assert limiter.bucket(FMP_DATA_SOURCE).rate == pytest.approx(DATA_SOURCES_CONFIG[FMP_DATA_SOURCE][THROTTLE_MAX_CALLS_PER_MINUTE] / 60)
+    assert limiter.bucket(FRED_DATA_SOURCE).rate == pytest.approx(DATA_SOURCES_CONFIG[FRED_DATA_SOURCE][THROTTLE_MAX_CALLS_PER_MINUTE] / 60)
+    assert limiter.bucket(None) is limiter.bucket(DEFAULT_BUCKET)
+
+
+def test_sources_do_not_starve_each_other() -> None:
+    clock = _Clock()
+    limiter = RateLimiter(clock=clock)
+    for _ in range(50):
+        limiter.reserve(FRED_DATA_SOURCE)
+    assert limiter.reserve(FRED_DATA_SOURCE)[0] > 0
+    assert limiter.reserve(FMP_DATA_SOURCE) == (0.0, 0)
+
+
+def test_global_cap_applies_across_sources() -> None:
+    clock = _Clock()
+    limiter = RateLimiter(global_max_calls=60, clock=clock)  # 1/s, burst of 1
+    assert limiter.reserve(FMP_DATA_SOURCE) == (0.0, 0)
+    wait, depth = limiter.reserve(FRED_DATA_SOURCE)
+    assert wait == pytest.approx(1.0)
+    assert depth == 1
+
+
+def test_min_seconds_spends_the_burst_then_the_steady_rate() -> None:
+    limiter = RateLimiter(global_max_calls=60)  # 1/s, burst of 1
+    fred = limiter.bucket(FRED_DATA_SOURCE)
+
+    assert limiter.min_seconds(FRED_DATA_SOURCE, int(fred.capacity)) == 0.0
+    assert limiter.min_seconds(FRED_DATA_SOURCE, int(fred.capacity) + 10) == pytest.approx(10 / fred.rate)
+    assert limiter.global_min_seconds(31) == pytest.approx(30.0)
+    assert RateLimiter().global_min_seconds(10_000) == 0.0
+
+
+def test_penalize_cuts_rate_and_blocks_until_retry_after() -> None:
+    clock = _Clock()
+    bucket = TokenBucket("t", rate=10.0, capacity=10, clock=clock)
+
+    bucket.penalize(retry_after=2.0)
+
+    assert bucket.rate == pytest.approx(5.0)
+    wait, depth = bucket.reserve()
+    assert wait == pytest.approx(2.0 + 1 / 5.0)
+    assert depth == 1
+
+
+def test_penalties_in_cooldown_window_count_once() -> None:
+    clock = _Clock()
+    bucket = TokenBucket("t", rate=10.0, capacity=10, clock=clock)
+    bucket.penalize()
+    bucket.penalize()
+    assert bucket.rate == pytest.approx(5.0)
+    clock.value = 2.0
+    bucket.penalize()
+    assert bucket.rate < 5.0
+
+
+def test_rate_recovers_linearly_to_base_rate() -> None:
+    clock = _Clock()
+    bucket = TokenBucket("t", rate=10.0, capacity=10, clock=clock, recovery_seconds=100)
+    bucket.penalize(retry_after=5.0)
+    assert bucket.rate == pytest.approx(5.0)
+
+    clock.value = 5.0 + 25.0  # no recovery while blocked, then 25% of base over 25s
+    bucket.reserve()
+    assert bucket.rate == pytest.approx(7.5)
+
+    clock.value = 500.0
+    bucket.reserve()
+    assert bucket.rate == pytest.approx(10.0)
+
+
+def test_rate_never_drops_below_floor() -> None:
+    clock = _Clock()
+    bucket = TokenBucket("t", rate=10.0, capacity=10, clock=clock, min_rate=4.0, penalty_cooldown_seconds=0)
+    for _ in range(5):
+        bucket.penalize()
+    assert bucket.rate == pytest.approx(4.0)
+
+
+def test_limiter_penalize_only_affects_source() -> None:
+    clock = _Clock()
+    limiter = RateLimiter(clock=clock)
+    limiter.penalize(FRED_DATA_SOURCE, retry_after=30.0)
+    assert limiter.reserve(FRED_DATA_SOURCE)[0] >= 30.0
+    assert limiter.reserve(FMP_DATA_SOURCE) == (0.0, 0)
+
+
+def test_parse_retry_after_seconds_and_http_date() -> None:
+    now = datetime(2026, 1, 27, 12, 0, 0, tzinfo=timezone.utc)
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after("Tue, 27 Jan 2026 12:00:30 GMT", now=now) == pytest.approx(30.0)
+    assert parse_retry_after("99999") == THROTTLE_MAX_RETRY_AFTER_SECONDS
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
@@ -33,6 +33,23 @@ def test_invalid_domain_raises_value_error() -> None:
         _cmd("bogus_domain").validate()
 
 
+@pytest.mark.parametrize("field", ["fetch_engine", "silver_batch_mode", "silver_engine", "silver_dedupe_mode"])
+def test_invalid_silver_option_raises_value_error(field: str) -> None:
+    with pytest.raises(ValueError, match=f"Invalid {field}"):
+        _cmd(EOD_DOMAIN, **{field: "tabel"}).validate()
+
+
+def test_silver_workers_cannot_use_the_duckdb_engine() -> None:
+    with pytest.raises(ValueError, match="silver_engine='duckdb'"):
+        _cmd(EOD_DOMAIN, silver_workers=2, silver_engine="duckdb").validate()
+
+
+@pytest.mark.parametrize("option", [{"silver_workers": 2}, {"silver_engine": "duckdb"}])
+def test_silver_table_batches_reject_workers_and_the_duckdb_engine(option: dict) -> None:
+    with pytest.raises(ValueError, match="silver_batch_mode='table'"):
+        _cmd(EOD_DOMAIN, silver_batch_mode="table", **option).validate()
+
+
 # ── UniverseDefinition tests (independent of RunCommand) ─────────────────────
 
 def test_universe_definition_fields() -> None:
@@ -58,3 +75,8 @@ def test_universe_registry_contains_all_definitions() -> None:
 def test_universe_definition_is_frozen() -> None:
     with pytest.raises((AttributeError, TypeError)):
         US_LARGE_CAP.name = "mutated"  # type: ignore[misc]
+
+
+def test_invalid_priority_raises() -> None:
+    with pytest.raises(ValueError, match="priority"):
+        _cmd(EOD_DOMAIN, priority="urgent").validate()
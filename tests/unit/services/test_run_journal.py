@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from sbfoundation.run.services.run_journal import RunJournal
+from tests.unit.helpers import make_bronze_result, make_run_request
+
+
+def test_journal_round_trips_manifests_and_ignores_torn_line(tmp_path) -> None:
+    journal = RunJournal(tmp_path / "journal" / "run-1.jsonl")
+    request = make_run_request()
+    result = make_bronze_result(request=request)
+    result.filename = "bronze/AAPL.json"
+
+    journal.record(result)
+    with journal.path.open("a", encoding="utf-8") as fh:
+        fh.write('{"key": ["company", "fmp"')  # process killed mid-write
+
+    entries = journal.load()
+
+    assert len(entries) == 1
+    key, ingestion = entries[0]
+    assert key == RunJournal.key(request)
+    assert ingestion.file_id == request.file_id
+    assert ingestion.ticker == request.ticker
+    assert ingestion.bronze_filename == "bronze/AAPL.json"
+    assert ingestion.bronze_from_date == date(2026, 1, 26)
+    assert ingestion.bronze_injest_start_time == datetime(2026, 1, 27, 12, 0)
+
+
+def test_missing_journal_loads_empty_and_discard_removes_file(tmp_path) -> None:
+    journal = RunJournal(tmp_path / "run-1.jsonl")
+    assert journal.load() == []
+
+    journal.record(make_bronze_result())
+    journal.discard()
+
+    assert not journal.path.exists()
+    journal.discard()
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+
 import pytest
 import requests
 
 from sbfoundation.run.services import run_request_executor as run_request_executor_module
-from sbfoundation.run.services.run_request_executor import RunRequestExecutor
+from sbfoundation.ops.dtos.http_validator import HttpValidator
+from sbfoundation.run.services.http_validator_cache import HttpValidatorCache
+from sbfoundation.run.services.circuit_breaker import CircuitBreaker
+from sbfoundation.run.services.rate_limiter import RateLimiter
+from sbfoundation.run.services.run_request_executor import DeferredRetry, RunRequestExecutor
+from sbfoundation.settings import DATA_SOURCES_CONFIG, FMP_DATA_SOURCE, FRED_DATA_SOURCE, THROTTLE_BURST
 from tests.unit.helpers import make_run_context
 
 
@@ -13,7 +21,7 @@ class _StubLogger:
         self.warnings: list[str] = []
         self.errors: list[str] = []
 
-    def debug(self, _msg: str) -> None:
+    def debug(self, _msg: str, *args: object) -> None:
         pass
 
     def warning(self, msg: str, *args: object) -> None:
@@ -26,7 +34,7 @@ class _StubLogger:
 def test_execute_exhausts_retries(monkeypatch: pytest.MonkeyPatch) -> None:
     logger = _StubLogger()
     executor = RunRequestExecutor(logger=logger)
-    executor._throttle = lambda: None
+    executor._throttle = lambda _source=None: None
     monkeypatch.setattr(run_request_executor_module.time, "sleep", lambda _: None)
 
     def failing_call() -> None:
@@ -39,29 +47,454 @@ def test_execute_exhausts_retries(monkeypatch: pytest.MonkeyPatch) -> None:
     assert len(logger.errors) == 1
 
 
-def test_throttle_updates_summary(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_throttle_updates_summary_per_source(monkeypatch: pytest.MonkeyPatch) -> None:
     logger = _StubLogger()
     summary = make_run_context()
-    executor = RunRequestExecutor(logger=logger, summary=summary)
+    clock = {"value": 0.0}
+    limiter = RateLimiter(clock=lambda: clock["value"])
+    executor = RunRequestExecutor(logger=logger, summary=summary, rate_limiter=limiter)
+    slept: list[float] = []
+    monkeypatch.setattr(run_request_executor_module.time, "sleep", slept.append)
 
-    fake_time = {"value": 1.0}
+    fred_burst = DATA_SOURCES_CONFIG[FRED_DATA_SOURCE][THROTTLE_BURST]
+    for _ in range(fred_burst + 1):
+        executor._throttle(FRED_DATA_SOURCE)
+    executor._throttle(FMP_DATA_SOURCE)
 
-    def fake_time_fn() -> float:
-        return fake_time["value"]
+    # FRED refills at 120/min → the call past the burst waits 0.5s; FMP is unaffected.
+    assert slept == [pytest.approx(0.5)]
+    assert summary.throttle_wait_count == 1
+    assert summary.throttle_sleep_seconds == pytest.approx(0.5)
+    assert summary.throttle_wait_seconds_by_source == {FRED_DATA_SOURCE: pytest.approx(0.5)}
+    assert summary.throttle_max_queue_depth_by_source == {FRED_DATA_SOURCE: 1}
+    assert summary.throttle_max_queue_depth == 1
 
-    def fake_sleep(seconds: float) -> None:
-        fake_time["value"] += seconds
-        executor.call_timestamps.clear()
 
-    monkeypatch.setattr(run_request_executor_module.time, "time", fake_time_fn)
-    monkeypatch.setattr(run_request_executor_module.time, "sleep", fake_sleep)
-    monkeypatch.setattr(run_request_executor_module, "THROTTLE_MAX_CALLS", 1)
-    monkeypatch.setattr(run_request_executor_module, "THROTTLE_PERIOD_SECONDS", 60)
+class _ThrottledResponse:
+    def __init__(self, status_code: int, retry_after: str | None = None) -> None:
+        self.status_code = status_code
+        self.headers = {"Retry-After": retry_after} if retry_after else {}
+        self.closed = False
 
-    executor._throttle()
-    fake_time["value"] = 1.1
-    executor._throttle()
+    def close(self) -> None:
+        self.closed = True
 
-    assert summary.throttle_wait_count == 1
-    assert summary.throttle_max_queue_depth == 1
-    assert summary.throttle_sleep_seconds == pytest.approx(59.9, rel=1e-3)
+
+def test_throttled_response_penalizes_source_and_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    summary = make_run_context()
+    clock = {"value": 0.0}
+    limiter = RateLimiter(clock=lambda: clock["value"])
+    executor = RunRequestExecutor(logger=_StubLogger(), summary=summary, rate_limiter=limiter)
+    slept: list[float] = []
+    monkeypatch.setattr(run_request_executor_module.time, "sleep", slept.append)
+    responses = [_ThrottledResponse(429, retry_after="3"), _ThrottledResponse(200)]
+    first = responses[0]
+
+    result = executor.execute(lambda: responses.pop(0), "GET https://example.com", source=FMP_DATA_SOURCE)
+
+    assert result.status_code == 200
+    assert first.closed
+    assert slept and slept[-1] >= 3.0
+    assert limiter.bucket(FMP_DATA_SOURCE).rate < limiter.bucket(FMP_DATA_SOURCE).base_rate
+    assert summary.throttle_backoffs_by_source == {FMP_DATA_SOURCE: 1}
+
+
+def test_throttled_response_returned_when_attempts_exhausted(monkeypatch: pytest.MonkeyPatch) -> None:
+    executor = RunRequestExecutor(logger=_StubLogger(), rate_limiter=RateLimiter(clock=lambda: 0.0))
+    monkeypatch.setattr(run_request_executor_module.time, "sleep", lambda _: None)
+    calls = {"n": 0}
+
+    def throttled() -> _ThrottledResponse:
+        calls["n"] += 1
+        return _ThrottledResponse(503)
+
+    result = executor.execute(throttled, "GET https://example.com", source=FRED_DATA_SOURCE)
+
+    assert result.status_code == 503
+    assert calls["n"] == run_request_executor_module.RETRY_MAX_ATTEMPS
+
+
+class _RecordingPool:
+    def __init__(self) -> None:
+        self.calls: list[dict] = []
+
+    def get(self, source: str, url: str, **kwargs: object) -> str:
+        self.calls.append(kwargs)
+        return "response"
+
+    def stats(self) -> tuple[int, int]:
+        return 0, 0
+
+
+class _ValidatorStore:
+    def __init__(self, validators: list[HttpValidator]) -> None:
+        self.validators = validators
+        self.upserted: list[HttpValidator] = []
+
+    def get_http_validators(self, url: str) -> dict[str, HttpValidator]:
+        return {v.cache_key: v for v in self.validators if v.url == url}
+
+    def upsert_http_validators(self, validators: list[HttpValidator]) -> int:
+        self.upserted.extend(validators)
+        return len(validators)
+
+
+def test_validator_cache_key_ignores_api_keys_and_param_order() -> None:
+    url = "https://example.com/prices"
+    key = HttpValidatorCache.cache_key(url, {"symbol": "AAPL", "apikey": "secret", "from": "2026-01-01"})
+
+    assert key == HttpValidatorCache.cache_key(url, {"from": "2026-01-01", "symbol": "AAPL", "apikey": "***"})
+    assert key == HttpValidatorCache.cache_key(url, {"from": "2026-01-01", "symbol": "AAPL", "api_key": "other"})
+    assert "secret" not in key
+    assert key != HttpValidatorCache.cache_key(url, {"symbol": "MSFT", "from": "2026-01-01"})
+
+
+def test_conditional_http_get_sends_cached_validators() -> None:
+    url = "https://example.com/prices"
+    params = {"symbol": "AAPL", "apikey": "secret"}
+    store = _ValidatorStore(
+        [HttpValidator(cache_key=HttpValidatorCache.cache_key(url, params), url=url, etag='"abc"', last_modified="Mon, 26 Jan 2026 00:00:00 GMT")]
+    )
+    pool = _RecordingPool()
+    executor = RunRequestExecutor(logger=_StubLogger(), session_pool=pool)
+    executor.set_validator_cache(HttpValidatorCache(store))
+
+    executor.http_get(FMP_DATA_SOURCE, url, params=params, conditional=True)
+    executor.http_get(FMP_DATA_SOURCE, url, params=params)
+    executor.http_get(FMP_DATA_SOURCE, url, params={"symbol": "MSFT"}, conditional=True)
+
+    assert pool.calls[0]["headers"] == {"If-None-Match": '"abc"', "If-Modified-Since": "Mon, 26 Jan 2026 00:00:00 GMT"}
+    assert pool.calls[1]["headers"] is None
+    assert pool.calls[2]["headers"] is None
+
+
+def test_validator_cache_loads_urls_outside_its_lock() -> None:
+    slow_url, fast_url = "https://example.com/slow", "https://example.com/fast"
+    loading = threading.Event()
+    release = threading.Event()
+
+    class _SlowStore(_ValidatorStore):
+        def get_http_validators(self, url: str) -> dict[str, HttpValidator]:
+            if url == slow_url:
+                loading.set()
+                release.wait(5)
+            return super().get_http_validators(url)
+
+    fast = HttpValidator(cache_key=fast_url, url=fast_url, etag='"fast"')
+    cache = HttpValidatorCache(_SlowStore([fast]))
+    slow_lookup = threading.Thread(target=cache.get, args=(slow_url, None))
+    slow_lookup.start()
+    try:
+        assert loading.wait(5)
+        # Another URL is served while the first lookup is still waiting on the database.
+        assert cache.get(fast_url, None) == fast
+    finally:
+        release.set()
+        slow_lookup.join(5)
+
+
+def test_execute_once_defers_failures_and_opens_circuit() -> None:
+    clock = {"value": 0.0}
+    summary = make_run_context()
+    breaker = CircuitBreaker(failure_threshold=2, cooldown_seconds=30, clock=lambda: clock["value"])
+    executor = RunRequestExecutor(logger=_StubLogger(), summary=summary, circuit_breaker=breaker)
+    executor._throttle = lambda _source=None: None
+    calls: list[int] = []
+
+    def failing_call() -> None:
+        calls.append(1)
+        raise requests.ConnectionError("reset")
+
+    with pytest.raises(DeferredRetry) as first:
+        executor.execute_once(failing_call, "GET https://example.com", FMP_DATA_SOURCE)
+    assert first.value.attempt == 1
+    assert 0 < first.value.delay <= run_request_executor_module.RETRY_BASE_DELAY
+    with pytest.raises(DeferredRetry):
+        executor.execute_once(failing_call, "GET https://example.com", FMP_DATA_SOURCE, attempt=1)
+    assert summary.circuit_opens_by_source == {FMP_DATA_SOURCE: 1}
+
+    # While the circuit is open the source is not called at all.
+    with pytest.raises(DeferredRetry) as paused:
+        executor.execute_once(failing_call, "GET https://example.com", FMP_DATA_SOURCE, attempt=2)
+    assert paused.value.delay == pytest.approx(30)
+    assert paused.value.attempt == 2
+    assert len(calls) == 2
+
+    # Half-open after the cooldown: a success closes the circuit.
+    clock["value"] = 31.0
+    assert executor.execute_once(lambda: "ok", "GET https://example.com", FMP_DATA_SOURCE, attempt=2) == "ok"
+    assert breaker.remaining(FMP_DATA_SOURCE) == 0
+
+
+def test_execute_once_parks_throttled_retry_until_the_bucket_reopens(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = {"value": 0.0}
+    limiter = RateLimiter(clock=lambda: clock["value"])
+    executor = RunRequestExecutor(logger=_StubLogger(), rate_limiter=limiter)
+    slept: list[float] = []
+    monkeypatch.setattr(run_request_executor_module.time, "sleep", slept.append)
+
+    with pytest.raises(DeferredRetry) as throttled:
+        executor.execute_once(lambda: _ThrottledResponse(429, retry_after="3"), "GET https://example.com", FMP_DATA_SOURCE)
+    assert throttled.value.delay >= 3.0
+    assert throttled.value.attempt == 1
+
+    # Picked up before the Retry-After has passed: parked again without calling the source.
+    clock["value"] = 1.0
+    with pytest.raises(DeferredRetry) as early:
+        executor.execute_once(lambda: pytest.fail("called while paused"), "GET https://example.com", FMP_DATA_SOURCE, attempt=1)
+    assert early.value.delay == pytest.approx(2.0)
+    assert early.value.attempt == 1
+    assert not slept
+
+
+def test_half_open_circuit_lets_one_probe_through() -> None:
+    clock = {"value": 0.0}
+    breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=30, clock=lambda: clock["value"], probe_poll_seconds=1.0)
+    breaker.record_failure(FMP_DATA_SOURCE)
+    assert breaker.acquire(FMP_DATA_SOURCE) == pytest.approx(30)
+
+    clock["value"] = 30.0
+    assert breaker.acquire(FMP_DATA_SOURCE) == 0
+    assert breaker.acquire(FMP_DATA_SOURCE) == pytest.approx(1.0)
+    assert breaker.acquire(FRED_DATA_SOURCE) == 0
+
+    # A failed probe re-opens the circuit; the next probe goes out after another cooldown.
+    breaker.record_failure(FMP_DATA_SOURCE)
+    assert breaker.acquire(FMP_DATA_SOURCE) == pytest.approx(30)
+    clock["value"] = 60.0
+    assert breaker.acquire(FMP_DATA_SOURCE) == 0
+    breaker.record_success(FMP_DATA_SOURCE)
+    assert breaker.acquire(FMP_DATA_SOURCE) == 0
+    assert breaker.acquire(FMP_DATA_SOURCE) == 0
+
+
+def test_in_flight_failures_do_not_reopen_an_open_circuit() -> None:
+    clock = {"value": 0.0}
+    breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=30, clock=lambda: clock["value"])
+    in_flight = [breaker.now() for _ in range(3)]
+
+    clock["value"] = 1.0
+    assert breaker.record_failure(FMP_DATA_SOURCE, in_flight[0]) is True
+    # The other calls fail later but were already out when the circuit opened.
+    clock["value"] = 5.0
+    assert breaker.record_failure(FMP_DATA_SOURCE, in_flight[1]) is False
+    assert breaker.remaining(FMP_DATA_SOURCE) == pytest.approx(26)
+
+    # Past the cooldown a stale failure must not re-open the circuit or cancel the probe.
+    clock["value"] = 31.0
+    probe_started = breaker.now()
+    assert breaker.acquire(FMP_DATA_SOURCE) == 0
+    assert breaker.record_failure(FMP_DATA_SOURCE, in_flight[2]) is False
+    assert breaker.acquire(FMP_DATA_SOURCE) > 0
+    assert breaker.remaining(FMP_DATA_SOURCE) == 0
+
+    # The probe's own failure is the half-open -> open transition.
+    clock["value"] = 32.0
+    assert breaker.record_failure(FMP_DATA_SOURCE, probe_started) is True
+    assert breaker.remaining(FMP_DATA_SOURCE) == pytest.approx(30)
+
+
+def test_execute_once_reports_a_circuit_open_once_per_opening() -> None:
+    clock = {"value": 0.0}
+    summary = make_run_context()
+    logger = _StubLogger()
+    breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=30, clock=lambda: clock["value"])
+    executor = RunRequestExecutor(logger=logger, summary=summary, circuit_breaker=breaker)
+    executor._throttle = lambda _source=None: None
+
+    def failing_call() -> None:
+        clock["value"] += 1.0
+        raise requests.ConnectionError("reset")
+
+    def overlapping_call() -> None:
+        # A second worker's call starts while this one is in flight and fails first, opening the circuit.
+        with pytest.raises(DeferredRetry):
+            executor.execute_once(failing_call, "GET https://example.com/b", FMP_DATA_SOURCE)
+        failing_call()
+
+    with pytest.raises(DeferredRetry):
+        executor.execute_once(overlapping_call, "GET https://example.com/a", FMP_DATA_SOURCE)
+    assert breaker.remaining(FMP_DATA_SOURCE) == pytest.approx(29)
+    assert len([w for w in logger.warnings if w.startswith("Circuit open")]) == 1
+    assert summary.circuit_opens_by_source == {FMP_DATA_SOURCE: 1}
+
+
+class _SlowFirstPool(_RecordingPool):
+    """The first GET blocks until released (or fails once released); later GETs answer at once."""
+
+    def __init__(self, primary_error: Exception | None = None) -> None:
+        super().__init__()
+        self.release = threading.Event()
+        self.closed: list[str] = []
+        self.threads: list[threading.Thread] = []
+        self.primary_error = primary_error
+        self._lock = threading.Lock()
+
+    def get(self, source: str, url: str, **kwargs: object) -> object:
+        with self._lock:
+            self.calls.append(kwargs)
+            self.threads.append(threading.current_thread())
+            name = f"response-{len(self.calls)}"
+        if name == "response-1":
+            self.release.wait(5)
+            if self.primary_error is not None:
+                raise self.primary_error
+        pool = self
+
+        class _Response:
+            def close(self) -> None:
+                pool.closed.append(name)
+
+            def __repr__(self) -> str:
+                return name
+
+        return _Response()
+
+
+def test_hedged_get_returns_duplicate_and_closes_slow_primary() -> None:
+    summary = make_run_context()
+    pool = _SlowFirstPool()
+    executor = RunRequestExecutor(logger=_StubLogger(), summary=summary, session_pool=pool)
+    executor._throttle = lambda _source=None: None
+    releaser = threading.Timer(0.3, pool.release.set)
+    releaser.start()
+
+    response = executor.http_get(FMP_DATA_SOURCE, "https://example.com/prices", hedge_after=0.01)
+    releaser.join()
+    executor._hedge_pool.shutdown(wait=True)
+
+    assert repr(response) == "response-2"
+    assert len(pool.calls) == 2
+    # The primary is sent from the calling thread; only the duplicate uses the hedge pool.
+    assert pool.threads[0] is threading.current_thread()
+    assert pool.threads[1] is not threading.current_thread()
+    assert pool.closed == ["response-1"]
+    assert (summary.hedged_requests, summary.hedge_wins) == (1, 1)
+
+
+def test_hedged_get_skips_duplicate_when_primary_is_fast() -> None:
+    summary = make_run_context()
+    pool = _SlowFirstPool()
+    pool.release.set()
+    executor = RunRequestExecutor(logger=_StubLogger(), summary=summary, session_pool=pool)
+    executor._throttle = lambda _source=None: None
+
+    response = executor.http_get(FMP_DATA_SOURCE, "https://example.com/prices", hedge_after=5)
+    executor._hedge_pool.shutdown(wait=True)
+
+    assert repr(response) == "response-1"
+    assert len(pool.calls) == 1
+    assert (summary.hedged_requests, summary.hedge_wins) == (0, 0)
+
+
+def test_hedged_get_falls_back_to_duplicate_when_primary_fails() -> None:
+    summary = make_run_context()
+    pool = _SlowFirstPool(primary_error=requests.ReadTimeout("slow"))
+    executor = RunRequestExecutor(logger=_StubLogger(), summary=summary, session_pool=pool)
+    executor._throttle = lambda _source=None: None
+    releaser = threading.Timer(0.3, pool.release.set)
+    releaser.start()
+
+    response = executor.http_get(FMP_DATA_SOURCE, "https://example.com/prices", hedge_after=0.01)
+    releaser.join()
+
+    assert repr(response) == "response-2"
+    assert (summary.hedged_requests, summary.hedge_wins) == (1, 1)
+
+
+def test_hedged_get_waits_for_primary_when_quota_is_exhausted() -> None:
+    from sbfoundation.run.services.quota_manager import QuotaExhausted
+
+    summary = make_run_context()
+    pool = _SlowFirstPool()
+    executor = RunRequestExecutor(logger=_StubLogger(), summary=summary, session_pool=pool)
+
+    def no_budget(_source: str | None = None) -> None:
+        raise QuotaExhausted(FMP_DATA_SOURCE, "normal")
+
+    executor._throttle = no_budget
+    releaser = threading.Timer(0.2, pool.release.set)
+    releaser.start()
+
+    response = executor.http_get(FMP_DATA_SOURCE, "https://example.com/prices", hedge_after=0.01)
+    releaser.join()
+
+    assert repr(response) == "response-1"
+    assert len(pool.calls) == 1
+    assert pool.closed == []
+    assert (summary.hedged_requests, summary.hedge_wins) == (0, 0)
+
+
+def test_transport_retries_are_throttled_and_charged(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(run_request_executor_module.time, "sleep", lambda _: None)
+    executor = RunRequestExecutor(logger=_StubLogger())
+    charged: list[str | None] = []
+    executor._throttle = charged.append
+    outcomes: list[object] = [requests.ConnectionError("reset"), requests.ConnectionError("reset"), "ok"]
+
+    def flaky() -> object:
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    assert executor.execute(flaky, "GET https://example.com", source=FMP_DATA_SOURCE) == "ok"
+    assert charged == [FMP_DATA_SOURCE] * 3
+
+
+def test_execute_async_retries_transport_errors_and_throttled_responses(monkeypatch: pytest.MonkeyPatch) -> None:
+    slept: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        slept.append(seconds)
+
+    monkeypatch.setattr(run_request_executor_module.asyncio, "sleep", fake_sleep)
+    summary = make_run_context()
+    limiter = RateLimiter(clock=lambda: 0.0)
+    executor = RunRequestExecutor(logger=_StubLogger(), summary=summary, rate_limiter=limiter)
+    outcomes: list[object] = [requests.ConnectionError("reset"), _ThrottledResponse(429, retry_after="3"), _ThrottledResponse(200)]
+    throttled = outcomes[1]
+
+    async def flaky() -> object:
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    result = asyncio.run(executor.execute_async(flaky, "GET https://example.com", source=FMP_DATA_SOURCE))
+
+    assert result.status_code == 200
+    assert throttled.closed
+    # One back-off after the reset, then the penalized bucket holds the retry for Retry-After.
+    assert slept and slept[-1] >= 3.0
+    assert summary.throttle_backoffs_by_source == {FMP_DATA_SOURCE: 1}
+
+
+def test_execute_async_raises_once_attempts_are_exhausted(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def fake_sleep(_seconds: float) -> None:
+        pass
+
+    monkeypatch.setattr(run_request_executor_module.asyncio, "sleep", fake_sleep)
+    executor = RunRequestExecutor(logger=_StubLogger())
+
+    async def failing() -> None:
+        raise requests.Timeout("slow")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(executor.execute_async(failing, "GET https://example.com", source=FMP_DATA_SOURCE))
+
+
+def test_quota_is_charged_before_anything_is_sent() -> None:
+    from sbfoundation.run.services.quota_manager import QuotaExhausted
+
+    class _EmptyQuota:
+        def reserve(self, source: str) -> None:
+            raise QuotaExhausted(source, "low")
+
+    executor = RunRequestExecutor(logger=_StubLogger())
+    executor.set_quota_manager(_EmptyQuota())
+    calls: list[str] = []
+
+    with pytest.raises(QuotaExhausted):
+        executor.execute(lambda: calls.append("sent"), "GET https://example.com", source=FMP_DATA_SOURCE)
+    assert calls == []
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from sbfoundation.eod import EodService
+from sbfoundation.ops.dtos.file_injestion import DatasetInjestion
+from sbfoundation.run.services import bulk_pipeline_service as bulk_pipeline_service_module
+from sbfoundation.silver import SilverPromotionPipeline, SilverService
+from tests.unit.helpers import make_dataset_recipe, make_run_context
+
+
+class _StubLogger:
+    def __init__(self) -> None:
+        self.errors: list[str] = []
+
+    def error(self, msg: str, *args: object, **kwargs: object) -> None:
+        self.errors.append(msg)
+
+
+class _GatedSilver:
+    """Promotes one file per ``gate`` release; file ids starting with "bad" fail."""
+
+    def __init__(self) -> None:
+        self.gate = threading.Semaphore(0)
+        self.promoted: list[str] = []
+
+    def promote_ingestion(self, ingestion: DatasetInjestion) -> int | None:
+        self.gate.acquire()
+        self.promoted.append(ingestion.file_id)
+        return None if ingestion.file_id.startswith("bad") else 10
+
+
+def _ingestion(file_id: str, can_promote: bool = True) -> DatasetInjestion:
+    return DatasetInjestion(
+        run_id="run-1", file_id=file_id, domain="eod", source="fmp", dataset="eod-bulk-price", bronze_can_promote=can_promote
+    )
+
+
+def test_pipeline_promotes_only_promotable_files_and_totals_rows() -> None:
+    silver = _GatedSilver()
+    pipeline = SilverPromotionPipeline(silver, _StubLogger(), maxsize=8)
+    pipeline.submit([_ingestion("f1"), _ingestion("skip", can_promote=False), _ingestion("bad1"), _ingestion("f2")])
+    for _ in range(3):
+        silver.gate.release()
+
+    assert pipeline.close() == (["f1", "f2"], 20)
+    assert silver.promoted == ["f1", "bad1", "f2"]
+
+
+def test_submit_blocks_while_the_queue_is_full() -> None:
+    silver = _GatedSilver()
+    pipeline = SilverPromotionPipeline(silver, _StubLogger(), maxsize=1)
+    submitted = threading.Event()
+
+    def producer() -> None:
+        # One file is taken by the worker, one fills the queue, the third must wait.
+        pipeline.submit([_ingestion("f1"), _ingestion("f2"), _ingestion("f3")])
+        submitted.set()
+
+    thread = threading.Thread(target=producer)
+    thread.start()
+    assert not submitted.wait(0.1)
+
+    for _ in range(3):
+        silver.gate.release()
+    thread.join(2)
+    assert submitted.is_set()
+    assert pipeline.close() == (["f1", "f2", "f3"], 30)
+
+
+def test_pipelined_promotion_merges_on_a_duplicate_connection(monkeypatch: pytest.MonkeyPatch) -> None:
+    class _SinkingBronze:
+        def __init__(self, manifest_sink=None, **kwargs: object) -> None:
+            self._sink = manifest_sink
+
+        def register_recipes(self, run, recipes) -> "_SinkingBronze":
+            return self
+
+        def process(self, run):
+            self._sink([_ingestion("f1"), _ingestion("f2")])
+            return run
+
+    monkeypatch.setattr(bulk_pipeline_service_module, "BronzeService", _SinkingBronze)
+    monkeypatch.setattr(bulk_pipeline_service_module, "QuotaManager", MagicMock())
+    silver_bootstraps: list[object] = []
+
+    def promote_ingestion(self: SilverService, ingestion: DatasetInjestion) -> int:
+        silver_bootstraps.append(self._bootstrap)
+        return 5
+
+    monkeypatch.setattr(SilverService, "promote_ingestion", promote_ingestion)
+    bootstrap, logger = MagicMock(), MagicMock()
+    service = EodService(
+        ops_service=MagicMock(),
+        dataset_service=MagicMock(),
+        bootstrap=bootstrap,
+        logger=logger,
+        enable_bronze=True,
+        enable_silver=True,
+        concurrent_requests=1,
+        force_from_date=None,
+        today="2026-01-27",
+        pipeline_silver=True,
+    )
+    run = make_run_context()
+
+    service._process_recipe_list([make_dataset_recipe()], run)
+
+    # Silver never queues on the lock the Bronze manifest flushes use.
+    assert silver_bootstraps == [bootstrap.duplicate.return_value] * 2
+    bootstrap.duplicate.return_value.close.assert_called_once()
+    assert run.silver_dto_count == 10
+    assert any("bronze_files=2 | rows=10" in call.args[0] for call in logger.info.call_args_list)
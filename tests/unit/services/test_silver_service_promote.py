@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import date, datetime
+import json
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -12,14 +13,23 @@ import pandas as pd
 import pytest
 
 from sbfoundation.dtos.bronze_to_silver_dto import BronzeToSilverDTO
+from sbfoundation.dtos.dto_projection import DTOProjection
 from sbfoundation.dtos.models import BronzeManifestRow
+from sbfoundation.dtos.sql_projection import SqlProjection
+from sbfoundation.folders import Folders
 from sbfoundation.dataset.models.dataset_keymap import DatasetKeymap
 from sbfoundation.dataset.models.dataset_keymap_entry import DatasetKeymapEntry
 from sbfoundation.dataset.models.dataset_schema import DatasetDtoSchema, SchemaColumn
 from sbfoundation.services.silver.silver_service import SilverService
-from sbfoundation.services.bronze.bronze_batch_reader import BronzeBatchItem
+from sbfoundation.services.bronze.bronze_batch_reader import BronzeBatchItem, BronzeBatchReader
 from sbfoundation.run.dtos.bronze_result import BronzeResult
-from sbfoundation.run.services.chunk_engine import Chunk
+from sbfoundation.run.services.chunk_engine import Chunk, ChunkEngine
+from sbfoundation.run.services.dedupe_engine import DedupeEngine
+from sbfoundation.ops.dtos.file_injestion import DatasetInjestion
+from sbfoundation.ops.requests.promotion_config import PromotionConfig
+from sbfoundation.maintenance.duckdb_bootstrap import SILVER_ROW_HASHES_DDL
+from sbfoundation.infra.result_file_adaptor import ResultFileAdapter
+from sbfoundation.silver import silver_service as silver_service_module
 
 
 # --- Test DTO ---
@@ -89,6 +99,15 @@ def _make_keymap_entry(
     )
 
 
+def _silver_connection() -> duckdb.DuckDBPyConnection:
+    """In-memory database with the silver schema and the ops row-hash index every MERGE maintains."""
+    conn = duckdb.connect(":memory:")
+    conn.execute("CREATE SCHEMA silver")
+    conn.execute("CREATE SCHEMA ops")
+    conn.execute(SILVER_ROW_HASHES_DDL)
+    return conn
+
+
 def _make_keymap(*entries: DatasetKeymapEntry) -> DatasetKeymap:
     return DatasetKeymap(version=1, entries=entries)
 
@@ -359,8 +378,7 @@ class TestTableExists:
 
 class TestMergeRows:
     def test_creates_table_when_not_exists(self) -> None:
-        conn = duckdb.connect(":memory:")
-        conn.execute("CREATE SCHEMA silver")
+        conn = _silver_connection()
 
         df = pd.DataFrame(
             {
@@ -371,6 +389,7 @@ class TestMergeRows:
         entry = _make_keymap_entry(key_cols=("ticker",))
 
         service = object.__new__(SilverService)
+        service._dedupe_engine = DedupeEngine()
         service._merge_rows(conn, entry, df, table_exists=False)
 
         result = conn.execute('SELECT * FROM silver."company_profile"').fetchall()
@@ -379,8 +398,7 @@ class TestMergeRows:
         conn.close()
 
     def test_merges_into_existing_table(self) -> None:
-        conn = duckdb.connect(":memory:")
-        conn.execute("CREATE SCHEMA silver")
+        conn = _silver_connection()
         conn.execute('CREATE TABLE silver."company_profile" (ticker VARCHAR, company_name VARCHAR)')
         conn.execute("INSERT INTO silver.company_profile VALUES ('AAPL', 'Apple Old')")
 
@@ -393,6 +411,7 @@ class TestMergeRows:
         entry = _make_keymap_entry(key_cols=("ticker",))
 
         service = object.__new__(SilverService)
+        service._dedupe_engine = DedupeEngine()
         service._merge_rows(conn, entry, df, table_exists=True)
 
         result = conn.execute('SELECT * FROM silver."company_profile" ORDER BY ticker').fetchall()
@@ -408,6 +427,7 @@ class TestMergeRows:
         entry = _make_keymap_entry()
 
         service = object.__new__(SilverService)
+        service._dedupe_engine = DedupeEngine()
         service._merge_rows(conn, entry, df, table_exists=True)
         # Should complete without error
         conn.close()
@@ -550,8 +570,9 @@ class TestPromoteRowIntegration:
         # Mock DuckDB connection
         mock_conn = MagicMock()
         mock_silver_service._bootstrap.connect.return_value = mock_conn
-        mock_silver_service._bootstrap.silver_transaction.return_value.__enter__ = MagicMock(return_value=mock_conn)
-        mock_silver_service._bootstrap.silver_transaction.return_value.__exit__ = MagicMock(return_value=False)
+        for name in ("silver_transaction", "read_connection"):
+            getattr(mock_silver_service._bootstrap, name).return_value.__enter__ = MagicMock(return_value=mock_conn)
+            getattr(mock_silver_service._bootstrap, name).return_value.__exit__ = MagicMock(return_value=False)
 
         # Mock dedupe to return the same df
         mock_silver_service._dedupe_engine.dedupe_against_table.return_value = projected_df
@@ -567,3 +588,429 @@ class TestPromoteRowIntegration:
         assert rows_seen == 1
         assert rows_written == 1
         assert table_name == '"silver"."company_profile"'
+
+
+class TestPromoteBatched:
+    @pytest.fixture
+    def conn(self):
+        conn = _silver_connection()
+        yield conn
+        conn.close()
+
+    @pytest.fixture
+    def batch_service(self, conn) -> SilverService:
+        service = object.__new__(SilverService)
+        service._logger = MagicMock()
+        service._enabled = True
+        service._bootstrap = MagicMock()
+        service._bootstrap.connect.return_value = conn
+        for name in ("silver_transaction", "read_connection"):
+            getattr(service._bootstrap, name).return_value.__enter__ = MagicMock(return_value=conn)
+            getattr(service._bootstrap, name).return_value.__exit__ = MagicMock(return_value=False)
+        service._promotion_config = PromotionConfig(batch_mode="table", watermark_mode="none")
+        service._chunk_engine = ChunkEngine(strategy="none")
+        service._dedupe_engine = DedupeEngine()
+        service._ops_service = MagicMock()
+        service.keymap = _make_keymap(_make_keymap_entry())
+        return service
+
+    @staticmethod
+    def _ingestion(file_id: str, ticker: str = "AAPL") -> DatasetInjestion:
+        return DatasetInjestion(
+            run_id="run-1",
+            file_id=file_id,
+            domain="company",
+            source="fmp",
+            dataset="company-profile",
+            ticker=ticker,
+            bronze_filename=f"bronze/{file_id}.json",
+        )
+
+    @staticmethod
+    def _projected(file_id: str, rows: list[tuple[str, str, str]]) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "ticker": [r[0] for r in rows],
+                "as_of_date": pd.to_datetime([r[1] for r in rows]),
+                "company_name": [r[2] for r in rows],
+                "bronze_file_id": file_id,
+            }
+        )
+
+    def test_one_merge_per_table_with_per_file_outcomes(self, batch_service: SilverService, conn) -> None:
+        frames = {
+            "file-1": self._projected("file-1", [("AAPL", "2026-01-15", "Apple Inc"), ("AAPL", "2026-01-16", "Apple Inc")]),
+            "file-2": self._projected("file-2", [("MSFT", "2026-01-15", "Microsoft")]),
+        }
+        ingestions = [self._ingestion("file-1"), self._ingestion("file-2", ticker="MSFT")]
+        batch_service._ops_service.load_promotable_file_ingestions.return_value = ingestions
+        run = MagicMock(run_id="run-1")
+
+        with patch.object(batch_service, "_project_row", side_effect=lambda row, entry: (frames[row.bronze_file_id], "as_of_date")):
+            with patch.object(batch_service, "_merge_rows", wraps=batch_service._merge_rows) as merge:
+                promoted, rows = batch_service.promote(run)
+
+        assert promoted == ["file-1", "file-2"]
+        assert rows == 3
+        assert merge.call_count == 1
+        assert conn.execute('SELECT COUNT(*) FROM silver."company_profile"').fetchone()[0] == 3
+        batch_service._ops_service.start_silver_ingestions.assert_called_once_with(ingestions)
+        batch_service._ops_service.finish_silver_ingestions.assert_called_once_with(ingestions)
+        batch_service._ops_service.finish_silver_ingestion.assert_not_called()
+        outcomes = {call.args[0].file_id: call.kwargs for call in batch_service._ops_service.set_silver_outcome.call_args_list}
+        assert outcomes["file-1"]["rows_written"] == 2
+        assert outcomes["file-1"]["coverage_from"] == date(2026, 1, 15)
+        assert outcomes["file-1"]["coverage_to"] == date(2026, 1, 16)
+        assert outcomes["file-2"]["rows_written"] == 1
+        assert outcomes["file-2"]["error"] is None
+
+    def test_dedupe_read_holds_the_connection_lock(self, batch_service: SilverService, conn) -> None:
+        batch_service._bootstrap.connect.side_effect = AssertionError("raw connection used without the lock")
+        df = self._projected("file-1", [("AAPL", "2026-01-15", "Apple Inc")])
+
+        written, rows, _ = batch_service._write_rows(batch_service.keymap.entries[0], df, "as_of_date")
+
+        assert rows == 1
+        batch_service._bootstrap.read_connection.assert_called_once_with()
+
+    def test_earliest_file_wins_duplicate_key(self, batch_service: SilverService, conn) -> None:
+        frames = {
+            "file-1": self._projected("file-1", [("AAPL", "2026-01-15", "first")]),
+            "file-2": self._projected("file-2", [("AAPL", "2026-01-15", "second")]),
+        }
+        batch_service._ops_service.load_promotable_file_ingestions.return_value = [self._ingestion("file-1"), self._ingestion("file-2")]
+
+        with patch.object(batch_service, "_project_row", side_effect=lambda row, entry: (frames[row.bronze_file_id], "as_of_date")):
+            _, rows = batch_service.promote(MagicMock(run_id="run-1"))
+
+        assert rows == 1
+        assert conn.execute('SELECT company_name, bronze_file_id FROM silver."company_profile"').fetchall() == [("first", "file-1")]
+
+    @pytest.mark.parametrize("dedupe_mode", ["none", "hash_only"])
+    def test_latest_file_wins_duplicate_key_when_rows_are_overwritten(self, batch_service: SilverService, conn, dedupe_mode: str) -> None:
+        batch_service._dedupe_engine = DedupeEngine(mode=dedupe_mode)
+        frames = {
+            "file-1": self._projected("file-1", [("AAPL", "2026-01-15", "first")]),
+            "file-2": self._projected("file-2", [("AAPL", "2026-01-15", "second")]),
+        }
+        batch_service._ops_service.load_promotable_file_ingestions.return_value = [self._ingestion("file-1"), self._ingestion("file-2")]
+
+        with patch.object(batch_service, "_project_row", side_effect=lambda row, entry: (frames[row.bronze_file_id], "as_of_date")):
+            _, rows = batch_service.promote(MagicMock(run_id="run-1"))
+
+        assert rows == 1
+        assert conn.execute('SELECT company_name, bronze_file_id FROM silver."company_profile"').fetchall() == [("second", "file-2")]
+
+    def test_hash_only_batch_ignores_the_watermark(self, batch_service: SilverService, conn) -> None:
+        batch_service._promotion_config = PromotionConfig(batch_mode="table", dedupe_mode="hash_only")
+        batch_service._dedupe_engine = DedupeEngine(mode="hash_only")
+        batch_service._ops_service.get_bulk_silver_watermarks.return_value = {("", "AAPL"): date(2026, 1, 16)}
+        frames = {"file-1": self._projected("file-1", [("AAPL", "2026-01-15", "restated")])}
+        batch_service._ops_service.load_promotable_file_ingestions.return_value = [self._ingestion("file-1")]
+
+        with patch.object(batch_service, "_project_row", side_effect=lambda row, entry: (frames[row.bronze_file_id], "as_of_date")):
+            _, rows = batch_service.promote(MagicMock(run_id="run-1"))
+
+        assert rows == 1
+        batch_service._ops_service.get_bulk_silver_watermarks.assert_not_called()
+        assert conn.execute('SELECT company_name FROM silver."company_profile"').fetchall() == [("restated",)]
+
+    def test_projection_failure_only_fails_that_file(self, batch_service: SilverService) -> None:
+        good = self._projected("file-2", [("AAPL", "2026-01-15", "Apple Inc")])
+
+        def project(row, entry):
+            if row.bronze_file_id == "file-1":
+                raise FileNotFoundError("Bronze payload missing")
+            return good, "as_of_date"
+
+        batch_service._ops_service.load_promotable_file_ingestions.return_value = [self._ingestion("file-1"), self._ingestion("file-2")]
+
+        with patch.object(batch_service, "_project_row", side_effect=project):
+            promoted, rows = batch_service.promote(MagicMock(run_id="run-1"))
+
+        assert promoted == ["file-2"]
+        assert rows == 1
+        outcomes = {call.args[0].file_id: call.kwargs for call in batch_service._ops_service.set_silver_outcome.call_args_list}
+        assert outcomes["file-1"]["error"] == "Bronze payload missing"
+        assert outcomes["file-2"]["error"] is None
+
+
+class TestPromoteRowEngines:
+    """The DuckDB engine must leave Silver exactly as the pandas engine does."""
+
+    _SCHEMA = DatasetDtoSchema(
+        dto_type=None,
+        columns=(
+            SchemaColumn(name="ticker", type="str", nullable=False),
+            SchemaColumn(name="company_name", type="str", nullable=True),
+            SchemaColumn(name="as_of_date", type="date", nullable=True, api="asOfDate"),
+            SchemaColumn(name="price", type="float", nullable=True),
+        ),
+    )
+
+    @staticmethod
+    def _service(conn, tmp_path, engine: str, watermark: date | None = None, dedupe_mode: str = "anti_join") -> SilverService:
+        service = object.__new__(SilverService)
+        service._logger = MagicMock()
+        service._bootstrap = MagicMock()
+        service._bootstrap.connect.return_value = conn
+        for name in ("silver_transaction", "read_connection"):
+            getattr(service._bootstrap, name).return_value.__enter__ = MagicMock(return_value=conn)
+            getattr(service._bootstrap, name).return_value.__exit__ = MagicMock(return_value=False)
+        service._promotion_config = PromotionConfig(engine=engine, dedupe_mode=dedupe_mode)
+        service._bronze_batch_reader = MagicMock()
+        service._dto_projection = DTOProjection()
+        service._sql_projection = SqlProjection()
+        service._chunk_engine = ChunkEngine(strategy="none")
+        service._dedupe_engine = DedupeEngine(mode=dedupe_mode)
+        service._ops_service = MagicMock()
+        service._ops_service.get_silver_watermark.return_value = watermark
+        service._tmp_path = tmp_path
+        return service
+
+    @staticmethod
+    def _promote(service: SilverService, file_id: str, rows: list[dict]) -> tuple:
+        path = service._tmp_path / f"{file_id}.json"
+        path.write_text(json.dumps(rows), encoding="utf-8")
+        batch_item = MagicMock(spec=BronzeBatchItem)
+        batch_item.df_content = pd.DataFrame(rows)
+        batch_item.result = MagicMock()
+        service._bronze_batch_reader.read.return_value = batch_item
+        service._bronze_batch_reader.relation_sql.return_value = f"read_json('{path}', format = 'array')"
+        entry = _make_keymap_entry(dto_schema=TestPromoteRowEngines._SCHEMA)
+        return service._promote_row(_make_manifest_row(bronze_file_id=file_id), _make_keymap(entry))
+
+    def _scenario(
+        self, tmp_path, engine: str, watermark: date | None = None, dedupe_mode: str = "anti_join"
+    ) -> tuple[list[tuple], list[tuple], list[tuple]]:
+        conn = _silver_connection()
+        service = self._service(conn, tmp_path / f"{engine}-{dedupe_mode}", engine, watermark, dedupe_mode)
+        service._tmp_path.mkdir()
+        first = self._promote(
+            service,
+            "file-1",
+            [
+                {"ticker": "AAPL", "companyName": "Apple", "asOfDate": "2026-01-14", "price": "1.5"},
+                {"ticker": "AAPL", "companyName": "Apple", "asOfDate": "2026-01-15", "price": 2},
+            ],
+        )
+        second = self._promote(
+            service,
+            "file-2",
+            [
+                {"ticker": "AAPL", "companyName": "Changed", "asOfDate": "2026-01-15", "price": 9},
+                {"ticker": "AAPL", "companyName": "Apple", "asOfDate": "2026-01-16", "price": None},
+                {"ticker": "AAPL", "companyName": "Apple Inc", "asOfDate": "2026-01-16", "price": 3},
+            ],
+        )
+        table = conn.execute('SELECT * FROM silver."company_profile" ORDER BY as_of_date').fetchall()
+        types = conn.execute('DESCRIBE silver."company_profile"').fetchall()
+        conn.close()
+        return [first, second], table, types
+
+    def test_duckdb_engine_matches_pandas_engine(self, tmp_path) -> None:
+        pandas_results, pandas_table, pandas_types = self._scenario(tmp_path, "pandas")
+        duckdb_results, duckdb_table, duckdb_types = self._scenario(tmp_path, "duckdb")
+
+        assert duckdb_results == pandas_results
+        assert duckdb_table == pandas_table
+        assert duckdb_types == pandas_types
+        assert duckdb_results[1][:4] == (1, 1, date(2026, 1, 16), date(2026, 1, 16))
+        assert [(row[1], row[3]) for row in duckdb_table] == [("Apple", 1.5), ("Apple", 2.0), ("Apple Inc", 3.0)]
+
+    @pytest.mark.parametrize("engine", ["pandas", "duckdb"])
+    def test_hash_only_merges_changed_rows_and_skips_unchanged(self, tmp_path, engine) -> None:
+        results, table, types = self._scenario(tmp_path, engine, dedupe_mode="hash_only")
+
+        # 2026-01-15 was restated and 2026-01-16 is new; the anti-join would have kept "Apple" / 2.0.
+        assert results[1][:4] == (2, 2, date(2026, 1, 15), date(2026, 1, 16))
+        assert [(row[1], row[3]) for row in table] == [("Apple", 1.5), ("Changed", 9.0), ("Apple Inc", 3.0)]
+        assert ("row_hash", "UBIGINT") in [(name, kind) for name, kind, *_ in types]
+
+    @pytest.mark.parametrize("engine", ["pandas", "duckdb"])
+    def test_hash_only_merges_restated_rows_behind_the_watermark(self, tmp_path, engine) -> None:
+        results, table, _ = self._scenario(tmp_path, engine, watermark=date(2026, 1, 16), dedupe_mode="hash_only")
+
+        assert results[1][:4] == (2, 2, date(2026, 1, 15), date(2026, 1, 16))
+        assert [(row[1], row[3]) for row in table] == [("Apple", 1.5), ("Changed", 9.0), ("Apple Inc", 3.0)]
+
+    def test_hash_only_engines_agree_on_row_hashes(self, tmp_path) -> None:
+        _, pandas_table, pandas_types = self._scenario(tmp_path, "pandas", dedupe_mode="hash_only")
+        _, duckdb_table, duckdb_types = self._scenario(tmp_path, "duckdb", dedupe_mode="hash_only")
+
+        assert duckdb_types == pandas_types
+        assert duckdb_table == pandas_table
+
+    def test_hash_only_skips_a_repromoted_file(self, tmp_path) -> None:
+        conn = _silver_connection()
+        service = self._service(conn, tmp_path, "pandas", dedupe_mode="hash_only")
+        rows = [
+            {"ticker": "AAPL", "companyName": "Apple", "asOfDate": "2026-01-14", "price": 1},
+            {"ticker": "AAPL", "companyName": "Apple", "asOfDate": "2026-01-15", "price": 2},
+        ]
+        first = self._promote(service, "file-1", rows)
+        again = self._promote(service, "file-2", rows)
+        restated = self._promote(service, "file-3", [rows[0], {**rows[1], "price": 5}])
+
+        assert first[:2] == (2, 2)
+        assert again[:2] == (0, 0)
+        assert restated[:2] == (1, 1)
+        assert conn.execute("SELECT COUNT(*) FROM ops.silver_row_hashes").fetchone()[0] == 2
+        assert conn.execute('SELECT bronze_file_id, price FROM silver."company_profile" ORDER BY as_of_date').fetchall() == [
+            ("file-1", 1.0),
+            ("file-3", 5.0),
+        ]
+        conn.close()
+
+    @pytest.mark.parametrize("engine", ["pandas", "duckdb"])
+    def test_hash_only_rewrites_rows_another_mode_overwrote(self, tmp_path, engine) -> None:
+        conn = _silver_connection()
+        service = self._service(conn, tmp_path, engine, dedupe_mode="hash_only")
+        original = [{"ticker": "AAPL", "companyName": "Apple", "asOfDate": "2026-01-15", "price": 2}]
+
+        self._promote(service, "file-1", original)
+        service._promotion_config = PromotionConfig(engine=engine, dedupe_mode="none")
+        service._dedupe_engine = DedupeEngine(mode="none")
+        self._promote(service, "file-2", [{**original[0], "price": 5}])
+        # The "none" run did not hash its rows, so the table's index entries are gone.
+        assert conn.execute("SELECT COUNT(*) FROM ops.silver_row_hashes").fetchone()[0] == 0
+
+        service._promotion_config = PromotionConfig(engine=engine, dedupe_mode="hash_only")
+        service._dedupe_engine = DedupeEngine(mode="hash_only")
+        restored = self._promote(service, "file-3", original)
+
+        assert restored[:2] == (1, 1)
+        assert conn.execute('SELECT bronze_file_id, price FROM silver."company_profile"').fetchall() == [("file-3", 2.0)]
+        conn.close()
+
+    def test_duckdb_engine_applies_watermark(self, tmp_path) -> None:
+        results, table, _ = self._scenario(tmp_path, "duckdb", watermark=date(2026, 1, 14))
+
+        assert results[0][:4] == (1, 1, date(2026, 1, 15), date(2026, 1, 15))
+        assert [row[2].date() for row in table] == [date(2026, 1, 15), date(2026, 1, 16)]
+
+    def test_duckdb_engine_falls_back_to_pandas(self, tmp_path) -> None:
+        conn = _silver_connection()
+        service = self._service(conn, tmp_path, "duckdb")
+        rows = [{"ticker": "AAPL", "companyName": "Apple", "asOfDate": "2026-01-15", "price": 1}]
+        batch_item = MagicMock(spec=BronzeBatchItem)
+        batch_item.df_content = pd.DataFrame(rows)
+        batch_item.result = MagicMock()
+        service._bronze_batch_reader.read.return_value = batch_item
+        service._bronze_batch_reader.relation_sql.return_value = None
+        entry = _make_keymap_entry(dto_schema=self._SCHEMA)
+
+        rows_seen, rows_written, _, _, _ = service._promote_row(_make_manifest_row(), _make_keymap(entry))
+
+        assert (rows_seen, rows_written) == (1, 1)
+        service._bronze_batch_reader.read.assert_called_once()
+        conn.close()
+
+
+    def test_duckdb_engine_falls_back_to_pandas_when_the_scan_fails(self, tmp_path) -> None:
+        conn = _silver_connection()
+        service = self._service(conn, tmp_path, "duckdb")
+        rows = [{"ticker": "AAPL", "companyName": "Apple", "asOfDate": "2026-01-15", "price": "n/a"}]
+        path = tmp_path / "file-1.json"
+        path.write_text(json.dumps(rows), encoding="utf-8")
+        batch_item = MagicMock(spec=BronzeBatchItem)
+        batch_item.df_content = pd.DataFrame(rows)
+        batch_item.result = MagicMock()
+        service._bronze_batch_reader.read.return_value = batch_item
+        # Binds (so DESCRIBE succeeds) but raises a ConversionException once rows are scanned.
+        service._bronze_batch_reader.relation_sql.return_value = (
+            f"read_json('{path}', format = 'array', "
+            "columns = {ticker: 'VARCHAR', companyName: 'VARCHAR', asOfDate: 'VARCHAR', price: 'INTEGER'})"
+        )
+        entry = _make_keymap_entry(dto_schema=self._SCHEMA)
+
+        rows_seen, rows_written, _, _, _ = service._promote_row(_make_manifest_row(), _make_keymap(entry))
+
+        assert (rows_seen, rows_written) == (1, 1)
+        service._bronze_batch_reader.read.assert_called_once()
+        assert conn.execute('SELECT ticker, price FROM silver."company_profile"').fetchall() == [("AAPL", None)]
+        conn.close()
+
+
+class TestPromoteParallel:
+    _SCHEMA = TestPromoteRowEngines._SCHEMA
+
+    def test_workers_project_and_main_process_writes_in_order(self, tmp_path, monkeypatch) -> None:
+        data_root = tmp_path / "data"
+        (data_root / "bronze").mkdir(parents=True)
+        # Spawned workers read the data root from the environment, this process from Folders.
+        monkeypatch.setenv("DATA_ROOT_FOLDER", str(data_root))
+        monkeypatch.setattr(Folders, "_data_root", staticmethod(lambda: data_root))
+        files = {
+            "file-1": [{"ticker": "AAPL", "companyName": "first", "asOfDate": "2026-01-15", "price": 1}],
+            "file-2": [
+                {"ticker": "AAPL", "companyName": "second", "asOfDate": "2026-01-15", "price": 2},
+                {"ticker": "AAPL", "companyName": "second", "asOfDate": "2026-01-16", "price": 3},
+            ],
+            "file-4": [{"ticker": "AAPL", "companyName": "fourth", "asOfDate": "2026-01-17", "price": 4}],
+        }
+        for file_id, content in files.items():
+            (data_root / "bronze" / f"{file_id}.json").write_text(json.dumps({"request": None, "content": content}), encoding="utf-8")
+        ingestions = [
+            DatasetInjestion(
+                run_id="run-1",
+                file_id=file_id,
+                domain="company",
+                source="fmp",
+                dataset="company-profile",
+                ticker="AAPL",
+                bronze_filename=f"bronze/{file_id}.json",
+            )
+            for file_id in ("file-1", "file-2", "file-3", "file-4")
+        ]
+
+        conn = _silver_connection()
+        service = TestPromoteRowEngines._service(conn, tmp_path, "pandas")
+        service._bronze_batch_reader = BronzeBatchReader(ResultFileAdapter())
+        service._enabled = True
+        service._workers = 2
+        service.keymap = _make_keymap(_make_keymap_entry(dto_schema=self._SCHEMA))
+        service._ops_service.load_promotable_file_ingestions.return_value = ingestions
+
+        promoted, rows = service.promote(MagicMock(run_id="run-1"))
+
+        assert promoted == ["file-1", "file-2", "file-4"]
+        assert rows == 3
+        table = conn.execute('SELECT company_name, bronze_file_id FROM silver."company_profile" ORDER BY as_of_date').fetchall()
+        assert table == [("first", "file-1"), ("second", "file-2"), ("fourth", "file-4")]
+        errors = {call.args[0].file_id: call.kwargs["error"] for call in service._ops_service.finish_silver_ingestion.call_args_list}
+        assert errors["file-1"] is None and errors["file-4"] is None
+        assert "Bronze payload missing" in errors["file-3"]
+        conn.close()
+
+    def test_workers_use_the_configured_reader_and_projection(self) -> None:
+        reader, projection = MagicMock(), MagicMock()
+        silver_service_module._init_projection_worker(reader, projection)
+        try:
+            with patch.object(SilverService, "_project_file", return_value=("df", "as_of_date")) as project:
+                silver_service_module._project_in_worker("row", "entry")
+        finally:
+            silver_service_module._worker_projection = None
+
+        project.assert_called_once_with("row", "entry", reader, projection)
+
+    def test_workers_cannot_be_combined_with_the_duckdb_engine(self) -> None:
+        with pytest.raises(ValueError, match="engine='duckdb'"):
+            SilverService(
+                bootstrap=MagicMock(),
+                keymap_service=MagicMock(),
+                ops_service=MagicMock(),
+                promotion_config=PromotionConfig(engine="duckdb"),
+                workers=2,
+            )
+
+    @pytest.mark.parametrize("engine, workers", [("pandas", 2), ("duckdb", 0)])
+    def test_table_batches_reject_workers_and_the_duckdb_engine(self, engine: str, workers: int) -> None:
+        with pytest.raises(ValueError, match="batch_mode='table'"):
+            SilverService(
+                bootstrap=MagicMock(),
+                keymap_service=MagicMock(),
+                ops_service=MagicMock(),
+                promotion_config=PromotionConfig(batch_mode="table", engine=engine),
+                workers=workers,
+            )